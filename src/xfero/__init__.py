@@ -14,12 +14,32 @@
 +-----------------------------------+------------------------------------------+
 | Func: monitor.dirmon              | Directory Monitor                        |
 +-----------------------------------+------------------------------------------+
+| Func: monitor.dirwatch            | Event driven Directory Monitor           |
++-----------------------------------+------------------------------------------+
+| Class: dirnotify.Notify           | Directory event notification (inotify)   |
++-----------------------------------+------------------------------------------+
+| Class: route_matcher.Route_Matcher| Multi-route filename pattern matching    |
++-----------------------------------+------------------------------------------+
+| Class: route_plan.Route_Plan_Cache| Cached route plans with change detection |
++-----------------------------------+------------------------------------------+
 | Func: stop_XFERO                     | Stop Xfero                                  |
 +-----------------------------------+------------------------------------------+
 | Class: workflow.Workflow_Thread   | Workflow worker                          |
 +-----------------------------------+------------------------------------------+
 | Class: xfer.Xfer_Thread           | Transfer worker                          |
 +-----------------------------------+------------------------------------------+
+| Class: pipeline.Pipeline          | Resident workflow & xfer worker pools    |
++-----------------------------------+------------------------------------------+
+| Class: xfer_scheduler.Xfer_Scheduler | Partner aware xfer queue              |
++-----------------------------------+------------------------------------------+
+| Module: xfer_retry                | Durable retries & partner circuit breaker|
++-----------------------------------+------------------------------------------+
+| Class: batcher.Batcher            | Micro batching of files into archives    |
++-----------------------------------+------------------------------------------+
+| Func: workflow_pool.run           | Process pool for CPU bound workflow steps|
++-----------------------------------+------------------------------------------+
+| Func: log_config.configure        | Once per process queue based logging     |
++-----------------------------------+------------------------------------------+
 | Module: db                        | Database CRUD functionality              |
 +-----------------------------------+------------------------------------------+
 | Module: gui                       | GUI functionality                        |
@@ -30,6 +50,8 @@
 +-----------------------------------+------------------------------------------+
 | Module: workflow_manager          | Workflow functionality                   |
 +-----------------------------------+------------------------------------------+
+| Module: xfer_engine               | In-process transfer engines              |
++-----------------------------------+------------------------------------------+
 | Module: Test                      | Unit Test functions                           |
 +-----------------------------------+------------------------------------------+
 
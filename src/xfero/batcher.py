@@ -0,0 +1,315 @@
+#!/usr/bin/env python
+'''
+Micro batching of files between the workflow and xfer queues
+'''
+
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from xfero import get_conf as get_conf
+from xfero import route_plan
+from xfero.workflow_manager import tree_hash
+from xfero.workflow_manager.manage_archives import Manage_Archives
+from xfero.workflow_manager.micro_batch import batch_settings
+
+# Class of the workflow item which marks a route for batching
+BATCH_CLASS = 'Micro_Batch'
+
+# Name of the manifest written to each batch
+MANIFEST = 'xfero_manifest.txt'
+
+
+def route_batch(work):
+    '''
+
+    **Purpose:**
+
+    Return the batch settings of the route of a work item, from the
+    Micro_Batch item of its workflow in the route plan, or None if the route
+    is not batched.
+
+    *Example usage:*
+
+    ```settings = route_batch(work)```
+
+    :param work: Work item from the workflow thread
+    :returns: Dictionary from micro_batch.batch_settings or None
+
+    '''
+    priority, route_id, filename, original_filename, xfero_token = work
+    plan = route_plan.get_cache().get(route_id, xfero_token)
+    for workflow in plan.workflow:
+        if workflow['workflow_item_class'] == BATCH_CLASS:
+            args = workflow['workflow_item_args']
+            if not args or args == 'NULL':
+                return batch_settings()
+            return batch_settings(*[arg.strip() for arg in args.split(',')])
+    return None
+
+
+def manifest_lines(members):
+    '''
+
+    **Purpose:**
+
+    Format the manifest of a batch. There is a line for each file giving its
+    name in the archive, its size, its SHA-256 digest, its XFERO token and
+    the name it was found with, separated by tabs.
+
+    *Example usage:*
+
+    ```manifest_lines([('CIS_FILE', '/xfero/transient/CIS_FILE', work)])```
+
+    :param members: List of (name, path, work) for each file in the batch
+    :returns: The lines
+
+    '''
+    lines = []
+    for name, path, work in members:
+        size = os.path.getsize(path)
+        lines.append('%s\t%s\t%s\t%s\t%s\n' % (
+            name, size, tree_hash.chunk_digest(path, 0, size), work[4],
+            work[3]))
+    return lines
+
+
+class Batch(object):
+
+    '''
+
+    **Purpose:**
+
+    The files gathered for one route, with the settings and deadline of the
+    batch.
+
+    '''
+
+    def __init__(self, route_id, settings):
+        '''init'''
+        self.route_id = route_id
+        self.settings = settings
+        self.work = []
+        self.size = 0
+        self.deadline = time.time() + settings['window']
+
+    def add(self, work):
+        '''Add a work item, returning True once the batch is full'''
+        self.work.append(work)
+        try:
+            self.size += os.path.getsize(work[2])
+        except OSError:
+            pass
+        return (len(self.work) >= self.settings['max_files'] or
+                self.size >= self.settings['max_bytes'])
+
+
+class Batcher(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`batcher.Batcher` class sits between the workflow threads and
+    the xfer queue. Files on a route whose workflow holds a Micro_Batch item
+    are gathered into a batch for the route rather than being transferred one
+    at a time. All other work is passed to the xfer queue unchanged.
+
+    Once a batch is full, or its window has passed, its files are moved into
+    a directory with a manifest and the directory is archived with
+    ```Manage_Archives.compress_dir```. The archive is put to the xfer queue
+    as a single work item, so it is renamed and transferred once for all of
+    the files, and is retried as one file if the transfer fails.
+
+    **Usage Notes:**
+
+    Each file keeps its XFERO token. The manifest records the token of every
+    file in the batch, and each token is logged with the token given to the
+    batch, so the progress of a file can be followed through its batch.
+
+    A batch which is filled is archived by the workflow thread which filled
+    it. A batch whose window passes is archived by the batcher's own thread.
+
+    The done item, (999, 'NONE'), sends every open batch before it is passed
+    on, so no file is left behind when the pipeline stops.
+
+    If a batch cannot be archived its files are moved to the error directory.
+
+    *Example usage:*
+
+    ```batcher = Batcher(outq).start()```
+    ```batcher.put(work)```
+    ```batcher.stop()```
+
+    :param queue: The xfer queue
+    :param batch_directory: Directory the batches are built in. Defaults to
+                            the transient directory
+    :param settings_for: Function returning the batch settings of a work
+                         item, or None. Defaults to route_batch
+
+    **Unit Test Module:** test_batcher.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, queue, batch_directory=None, settings_for=None):
+        '''init'''
+        (xfero_logger, xfero_database, outbound_directory,
+         transient_directory, error_directory,
+         xfero_pid) = get_conf.get_xfero_config()
+
+        self.queue = queue
+        self.batch_directory = batch_directory or transient_directory
+        self.error_directory = error_directory
+        self.settings_for = settings_for or route_batch
+        self.batches = {}
+        self.condition = threading.Condition()
+        self.thread = None
+        self.running = False
+
+    def start(self):
+        '''Start the thread which sends batches whose window has passed'''
+        self.running = True
+        self.thread = threading.Thread(target=self.run, name='batcher',
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        '''Send every open batch and stop the thread'''
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+        self.flush_all()
+
+    def put(self, work, block=True, timeout=None):
+        '''Add work to its batch, or pass it to the xfer queue'''
+        logger = logging.getLogger('workflow')
+
+        if len(work) == 2:
+            self.flush_all()
+            self.queue.put(work, block, timeout)
+            return
+
+        try:
+            settings = self.settings_for(work) if len(work) == 5 else None
+        except Exception as err:
+            logger.error('Unable to read batch settings of route %s: Error %s. (XFERO_Token=%s)',
+                         work[1], err, work[4], exc_info=True)
+            settings = None
+
+        if settings is None:
+            self.queue.put(work, block, timeout)
+            return
+
+        route_id = work[1]
+        with self.condition:
+            batch = self.batches.get(route_id)
+            if batch is None:
+                batch = Batch(route_id, settings)
+                self.batches[route_id] = batch
+                self.condition.notify()
+            full = batch.add(work)
+            if full:
+                del self.batches[route_id]
+
+        logger.info('File %s added to the batch for route %s. (XFERO_Token=%s)',
+                    work[2], route_id, work[4])
+
+        if full:
+            self.flush(batch)
+
+    def run(self):
+        '''Send each batch once its window has passed'''
+        while True:
+            with self.condition:
+                if not self.running:
+                    return
+                now = time.time()
+                due = [batch for batch in self.batches.values()
+                       if batch.deadline <= now]
+                for batch in due:
+                    del self.batches[batch.route_id]
+                if not due:
+                    deadlines = [batch.deadline
+                                 for batch in self.batches.values()]
+                    self.condition.wait(
+                        min(deadlines) - now if deadlines else None)
+                    continue
+
+            for batch in due:
+                self.flush(batch)
+
+    def flush_all(self):
+        '''Send every open batch'''
+        with self.condition:
+            batches = list(self.batches.values())
+            self.batches = {}
+        for batch in batches:
+            self.flush(batch)
+
+    def flush(self, batch):
+        '''Archive a batch with its manifest and put it to the xfer queue'''
+        logger = logging.getLogger('workflow')
+
+        batch_token = uuid.uuid4()
+        archive_name = 'xfero_batch_%s_%s' % (batch.route_id,
+                                              batch_token.hex[:8])
+        batch_dir = os.path.join(self.batch_directory, archive_name)
+
+        for work in batch.work:
+            logger.info('File %s sent in batch %s. (XFERO_Token=%s)',
+                        work[3], batch_token, work[4])
+        logger.info('Batch %s of %s files (%s bytes) for route %s. (XFERO_Token=%s)',
+                    archive_name, len(batch.work), batch.size,
+                    batch.route_id, batch_token)
+
+        members = []
+        try:
+            os.mkdir(batch_dir)
+            names = set([MANIFEST])
+            for index, work in enumerate(batch.work):
+                name = os.path.basename(work[2])
+                if name in names:
+                    name = '%s_%s' % (index, name)
+                names.add(name)
+                path = os.path.join(batch_dir, name)
+                shutil.move(work[2], path)
+                members.append((name, path, work))
+
+            with open(os.path.join(batch_dir, MANIFEST), 'w') as out:
+                out.writelines(manifest_lines(members))
+
+            archive = Manage_Archives(batch_token).compress_dir(
+                batch_dir, batch.settings['archive_type'], archive_name)
+        except Exception as err:
+            logger.error('Unable to build batch %s: Error %s. (XFERO_Token=%s)',
+                         archive_name, err, batch_token, exc_info=True)
+            moved = dict((id(work), path) for name, path, work in members)
+            for work in batch.work:
+                path = moved.get(id(work), work[2])
+                logger.error('Exception: Moving %s to %s. (XFERO_Token=%s)',
+                             path, self.error_directory, work[4])
+                try:
+                    shutil.move(path, self.error_directory)
+                except (OSError, shutil.Error) as move_err:
+                    logger.error('Exception moving file from %s to %s: Error %s. (XFERO_Token=%s)',
+                                 path, self.error_directory, move_err,
+                                 work[4])
+            shutil.rmtree(batch_dir, ignore_errors=True)
+            return None
+
+        priority = min(work[0] for work in batch.work)
+        self.queue.put((priority, batch.route_id, archive, archive,
+                        batch_token))
+        return archive
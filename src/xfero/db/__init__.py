@@ -6,6 +6,10 @@
 +===================================+==========================================+
 | Func: create_XFERO_DB.create_db   | Database creation function               |
 +-----------------------------------+------------------------------------------+
+| Func: connection.get_connection   | Per-thread persistent WAL connections    |
++-----------------------------------+------------------------------------------+
+| Func: manage_av_pattern           | AV Pattern table CRUD functions          |
++-----------------------------------+------------------------------------------+
 | Func: manage_control              | Control table CRUD functions             |
 +-----------------------------------+------------------------------------------+
 | Func: manage_cots_pattern         | COTS Pattern table CRUD functions        |
@@ -14,6 +18,8 @@
 +-----------------------------------+------------------------------------------+
 | Func: manage_partner              | Partner table CRUD functions             |
 +-----------------------------------+------------------------------------------+
+| Func: manage_partner_limit        | Partner Limit table CRUD functions       |
++-----------------------------------+------------------------------------------+
 | Func: manage_priority             | Priority table CRUD functions            |
 +-----------------------------------+------------------------------------------+
 | Func: manage_route                | Route table CRUD functions               |
@@ -24,10 +30,20 @@
 +-----------------------------------+------------------------------------------+
 | Func: manage_xfer                 | Xfer table CRUD functions                |
 +-----------------------------------+------------------------------------------+
+| Func: manage_xfer_retry           | Xfer Retry table CRUD functions          |
++-----------------------------------+------------------------------------------+
 
 +------------+-------------+---------------------------------------------------+
 | Date       | Author      | Change Details                                    |
 +============+=============+===================================================+
 | 04/05/2013 | Chris Falck | Created                                           |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added connection                                  |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added manage_partner_limit                        |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added manage_xfer_retry                           |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added manage_av_pattern                           |
++------------+-------------+---------------------------------------------------+
 '''
@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Module contains the shared connection manager used by the manage_* modules to
+access the XFERO database.
+
+Each thread holds one persistent connection per database file rather than
+opening and closing a connection for every statement. The connection is opened
+with:
+
+* WAL journal mode. Readers do not block the writer and the writer does not
+  block readers, so the GUI, scheduler, stop script and worker threads can
+  use the database at the same time.
+* A busy timeout. A connection which finds the database locked waits for the
+  lock to be released rather than failing immediately.
+* A prepared statement cache. Statements run by the manage_* functions are
+  compiled once per connection and reused.
+
+**Usage Notes:**
+
+A connection must only be used by the thread which obtained it. The manage_*
+functions obtain the connection at the start of each call and must not close
+it.
+
+The row_factory is reset each time the connection is obtained, so a function
+which sets ```con.row_factory = lite.Row``` does not affect the next caller.
+Any transaction left open by a failed call is rolled back.
+
+A new connection is opened if the database file has been replaced since the
+connection was opened (for example after the tests remove and recreate the
+database) or if the process has forked.
+
+*Example usage:*
+
+```con = db_connection.get_connection(db_location)```
+
+**Unit Test Module:** None
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import os
+import sqlite3 as lite
+import threading
+
+# Seconds to wait for a lock held by another connection
+BUSY_TIMEOUT = 30.0
+
+# Number of prepared statements cached by each connection
+CACHED_STATEMENTS = 256
+
+LOCAL = threading.local()
+
+
+def file_identity(db_location):
+    '''
+    Return the device and inode of the database file, or None if it does not
+    exist.
+    '''
+    try:
+        stat = os.stat(db_location)
+    except OSError:
+        return None
+
+    return (stat.st_dev, stat.st_ino)
+
+
+def get_connection(db_location):
+    '''
+
+    **Purpose:**
+
+    Return the connection to the database for the calling thread, opening it
+    if required.
+
+    *Example usage:*
+
+    ```con = get_connection(db_location)```
+
+    :param db_location: Location of the XFERO database
+    :returns: sqlite3 Connection
+
+    '''
+    connections = getattr(LOCAL, 'connections', None)
+    if connections is None:
+        connections = LOCAL.connections = {}
+
+    pid = os.getpid()
+    identity = file_identity(db_location)
+
+    entry = connections.get(db_location)
+    if entry is not None:
+        con, con_pid, con_identity = entry
+        if con_pid == pid and identity is not None and \
+            identity == con_identity:
+            con.row_factory = None
+            if con.in_transaction:
+                con.rollback()
+            return con
+
+        del connections[db_location]
+        # A connection inherited across a fork must not be used or closed
+        if con_pid == pid:
+            try:
+                con.close()
+            except lite.Error:
+                pass
+
+    con = lite.connect(db_location, timeout=BUSY_TIMEOUT,
+                       cached_statements=CACHED_STATEMENTS)
+    con.execute('pragma journal_mode=WAL')
+    con.execute('pragma busy_timeout=%d' % int(BUSY_TIMEOUT * 1000))
+
+    connections[db_location] = (con, pid, file_identity(db_location))
+    return con
+
+
+def close_connection():
+    '''
+
+    **Purpose:**
+
+    Close all of the connections held by the calling thread. A thread which
+    is about to finish may call this to release its connections promptly.
+
+    *Example usage:*
+
+    ```close_connection()```
+
+    :returns: None
+
+    '''
+    connections = getattr(LOCAL, 'connections', None)
+    if not connections:
+        return
+
+    pid = os.getpid()
+    for con, con_pid, con_identity in connections.values():
+        if con_pid == pid:
+            try:
+                con.close()
+            except lite.Error:
+                pass
+    connections.clear()
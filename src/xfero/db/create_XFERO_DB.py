@@ -4,7 +4,11 @@
 '''
 import sqlite3 as lite
 import sys
-from /xfero/ import get_conf as get_conf
+from xfero import get_conf as get_conf
+
+# The tables held in the route plan cache
+CONFIG_TABLES = ('XFERO_Route', 'XFERO_Workflow_Item', 'XFERO_Xfer',
+                 'XFERO_Partner', 'XFERO_COTS_Pattern', 'XFERO_Partner_Limit')
 
 
 def create_db():
@@ -61,12 +65,22 @@ def create_db():
     | 28/04/2015 | Chris Falck | Added support for eNDI and UTM to the Partner |
     |            |             | table                                         |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_Partner_Limit table holding the   |
+    |            |             | concurrency and bandwidth limits of a partner |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_Xfer_Retry table holding the      |
+    |            |             | retry schedule of failed transfers            |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_Config_Generation, bumped by      |
+    |            |             | triggers on the tables held in the route plan |
+    |            |             | cache                                         |
+    +------------+-------------+-----------------------------------------------+
     
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s', err)
         sys.exit(err)
@@ -88,12 +102,16 @@ def create_db():
             cur.execute("DROP TABLE IF EXISTS XFERO_Workflow_Item")
             cur.execute("DROP TABLE IF EXISTS XFERO_Scheduled_Task")
             cur.execute("DROP TABLE IF EXISTS XFERO_Control")
+            cur.execute("DROP TABLE IF EXISTS XFERO_Partner_Limit")
+            cur.execute("DROP TABLE IF EXISTS XFERO_Xfer_Retry")
             cur.execute("DROP TABLE IF EXISTS XFERO_Partner")
+            cur.execute("DROP TABLE IF EXISTS XFERO_Config_Generation")
 
             cur.execute("DROP INDEX IF EXISTS routeindex")
             cur.execute("DROP INDEX IF EXISTS xferindex")
             cur.execute("DROP INDEX IF EXISTS workflowindex")
             cur.execute("DROP INDEX IF EXISTS xfercotspatternindex")
+            cur.execute("DROP INDEX IF EXISTS xferretryindex")
 
             cur.execute(
                 "CREATE TABLE XFERO_Function \
@@ -219,6 +237,45 @@ def create_db():
             cur.execute(
                 "CREATE INDEX workflowindex ON \
                 XFERO_Workflow_Item(workflow_item_route);")
+            cur.execute(
+                "CREATE TABLE XFERO_Partner_Limit \
+                (partner_limit_partner INTEGER NOT NULL PRIMARY KEY \
+                REFERENCES XFERO_Partner(partner_id) ON DELETE CASCADE ON \
+                UPDATE CASCADE, \
+                partner_limit_max_xfers INTEGER NULL, \
+                partner_limit_bytes_per_sec INTEGER NULL);")
+            cur.execute(
+                "CREATE TABLE XFERO_Xfer_Retry \
+                (retry_id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, \
+                retry_route INTEGER NOT NULL, \
+                retry_xfer INTEGER NOT NULL REFERENCES XFERO_Xfer(xfer_id) ON \
+                DELETE CASCADE ON UPDATE CASCADE, \
+                retry_partner INTEGER NOT NULL, \
+                retry_priority INTEGER NOT NULL, \
+                retry_file TEXT NOT NULL, \
+                retry_original_filename TEXT NOT NULL, \
+                retry_token TEXT NULL, \
+                retry_attempts INTEGER NOT NULL, \
+                retry_next_attempt REAL NOT NULL, \
+                retry_last_error TEXT NULL);")
+            cur.execute(
+                "CREATE INDEX xferretryindex ON \
+                XFERO_Xfer_Retry(retry_next_attempt);")
+            cur.execute(
+                "CREATE TABLE XFERO_Config_Generation \
+                (config_generation INTEGER NOT NULL);")
+            cur.execute("INSERT INTO XFERO_Config_Generation VALUES (0);")
+
+            # A change to a table held in the route plan cache bumps the
+            # configuration generation. Changes to XFERO_Xfer_Retry and
+            # XFERO_Control do not
+            for table in CONFIG_TABLES:
+                for event in ('INSERT', 'UPDATE', 'DELETE'):
+                    cur.execute(
+                        "CREATE TRIGGER %s_%s_generation AFTER %s ON %s \
+                        BEGIN UPDATE XFERO_Config_Generation SET \
+                        config_generation = config_generation + 1; END;" % (
+                            table, event.lower(), event, table))
 
     except lite.Error as err:
         print("Error %s:" % err.args[0])
@@ -0,0 +1,410 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Module contains functions to manage the database table XFERO_AV_Pattern
+
+Each row holds the command line used by the Anti_Virus workflow step to run an
+AV product. ``{File_to_Check}`` in avpattern_params is replaced by the files
+to scan, see :class:`av_check.Anti_Virus`.
+
+**Unit Test Module:** test_manage_av_pattern.py
+
+*External dependencies*
+
+    xfero
+      get_conf (xfero.db.manage_av_pattern)
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import sqlite3 as lite
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
+import logging.config
+from xfero import log_config
+
+def create_XFERO_AV_Pattern(avpattern_product, avpattern_pattern_name,
+                           avpattern_params, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```create_XFERO_AV_Pattern``` is a script to insert a row into
+    the XFERO_AV_Pattern table.
+
+    It performs the following SQL statement:
+
+    ```'INSERT INTO XFERO_AV_Pattern VALUES(NULL, ?, ?, ?)',
+    (avpattern_product,avpattern_pattern_name, avpattern_params)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```create_XFERO_AV_Pattern(avpattern_product, avpattern_pattern_name,
+    avpattern_params)```
+
+    :param avpattern_product: Name of AV Product
+    :param avpattern_pattern_name: Pattern name
+    :param avpattern_params: Contains the command line of the AV product
+    :returns: Row Inserted
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('INSERT INTO XFERO_AV_Pattern VALUES(NULL, ?, ?, ?)',
+                    (avpattern_product, avpattern_pattern_name,
+                     avpattern_params))
+        con.commit()
+
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Inserting row into XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    # return cur
+    cur.close()
+
+    return 'Row Inserted'
+
+
+def read_XFERO_AV_Pattern(avpattern_id, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```read_XFERO_AV_Pattern``` is a script to retrieve a specific
+    row from the XFERO_AV_Pattern table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT * FROM XFERO_AV_Pattern
+    WHERE avpattern_id=?', (avpattern_id,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```read_XFERO_AV_Pattern(avpattern_id)```
+
+    :param avpattern_id: Primary Key ID which identifies the row to retrieve
+    :returns: rows: A Tuple of the selected rows.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute(
+            'SELECT * FROM XFERO_AV_Pattern \
+            WHERE avpattern_id=?', (avpattern_id,))
+
+    except lite.Error as err:
+
+        logger.error('Error Selecting row from XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchone()
+
+    cur.close()
+
+    return rows
+
+
+def read_with_name_XFERO_AV_Pattern(avpattern_pattern_name, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```read_with_name_XFERO_AV_Pattern``` is a script to retrieve
+    a specific row from the XFERO_AV_Pattern table that matched the AV Pattern
+    Name supplied.
+
+    It performs the following SQL statement:
+
+    ```'SELECT avpattern_id, avpattern_product, avpattern_pattern_name,
+    avpattern_params  FROM XFERO_AV_Pattern
+    WHERE avpattern_pattern_name=?', (avpattern_pattern_name,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```read_XFERO_AV_Pattern(avpattern_pattern_name)```
+
+    :param avpattern_pattern_name: which identifies the row to retrieve
+    :returns: rows: A Tuple of the selected rows.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute(
+            'SELECT avpattern_id, \
+            avpattern_product, \
+            avpattern_pattern_name, \
+            avpattern_params  \
+            FROM XFERO_AV_Pattern \
+            WHERE avpattern_pattern_name=?', (avpattern_pattern_name,))
+
+    except lite.Error as err:
+
+        logger.error('Error Selecting row from XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchone()
+
+    cur.close()
+
+    return rows
+
+
+def update_XFERO_AV_Pattern(avpattern_id, avpattern_product,
+                           avpattern_pattern_name,
+                           avpattern_params, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```update_XFERO_AV_Pattern``` is a script to update a specific
+    row on the XFERO_AV_Pattern table.
+
+    It performs the following SQL statement:
+
+    ```cur.execute('UPDATE XFERO_AV_Pattern SET avpattern_product=?,
+    avpattern_pattern_name=?, avpattern_params=? WHERE avpattern_id=?',
+    (avpattern_product, avpattern_pattern_name, avpattern_params,
+    avpattern_id))```
+
+    **Usage Notes:**
+
+    *Example usage:*
+
+    ```'UPDATE XFERO_AV_Pattern SET avpattern_product=?,
+    avpattern_pattern_name=?, avpattern_params=?
+    WHERE avpattern_id=?', (avpattern_product, avpattern_pattern_name,
+    avpattern_params, avpattern_id)```
+
+    :param avpattern_id: Primary Key ID which identifies the row to retrieve
+    :param avpattern_product: Name of AV Product
+    :param avpattern_pattern_name: Pattern name
+    :param avpattern_params: Contains the command line of the AV product
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('UPDATE XFERO_AV_Pattern \
+        SET avpattern_product=?, \
+        avpattern_pattern_name=?, \
+        avpattern_params=? \
+        WHERE avpattern_id=?', (avpattern_product, avpattern_pattern_name,
+                                  avpattern_params, avpattern_id))
+
+        con.commit()
+
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Selecting row from XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def delete_XFERO_AV_Pattern(avpattern_id, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```delete_XFERO_AV_Pattern``` is a script to delete a specific
+    row from the XFERO_AV_Pattern table.
+
+    It performs the following SQL statement:
+
+    ```cur.execute('DELETE FROM XFERO_AV_Pattern
+    WHERE avpattern_id=?', (avpattern_id,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```delete_XFERO_AV_Pattern(avpattern_id)```
+
+    :param avpattern_id: Primary Key ID which identifies the row to delete
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute(
+            'DELETE FROM XFERO_AV_Pattern \
+            WHERE avpattern_id=?', (avpattern_id,))
+
+        con.commit()
+
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+        logger.error('Error deleting row from XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def list_XFERO_AV_Pattern(xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```list_XFERO_AV_Pattern``` is a script to retrieve all rows
+    from the XFERO_AV_Pattern table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT * FROM XFERO_AV_Pattern'```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```list_XFERO_AV_Pattern()```
+
+    :param NONE: No parameters are passed to this function
+    :returns: rows: Tuple containing the rows returned.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('SELECT * FROM XFERO_AV_Pattern')
+        con.commit()
+
+    except lite.Error as err:
+
+        logger.error('Error selecting rows from XFERO_AV_Pattern table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchall()
+
+    cur.close()
+
+    return rows
@@ -34,12 +34,19 @@ Module contains functions to manage the database table XFERO_Control
 | 16/10/2014 | Chris Falck | Updated because XFERO_Control table has changed to   |
 |            |             | add the column control_num_threads                |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 import os
 import sys
 
@@ -74,20 +81,20 @@ def create_XFERO_Control(control_status, control_key, control_passphrase,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('INSERT INTO XFERO_Control VALUES(NULL, ?, ?, ?, ?)',
@@ -105,7 +112,6 @@ def create_XFERO_Control(control_status, control_key, control_passphrase,
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -137,20 +143,20 @@ def read_XFERO_Control(control_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -170,7 +176,6 @@ def read_XFERO_Control(control_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -207,20 +212,20 @@ def read_XFERO_Control_monitor(control_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -234,7 +239,6 @@ def read_XFERO_Control_monitor(control_id, xfero_token=False):
 
     rows = cur.fetchone()
     cur.close()
-    con.close()
 
     return rows
 
@@ -266,20 +270,20 @@ def update_XFERO_Control(control_id, control_status, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -297,7 +301,6 @@ def update_XFERO_Control(control_id, control_status, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -336,20 +339,20 @@ def update_pgp_XFERO_Control(control_id, control_status, control_pgp_priv_key,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('UPDATE XFERO_Control \
@@ -376,7 +379,6 @@ def update_pgp_XFERO_Control(control_id, control_status, control_pgp_priv_key,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -406,20 +408,20 @@ def delete_XFERO_Control(control_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('DELETE FROM XFERO_Control WHERE control_id=?', (control_id,))
@@ -435,7 +437,6 @@ def delete_XFERO_Control(control_id, xfero_token=False):
         raise e
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -466,20 +467,20 @@ def list_XFERO_Control(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
@@ -504,7 +505,6 @@ def list_XFERO_Control(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -534,20 +534,20 @@ def list_XFERO_All_Control(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT * FROM XFERO_Control')
@@ -564,7 +564,6 @@ def list_XFERO_All_Control(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
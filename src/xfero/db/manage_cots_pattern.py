@@ -33,12 +33,19 @@ Module contains functions to manage the database table XFERO_COTS_Pattern
 | 12/05/2014 | Chris Falck | New element passed on queue 'xfero_token'. Used in   |
 |            |             | Logging.                                          |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 
 def create_XFERO_COTS_Pattern(cotspattern_product, cotspattern_pattern_name,
                            cotspattern_prototype, xfero_token=False):
@@ -71,20 +78,20 @@ def create_XFERO_COTS_Pattern(cotspattern_product, cotspattern_pattern_name,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('INSERT INTO XFERO_COTS_Pattern VALUES(NULL, ?, ?, ?)',
@@ -103,7 +110,6 @@ def create_XFERO_COTS_Pattern(cotspattern_product, cotspattern_pattern_name,
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -134,20 +140,20 @@ def read_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -163,7 +169,6 @@ def read_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -195,20 +200,20 @@ def read_cpn_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -223,7 +228,6 @@ def read_cpn_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -256,20 +260,20 @@ def read_with_name_XFERO_COTS_Pattern(cotspattern_pattern_name, xfero_token=Fals
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -289,7 +293,6 @@ def read_with_name_XFERO_COTS_Pattern(cotspattern_pattern_name, xfero_token=Fals
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -329,20 +332,20 @@ def update_XFERO_COTS_Pattern(cotspattern_id, cotspattern_product,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('UPDATE XFERO_COTS_Pattern \
@@ -364,7 +367,6 @@ def update_XFERO_COTS_Pattern(cotspattern_id, cotspattern_product,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -395,20 +397,20 @@ def delete_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -426,7 +428,6 @@ def delete_XFERO_COTS_Pattern(cotspattern_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -456,20 +457,20 @@ def list_XFERO_COTS_Pattern(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT * FROM XFERO_COTS_Pattern')
@@ -484,7 +485,6 @@ def list_XFERO_COTS_Pattern(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -514,20 +514,20 @@ def list_all_patterns_XFERO_COTS_Pattern(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT cotspattern_pattern_name FROM XFERO_COTS_Pattern')
@@ -542,7 +542,6 @@ def list_all_patterns_XFERO_COTS_Pattern(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -37,12 +37,19 @@ External dependencies
 +------------+-------------+---------------------------------------------------+
 | 27/10/2014 | Chris Falck | modified call to get_conf                         |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 import os
 import sys
 
@@ -78,20 +85,20 @@ def create_XFERO_Function(function_name, function_class, function_description,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('INSERT INTO XFERO_Function VALUES(NULL, ?, ?, ?, ?)',
@@ -110,7 +117,6 @@ def create_XFERO_Function(function_name, function_class, function_description,
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -140,20 +146,20 @@ def read_XFERO_Function(function_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -166,7 +172,6 @@ def read_XFERO_Function(function_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -197,20 +202,20 @@ def read_with_name_XFERO_Function(function_name, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -223,7 +228,6 @@ def read_with_name_XFERO_Function(function_name, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -263,20 +267,20 @@ def update_XFERO_Function(function_id, function_class, function_name,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('UPDATE XFERO_Function \
@@ -297,7 +301,6 @@ def update_XFERO_Function(function_id, function_class, function_name,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -328,20 +331,20 @@ def delete_XFERO_Function(function_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -356,7 +359,6 @@ def delete_XFERO_Function(function_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -386,20 +388,20 @@ def list_XFERO_Function(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT * FROM XFERO_Function')
@@ -439,20 +441,20 @@ def list_fname_XFERO_Function(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT function_name, function_class FROM XFERO_Function')
@@ -39,12 +39,19 @@ Module contains functions to manage the database table XFERO_Partner
 +------------+-------------+---------------------------------------------------+
 | 28/04/2015 | Chris Falck | Added support for eNDI and UTM functionality      |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 
 def create_XFERO_Partner(partner_service_name, partner_service_description,
                       partner_COTS_type, partner_remote_system_id, partner_code,
@@ -131,20 +138,20 @@ def create_XFERO_Partner(partner_service_name, partner_service_description,
     +------------+-------------+-----------------------------------------------+
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('INSERT INTO XFERO_Partner \
@@ -176,7 +183,6 @@ def create_XFERO_Partner(partner_service_name, partner_service_description,
 
     # return cur
     cur.close()
-    con.close()
 
     return inserted_id
 
@@ -206,20 +212,20 @@ def read_XFERO_Partner(partner_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -232,7 +238,6 @@ def read_XFERO_Partner(partner_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -263,20 +268,20 @@ def read_psn_XFERO_Partner(partner_service_name, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -291,7 +296,6 @@ def read_psn_XFERO_Partner(partner_service_name, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -365,20 +369,20 @@ def update_XFERO_Partner(partner_id, partner_service_name,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('UPDATE XFERO_Partner \
@@ -419,7 +423,6 @@ def update_XFERO_Partner(partner_id, partner_service_name,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -449,20 +452,20 @@ def delete_XFERO_Partner(partner_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('DELETE FROM XFERO_Partner WHERE partner_id=?', (partner_id,))
@@ -477,7 +480,6 @@ def delete_XFERO_Partner(partner_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -507,20 +509,20 @@ def list_XFERO_Partner(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT * FROM XFERO_Partner')
@@ -535,7 +537,6 @@ def list_XFERO_Partner(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -565,20 +566,20 @@ def list_service_name_XFERO_Partner(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT partner_service_name FROM XFERO_Partner')
@@ -592,7 +593,6 @@ def list_service_name_XFERO_Partner(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
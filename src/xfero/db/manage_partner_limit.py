@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+
+'''
+**Purpose**
+
+Module contains functions to manage the database table XFERO_Partner_Limit
+
+Each row holds the limits applied by the xfer scheduler to transfers to a
+partner:
+
++-----------------------------+------------------------------------------------+
+| Column                      | Description                                    |
++=============================+================================================+
+| partner_limit_partner       | partner_id from the XFERO_Partner table        |
++-----------------------------+------------------------------------------------+
+| partner_limit_max_xfers     | Maximum number of files being transferred to   |
+|                             | the partner at once. NULL or 0 for no limit    |
++-----------------------------+------------------------------------------------+
+| partner_limit_bytes_per_sec | Bandwidth shared by all transfers to the       |
+|                             | partner. NULL or 0 for no limit                |
++-----------------------------+------------------------------------------------+
+
+A partner without a row has no limits.
+
+**Unit Test Module:** test_manage_partner_limit.py
+
+*External dependencies*
+
+    xfero
+      get_conf (xfero.db.manage_partner_limit)
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import sqlite3 as lite
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
+import logging.config
+from xfero import log_config
+
+
+def create_XFERO_Partner_Limit(partner_limit_partner, partner_limit_max_xfers,
+                               partner_limit_bytes_per_sec, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```create_XFERO_Partner_Limit``` is a script to insert a row
+    into the XFERO_Partner_Limit table.
+
+    It performs the following SQL statement:
+
+    ```'INSERT INTO XFERO_Partner_Limit VALUES(?, ?, ?)',
+    (partner_limit_partner, partner_limit_max_xfers,
+    partner_limit_bytes_per_sec)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```create_XFERO_Partner_Limit(partner_id, 2, 1048576)```
+
+    :param partner_limit_partner: partner_id of the partner
+    :param partner_limit_max_xfers: Maximum concurrent transfers or None
+    :param partner_limit_bytes_per_sec: Maximum bytes per second or None
+    :returns: Row Inserted
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('INSERT INTO XFERO_Partner_Limit VALUES(?, ?, ?)',
+                    (partner_limit_partner, partner_limit_max_xfers,
+                     partner_limit_bytes_per_sec))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Inserting row into XFERO_Partner_Limit table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Row Inserted'
+
+
+def read_XFERO_Partner_Limit(partner_limit_partner, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```read_XFERO_Partner_Limit``` is a script to retrieve the
+    limits of a partner from the XFERO_Partner_Limit table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT partner_limit_partner, partner_limit_max_xfers,
+    partner_limit_bytes_per_sec FROM XFERO_Partner_Limit
+    WHERE partner_limit_partner=?', (partner_limit_partner,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```read_XFERO_Partner_Limit(partner_id)```
+
+    :param partner_limit_partner: partner_id of the partner
+    :returns: rows: A Tuple of the selected row.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute(
+            'SELECT partner_limit_partner, partner_limit_max_xfers, \
+            partner_limit_bytes_per_sec \
+            FROM XFERO_Partner_Limit \
+            WHERE partner_limit_partner=?', (partner_limit_partner,))
+    except lite.Error as err:
+
+        logger.error('Error Selecting row from XFERO_Partner_Limit table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchone()
+
+    cur.close()
+
+    return rows
+
+
+def update_XFERO_Partner_Limit(partner_limit_partner, partner_limit_max_xfers,
+                               partner_limit_bytes_per_sec, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```update_XFERO_Partner_Limit``` is a SQL update script to
+    update the limits of a partner in the XFERO_Partner_Limit table.
+
+    It performs the following SQL statement:
+
+    ```'UPDATE XFERO_Partner_Limit SET partner_limit_max_xfers=?,
+    partner_limit_bytes_per_sec=? WHERE partner_limit_partner=?',
+    (partner_limit_max_xfers, partner_limit_bytes_per_sec,
+    partner_limit_partner)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```update_XFERO_Partner_Limit(partner_id, 4, None)```
+
+    :param partner_limit_partner: partner_id of the partner
+    :param partner_limit_max_xfers: Maximum concurrent transfers or None
+    :param partner_limit_bytes_per_sec: Maximum bytes per second or None
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('UPDATE XFERO_Partner_Limit SET partner_limit_max_xfers=?, \
+        partner_limit_bytes_per_sec=? WHERE partner_limit_partner=?',
+                    (partner_limit_max_xfers, partner_limit_bytes_per_sec,
+                     partner_limit_partner))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Updating row on XFERO_Partner_Limit table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def delete_XFERO_Partner_Limit(partner_limit_partner, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```delete_XFERO_Partner_Limit``` is a script to remove the
+    limits of a partner from the XFERO_Partner_Limit table.
+
+    It performs the following SQL statement:
+
+    ```'DELETE FROM XFERO_Partner_Limit WHERE partner_limit_partner=?',
+    (partner_limit_partner,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```delete_XFERO_Partner_Limit(partner_id)```
+
+    :param partner_limit_partner: partner_id of the partner
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute(
+            'DELETE FROM XFERO_Partner_Limit WHERE partner_limit_partner=?',
+            (partner_limit_partner,))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error deleting row on XFERO_Partner_Limit table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def list_XFERO_Partner_Limit(xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```list_XFERO_Partner_Limit``` is a script to retrieve all
+    rows from the XFERO_Partner_Limit table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT partner_limit_partner, partner_limit_max_xfers,
+    partner_limit_bytes_per_sec FROM XFERO_Partner_Limit'```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```list_XFERO_Partner_Limit()```
+
+    :param NONE: No parameters are passed to this function
+    :returns: rows: A Tuple of the selected rows.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('SELECT partner_limit_partner, partner_limit_max_xfers, \
+        partner_limit_bytes_per_sec FROM XFERO_Partner_Limit')
+    except lite.Error as err:
+
+        logger.error('Error Selecting row on XFERO_Partner_Limit table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchall()
+
+    cur.close()
+
+    return rows
@@ -43,12 +43,19 @@ Module contains functions to manage the database table XFERO_Priority
 | 16/10/2014 | Chris Falck | Updated because XFERO_Priority table has changed to  |
 |            |             | remove the column priority_worker_threads         |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 
 def create_XFERO_Priority(priority_level, priority_detail, xfero_token=False):
     '''
@@ -77,20 +84,20 @@ def create_XFERO_Priority(priority_level, priority_detail, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('INSERT INTO XFERO_Priority VALUES(?, ?)',
@@ -107,7 +114,6 @@ def create_XFERO_Priority(priority_level, priority_detail, xfero_token=False):
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -138,20 +144,20 @@ def read_XFERO_Priority(priority_level, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -167,7 +173,6 @@ def read_XFERO_Priority(priority_level, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -198,20 +203,20 @@ def read_XFERO_Priority_level(priority_detail, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT priority_level from XFERO_Priority \
@@ -225,7 +230,6 @@ def read_XFERO_Priority_level(priority_detail, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -258,20 +262,20 @@ def update_XFERO_Priority(priority_level, priority_detail, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('UPDATE XFERO_Priority SET priority_detail=?, \
@@ -288,7 +292,6 @@ def update_XFERO_Priority(priority_level, priority_detail, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -318,20 +321,20 @@ def delete_XFERO_Priority(priority_level, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -347,7 +350,6 @@ def delete_XFERO_Priority(priority_level, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -377,20 +379,20 @@ def list_XFERO_Priority(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute('SELECT * FROM XFERO_Priority')
@@ -404,7 +406,6 @@ def list_XFERO_Priority(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -434,20 +435,20 @@ def list_XFERO_Priority_detail(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -463,7 +464,6 @@ def list_XFERO_Priority_detail(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -493,20 +493,20 @@ def list_XFERO_Priority_Asc(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         cur.execute(
@@ -522,7 +522,6 @@ def list_XFERO_Priority_Asc(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
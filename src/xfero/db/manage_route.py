@@ -38,12 +38,19 @@ Module contains functions to manage the database table XFERO_Route
 +------------+-------------+---------------------------------------------------+
 | 16/10/2014 | Chris Falck | Created a new function called count_XFERO_Route      |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
-from /xfero/ import get_conf as get_conf
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
 import logging.config
+from xfero import log_config
 
 def create_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
                     route_priority, xfero_token=False):
@@ -76,20 +83,20 @@ def create_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -110,7 +117,6 @@ def create_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
 
     # return cur
     cur.close()
-    con.close()
 
     return inserted_id
 
@@ -140,13 +146,13 @@ def read_XFERO_Route(route_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -155,7 +161,7 @@ def read_XFERO_Route(route_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         # con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -168,7 +174,6 @@ def read_XFERO_Route(route_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -205,13 +210,13 @@ def update_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -220,7 +225,7 @@ def update_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -240,7 +245,6 @@ def update_XFERO_Route(route_monitoreddir, route_filenamepattern, route_active,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -270,13 +274,13 @@ def delete_XFERO_Route(route_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -285,7 +289,7 @@ def delete_XFERO_Route(route_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -301,7 +305,6 @@ def delete_XFERO_Route(route_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -331,13 +334,13 @@ def list_XFERO_Route(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -346,7 +349,7 @@ def list_XFERO_Route(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -359,7 +362,6 @@ def list_XFERO_Route(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -389,13 +391,13 @@ def list_XFERO_Route_Priority_Route(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -404,7 +406,7 @@ def list_XFERO_Route_Priority_Route(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -417,7 +419,6 @@ def list_XFERO_Route_Priority_Route(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -446,13 +447,13 @@ def list_XFERO_Route_Active(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -461,7 +462,7 @@ def list_XFERO_Route_Active(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -478,7 +479,6 @@ def list_XFERO_Route_Active(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -509,13 +509,13 @@ def count_XFERO_Route_Priority(priority, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -524,7 +524,7 @@ def count_XFERO_Route_Priority(priority, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -539,7 +539,6 @@ def count_XFERO_Route_Priority(priority, xfero_token=False):
     count = cur.fetchone()[0]
 
     cur.close()
-    con.close()
     return count
 
 
@@ -568,13 +567,13 @@ def count_XFERO_Route(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -583,7 +582,7 @@ def count_XFERO_Route(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -596,7 +595,6 @@ def count_XFERO_Route(xfero_token=False):
     count = cur.fetchone()[0]
 
     cur.close()
-    con.close()
     return count
 
 if __name__ == '__main__':
@@ -39,12 +39,19 @@ Module contains functions to manage the database table XFERO_Workflow
 +------------+-------------+---------------------------------------------------+
 | 27/10/2014 | Chris Falck | modified call to get_conf                         |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
+from xfero.db import connection as db_connection
 import logging.config
-from /xfero/ import get_conf as get_conf
+from xfero import log_config
+from xfero import get_conf as get_conf
 
 
 def create_XFERO_Workflow_Item(workflow_item_route, workflow_item_class,
@@ -82,13 +89,13 @@ def create_XFERO_Workflow_Item(workflow_item_route, workflow_item_class,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -97,7 +104,7 @@ def create_XFERO_Workflow_Item(workflow_item_route, workflow_item_class,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -119,7 +126,6 @@ def create_XFERO_Workflow_Item(workflow_item_route, workflow_item_class,
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -150,13 +156,13 @@ def read_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -165,7 +171,7 @@ def read_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -181,7 +187,6 @@ def read_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -213,13 +218,13 @@ def select_max_XFERO_Workflow_Item(workflow_item_route, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -228,7 +233,7 @@ def select_max_XFERO_Workflow_Item(workflow_item_route, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -244,7 +249,6 @@ def select_max_XFERO_Workflow_Item(workflow_item_route, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -288,13 +292,13 @@ def update_XFERO_Workflow_Item(workflow_item_id, workflow_item_route,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -303,7 +307,7 @@ def update_XFERO_Workflow_Item(workflow_item_id, workflow_item_route,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -326,7 +330,6 @@ def update_XFERO_Workflow_Item(workflow_item_id, workflow_item_route,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -357,13 +360,13 @@ def delete_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -372,7 +375,7 @@ def delete_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -390,7 +393,6 @@ def delete_XFERO_Workflow_Item(workflow_item_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -420,13 +422,13 @@ def list_XFERO_Workflow_Item(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -435,7 +437,7 @@ def list_XFERO_Workflow_Item(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -450,7 +452,6 @@ def list_XFERO_Workflow_Item(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -485,13 +486,13 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order(workflow_item_route,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -500,7 +501,7 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order(workflow_item_route,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         cur = con.execute("pragma foreign_keys=ON")
         # cur = con.execute("pragma foreign_keys=OFF")
@@ -519,7 +520,6 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order(workflow_item_route,
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -554,13 +554,13 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor(workflow_item_route,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -569,7 +569,7 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor(workflow_item_route,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         con.row_factory = lite.Row
         cur = con.execute("pragma foreign_keys=ON")
@@ -590,7 +590,6 @@ def list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor(workflow_item_route,
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -35,12 +35,22 @@ Module contains functions to manage the database table XFERO_Workflow
 +------------+-------------+---------------------------------------------------+
 | 27/10/2014 | Chris Falck | modified call to get_conf                         |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Connections are obtained from db.connection, which|
+|            |             | holds a persistent connection per thread in WAL   |
+|            |             | mode. Connections are no longer closed by each    |
+|            |             | function.                                         |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | join_xfer_partner also returns the partner        |
+|            |             | connection settings and cotspattern_product       |
++------------+-------------+---------------------------------------------------+
 
 '''
 
 import sqlite3 as lite
+from xfero.db import connection as db_connection
 import logging.config
-from /xfero/ import get_conf as get_conf
+from xfero import log_config
+from xfero import get_conf as get_conf
 
 def create_XFERO_Xfer(xfer_route, xfer_cotspattern, xfer_partner, xfer_cmd,
                    xfer_params, xfer_delsrc='No', xfero_token=False):
@@ -76,13 +86,13 @@ def create_XFERO_Xfer(xfer_route, xfer_cotspattern, xfer_partner, xfer_cmd,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -91,7 +101,7 @@ def create_XFERO_Xfer(xfer_route, xfer_cotspattern, xfer_partner, xfer_cmd,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -111,7 +121,6 @@ def create_XFERO_Xfer(xfer_route, xfer_cotspattern, xfer_partner, xfer_cmd,
 
     # return cur
     cur.close()
-    con.close()
 
     return 'Row Inserted'
 
@@ -139,13 +148,13 @@ def read_XFERO_Xfer(xfer_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -154,7 +163,7 @@ def read_XFERO_Xfer(xfer_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -167,7 +176,6 @@ def read_XFERO_Xfer(xfer_id, xfero_token=False):
     rows = cur.fetchone()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -207,13 +215,13 @@ def update_XFERO_Xfer(xfer_id, xfer_route, xfer_cotspattern, xfer_partner,
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -222,7 +230,7 @@ def update_XFERO_Xfer(xfer_id, xfer_route, xfer_cotspattern, xfer_partner,
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -242,7 +250,6 @@ def update_XFERO_Xfer(xfer_id, xfer_route, xfer_cotspattern, xfer_partner,
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -271,13 +278,13 @@ def delete_XFERO_Xfer(xfer_id, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -286,7 +293,7 @@ def delete_XFERO_Xfer(xfer_id, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -301,7 +308,6 @@ def delete_XFERO_Xfer(xfer_id, xfero_token=False):
         raise err
 
     cur.close()
-    con.close()
 
     return 'Success'
 
@@ -331,13 +337,13 @@ def list_XFERO_Xfer(xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -346,7 +352,7 @@ def list_XFERO_Xfer(xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -360,7 +366,6 @@ def list_XFERO_Xfer(xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -391,13 +396,13 @@ def list_XFERO_Xfer_Route(xfer_route, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -406,7 +411,7 @@ def list_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -422,7 +427,6 @@ def list_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -452,13 +456,13 @@ def list_all_XFERO_Xfer_Route(xfer_route, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -467,7 +471,7 @@ def list_all_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -480,7 +484,6 @@ def list_all_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
@@ -510,13 +513,13 @@ def count_XFERO_Xfer_Route(xfer_route, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -525,7 +528,7 @@ def count_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
@@ -539,7 +542,6 @@ def count_XFERO_Xfer_Route(xfer_route, xfero_token=False):
     count = cur.fetchone()[0]
 
     cur.close()
-    con.close()
 
     return count
 
@@ -550,17 +552,24 @@ def join_xfer_partner(xfer_route, xfero_token=False):
     **Purpose:**
 
     The function ```join_xfer_partner``` is a script which selects items from a
-    2 table join of the XFERO_Xfer and XFERO_Partner table.
+    3 table join of the XFERO_Xfer, XFERO_Partner and XFERO_COTS_Pattern
+    tables.
 
     It performs the following SQL statement:
 
     ```'SELECT xfer_id, xfer_route, xfer_cotspattern, xfer_partner, xfer_cmd,
-    xfer_params, xfer_delsrc partner_service_name FROM XFERO_Xfer, XFERO_Partner
-    WHERE xfer_route=? AND xfer_partner = partner_id', (xfer_route,)```
+    xfer_params, xfer_delsrc, partner_service_name, partner_remote_system_id,
+    partner_control_port, partner_remote_user, partner_remote_password,
+    partner_CA_certificate, partner_cert_bundle, cotspattern_product
+    FROM XFERO_Xfer JOIN XFERO_Partner ON xfer_partner = partner_id
+    LEFT JOIN XFERO_COTS_Pattern ON xfer_cotspattern = cotspattern_id
+    WHERE xfer_route=?', (xfer_route,)```
 
     **Usage Notes:**
 
-    None
+    The partner connection settings and the COTS pattern product are used by
+    the in-process transfer engines. cotspattern_product is None if the xfer
+    does not reference a COTS pattern.
 
     *Example usage:*
 
@@ -571,13 +580,13 @@ def join_xfer_partner(xfer_route, xfero_token=False):
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('database')
 
@@ -586,16 +595,20 @@ def join_xfer_partner(xfer_route, xfero_token=False):
     db_location = xfero_database
 
     try:
-        con = lite.connect(db_location)
+        con = db_connection.get_connection(db_location)
         cur = con.cursor()
         con.row_factory = lite.Row
         # cur = con.execute("pragma foreign_keys=ON")
         cur = con.execute("pragma foreign_keys=OFF")
         cur.execute(
             'SELECT xfer_id, xfer_route, xfer_cotspattern, xfer_partner, \
-            xfer_cmd, xfer_params, xfer_delsrc, partner_service_name \
-            FROM XFERO_Xfer, XFERO_Partner WHERE xfer_route=? \
-            AND xfer_partner = partner_id', (xfer_route,))
+            xfer_cmd, xfer_params, xfer_delsrc, partner_service_name, \
+            partner_remote_system_id, partner_control_port, \
+            partner_remote_user, partner_remote_password, \
+            partner_CA_certificate, partner_cert_bundle, cotspattern_product \
+            FROM XFERO_Xfer JOIN XFERO_Partner ON xfer_partner = partner_id \
+            LEFT JOIN XFERO_COTS_Pattern ON xfer_cotspattern = cotspattern_id \
+            WHERE xfer_route=?', (xfer_route,))
     except lite.Error as err:
         logger.error('Error selecting row from table join between XFERO_Xfer & \
         XFERO_Partner table: %s. (XFERO_Token=%s)', err.args[0], xfero_token)
@@ -604,7 +617,6 @@ def join_xfer_partner(xfer_route, xfero_token=False):
     rows = cur.fetchall()
 
     cur.close()
-    con.close()
 
     return rows
 
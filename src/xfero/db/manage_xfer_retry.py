@@ -0,0 +1,493 @@
+#!/usr/bin/env python
+
+'''
+**Purpose**
+
+Module contains functions to manage the database table XFERO_Xfer_Retry
+
+Each row is a transfer of a file to one destination (an XFERO_Xfer row) which
+has failed and is scheduled to be retried:
+
++-------------------------+----------------------------------------------------+
+| Column                  | Description                                        |
++=========================+====================================================+
+| retry_id                | Primary key                                        |
++-------------------------+----------------------------------------------------+
+| retry_route             | route_id of the route                              |
++-------------------------+----------------------------------------------------+
+| retry_xfer              | xfer_id of the destination                         |
++-------------------------+----------------------------------------------------+
+| retry_partner           | partner_id of the destination                      |
++-------------------------+----------------------------------------------------+
+| retry_priority          | Priority of the route when the file was found      |
++-------------------------+----------------------------------------------------+
+| retry_file              | Copy of the file held for the retry                |
++-------------------------+----------------------------------------------------+
+| retry_original_filename | Original file name                                 |
++-------------------------+----------------------------------------------------+
+| retry_token             | XFERO Token of the file                            |
++-------------------------+----------------------------------------------------+
+| retry_attempts          | Number of failed attempts                          |
++-------------------------+----------------------------------------------------+
+| retry_next_attempt      | Time of the next attempt, seconds since the epoch  |
++-------------------------+----------------------------------------------------+
+| retry_last_error        | Result of the last failed attempt                  |
++-------------------------+----------------------------------------------------+
+
+**Unit Test Module:** test_manage_xfer_retry.py
+
+*External dependencies*
+
+    xfero
+      get_conf (xfero.db.manage_xfer_retry)
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import sqlite3 as lite
+from xfero.db import connection as db_connection
+from xfero import get_conf as get_conf
+import logging.config
+from xfero import log_config
+
+
+def create_XFERO_Xfer_Retry(retry_route, retry_xfer, retry_partner,
+                            retry_priority, retry_file,
+                            retry_original_filename, retry_token,
+                            retry_attempts, retry_next_attempt,
+                            retry_last_error, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```create_XFERO_Xfer_Retry``` is a script to insert a row into
+    the XFERO_Xfer_Retry table.
+
+    It performs the following SQL statement:
+
+    ```'INSERT INTO XFERO_Xfer_Retry VALUES(NULL, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+    ?)', (retry_route, retry_xfer, retry_partner, retry_priority, retry_file,
+    retry_original_filename, retry_token, retry_attempts, retry_next_attempt,
+    retry_last_error)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```create_XFERO_Xfer_Retry(route_id, xfer_id, partner_id, priority,
+    retry_file, original_filename, xfero_token, 1, next_attempt, 'RC 7')```
+
+    :param retry_route: route_id of the route
+    :param retry_xfer: xfer_id of the destination
+    :param retry_partner: partner_id of the destination
+    :param retry_priority: Priority of the route
+    :param retry_file: Copy of the file held for the retry
+    :param retry_original_filename: Original file name
+    :param retry_token: XFERO Token of the file
+    :param retry_attempts: Number of failed attempts
+    :param retry_next_attempt: Time of the next attempt
+    :param retry_last_error: Result of the last failed attempt
+    :returns: Row Inserted
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('INSERT INTO XFERO_Xfer_Retry VALUES(NULL, ?, ?, ?, ?, ?, \
+        ?, ?, ?, ?, ?)', (retry_route, retry_xfer, retry_partner,
+                          retry_priority, retry_file, retry_original_filename,
+                          retry_token, retry_attempts, retry_next_attempt,
+                          retry_last_error))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Inserting row into XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Row Inserted'
+
+
+def read_XFERO_Xfer_Retry(retry_id, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```read_XFERO_Xfer_Retry``` is a script to retrieve a specific
+    row from the XFERO_Xfer_Retry table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT * FROM XFERO_Xfer_Retry WHERE retry_id=?', (retry_id,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```read_XFERO_Xfer_Retry(retry_id)```
+
+    :param retry_id: Primary Key ID which identifies the row to retrieve
+    :returns: rows: A Tuple of the selected row.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('SELECT * FROM XFERO_Xfer_Retry WHERE retry_id=?',
+                    (retry_id,))
+    except lite.Error as err:
+
+        logger.error('Error Selecting row from XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchone()
+
+    cur.close()
+
+    return rows
+
+
+def update_XFERO_Xfer_Retry(retry_id, retry_attempts, retry_next_attempt,
+                            retry_last_error, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```update_XFERO_Xfer_Retry``` is a SQL update script to record
+    a further failed attempt on the XFERO_Xfer_Retry table.
+
+    It performs the following SQL statement:
+
+    ```'UPDATE XFERO_Xfer_Retry SET retry_attempts=?, retry_next_attempt=?,
+    retry_last_error=? WHERE retry_id=?', (retry_attempts, retry_next_attempt,
+    retry_last_error, retry_id)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```update_XFERO_Xfer_Retry(retry_id, 2, next_attempt, 'RC 7')```
+
+    :param retry_id: Primary Key ID which identifies the row to update
+    :param retry_attempts: Number of failed attempts
+    :param retry_next_attempt: Time of the next attempt
+    :param retry_last_error: Result of the last failed attempt
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('UPDATE XFERO_Xfer_Retry SET retry_attempts=?, \
+        retry_next_attempt=?, retry_last_error=? WHERE retry_id=?',
+                    (retry_attempts, retry_next_attempt, retry_last_error,
+                     retry_id))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Updating row on XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def update_XFERO_Xfer_Retry_Next_Attempt(retry_id, retry_next_attempt,
+                                         xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```update_XFERO_Xfer_Retry_Next_Attempt``` is a SQL update
+    script to change the time of the next attempt on the XFERO_Xfer_Retry
+    table, without recording a failed attempt.
+
+    It performs the following SQL statement:
+
+    ```'UPDATE XFERO_Xfer_Retry SET retry_next_attempt=? WHERE retry_id=?',
+    (retry_next_attempt, retry_id)```
+
+    **Usage Notes:**
+
+    Used to lease a row while its retry is in progress, and to defer a retry
+    while the partner's circuit breaker is open.
+
+    *Example usage:*
+
+    ```update_XFERO_Xfer_Retry_Next_Attempt(retry_id, time.time() + 3600)```
+
+    :param retry_id: Primary Key ID which identifies the row to update
+    :param retry_next_attempt: Time of the next attempt
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('UPDATE XFERO_Xfer_Retry SET retry_next_attempt=? \
+        WHERE retry_id=?', (retry_next_attempt, retry_id))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error Updating row on XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def delete_XFERO_Xfer_Retry(retry_id, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```delete_XFERO_Xfer_Retry``` is a script to delete a specific
+    row from the XFERO_Xfer_Retry table.
+
+    It performs the following SQL statement:
+
+    ```'DELETE FROM XFERO_Xfer_Retry WHERE retry_id=?', (retry_id,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```delete_XFERO_Xfer_Retry(retry_id)```
+
+    :param retry_id: Primary Key ID which identifies the row to delete
+    :returns: Success
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('DELETE FROM XFERO_Xfer_Retry WHERE retry_id=?',
+                    (retry_id,))
+        con.commit()
+    except lite.Error as err:
+
+        if con:
+            con.rollback()
+
+        logger.error('Error deleting row on XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    cur.close()
+
+    return 'Success'
+
+
+def list_XFERO_Xfer_Retry(xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```list_XFERO_Xfer_Retry``` is a script to retrieve all rows
+    from the XFERO_Xfer_Retry table.
+
+    It performs the following SQL statement:
+
+    ```'SELECT * FROM XFERO_Xfer_Retry'```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```list_XFERO_Xfer_Retry()```
+
+    :param NONE: No parameters are passed to this function
+    :returns: rows: A Tuple of the selected rows.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('SELECT * FROM XFERO_Xfer_Retry')
+    except lite.Error as err:
+
+        logger.error('Error Selecting row on XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchall()
+
+    cur.close()
+
+    return rows
+
+
+def list_XFERO_Xfer_Retry_Due(retry_next_attempt, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    The function ```list_XFERO_Xfer_Retry_Due``` is a script to retrieve the
+    rows from the XFERO_Xfer_Retry table which are due to be retried, in
+    priority order.
+
+    It performs the following SQL statement:
+
+    ```'SELECT * FROM XFERO_Xfer_Retry WHERE retry_next_attempt<=?
+    ORDER BY retry_priority ASC, retry_next_attempt ASC',
+    (retry_next_attempt,)```
+
+    **Usage Notes:**
+
+    None
+
+    *Example usage:*
+
+    ```list_XFERO_Xfer_Retry_Due(time.time())```
+
+    :param retry_next_attempt: Current time
+    :returns: rows: A Tuple of the selected rows.
+
+    '''
+    try:
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('database')
+
+    db_location = xfero_database
+
+    try:
+        con = db_connection.get_connection(db_location)
+        cur = con.cursor()
+        cur = con.execute("pragma foreign_keys=ON")
+        cur.execute('SELECT * FROM XFERO_Xfer_Retry \
+        WHERE retry_next_attempt<=? \
+        ORDER BY retry_priority ASC, retry_next_attempt ASC',
+                    (retry_next_attempt,))
+    except lite.Error as err:
+
+        logger.error('Error Selecting row on XFERO_Xfer_Retry table: %s. \
+        (XFERO_Token=%s)', err.args[0], xfero_token)
+        raise err
+
+    rows = cur.fetchall()
+
+    cur.close()
+
+    return rows
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+'''
+Directory notification module
+'''
+
+import os
+import select
+import struct
+import ctypes
+import ctypes.util
+
+# inotify event masks (see <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+EVENT_HEADER = struct.Struct('iIII')
+
+
+class Notify(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`dirnotify.Notify` class subscribes to file arrival events on a
+    set of directories using the Linux inotify interface. It allows the monitor
+    to be told about a file as soon as it has been written to a monitored
+    directory rather than waiting for the next scheduled scan.
+
+    Only two events are reported:
+
+    * IN_CLOSE_WRITE - a file opened for writing in the directory was closed
+    * IN_MOVED_TO - a file was renamed or moved into the directory
+
+    Both indicate that a complete file is available for processing. Events for
+    sub-directories are ignored.
+
+    If the kernel event queue overflows, events will have been lost. In this
+    case the ``overflow`` attribute is set to True and the caller is expected
+    to perform a full scan of its directories before resetting the flag.
+
+    **Usage Notes:**
+
+    inotify is only available on Linux. On other platforms an OSError is raised
+    when the object is initialised, and the caller should fall back to periodic
+    scanning of the directories.
+
+    *Example usage:*
+
+    ```with Notify() as notify:```
+        ```notify.add('/xfero/WIN1')```
+        ```for dirname, filename in notify.read(1.0):```
+            ```print(dirname, filename)```
+
+    :param none: This class takes no parameters
+    :returns: A list of (directory, filename) tuples from the read method
+
+    **Unit Test Module:** test_dirnotify.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_dirnotify                          |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self):
+        '''
+        Initialise the inotify instance. Raises OSError if inotify is not
+        available on this platform.
+        '''
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise OSError(2, 'Unable to locate libc - inotify unavailable')
+
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError(38, 'inotify is not supported on this platform')
+
+        self.libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        self.watches = {}
+        self.overflow = False
+        self.poller = select.poll()
+        self.poller.register(self.fd, select.POLLIN)
+
+    def add(self, dirname):
+        '''
+        Add a directory to the set of watched directories. Adding a directory
+        that is already watched has no effect.
+        '''
+        if dirname in self.watches.values():
+            return
+
+        wdesc = self.libc.inotify_add_watch(
+            self.fd, os.fsencode(dirname), IN_CLOSE_WRITE | IN_MOVED_TO)
+        if wdesc < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), dirname)
+
+        self.watches[wdesc] = dirname
+
+    def remove(self, dirname):
+        '''
+        Remove a directory from the set of watched directories.
+        '''
+        for wdesc, watched in list(self.watches.items()):
+            if watched == dirname:
+                self.libc.inotify_rm_watch(self.fd, wdesc)
+                del self.watches[wdesc]
+
+    def read(self, timeout=None):
+        '''
+        Wait up to timeout seconds for events and return a list of
+        (directory, filename) tuples for files that have arrived.
+        '''
+        if timeout is not None:
+            timeout = int(timeout * 1000)
+
+        if not self.poller.poll(timeout):
+            return []
+
+        try:
+            buf = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+
+        arrived = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buf):
+            wdesc, mask, cookie, length = EVENT_HEADER.unpack_from(buf, offset)
+            offset += EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b'\0')
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                self.overflow = True
+                continue
+
+            if mask & IN_IGNORED:
+                # Watched directory was removed or unmounted
+                self.watches.pop(wdesc, None)
+                continue
+
+            if mask & IN_ISDIR or not name or wdesc not in self.watches:
+                continue
+
+            arrived.append((self.watches[wdesc], os.fsdecode(name)))
+
+        return arrived
+
+    def close(self):
+        '''
+        Close the inotify instance. All watches are released.
+        '''
+        if self.fd >= 0:
+            self.poller.unregister(self.fd)
+            os.close(self.fd)
+            self.fd = -1
+            self.watches = {}
+
+    def __enter__(self):
+        '''
+        Activated when used in the with statement.
+        '''
+        return self
+
+    def __exit__(self, typeof, value, traceback):
+        '''
+        Activated at the end of the with statement. Closes the inotify
+        instance.
+        '''
+        self.close()
@@ -92,6 +92,55 @@ def get_xfero_config():
     return (log, xfero_db, outbound_directory, transient_directory,
             error_directory, xfero_pid)
 
+
+def get_xfero_option(section, option, default=None):
+
+    '''
+
+    **Purpose:**
+
+    Retrieve an optional xfero Configuration variable. Optional variables
+    tune XFERO and need not be present in the configuration file.
+
+    *Example usage:*
+
+    ```xfer_fanout = int(get_conf.get_xfero_option('settings', 'xfer_fanout',
+                                                   4))```
+
+    :param section: Section of the configuration file
+    :param option: Name of the variable
+    :param default: Value returned if the variable is not set
+    :returns: The value of the variable as a string, or default
+
+    **Unit Test Module:** None
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    try:
+        xfero_conf = os.environ['XFERO_CONFIG']
+    except KeyError as err:
+        print('Environment Variable XFERO_CONFIG is not set: Error %s' % err)
+        raise err
+
+    config = configparser.RawConfigParser()
+
+    try:
+        config.read(xfero_conf)
+    except configparser.Error as err:
+        print('Config Parser exception: Error %s' % err)
+        raise err
+
+    if not config.has_option(section, option):
+        return default
+
+    return config.get(section, option)
+
 if __name__ == "__main__":
 
     (xferologger, xferodatabase, outbounddirectory,
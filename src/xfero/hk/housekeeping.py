@@ -60,16 +60,17 @@ def delete_old_files(purge_dir, fn_pattern, num_days, subdir):
     import time
     import re
     import logging.config
-    import /xfero/.get_conf as get_conf
+    from xfero import log_config
+    import xfero.get_conf as get_conf
 
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger# create logger
     logger = logging.getLogger('housekeeping')
 
@@ -0,0 +1,307 @@
+#!/usr/bin/env python
+'''
+Queue based logging configuration
+'''
+
+import atexit
+import logging
+import logging.config
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import threading
+
+# Logging configuration for this process
+LISTENER = None
+CONFIGURED = None
+CONFIG_LOCK = threading.Lock()
+
+# Queue on which a workflow pool process sends its records to the parent, and
+# the listener in the parent which logs them
+WORKER_QUEUE = None
+WORKER_LISTENER = None
+
+
+class Routing_Queue_Handler(logging.handlers.QueueHandler):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`log_config.Routing_Queue_Handler` class puts records to the
+    logging queue, tagged with the route which identifies the handlers the
+    record is written to by the :class:`log_config.Routing_Queue_Listener`.
+
+    :param log_queue: The logging queue
+    :param route: Key of the handlers configured for the logger
+
+    '''
+
+    def __init__(self, log_queue, route):
+        '''init'''
+        logging.handlers.QueueHandler.__init__(self, log_queue)
+        self.route = route
+
+    def prepare(self, record):
+        '''
+        Prepare the record for the queue and tag it with the route.
+        '''
+        record = logging.handlers.QueueHandler.prepare(self, record)
+        record.xfero_route = self.route
+        return record
+
+
+class Routing_Queue_Listener(logging.handlers.QueueListener):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`log_config.Routing_Queue_Listener` class takes records from the
+    logging queue on its own thread and writes each record to the handlers
+    for its route.
+
+    :param log_queue: The logging queue
+    :param routes: Dictionary of route to the handlers for the route
+
+    '''
+
+    def __init__(self, log_queue, routes):
+        '''init'''
+        handlers = []
+        for route_handlers in routes.values():
+            for handler in route_handlers:
+                if handler not in handlers:
+                    handlers.append(handler)
+
+        logging.handlers.QueueListener.__init__(
+            self, log_queue, *handlers)
+        self.routes = routes
+
+    def handle(self, record):
+        '''
+        Write the record to the handlers for its route.
+        '''
+        record = self.prepare(record)
+        for handler in self.routes.get(getattr(record, 'xfero_route', None),
+                                       ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+class Worker_Queue_Listener(logging.handlers.QueueListener):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`log_config.Worker_Queue_Listener` class takes the records sent
+    by the workflow pool processes on its own thread and logs each to the
+    logger of the same name in this process, so that they are written by the
+    handlers of this process.
+
+    :param log_queue: The multiprocessing queue the records are sent on
+
+    '''
+
+    def handle(self, record):
+        '''
+        Log the record to the logger of the same name.
+        '''
+        logging.getLogger(record.name).handle(record)
+
+
+def configure(xfero_logger):
+    '''
+
+    **Purpose:**
+
+    Configure logging for this process from the XFERO logging configuration
+    file, once.
+
+    Previously each function called ```logging.config.fileConfig``` on every
+    call. This re-parsed the configuration file, closed and reopened every
+    log file and held the logging module lock while doing so, blocking any
+    other thread that was logging.
+
+    The configuration file is now read on the first call only. The handlers
+    it defines are then moved behind a single queue. Each logger is given a
+    :class:`log_config.Routing_Queue_Handler`, which only puts the record to
+    the queue, and a :class:`log_config.Routing_Queue_Listener` thread writes
+    each record to the handlers configured for its logger. The file I/O for
+    the workflow, xfer, monitor and ftstats loggers, and all others, is
+    therefore carried out off the threads doing the work.
+
+    **Usage Notes:**
+
+    Subsequent calls return immediately. A call in a forked child process
+    configures logging again for that process.
+
+    A workflow pool process, started with ```init_worker```, does not write
+    to the log files itself. Each of the handlers would otherwise rotate the
+    same file as the parent and the other pool processes at midnight. Its
+    records are instead sent on a multiprocessing queue to the parent, which
+    logs them to its own loggers.
+
+    The listener is stopped, and queued records written, when the process
+    exits.
+
+    *Example usage:*
+
+    ```log_config.configure(xfero_logger)```
+    ```logger = logging.getLogger('workflow')```
+
+    :param xfero_logger: Location of the logging configuration file
+    :returns: None
+
+    **Unit Test Module:** test_log_config.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Send the records of pool processes to the     |
+    |            |             | parent                                        |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    global LISTENER, CONFIGURED
+
+    if CONFIGURED == os.getpid():
+        return
+
+    with CONFIG_LOCK:
+        if CONFIGURED == os.getpid():
+            return
+
+        if LISTENER is not None and LISTENER.owner == os.getpid():
+            LISTENER.stop()
+        LISTENER = None
+
+        logging.config.fileConfig(xfero_logger)
+
+        loggers = [logging.getLogger()]
+        loggers.extend(logger for logger in
+                       list(logging.Logger.manager.loggerDict.values())
+                       if isinstance(logger, logging.Logger))
+
+        if WORKER_QUEUE is not None:
+            # Every record propagates to the root logger, which sends it to
+            # the parent once
+            for logger in loggers:
+                for handler in logger.handlers:
+                    handler.close()
+                logger.handlers = []
+                logger.propagate = True
+            loggers[0].addHandler(logging.handlers.QueueHandler(WORKER_QUEUE))
+            CONFIGURED = os.getpid()
+            return
+
+        log_queue = queue.SimpleQueue()
+        routes = {}
+        queue_handlers = {}
+
+        for logger in loggers:
+            handlers = [handler for handler in logger.handlers
+                        if not isinstance(handler, Routing_Queue_Handler)]
+            if not handlers:
+                continue
+
+            route = tuple(id(handler) for handler in handlers)
+            if route not in routes:
+                routes[route] = tuple(handlers)
+                queue_handlers[route] = Routing_Queue_Handler(log_queue, route)
+
+            logger.handlers = [queue_handlers[route]]
+
+        LISTENER = Routing_Queue_Listener(log_queue, routes)
+        LISTENER.owner = os.getpid()
+        LISTENER.start()
+
+        CONFIGURED = os.getpid()
+
+
+def worker_queue():
+    '''
+
+    **Purpose:**
+
+    Return the queue on which the workflow pool processes send their records
+    to this process, starting the listener which logs them on first use.
+
+    *Example usage:*
+
+    ```log_queue = log_config.worker_queue()```
+
+    :returns: multiprocessing Queue
+
+    '''
+    global WORKER_LISTENER
+
+    with CONFIG_LOCK:
+        if WORKER_LISTENER is None or WORKER_LISTENER.owner != os.getpid():
+            WORKER_LISTENER = Worker_Queue_Listener(
+                multiprocessing.get_context('spawn').Queue())
+            WORKER_LISTENER.owner = os.getpid()
+            WORKER_LISTENER.start()
+        return WORKER_LISTENER.queue
+
+
+def init_worker(log_queue, xfero_logger):
+    '''
+
+    **Purpose:**
+
+    Configure logging for a workflow pool process, sending its records on
+    the queue returned by ```worker_queue``` in the parent.
+
+    *Example usage:*
+
+    ```log_config.init_worker(log_queue, xfero_logger)```
+
+    :param log_queue: The queue returned by worker_queue
+    :param xfero_logger: Location of the logging configuration file
+    :returns: None
+
+    '''
+    global WORKER_QUEUE, CONFIGURED
+
+    with CONFIG_LOCK:
+        WORKER_QUEUE = log_queue
+        CONFIGURED = None
+    configure(xfero_logger)
+
+
+def stop():
+    '''
+
+    **Purpose:**
+
+    Stop the listener thread, writing any records still queued.
+
+    *Example usage:*
+
+    ```log_config.stop()```
+
+    :returns: None
+
+    '''
+    global LISTENER, WORKER_LISTENER, CONFIGURED
+
+    with CONFIG_LOCK:
+        # The records from the pool processes are logged before the
+        # listener which writes them is stopped
+        if (WORKER_LISTENER is not None and
+                WORKER_LISTENER.owner == os.getpid()):
+            WORKER_LISTENER.stop()
+        WORKER_LISTENER = None
+        if LISTENER is not None and LISTENER.owner == os.getpid():
+            LISTENER.stop()
+            for handler in LISTENER.handlers:
+                handler.flush()
+        LISTENER = None
+        CONFIGURED = None
+
+atexit.register(stop)
@@ -3,11 +3,9 @@
 Directory Monitor module
 '''
 
-from queue import PriorityQueue
-# from queue import Queue
 import logging.config
+from xfero import log_config
 import os
-import re
 import time
 import sys
 import uuid
@@ -16,9 +14,16 @@ from xfero import get_conf as get_conf
 from xfero.db import manage_route as db_route
 from xfero.db import manage_control as db_control
 from xfero.workflow_manager.copy_file import Copy_File
-from xfero.workflow import Workflow_Thread
-from xfero.xfer import Xfer_Thread
+from xfero import pipeline
 from xfero.dirlock import Lock as dirlock
+from xfero import dirnotify
+from xfero import route_matcher
+from xfero import route_plan
+
+# Seconds between checks of XFERO_Control for a stop request (dirwatch)
+CONTROL_INTERVAL = 5
+# Seconds to wait for directory events before re-checking (dirwatch)
+EVENT_WAIT = 1.0
 
 
 def dirmon():
@@ -32,18 +37,21 @@ def dirmon():
 
     It is also responsible for starting workflow and xfer worker threads, so
     first it needs to access the XFERO_Control table to get the number of threads
-    it is required to startup.
-
-    It then create 2 Priority Queues which are used to allocate work items to
-    the Workflow threads and the Xfer threads.
+    it is required to startup. The threads, and the 2 Priority Queues which are
+    used to allocate work items to them, are held by a resident
+    :class:`pipeline.Pipeline` which is started by the first firing of the
+    monitor and reused by every subsequent firing.
 
     Next active routes are retrieved from the XFERO_Route table and a lock acquired
     on the monitored directory to ensure that other instances of xfero running on
     another node can not access the directory.
 
-    A list of files that match the filename pattern is retrieved. If no files
-    are found to match the pattern, the monitor task will process the next route
-    record. Once the rows are exhausted the monitor will simply terminate.
+    Routes which share a monitored directory are grouped together so that each
+    directory is listed only once. Each file found is matched against the
+    filename patterns of all of the routes for the directory in a single pass
+    by a :class:`route_matcher.Route_Matcher`. Where more than one route
+    matches, the route with the highest priority wins. Once the directories
+    are exhausted the monitor will simply terminate.
 
     When files are found, they will be moved to a transient directory in
     readiness for processing.
@@ -53,17 +61,17 @@ def dirmon():
 
     **Usage Notes:**
 
-    Creates queues, starts output and worker processes and puts workflow tasks
-    to the input queue.
+    Puts workflow tasks to the input queue of the resident pipeline.
 
-    It creates the input and output queues. These are Priority Queues, with a
-    limit of 50% more than the number of workers to avoid locking up too much
-    memory in buffered objects.
+    The input and output queues are Priority Queues, with a limit of 50% more
+    than the number of workers to avoid locking up too much memory in buffered
+    objects.
 
     Workflow threads get from the input queue and put to the output queue. The
-    control thread then simply keeps the input queue loaded as long as long as
-    it has work to do before sending the None values required to shut the worker
-    threads down. Once the input queue is empty, the thread terminates.
+    monitor simply keeps the input queue loaded as long as it has work to do and
+    then returns without waiting for the work to complete, so work found by one
+    firing overlaps with the next. The worker threads are only shut down when
+    the scheduler receives a stop request and calls ```stop_pipeline```.
 
     *Example usage:*
 
@@ -83,7 +91,6 @@ def dirmon():
     *External dependencies:*
 
     os (xfero.monitor)
-    re (xfero.monitor)
     scandir (xfero.monitor)
     time (xfero.monitor)
     xfero
@@ -91,11 +98,13 @@ def dirmon():
       | \-manage_control (xfero.monitor)
       | \-manage_route (xfero.monitor)
       \-dirlock (xfero.monitor)
+      \-dirnotify (xfero.monitor)
       \-get_conf (xfero.monitor)
-      \-workflow (xfero.monitor)
+      \-pipeline (xfero.monitor)
+      \-route_matcher (xfero.monitor)
+      \-route_plan (xfero.monitor)
       \-workflow_manager
       | \-copy_file (xfero.monitor)
-      \-xfer (xfero.monitor)
 
     +------------+-------------+-----------------------------------------------+
     | Date       | Author      | Change Details                                |
@@ -140,6 +149,20 @@ def dirmon():
     |            |             | xfer threads.                                 |
     |            |             | [6] Remove parameters to dirmon function      |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Workflow and xfer threads are now resident in |
+    |            |             | pipeline.Pipeline and survive across firings  |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Group routes by monitored directory. List each|
+    |            |             | directory once and match all of its routes in |
+    |            |             | a single pass using route_matcher             |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Active routes are read from the route plan    |
+    |            |             | cache. dirwatch rescans when the config       |
+    |            |             | changes                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Logging is configured once per process by     |
+    |            |             | log_config                                    |
+    +------------+-------------+-----------------------------------------------+
     '''
     try:
         (xfero_logger,
@@ -147,15 +170,13 @@ def dirmon():
          outbound_directory,
          transient_directory,
          error_directory,
-         xfero_pid) = get_conf.get.xfero_config()
+         xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    done = (999, 'NONE')
-
     # logging.config.fileConfig(conf_dir + os.sep + 'logging.conf')
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('monitor')
 
@@ -191,49 +212,25 @@ def dirmon():
     # for item in row:
     workers = row[4]
 
-    # Create workflow and xfer queues
-    inq = PriorityQueue(maxsize=int(int(workers) * 1.5))
-    outq = PriorityQueue(maxsize=int(int(workers) * 1.5))
-
-    # creates and starts as many workflow and xfer threads as configured by
-    # the WORKERS constant
-    for i in range(workers):
-        w_thread = Workflow_Thread(inq, outq)
-        w_thread.start()
-
-        out_thread = Xfer_Thread(outq, outbound_directory)
-        out_thread.start()
+    # The workflow and xfer queues and threads are resident. They are started
+    # by the first firing of the monitor and reused by subsequent firings
+    pipe = pipeline.get_pipeline(workers, outbound_directory)
 
     # -------------
 
     try:
-        rows = db_route.list_XFERO_Route_Active()
+        rows = route_plan.get_cache().active_routes()
     except Exception as err:
         logger.error(
             'Unable to retrieve Routes from DB: Error %s',
             (err), exc_info=True)
         sys.exit(0)
 
-    # For each row retrieved from XFERO_Routes, the function interrogates the
-    # directory to get a list of files that match the filename pattern. If no
-    # matching files are found, the monitor task will process the next row.
-    # Once the rows are exhausted the monitor will simply terminate.
-    for route in rows:
-        # print('in route loop')
-        route_id = route['route_id']
-        route_monitoreddir = route['route_monitoreddir']
-        route_filenamepattern = route['route_filenamepattern']
-        route_active = route['route_active']
-        route_priority = route['route_priority']
-        logger.info(
-            'Processing: route_id = {0}, route_monitoreddir = {1}, \
-            route_filenamepattern = {2}, route_active = {3}, route_priority \
-            = {4}'.format(
-                route_id,
-                route_monitoreddir,
-                route_filenamepattern,
-                route_active,
-                route_priority))
+    # Routes are grouped by monitored directory. Each directory is listed once
+    # and each file found is matched against the filename patterns of all of
+    # the routes for the directory in a single pass. Once the directories are
+    # exhausted the monitor will simply terminate.
+    for route_monitoreddir, matcher in route_matcher.group_routes(rows).items():
 
         # interrogates the directory
         if os.path.isdir(route_monitoreddir) is False:
@@ -242,109 +239,428 @@ def dirmon():
                 route_monitoreddir)
             sys.exit(0)
 
-        # Acquire a lock in the directory
+        scan_directory(route_monitoreddir, matcher, pipe, transient_directory)
+
+    logger.debug("Monitor process terminating")
+
+
+def scan_directory(route_monitoreddir, matcher, inq, transient_directory):
+    '''
+
+    **Purpose:**
+
+    Perform a full scan of a monitored directory. A lock is acquired on the
+    monitored directory and the directory is listed once. Each file found is
+    matched against the filename patterns of every route monitoring the
+    directory and, if a route matches, passed to ```dispatch_file``` to be
+    queued for workflow processing.
+
+    **Usage Notes:**
+
+    Used by ```dirmon``` for each monitored directory and by ```dirwatch``` as
+    its periodic safety net scan.
+
+    *Example usage:*
+
+    ```scan_directory(route_monitoreddir, matcher, inq, transient_directory)```
+
+    :param route_monitoreddir: Monitored directory to scan
+    :param matcher: route_matcher.Route_Matcher for the routes monitoring the
+                    directory
+    :param inq: Workflow input queue
+    :param transient_directory: Directory files are moved to for processing
+    :returns: None
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created from the route loop in dirmon         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Scan once per directory rather than once per  |
+    |            |             | route, matching all routes in a single pass   |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Only a failure to acquire the lock is logged  |
+    |            |             | as such                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    logger = logging.getLogger('monitor')
+
+    for route in matcher.routes:
+        logger.info(
+            'Processing: route_id = {0}, route_monitoreddir = {1}, \
+            route_filenamepattern = {2}, route_active = {3}, route_priority \
+            = {4}'.format(
+                route['route_id'],
+                route['route_monitoreddir'],
+                route['route_filenamepattern'],
+                route['route_active'],
+                route['route_priority']))
+
+    for route in matcher.invalid:
+        logger.error(
+            'Invalid filename pattern %s on route_id %s... Skipping',
+            route['route_filenamepattern'], route['route_id'])
+
+    # Acquire a lock in the directory
+    lock = dirlock(route_monitoreddir + os.sep + "XFERO")
+    try:
+        lock.acquire()
+    except OSError:
+        logger.info('Unable to acquire a lock on %s', (route_monitoreddir))
+        return
+
+    try:
+        logger.info('Lock acquired.')
+        # Do something with the locked file
+
+        for found_file in scandir.scandir(route_monitoreddir):
+
+            fullpath = os.path.join(route_monitoreddir, found_file.name)
+
+            if found_file.is_dir():
+                logger.info(
+                    '%s is a directory... Skipping', fullpath)
+                continue
+
+            if found_file.is_symlink():
+                logger.info(
+                    '%s is a symbolic link... Skipping', fullpath)
+                continue
+
+            route = matcher.match(found_file.name)
+
+            if route is None:
+                logger.info('Pattern Not Matched: file %s', fullpath)
+                continue
+
+            dispatch_file(route, found_file.name, inq, transient_directory)
+    finally:
+        lock.unlock()
+
+
+def dispatch_file(route, found_name, inq, transient_directory):
+    '''
+
+    **Purpose:**
+
+    Process a single file found in the monitored directory of a route whose
+    filename pattern it has matched. An 'xfero_token' is generated, the file is
+    moved to the transient directory and the work item is put to the workflow
+    input queue.
+
+    **Usage Notes:**
+
+    The caller is responsible for holding the lock on the monitored directory
+    and for matching the file to the route.
+
+    *Example usage:*
+
+    ```dispatch_file(route, 'WIN1_Pattern.txt', inq, transient_directory)```
+
+    :param route: Row selected from the XFERO_Route table
+    :param found_name: Name of the file (no path) found in the directory
+    :param inq: Workflow input queue
+    :param transient_directory: Directory files are moved to for processing
+    :returns: True if the file was queued for processing, otherwise False
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created from the route loop in dirmon         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Pattern matching moved to Route_Matcher       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | A file which cannot be queued because the     |
+    |            |             | pipeline has stopped is moved back to the     |
+    |            |             | monitored directory                           |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    logger = logging.getLogger('monitor')
+
+    route_id = route['route_id']
+    route_monitoreddir = route['route_monitoreddir']
+    route_filenamepattern = route['route_filenamepattern']
+    route_priority = route['route_priority']
+
+    fullpath = os.path.join(route_monitoreddir, found_name)
+
+    xfero_token = uuid.uuid4()  # Generate random uuid token
+    # Store the matched filename
+    original_filename = fullpath
+
+    logger.info(
+        'Pattern Matched: %s with file %s (XFERO_Token=%s)',
+        route_filenamepattern, fullpath, xfero_token)
+
+    try:
+        logger_stats = logging.getLogger('ftstats')
+        logger_stats.info(
+            "File: %s - Last Modified: %s (XFERO_Token=%s)",
+            fullpath, \
+             time.ctime(os.path.getmtime(fullpath)), xfero_token)
+        logger_stats.info(
+            "File: %s - Created: %s (XFERO_Token=%s)",
+            fullpath, \
+             time.ctime(os.path.getctime(fullpath)), xfero_token)
+        logger_stats.info(
+            "File: %s - Size: %s (XFERO_Token=%s)",
+            fullpath, os.path.getsize(fullpath), xfero_token)
+    except OSError as err:
+        # File has already been taken by another monitor
+        logger.info(
+            'File %s no longer available: %s (XFERO_Token=%s)',
+            fullpath, err, xfero_token)
+        return False
+
+    logger.info(
+        'move %s to %s (XFERO_Token=%s)',
+        fullpath, transient_directory, xfero_token)
+
+    try:
+        rename_func = Copy_File()
+        working_file = rename_func.rename_file(
+            fullpath,
+            transient_directory +
+            os.sep +
+            found_name)
+    except Exception as err:
+        logger.error(
+            'Rename File %s to %s. Will retry next time \
+            monitor fires. Error: %s (XFERO_Token=%s)',
+            fullpath, transient_directory, err, xfero_token)
+        return False
+
+    # Inputs for workflow processing: route_id, file, & XFERO
+    # Token
+    work = (
+        route_priority,
+        route_id,
+        working_file,
+        original_filename,
+        xfero_token)
+    logger.debug(
+        'Work: %s - Work-Type: %s (XFERO_Token=%s)',
+        work, type(work), xfero_token)
+    try:
+        inq.put(work)
+    except RuntimeError as err:
+        # The pipeline has been stopped, so the file is returned to the
+        # monitored directory to be picked up when XFERO is restarted
+        logger.error(
+            'Unable to queue file %s for processing. Error: %s \
+            (XFERO_Token=%s)', fullpath, err, xfero_token)
         try:
-            with dirlock(route_monitoreddir + os.sep + "XFERO") as lock:
-                logger.info('Lock acquired.')
-                # Do something with the locked file
+            rename_func.rename_file(working_file, fullpath)
+        except Exception as err:
+            logger.error(
+                'Unable to return file %s to %s. Error: %s (XFERO_Token=%s)',
+                working_file, route_monitoreddir, err, xfero_token)
+        return False
 
-                for found_file in scandir.scandir(route_monitoreddir):
+    return True
 
-                    fullpath = os.path.join(route_monitoreddir, found_file.name)
 
-                    if found_file.is_dir():
-                        logger.info(
-                            '%s is a directory... Skipping', fullpath)
-                        continue
+def dirwatch(rescan_interval=60):
+    '''
 
-                    if found_file.is_symlink():
-                        logger.info(
-                            '%s is a symbolic link... Skipping', fullpath)
-                        continue
+    **Purpose:**
 
-                    logger.info(
-                        'Testing Pattern Match: %s on file %s',
-                        route_filenamepattern, fullpath)
+    This function initiates a long running, event driven monitor task. Rather
+    than listing every monitored directory each time the scheduler fires, it
+    subscribes to file arrival events (close-write and moved-to) on the
+    monitored directory of every active route using
+    :class:`dirnotify.Notify`. A file is matched against the route filename
+    patterns and put to the workflow input queue as soon as it lands.
 
-                    match = re.search(route_filenamepattern, found_file.name)
-                    if match is None:
-                        match = re.match(route_filenamepattern, found_file.name)
+    A full scan of every active route, identical to that performed by
+    ```dirmon```, is still carried out every ```rescan_interval``` seconds as
+    a safety net. This picks up files that were present before the watch was
+    established, files whose events were lost because the kernel event queue
+    overflowed, and any routes which have been added since the last scan.
+    Directories which no longer have an active route stop being watched.
 
-                    if match is None:
-                        logger.info(
-                            'Pattern Not Matched: %s with file %s',
-                            route_filenamepattern, fullpath)
-                        continue
+    The workflow and xfer threads of the resident :class:`pipeline.Pipeline`
+    are used, and are drained and shut down when the monitor stops.
+
+    **Usage Notes:**
+
+    The task runs until XFERO_Control.control_status is set to 'STOPPING' by
+    the stop_XFERO script, at which point the worker threads are shut down and
+    the function returns. It should be added to the XFERO_Scheduled_Task table
+    as ```monitor.dirwatch``` scheduled to fire once, in place of the
+    ```monitor.dirmon``` task. The rescan interval may be supplied as the
+    scheduled task argument.
+
+    On platforms without inotify the task degrades to scanning every
+    ```rescan_interval``` seconds.
 
-                    xfero_token = uuid.uuid4()  # Generate random uuid token
-                    # Store the matched filename
-                    original_filename = fullpath
-
-                    logger.info(
-                        'Pattern Matched: %s with file %s (XFERO_Token=%s)',
-                        route_filenamepattern, fullpath, xfero_token)
-
-                    logger_stats = logging.getLogger('ftstats')
-                    logger_stats.info(
-                        "File: %s - Last Modified: %s (XFERO_Token=%s)",
-                        fullpath, \
-                         time.ctime(os.path.getmtime(fullpath)), xfero_token)
-                    logger_stats.info(
-                        "File: %s - Created: %s (XFERO_Token=%s)",
-                        fullpath, \
-                         time.ctime(os.path.getctime(fullpath)), xfero_token)
-                    logger_stats.info(
-                        "File: %s - Size: %s (XFERO_Token=%s)",
-                        fullpath, os.path.getsize(fullpath), xfero_token)
-
-                    logger = logging.getLogger('monitor')
-                    logger.info(
-                        'move %s to %s (XFERO_Token=%s)',
-                        fullpath, transient_directory, xfero_token)
+    *Example usage:*
+
+    ```dirwatch(60)```
+
+    :param rescan_interval: Seconds between safety net full scans
+    :returns: None
 
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Remove the watches of deactivated routes      |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    try:
+        (xfero_logger,
+         xfero_database,
+         outbound_directory,
+         transient_directory,
+         error_directory,
+         xfero_pid) = get_conf.get_xfero_config()
+    except Exception as err:
+        print('Cannot get XFERO Config: %s' % err)
+        raise err
+
+    rescan_interval = float(rescan_interval)
+
+    log_config.configure(xfero_logger)
+    # create logger
+    logger = logging.getLogger('monitor')
+
+    try:
+        row = db_control.read_XFERO_Control(1)
+    except Exception as err:
+        logger.error(
+            'Unable to retrieve XFERO_Control from DB: Error %s',
+            (err), exc_info=True)
+        sys.exit(0)
+
+    workers = row[4]
+
+    pipe = pipeline.get_pipeline(workers, outbound_directory)
+
+    try:
+        notify = dirnotify.Notify()
+    except OSError as err:
+        logger.warning(
+            'Directory notification unavailable, falling back to scanning \
+            every %s seconds: %s', rescan_interval, err)
+        notify = None
+
+    matchers = {}
+    last_scan = 0
+    last_control = 0
+
+    while True:
+
+        now = time.time()
+
+        # Check for a request to stop
+        if now - last_control >= CONTROL_INTERVAL:
+            last_control = now
+            try:
+                control = db_control.read_XFERO_Control(1)
+            except Exception as err:
+                logger.error(
+                    'Unable to retrieve XFERO_Control from DB: Error %s',
+                    (err), exc_info=True)
+            else:
+                if control[1] == 'STOPPING':
+                    logger.info('Stop requested. Monitor shutting down')
+                    break
+
+            # A change to the configuration forces a full scan with the new
+            # routes
+            try:
+                if route_plan.get_cache().check():
+                    last_scan = 0
+            except Exception as err:
+                logger.error(
+                    'Unable to check the route plan cache: Error %s',
+                    (err), exc_info=True)
+
+        # Safety net - full scan of all routes
+        if now - last_scan >= rescan_interval or \
+            (notify is not None and notify.overflow):
+            last_scan = now
+            try:
+                matchers = route_matcher.group_routes(
+                    route_plan.get_cache().active_routes())
+            except Exception as err:
+                logger.error(
+                    'Unable to retrieve Routes from DB: Error %s',
+                    (err), exc_info=True)
+
+            if notify is not None:
+                notify.overflow = False
+                # Stop watching directories which no longer have an active
+                # route
+                for dirname in set(notify.watches.values()) - set(matchers):
+                    notify.remove(dirname)
+
+            for route_monitoreddir, matcher in matchers.items():
+                if os.path.isdir(route_monitoreddir) is False:
+                    logger.error(
+                        'Monitored Directory supplied is not a directory: %s',
+                        route_monitoreddir)
+                    continue
+
+                if notify is not None:
                     try:
-                        rename_func = Copy_File()
-                        working_file = rename_func.rename_file(
-                            fullpath,
-                            transient_directory +
-                            os.sep +
-                            found_file.name)
-                    except Exception as err:
+                        notify.add(route_monitoreddir)
+                    except OSError as err:
                         logger.error(
-                            'Rename File %s to %s. Will retry next time \
-                            monitor fires. Error: %s (XFERO_Token=%s)',
-                            working_file, transient_directory, err, xfero_token)
+                            'Unable to watch directory %s: Error %s',
+                            route_monitoreddir, err)
+
+                scan_directory(route_monitoreddir, matcher, pipe,
+                               transient_directory)
+
+        if notify is None:
+            time.sleep(min(CONTROL_INTERVAL, rescan_interval))
+            continue
+
+        # Wait for files to arrive
+        arrived = {}
+        for dirname, filename in notify.read(EVENT_WAIT):
+            arrived.setdefault(dirname, []).append(filename)
+
+        for dirname, filenames in arrived.items():
+            if dirname not in matchers:
+                continue
+            lock = dirlock(dirname + os.sep + "XFERO")
+            try:
+                lock.acquire()
+            except OSError:
+                logger.info('Unable to acquire a lock on %s', (dirname))
+                continue
+            try:
+                for filename in filenames:
+                    fullpath = os.path.join(dirname, filename)
+                    if not os.path.isfile(fullpath) or \
+                        os.path.islink(fullpath):
                         continue
+                    route = matchers[dirname].match(filename)
+                    if route is None:
+                        logger.info('Pattern Not Matched: file %s',
+                                    fullpath)
+                        continue
+                    dispatch_file(route, filename, pipe,
+                                  transient_directory)
+            finally:
+                lock.unlock()
+
+    if notify is not None:
+        notify.close()
 
-                    # Inputs for workflow processing: route_id, file, & XFERO
-                    # Token
-                    work = (
-                        route_priority,
-                        route_id,
-                        working_file,
-                        original_filename,
-                        xfero_token)
-                    logger.debug(
-                        'Work: %s - Work-Type: %s (XFERO_Token=%s)',
-                        work, type(work), xfero_token)
-                    inq.put(work)
-
-        except Exception:
-            logger.info('Unable to acquire a lock on %s', (route_monitoreddir))
-
-    # When work is done put None to the queue for each worker
-    for i in range(workers):
-        print('None to inq worker')
-
-        inq.put(done)
-    inq.join()
-    print('joined inq')
-    outq.join()
-    print('joined outq')
+    # Drain the queued work and shut the workers down
+    pipeline.stop_pipeline()
 
     logger.debug("Monitor process terminating")
-    print('end')
 
 if __name__ == '__main__':
 
     dirmon()
+    pipeline.stop_pipeline()
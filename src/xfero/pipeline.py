@@ -0,0 +1,221 @@
+#!/usr/bin/env python
+'''
+Resident workflow and xfer pipeline
+'''
+
+from queue import PriorityQueue
+import logging
+import threading
+from xfero.workflow import Workflow_Thread
+from xfero.xfer import Xfer_Thread
+from xfero.xfer_scheduler import Xfer_Scheduler
+from xfero.batcher import Batcher
+from xfero import workflow_pool
+from xfero import xfer_retry
+from xfero.xfer_engine import session_pool
+
+# The pipeline shared by every monitor firing in this process
+PIPELINE = None
+PIPELINE_LOCK = threading.Lock()
+
+
+class Pipeline(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`pipeline.Pipeline` class is a resident service holding the
+    workflow and xfer Priority Queues together with the pools of
+    Workflow_Thread and Xfer_Thread workers which service them.
+
+    The pools are started once and then accept work continuously from any
+    number of monitor firings. Work found by one firing of the monitor can
+    therefore still be in progress when the next firing starts adding work.
+
+    **Usage Notes:**
+
+    The queues are Priority Queues with a limit of 50% more than the number of
+    workers, as before, so that a monitor discovering a large batch of files
+    is held back rather than buffering them all in memory. The xfer queue is
+    an :class:`xfer_scheduler.Xfer_Scheduler`, which applies the limits of
+    each partner and hands the xfer threads work for partners which are
+    within them.
+
+    The workflow threads put their work to a :class:`batcher.Batcher`, which
+    gathers the files of routes with a Micro_Batch workflow item into batches
+    and passes all other work straight to the xfer queue.
+
+    A :class:`xfer_retry.Retry_Thread` puts failed transfers which are due to
+    be retried to the xfer queue, unless retries are disabled.
+
+    ```stop``` drains the pipeline gracefully. The retry thread is stopped
+    first, so retries which are not yet due remain scheduled in the database. A None work item is put to the
+    workflow queue for each worker, which is forwarded to the xfer queue once
+    the workflow thread has finished, and the method waits for all queued work
+    to complete before returning. Idle transfer sessions held by the
+    xfer_engine session pool are then closed and the processes of the
+    workflow_pool are stopped.
+
+    The number of workers is fixed when the pipeline is started. A change to
+    XFERO_Control.control_num_threads takes effect when XFERO is restarted.
+
+    *Example usage:*
+
+    ```pipe = get_pipeline(workers, outbound_directory)```
+    ```pipe.submit(work)```
+    ```stop_pipeline()```
+
+    :param workers: Number of workflow threads and number of xfer threads
+    :param outbound_directory: Outbound directory passed to the xfer threads
+
+    **Unit Test Module:** None
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The xfer queue is an Xfer_Scheduler           |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added the retry thread                        |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added the batcher                             |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The workflow_pool is stopped with the         |
+    |            |             | pipeline                                      |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, workers, outbound_directory):
+        '''init'''
+        self.workers = int(workers)
+        self.outbound_directory = outbound_directory
+        self.done = (999, 'NONE')
+        self.inq = PriorityQueue(maxsize=int(self.workers * 1.5))
+        self.outq = Xfer_Scheduler(maxsize=int(self.workers * 1.5))
+        self.batcher = Batcher(self.outq)
+        self.threads = []
+        self.retry_thread = None
+        self.running = False
+
+    def start(self):
+        '''
+        Create and start the workflow and xfer threads.
+        '''
+        logger = logging.getLogger('monitor')
+        logger.info('Starting pipeline with %s workers', self.workers)
+
+        self.batcher.start()
+
+        for i in range(self.workers):
+            w_thread = Workflow_Thread(self.inq, self.batcher)
+            w_thread.start()
+            self.threads.append(w_thread)
+
+            out_thread = Xfer_Thread(self.outq, self.outbound_directory)
+            out_thread.start()
+            self.threads.append(out_thread)
+
+        if xfer_retry.xfer_retries > 0:
+            self.retry_thread = xfer_retry.Retry_Thread(self.outq)
+            self.retry_thread.start()
+
+        self.running = True
+        return self
+
+    def submit(self, work):
+        '''
+        Put a work item to the workflow queue. Blocks while the queue is full.
+        '''
+        if not self.running:
+            raise RuntimeError('Pipeline is not running')
+        self.inq.put(work)
+
+    def put(self, work):
+        '''
+        Queue compatible alias for ```submit``` so that the pipeline can be
+        passed wherever the workflow input queue is expected.
+        '''
+        self.submit(work)
+
+    def stop(self):
+        '''
+        Drain the queues and shut the workers down.
+        '''
+        if not self.running:
+            return
+
+        logger = logging.getLogger('monitor')
+        logger.info('Stopping pipeline. Draining queued work')
+        self.running = False
+
+        if self.retry_thread is not None:
+            self.retry_thread.stop()
+            self.retry_thread = None
+
+        # When work is done put None to the queue for each worker
+        for i in range(self.workers):
+            self.inq.put(self.done)
+        self.inq.join()
+        self.batcher.stop()
+        self.outq.join()
+
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+        # Log out of any warm transfer sessions
+        session_pool.close_pool()
+
+        # Stop the processes running CPU bound workflow steps
+        workflow_pool.close_pool()
+
+        logger.info('Pipeline stopped')
+
+
+def get_pipeline(workers, outbound_directory):
+    '''
+
+    **Purpose:**
+
+    Return the pipeline for this process, starting it on first use.
+
+    *Example usage:*
+
+    ```pipe = get_pipeline(workers, outbound_directory)```
+
+    :param workers: Number of workers to start if the pipeline is not running
+    :param outbound_directory: Outbound directory passed to the xfer threads
+    :returns: The running :class:`pipeline.Pipeline`
+
+    '''
+    global PIPELINE
+
+    with PIPELINE_LOCK:
+        if PIPELINE is None or not PIPELINE.running:
+            PIPELINE = Pipeline(workers, outbound_directory).start()
+        return PIPELINE
+
+
+def stop_pipeline():
+    '''
+
+    **Purpose:**
+
+    Drain and stop the pipeline for this process, if one is running.
+
+    *Example usage:*
+
+    ```stop_pipeline()```
+
+    :returns: None
+
+    '''
+    global PIPELINE
+
+    with PIPELINE_LOCK:
+        if PIPELINE is not None:
+            PIPELINE.stop()
+            PIPELINE = None
@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+'''
+Route matching module
+'''
+
+import re
+
+
+class Route_Matcher(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`route_matcher.Route_Matcher` class matches file names against
+    the filename patterns of all of the routes which share a monitored
+    directory in a single pass, returning the winning route.
+
+    The routes are ordered by route_priority (1 being High) and then by
+    route_id. The filename patterns are compiled into a single regular
+    expression of the form:
+
+    ```(?:(?=.*?(?:pattern_1))(?P<r0>)|(?=.*?(?:pattern_2))(?P<r1>)|...)```
+
+    Each alternative is a look-ahead which succeeds wherever ```re.search```
+    on the original pattern would succeed. Alternatives are tried in order, so
+    the alternative which matches identifies the highest priority route whose
+    pattern matches the file name.
+
+    **Usage Notes:**
+
+    Patterns containing capture groups can not safely be combined, as any
+    back-references they contain would refer to the wrong group. Equally some
+    patterns, such as those with global inline flags part way through, fail
+    to compile when combined. In either case the matcher falls back to trying
+    each precompiled pattern in priority order, which gives the same result.
+
+    Routes whose filename pattern is not a valid regular expression are never
+    matched and are listed in the ```invalid``` attribute.
+
+    *Example usage:*
+
+    ```matcher = Route_Matcher(routes)```
+    ```route = matcher.match('WIN1_Pattern.txt')```
+
+    :param routes: Rows selected from the XFERO_Route table which share a
+                   monitored directory
+    :returns: The winning route row from the match method or None
+
+    **Unit Test Module:** test_route_matcher.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, routes):
+        '''init'''
+        self.routes = []
+        self.patterns = []
+        self.invalid = []
+        self.combined = None
+
+        for route in sorted(routes,
+                            key=lambda route: (int(route['route_priority']),
+                                               int(route['route_id']))):
+            try:
+                self.patterns.append(re.compile(route['route_filenamepattern']))
+            except re.error:
+                self.invalid.append(route)
+                continue
+            self.routes.append(route)
+
+        if not any(pattern.groups for pattern in self.patterns):
+            alternatives = [
+                '(?=[\\s\\S]*?(?:%s))(?P<r%d>)' % (pattern.pattern, index)
+                for index, pattern in enumerate(self.patterns)]
+            try:
+                self.combined = re.compile('(?:%s)' % '|'.join(alternatives))
+            except re.error:
+                self.combined = None
+
+    def match(self, filename):
+        '''
+        Return the highest priority route whose filename pattern matches the
+        supplied file name, or None if no route matches.
+        '''
+        if not self.routes:
+            return None
+
+        if self.combined is not None:
+            found = self.combined.match(filename)
+            if found is None:
+                return None
+            return self.routes[int(found.lastgroup[1:])]
+
+        for index, pattern in enumerate(self.patterns):
+            if pattern.search(filename) is not None:
+                return self.routes[index]
+
+        return None
+
+
+def group_routes(routes):
+    '''
+
+    **Purpose:**
+
+    Group routes by monitored directory and build a
+    :class:`route_matcher.Route_Matcher` for each directory.
+
+    *Example usage:*
+
+    ```matchers = group_routes(db_route.list_XFERO_Route_Active())```
+
+    :param routes: Rows selected from the XFERO_Route table
+    :returns: A dictionary of monitored directory to Route_Matcher, in the
+              order the directories were first seen
+
+    '''
+    grouped = {}
+    for route in routes:
+        grouped.setdefault(route['route_monitoreddir'], []).append(route)
+
+    return dict((dirname, Route_Matcher(dir_routes))
+                for dirname, dir_routes in grouped.items())
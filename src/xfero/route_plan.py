@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+'''
+Route plan cache
+'''
+
+import logging
+import sqlite3 as lite
+import threading
+from xfero import get_conf as get_conf
+from xfero import log_config
+from xfero.db import manage_partner_limit as db_partner_limit
+from xfero.db import manage_route as db_route
+from xfero.db import manage_workflow as db_workflow
+from xfero.db import manage_xfer as db_xfer
+from xfero.workflow_manager import filename_pipeline
+from xfero.workflow_manager import stream_filter
+from xfero.xfer_engine import engines
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+log_config.configure(xfero_logger)
+# create logger
+logger = logging.getLogger('workflow')
+
+# The route plan cache shared by every thread in this process
+CACHE = None
+CACHE_LOCK = threading.Lock()
+
+# Yes to apply the content steps at the end of a workflow as the file is
+# transferred, see stream_filter
+stream_xfer = get_conf.get_xfero_option('settings', 'stream_xfer', 'No')
+
+
+def streamable(xfer):
+    '''
+    Return True if the content steps at the end of the workflow can be
+    applied as the file is sent by the xfer rows: the file is sent to a
+    single destination, by an in-process engine or by curl reading the file
+    named by {File_to_Send_with_Path}.
+    '''
+    if stream_xfer != 'Yes' or len(xfer) != 1:
+        return False
+    row = xfer[0]
+    if engines.is_engine(row['cotspattern_product']):
+        return True
+    return row['xfer_cmd'] == 'curl' and \
+        '{File_to_Send_with_Path}' in (row['xfer_params'] or '')
+
+
+def is_split(row):
+    '''
+    Return True if the workflow item splits the file into pieces.
+    '''
+    return row['workflow_item_class'] == 'Split_File' and \
+        row['workflow_item_function_call'] == 'split_file'
+
+
+class Route_Plan(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`route_plan.Route_Plan` class holds everything needed to process
+    a file on a route: its workflow items in running order and its xfer rows
+    joined with the partner rows.
+
+    The workflow items are also held compiled as steps, in which each run of
+    consecutive filename only items is a single
+    :class:`filename_pipeline.Filename_Pipeline` and each run of consecutive
+    content items which can be applied to a stream is a single
+    :class:`stream_filter.Filter_Pipeline`.
+
+    When stream_xfer is Yes and the route has a single destination, the
+    content items at the end of the workflow which can be applied to a
+    stream are held in stream rather than in steps. They are applied by the
+    xfer thread as the file is sent, so compression or encryption overlaps
+    the upload. A route with a Micro_Batch item is not streamed, as the items
+    after it apply to the batch.
+
+    A Split_File split_file item is moved to the end of the workflow, so any
+    items configured after it are applied to the whole file before it is
+    split. The pieces and manifest are then sent as they were written, and
+    can be merged and verified by the receiver. A warning naming the route
+    and the items moved past is logged when the plan is built.
+
+    :param route_id: Route ID from the XFERO_Route table
+    :param workflow: Rows from list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor
+    :param xfer: Rows from join_xfer_partner
+
+    '''
+
+    def __init__(self, route_id, workflow, xfer):
+        '''init'''
+        self.route_id = route_id
+        self.workflow = tuple(
+            [row for row in workflow if not is_split(row)] +
+            [row for row in workflow if is_split(row)])
+        self.xfer = tuple(xfer)
+
+        workflow = tuple(workflow)
+        if self.workflow != workflow:
+            first = min(index for index, row in enumerate(workflow)
+                        if is_split(row))
+            logger.warning(
+                'Route %s: Split_File split_file moved to the end of the '
+                'workflow, after %s, which are applied to the whole file',
+                route_id, ', '.join(
+                    '%s %s' % (row['workflow_item_class'],
+                               row['workflow_item_function_call'])
+                    for row in workflow[first:] if not is_split(row)))
+
+        count = 0
+        if streamable(self.xfer) and not any(
+                row['workflow_item_class'] == 'Micro_Batch'
+                for row in self.workflow):
+            count = stream_filter.trailing_filters(self.workflow)
+        self.stream = self.workflow[len(self.workflow) - count:]
+        self.steps = stream_filter.compile_workflow(
+            filename_pipeline.compile_workflow(
+                self.workflow[:len(self.workflow) - count]))
+
+
+class Route_Plan_Cache(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`route_plan.Route_Plan_Cache` class holds the active routes and
+    a :class:`route_plan.Route_Plan` for each route in memory, so that the
+    XFERO_Workflow_Item and XFERO_Xfer/XFERO_Partner tables are queried once
+    per route rather than once for every file processed.
+
+    Change detection uses ```PRAGMA data_version``` on a connection which is
+    held open by the cache for that purpose only. SQLite changes the value
+    returned whenever another connection, in this or any other process (the
+    GUI, the data loader or stop_XFERO for example), commits a change to the
+    database. Checking costs a single pragma and no table access.
+
+    As the value also changes when the xfer threads record a retry, a change
+    is then confirmed by reading the XFERO_Config_Generation row, which is
+    bumped by triggers on the tables held in the cache only. When the
+    generation changes the whole cache is discarded and plans are reloaded as
+    they are next requested. A database created before the table was added
+    discards the cache on every change.
+
+    **Usage Notes:**
+
+    Plans are loaded on first use, so a file queued for a route which has
+    since been deactivated is still processed with the route as it is now
+    configured.
+
+    The data version is read before a plan is loaded. A change committed
+    while the plan is loading is therefore detected on the next request and
+    the plan is reloaded.
+
+    The limits from the XFERO_Partner_Limit table are cached in the same way
+    by ```partner_limits```. A database created before the table was added
+    has no limits.
+
+    The cache is safe to share between threads.
+
+    *Example usage:*
+
+    ```cache = get_cache()```
+    ```plan = cache.get(route_id)```
+    ```for workflow in plan.workflow:```
+
+    :param db_location: Location of the XFERO database. Defaults to the
+                        location in the XFERO configuration
+    :returns: Route_Plan from the get method
+
+    **Unit Test Module:** None
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added partner_limits                          |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Plans hold the workflow compiled as steps     |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Plans hold the content steps streamed by the  |
+    |            |             | xfer thread when stream_xfer is Yes           |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Consecutive content steps are compiled into   |
+    |            |             | one Filter_Pipeline                           |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Only discard the cache when the configuration |
+    |            |             | generation changes                            |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | A file is split by the last step of its plan  |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, db_location=None):
+        '''init'''
+        if db_location is None:
+            (xfero_logger, xfero_database, outbound_directory,
+             transient_directory, error_directory,
+             xfero_pid) = get_conf.get_xfero_config()
+            db_location = xfero_database
+
+        self.lock = threading.RLock()
+        self.con = lite.connect(db_location, check_same_thread=False)
+        self.data_version = None
+        self.config_generation = None
+        self.generation = 0
+        self.plans = {}
+        self.routes = None
+        self.limits = None
+
+    def check(self):
+        '''
+        Discard the cache if the configuration has changed since it was
+        loaded. Returns True if the cache was discarded.
+        '''
+        with self.lock:
+            data_version = self.con.execute(
+                'PRAGMA data_version').fetchone()[0]
+            if data_version == self.data_version:
+                return False
+            self.data_version = data_version
+
+            try:
+                config_generation = self.con.execute(
+                    'SELECT config_generation FROM XFERO_Config_Generation'
+                    ).fetchone()[0]
+            except lite.OperationalError:
+                config_generation = None
+            if config_generation is not None and \
+                config_generation == self.config_generation:
+                return False
+
+            self.config_generation = config_generation
+            self.generation += 1
+            self.plans = {}
+            self.routes = None
+            self.limits = None
+            return True
+
+    def active_routes(self, xfero_token=False):
+        '''
+        Return the active routes from the XFERO_Route table.
+        '''
+        with self.lock:
+            self.check()
+            if self.routes is None:
+                self.routes = tuple(db_route.list_XFERO_Route_Active(
+                    xfero_token))
+            return self.routes
+
+    def get(self, route_id, xfero_token=False):
+        '''
+        Return the Route_Plan for the route, loading it if required.
+        '''
+        route_id = str(route_id)
+
+        with self.lock:
+            self.check()
+            plan = self.plans.get(route_id)
+            if plan is None:
+                workflow = \
+                db_workflow.list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor(
+                    route_id, xfero_token)
+                xfer = db_xfer.join_xfer_partner(route_id, xfero_token)
+                plan = Route_Plan(route_id, workflow, xfer)
+                self.plans[route_id] = plan
+            return plan
+
+    def partner_limits(self, xfero_token=False):
+        '''
+        Return a dictionary of partner_id to a tuple of the maximum concurrent
+        transfers and bytes per second for the partner. None for no limit.
+        '''
+        with self.lock:
+            self.check()
+            if self.limits is None:
+                try:
+                    rows = db_partner_limit.list_XFERO_Partner_Limit(
+                        xfero_token)
+                except lite.OperationalError:
+                    rows = ()
+                self.limits = dict(
+                    (partner, (max_xfers or None, bytes_per_sec or None))
+                    for partner, max_xfers, bytes_per_sec in rows)
+            return self.limits
+
+    def close(self):
+        '''
+        Close the data version connection.
+        '''
+        with self.lock:
+            self.con.close()
+
+
+def get_cache():
+    '''
+
+    **Purpose:**
+
+    Return the route plan cache for this process, creating it on first use.
+
+    *Example usage:*
+
+    ```plan = get_cache().get(route_id)```
+
+    :returns: The :class:`route_plan.Route_Plan_Cache`
+
+    '''
+    global CACHE
+
+    with CACHE_LOCK:
+        if CACHE is None:
+            CACHE = Route_Plan_Cache()
+        return CACHE
@@ -6,12 +6,14 @@ CRON Like Scheduler module
 from apscheduler.scheduler import Scheduler
 from time import sleep
 import logging.config
+from xfero import log_config
 import signal
 import sys
 from xfero import monitor as monitor
+from xfero import pipeline
 from xfero import get_conf as get_conf
 from xfero.hk import housekeeping as housekeeping
-from xfero.stats import xfero_stats as.xfero_stats
+from xfero.stats import xfero_stats as xfero_stats
 from xfero.db import manage_schedule as db_schedule
 from xfero.db import manage_control as db_control
 
@@ -139,6 +141,8 @@ def schedule():
     +------------+-------------+-----------------------------------------------+
     | 27/10/2014 | Chris Falck | modified call to get_conf                     |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Drain the resident pipeline on shutdown       |
+    +------------+-------------+-----------------------------------------------+
 
     '''
     try:
@@ -147,12 +151,12 @@ def schedule():
          outbound_directory,
          transient_directory,
          error_directory,
-         xfero_pid) = get_conf.get.xfero_config()
+         xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
 
     # create logger
     logger = logging.getLogger('scheduler')
@@ -340,6 +344,10 @@ def schedule():
             logger.info('Scheduler is shutting down')
             sched.shutdown(0)
 
+            # Drain the resident workflow and xfer threads
+            logger.info('Waiting for queued work to complete')
+            pipeline.stop_pipeline()
+
             # Set XFERO_Control.control_status = 'STOPPED'
             try:
                 rows = db_control.update_XFERO_Control('1', 'STOPPED')
@@ -377,12 +385,12 @@ def listener(event):
          outbound_directory,
          transient_directory,
          error_directory,
-         xfero_pid) = get_conf.get.xfero_config()
+         xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s' % err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('scheduler')
     if event.exception:
@@ -1,7 +1,8 @@
 #!/usr/bin/env python
 ''' Boldon James Impart Transfer Details '''
 import logging.config
-import /xfero/.get_conf as get_conf
+from xfero import log_config
+import xfero.get_conf as get_conf
 import re
 import shutil
 import time
@@ -46,13 +47,13 @@ def collect():
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s', err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
 
     timestamp = time.time()
 
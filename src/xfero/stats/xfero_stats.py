@@ -2,7 +2,8 @@
 ''' XFERO Statistics '''
 import psutil
 import logging.config
-from /xfero/ import get_conf as get_conf
+from xfero import log_config
+from xfero import get_conf as get_conf
 
 def collect():
     '''
@@ -210,13 +211,13 @@ def collect():
 
     '''
     try:
-        (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-         error_directory, xfero_pid) = get_conf.get.xfero_config()
+        (xfero_logger, xfero_database, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
     except Exception as err:
         print('Cannot get XFERO Config: %s', err)
         raise err
 
-    logging.config.fileConfig(xfero_logger)
+    log_config.configure(xfero_logger)
     # create logger
     logger = logging.getLogger('sysinfo')
 
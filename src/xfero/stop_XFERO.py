@@ -49,17 +49,18 @@ a Scheduled Task from within the XFERO Scheduler.
 from time import sleep
 import psutil
 import logging.config
+from xfero import log_config
 from xfero import get_conf as get_conf
 from xfero.db import manage_control as db_control
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('stop_xfero')
 logger.info('XFERO Scheduler is shutting down...')
@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+'''Test AV Check'''
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+from xfero import workflow_pool
+from xfero.workflow_manager import av_check
+from xfero.workflow_manager.av_check import Anti_Virus
+
+# Stands in for an AV product. Each run appends the number of files it was
+# given to the runs file, and a file containing EICAR is reported as infected
+SCANNER = '''#!/bin/sh
+files=0
+status=0
+for arg; do
+    case "$arg" in
+        -*) ;;
+        *) files=$((files + 1))
+           if grep -q EICAR "$arg"; then echo "$arg: EICAR"; status=13; fi ;;
+    esac
+done
+echo $files >> "%s"
+exit $status
+'''
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Anti_Virus```
+
+    A shell script stands in for the AV product.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_not_cpu_bound                      |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create the stand-in scanner in a temporary directory. Each test has
+        its own scanner, and so its own batches and verdict cache.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.runs = os.path.join(self.tmpdir, 'runs')
+        scanner = os.path.join(self.tmpdir, 'scan.sh')
+        with open(scanner, 'w') as out:
+            out.write(SCANNER % self.runs)
+        os.chmod(scanner, stat.S_IRWXU)
+        self.command = scanner + ' -v {File_to_Check}'
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the temporary directory
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def make_file(self, name, data):
+        '''Create a file in the temporary directory'''
+        filename = os.path.join(self.tmpdir, name)
+        with open(filename, 'w') as out:
+            out.write(data)
+        return filename
+
+    def scanner_runs(self):
+        '''Return the number of files given to each run of the scanner'''
+        if not os.path.exists(self.runs):
+            return []
+        with open(self.runs) as infile:
+            return [int(line) for line in infile.read().split()]
+
+    def test_scan_command(self):
+        '''
+
+        **Purpose:**
+
+        Check that {File_to_Check} is replaced by every file, and that the
+        files are added to a command without it.
+
+        '''
+        files = ['/xfero/A', '/xfero/B']
+        self.assertEqual(
+            av_check.scan_command('uvscan -c -v {File_to_Check}', files),
+            ['uvscan', '-c', '-v', '/xfero/A', '/xfero/B'])
+        self.assertEqual(
+            av_check.scan_command('scan --file={File_to_Check} -q', files),
+            ['scan', '--file=/xfero/A', '--file=/xfero/B', '-q'])
+        self.assertEqual(av_check.scan_command('uvscan -c -v', files),
+                         ['uvscan', '-c', '-v', '/xfero/A', '/xfero/B'])
+
+    def test_av_check_clean(self):
+        '''
+
+        **Purpose:**
+
+        A clean file is passed on unchanged.
+
+        '''
+        filename = self.make_file('clean.txt', 'Clean data\n')
+        self.assertEqual(Anti_Virus().av_check(filename, self.command),
+                         filename)
+        self.assertEqual(self.scanner_runs(), [1])
+
+    def test_av_check_infected(self):
+        '''
+
+        **Purpose:**
+
+        An infected file raises an IOError.
+
+        '''
+        filename = self.make_file('infected.txt', 'EICAR test\n')
+        with self.assertRaises(IOError):
+            Anti_Virus().av_check(filename, self.command)
+
+    def test_av_check_batch(self):
+        '''
+
+        **Purpose:**
+
+        Files checked by several threads at once are scanned by one run of
+        the scanner, and only the infected file fails.
+
+        '''
+        av_check.get_scanner(self.command).batch_wait = 2
+        filenames = [self.make_file('file%s.txt' % num, 'Data %s\n' % num)
+                     for num in range(7)]
+        filenames.append(self.make_file('infected.txt', 'EICAR test\n'))
+
+        results = {}
+
+        def check(filename):
+            '''Check a file and record the outcome'''
+            try:
+                results[filename] = Anti_Virus().av_check(filename,
+                                                          self.command)
+            except IOError:
+                results[filename] = 'Infected'
+
+        threads = [threading.Thread(target=check, args=(filename,))
+                   for filename in filenames]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for filename in filenames[:-1]:
+            self.assertEqual(results[filename], filename)
+        self.assertEqual(results[filenames[-1]], 'Infected')
+
+        # The batch of eight is scanned once and then bisected to find the
+        # infected file
+        runs = self.scanner_runs()
+        self.assertEqual(runs[0], 8)
+        self.assertEqual(len(runs), 7)
+
+    def test_av_check_cached(self):
+        '''
+
+        **Purpose:**
+
+        A file with the same content as a clean file is not scanned again,
+        but an infected file is scanned every time.
+
+        '''
+        first = self.make_file('first.txt', 'Same data\n')
+        second = self.make_file('second.txt', 'Same data\n')
+        infected = self.make_file('infected.txt', 'EICAR test\n')
+
+        obj = Anti_Virus()
+        obj.av_check(first, self.command)
+        self.assertEqual(obj.av_check(second, self.command), second)
+        self.assertEqual(self.scanner_runs(), [1])
+
+        for _ in range(2):
+            with self.assertRaises(IOError):
+                obj.av_check(infected, self.command)
+        self.assertEqual(self.scanner_runs(), [1, 1, 1])
+
+    def test_not_cpu_bound(self):
+        '''
+
+        **Purpose:**
+
+        The check is run on the workflow thread, which shares the scanner of
+        this process, rather than in the workflow process pool.
+
+        '''
+        self.assertFalse(workflow_pool.is_cpu_bound(Anti_Virus()))
+
+    def test_verdict_cache(self):
+        '''
+
+        **Purpose:**
+
+        The least recently used digest is forgotten once the cache is full.
+
+        '''
+        cache = av_check.Verdict_Cache(size=2)
+        cache.add('a')
+        cache.add('b')
+        self.assertTrue(cache.is_clean('a'))
+        cache.add('c')
+        self.assertFalse(cache.is_clean('b'))
+        self.assertTrue(cache.is_clean('a'))
+        self.assertTrue(cache.is_clean('c'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python
+'''Test Batcher'''
+import os
+import queue
+import shutil
+import tarfile
+import tempfile
+import time
+import unittest
+import zipfile
+from xfero import batcher
+from xfero.workflow_manager import micro_batch
+from xfero.workflow_manager.micro_batch import Micro_Batch
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Batcher``` and the workflow step
+    ```Micro_Batch```
+
+    Route 1 is batched and route 2 is not. A Queue stands in for the xfer
+    queue.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory and a batcher for route 1
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.settings = micro_batch.batch_settings('tar.gz', '60', '3',
+                                                   '1000000')
+        self.outq = queue.Queue()
+        self.batcher = batcher.Batcher(
+            self.outq, self.tmpdir,
+            lambda work: self.settings if work[1] == 1 else None)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Stop the batcher and remove the temporary directory
+
+        '''
+        self.batcher.stop()
+        shutil.rmtree(self.tmpdir)
+
+    def make_work(self, num, route_id=1, priority=5):
+        '''Create a file and the work item for it'''
+        filename = os.path.join(self.tmpdir, 'file%s.txt' % num)
+        with open(filename, 'w') as out:
+            out.write('Data %s\n' % num)
+        return (priority, route_id, filename, '/xfero/IN/file%s.txt' % num,
+                'token-%s' % num)
+
+    def archive_contents(self, archive):
+        '''Return the manifest lines and file names in an archive'''
+        with tarfile.open(archive) as atar:
+            names = sorted(atar.getnames())
+            manifest = atar.extractfile(batcher.MANIFEST).read().decode()
+        return manifest.splitlines(), names
+
+    def test_not_batched(self):
+        '''
+
+        **Purpose:**
+
+        Work on a route which is not batched is passed straight on.
+
+        '''
+        work = self.make_work(1, route_id=2)
+        self.batcher.put(work)
+        self.assertEqual(self.outq.get_nowait(), work)
+
+    def test_full_batch(self):
+        '''
+
+        **Purpose:**
+
+        A batch is sent as one archive with a manifest once it holds
+        max_files files, keeping the XFERO token of every file.
+
+        '''
+        works = [self.make_work(num, priority=num) for num in range(3)]
+        for work in works[:2]:
+            self.batcher.put(work)
+        self.assertTrue(self.outq.empty())
+
+        self.batcher.put(works[2])
+        priority, route_id, archive, original, token = self.outq.get_nowait()
+        self.assertEqual((priority, route_id, archive), (0, 1, original))
+        self.assertTrue(archive.endswith('.tar.gz'))
+
+        manifest, names = self.archive_contents(archive)
+        self.assertEqual(names, ['file0.txt', 'file1.txt', 'file2.txt',
+                                 batcher.MANIFEST])
+        for line, work in zip(manifest, works):
+            name, size, digest, xfero_token, found = line.split('\t')
+            self.assertEqual((name, size, xfero_token, found),
+                             (os.path.basename(work[2]), '7', work[4],
+                              work[3]))
+            self.assertEqual(len(digest), 64)
+            self.assertFalse(os.path.exists(work[2]))
+
+    def test_max_bytes(self):
+        '''
+
+        **Purpose:**
+
+        A batch is sent once its files reach max_bytes, as a zip if asked.
+
+        '''
+        self.settings = micro_batch.batch_settings('.zip', '60', '100', '10')
+        for num in range(2):
+            self.batcher.put(self.make_work(num))
+        archive = self.outq.get_nowait()[2]
+        with zipfile.ZipFile(archive) as azip:
+            self.assertEqual(sorted(azip.namelist()),
+                             ['file0.txt', 'file1.txt', batcher.MANIFEST])
+
+    def test_window(self):
+        '''
+
+        **Purpose:**
+
+        A batch which is not full is sent once its window has passed.
+
+        '''
+        self.settings = micro_batch.batch_settings('tar.gz', '0.2')
+        self.batcher.start()
+        self.batcher.put(self.make_work(1))
+        started = time.time()
+        archive = self.outq.get(timeout=5)[2]
+        self.assertLess(time.time() - started, 5)
+        manifest, names = self.archive_contents(archive)
+        self.assertEqual(len(manifest), 1)
+
+    def test_done(self):
+        '''
+
+        **Purpose:**
+
+        The done item sends the open batches before it is passed on.
+
+        '''
+        self.batcher.put(self.make_work(1))
+        self.batcher.put((999, 'NONE'))
+        self.assertEqual(len(self.outq.get_nowait()), 5)
+        self.assertEqual(self.outq.get_nowait(), (999, 'NONE'))
+
+    def test_micro_batch(self):
+        '''
+
+        **Purpose:**
+
+        The workflow step passes the file on, and rejects an invalid archive
+        type.
+
+        '''
+        obj = Micro_Batch('test')
+        self.assertEqual(obj.batch('/xfero/IN/file', 'tar.xz', '30'),
+                         '/xfero/IN/file')
+        with self.assertRaises(TypeError):
+            obj.batch('/xfero/IN/file', '.rar')
+
+if __name__ == '__main__':
+    unittest.main()
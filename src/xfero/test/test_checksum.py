@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+'''Test Checksum'''
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+import zipfile
+from xfero.workflow_manager import checksum
+from xfero.workflow_manager import tree_hash
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the sums computed by ```checksum```. The archives
+    produced by ```Checksum.cksum``` are tested in test_cksum.py.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create files of various sizes, using a small block size so the files
+        span several blocks.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.saved_blocksize = checksum.BLOCKSIZE
+        checksum.BLOCKSIZE = 1000
+
+        self.files = {}
+        for size in (0, 1, 999, 1000, 70000):
+            filename = os.path.join(self.tmpdir, 'file_%s' % size)
+            data = os.urandom(size)
+            with open(filename, 'wb') as out:
+                out.write(data)
+            self.files[filename] = data
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the files and restore the block size.
+
+        '''
+        checksum.BLOCKSIZE = self.saved_blocksize
+        shutil.rmtree(self.tmpdir)
+
+    def test_posix_cksum(self):
+        '''
+
+        **Purpose:**
+
+        The CRC and size match those printed by the ```cksum``` utility.
+
+        '''
+        for filename in self.files:
+            expected = subprocess.check_output(['cksum', filename]).split()
+            sums = checksum.file_sums(filename)
+            self.assertEqual(
+                (sums['cksum'], sums['size']),
+                (int(expected[0]), int(expected[1])), filename)
+
+    def test_digests(self):
+        '''
+
+        **Purpose:**
+
+        The MD5 and SHA-256 digests match those computed by hashlib.
+
+        '''
+        for filename, data in self.files.items():
+            sums = checksum.file_sums(filename)
+            self.assertEqual(sums['md5'], hashlib.md5(data).hexdigest())
+            self.assertEqual(sums['sha256'],
+                             hashlib.sha256(data).hexdigest())
+
+    def test_sum_file(self):
+        '''
+
+        **Purpose:**
+
+        A file is archived with a sum file named after it.
+
+        '''
+        filename = os.path.join(self.tmpdir, 'file_999')
+        sums = checksum.file_sums(filename)
+
+        archive = checksum.Checksum().cksum(filename, '.zip', '')
+        self.assertEqual(archive, filename + '.zip')
+        with zipfile.ZipFile(archive) as azip:
+            self.assertEqual(set(azip.namelist()),
+                             {'file_999', 'file_999.sum'})
+            lines = azip.read('file_999.sum').decode().splitlines(True)
+        self.assertEqual(lines, checksum.sum_lines('file_999', sums))
+        self.assertFalse(os.path.exists(filename + '.sum'))
+
+    def test_tree_sum_file(self):
+        '''
+
+        **Purpose:**
+
+        A file is archived with a manifest of its tree.
+
+        '''
+        filename = os.path.join(self.tmpdir, 'file_70000')
+        tree = tree_hash.tree_sums(filename, 16384, 1)
+
+        saved_chunk_size = checksum.tree_chunk_size
+        checksum.tree_chunk_size = 16384
+        try:
+            archive = checksum.Checksum().tree_cksum(filename, '.zip', '')
+        finally:
+            checksum.tree_chunk_size = saved_chunk_size
+
+        with zipfile.ZipFile(archive) as azip:
+            self.assertEqual(set(azip.namelist()),
+                             {'file_70000', 'file_70000.sum'})
+            lines = azip.read('file_70000.sum').decode().splitlines(True)
+        self.assertEqual(len(tree['chunks']), 5)
+        self.assertEqual(lines, tree_hash.manifest_lines('file_70000', tree))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,8 +2,9 @@
 '''Test Copy FIle'''
 import os
 import shutil
+import tempfile
 import unittest
-import /xfero/.workflow_manager.copy_file as copy_file
+import xfero.workflow_manager.copy_file as copy_file
 
 
 class Test(unittest.TestCase):
@@ -20,6 +21,8 @@ class Test(unittest.TestCase):
     +============+=============+===============================================+
     | 02/06/2013 | Chris Falck | Created                                       |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added tests of fast_copy and fast_move        |
+    +------------+-------------+-----------------------------------------------+
 
     '''
 
@@ -496,6 +499,63 @@ class Test(unittest.TestCase):
                 err.args, (2, 'No such file or directory'),
                 'Invalid test result')
 
+    def test_fast_copy(self):
+        '''
+
+        **Purpose:**
+
+        ```fast_copy``` copies the data, permissions and times of a file and
+        leaves no temporary file behind.
+
+        '''
+        tmpdir = tempfile.mkdtemp()
+        try:
+            source = os.path.join(tmpdir, 'source')
+            with open(source, 'wb') as out:
+                out.write(os.urandom(3 * 1024 * 1024 + 7))
+            os.chmod(source, 0o640)
+            os.utime(source, (1000000000, 1000000000))
+
+            target = os.path.join(tmpdir, 'target')
+            self.assertEqual(copy_file.fast_copy(source, target), target)
+            with open(source, 'rb') as in1, open(target, 'rb') as in2:
+                self.assertEqual(in1.read(), in2.read())
+            self.assertEqual(os.stat(target).st_mode & 0o777, 0o640)
+            self.assertEqual(os.stat(target).st_mtime, 1000000000)
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['source', 'target'])
+
+            with self.assertRaises(OSError):
+                copy_file.fast_copy(source + '_missing', target + '_2')
+            self.assertEqual(sorted(os.listdir(tmpdir)), ['source', 'target'])
+        finally:
+            shutil.rmtree(tmpdir)
+
+    @unittest.skipUnless(os.path.isdir('/dev/shm'), 'No /dev/shm')
+    def test_fast_move_other_filesystem(self):
+        '''
+
+        **Purpose:**
+
+        ```move_file``` moves a file to another filesystem through
+        ```fast_move``` without waiting.
+
+        '''
+        tmpdir = tempfile.mkdtemp()
+        shmdir = tempfile.mkdtemp(dir='/dev/shm')
+        try:
+            source = os.path.join(tmpdir, 'move_me.txt')
+            with open(source, 'w') as out:
+                out.write('Just a test file\n')
+
+            moved = copy_file.Copy_File().move_file(source, shmdir)
+            self.assertEqual(moved, os.path.join(shmdir, 'move_me.txt'))
+            self.assertFalse(os.path.exists(source))
+            with open(moved) as infile:
+                self.assertEqual(infile.read(), 'Just a test file\n')
+        finally:
+            shutil.rmtree(tmpdir)
+            shutil.rmtree(shmdir)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.test_cksum']
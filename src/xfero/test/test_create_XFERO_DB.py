@@ -4,7 +4,7 @@ import unittest
 import configparser
 import os
 import sqlite3 as lite
-from /xfero/.db import create_XFERO_DB as db
+from xfero.db import create_XFERO_DB as db
 
 
 class Test(unittest.TestCase):
@@ -33,6 +33,11 @@ class Test(unittest.TestCase):
     +------------+-------------+-----------------------------------------------+
     | 08/01/2014 | Chris Falck | Tested to confirm changes to DB               |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_Partner_Limit                     |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_Xfer_Retry and                    |
+    |            |             | XFERO_Config_Generation                       |
+    +------------+-------------+-----------------------------------------------+
 
     '''
 
@@ -111,11 +116,13 @@ class Test(unittest.TestCase):
 
         rows = cur.fetchall()
 
-        expected_table_list = {'XFERO_AV_Pattern', 'XFERO_COTS_Pattern', ''XFERO_Control',
-                               'XFERO_Function', 'XFERO_Partner', ''XFERO_Priority',
+        expected_table_list = {'XFERO_AV_Pattern', 'XFERO_COTS_Pattern', 'XFERO_Control',
+                               'XFERO_Function', 'XFERO_Partner', 'XFERO_Priority',
                                'XFERO_Route', 'XFERO_Scheduled_Task',
-                               'XFERO_Workflow_Item', 'XFERO_Xfer', 'sqlite_sequence'}
-        expected_num_tables = 11
+                               'XFERO_Workflow_Item', 'XFERO_Xfer', 'sqlite_sequence',
+                               'XFERO_Partner_Limit', 'XFERO_Xfer_Retry',
+                               'XFERO_Config_Generation'}
+        expected_num_tables = 14
         c = 0
         unexpected_tables = 0
 
@@ -181,8 +188,8 @@ class Test(unittest.TestCase):
 
         expected_index_list = {
             'routeindex', 'workflowindex', 'xfercotspatternindex', 'xferindex',
-            'xferpartner'}
-        expected_num_indices = 5
+            'xferpartner', 'xferretryindex'}
+        expected_num_indices = 6
         c = 0
         unexpected_index = 0
 
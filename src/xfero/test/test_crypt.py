@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+'''Test Crypt'''
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from xfero.workflow_manager import crypt
+from xfero.workflow_manager.crypt import Crypt
+
+PASSPHRASE = 'xfero test passphrase'
+
+
+def gpg(homedir, *args):
+    '''Run gpg with a keyring and return its output'''
+    return subprocess.check_output(
+        ['gpg', '--homedir', homedir, '--batch', '--yes',
+         '--pinentry-mode', 'loopback', '--passphrase', PASSPHRASE] +
+        list(args), stderr=subprocess.DEVNULL)
+
+
+@unittest.skipUnless(shutil.which('gpg'), 'gpg is not installed')
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Crypt```
+
+    A key pair is generated for the tests with gpg.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        '''
+
+        **Purpose:**
+
+        Generate a key pair protected by a passphrase and export it.
+
+        '''
+        cls.homedir = tempfile.mkdtemp()
+        gpg(cls.homedir, '--quick-gen-key', 'XFERO Test <test@xfero>',
+            'future-default', 'default', 'never')
+        cls.public_key = gpg(cls.homedir, '--armor',
+                             '--export').decode('utf-8')
+        cls.private_key = gpg(cls.homedir, '--armor',
+                              '--export-secret-keys').decode('utf-8')
+
+    @classmethod
+    def tearDownClass(cls):
+        '''
+
+        **Purpose:**
+
+        Delete the key pair.
+
+        '''
+        subprocess.call(['gpgconf', '--homedir', cls.homedir, '--kill',
+                         'gpg-agent'])
+        shutil.rmtree(cls.homedir, ignore_errors=True)
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a file to encrypt and a keyring for the test.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = os.urandom(100000)
+        self.filename = os.path.join(self.tmpdir, 'CIS_FILE')
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+
+        self.saved_keyring = crypt.KEYRING
+        crypt.KEYRING = crypt.Key_Ring()
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Delete the file and the keyring.
+
+        '''
+        crypt.KEYRING.close()
+        crypt.KEYRING = self.saved_keyring
+        shutil.rmtree(self.tmpdir)
+
+    def read_file(self, path):
+        '''Return the contents of a file'''
+        with open(path, 'rb') as infile:
+            return infile.read()
+
+    def test_encrypt_decrypt(self):
+        '''
+
+        **Purpose:**
+
+        A file is encrypted and decrypted back to the original, with the
+        keys imported once however many files are processed.
+
+        '''
+        for run in range(3):
+            encrypted = Crypt().encrypt_file(self.filename, self.public_key)
+            self.assertEqual(encrypted, self.filename + '.gpg')
+            self.assertFalse(os.path.exists(self.filename))
+            self.assertNotEqual(self.read_file(encrypted), self.data)
+
+            decrypted = Crypt().decrypt_file(encrypted, self.private_key,
+                                             PASSPHRASE)
+            self.assertEqual(decrypted, self.filename)
+            self.assertEqual(self.read_file(decrypted), self.data)
+
+        self.assertEqual(crypt.KEYRING.imports, 2)
+        self.assertEqual(os.listdir(self.tmpdir), ['CIS_FILE'])
+
+    def test_key_file(self):
+        '''
+
+        **Purpose:**
+
+        A key may be given as the path of a key file.
+
+        '''
+        keyfile = os.path.join(self.tmpdir, 'public.asc')
+        with open(keyfile, 'w') as out:
+            out.write(self.public_key)
+
+        encrypted = Crypt().encrypt_file(self.filename, keyfile, 'Yes',
+                                         self.private_key, PASSPHRASE)
+        output = gpg(self.homedir, '--decrypt', encrypted)
+        self.assertEqual(output, self.data)
+
+    def test_sign(self):
+        '''
+
+        **Purpose:**
+
+        A detached signature is written and both the file and signature are
+        returned.
+
+        '''
+        files = Crypt().sign_file(self.filename, self.private_key,
+                                  PASSPHRASE)
+        self.assertEqual(files, [self.filename, self.filename + '.sig'])
+        gpg(self.homedir, '--verify', files[1], files[0])
+
+    def test_wrong_passphrase(self):
+        '''
+
+        **Purpose:**
+
+        A decryption which fails raises an IOError and leaves the encrypted
+        file and no partial output.
+
+        '''
+        encrypted = Crypt().encrypt_file(self.filename, self.public_key)
+
+        self.assertRaises(IOError, Crypt().decrypt_file, encrypted,
+                          self.private_key, 'wrong')
+        self.assertEqual(os.listdir(self.tmpdir), ['CIS_FILE.gpg'])
+
+    def test_missing_file(self):
+        '''
+
+        **Purpose:**
+
+        A missing file raises an OSError.
+
+        '''
+        self.assertRaises(OSError, Crypt().encrypt_file,
+                          os.path.join(self.tmpdir, 'missing'),
+                          self.public_key)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+'''Test Directory Notification'''
+import os
+import shutil
+import tempfile
+import unittest
+from xfero import dirnotify
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for ```dirnotify.Notify```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Watch a temporary directory, skipping the tests where inotify is not
+        available.
+
+        '''
+        try:
+            self.notify = dirnotify.Notify()
+        except OSError:
+            self.skipTest('inotify is not available')
+        self.tmpdir = tempfile.mkdtemp()
+        self.watched = os.path.join(self.tmpdir, 'watched')
+        os.mkdir(self.watched)
+        self.notify.add(self.watched)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Close the inotify instance and remove the directory.
+
+        '''
+        self.notify.close()
+        shutil.rmtree(self.tmpdir)
+
+    def events(self):
+        '''
+
+        **Purpose:**
+
+        Read every event until none arrive for half a second.
+
+        '''
+        arrived = []
+        while True:
+            events = self.notify.read(0.5)
+            if not events:
+                return arrived
+            arrived.extend(events)
+
+    def test_write(self):
+        '''
+
+        **Purpose:**
+
+        A file written to the directory produces exactly one event.
+
+        '''
+        with open(os.path.join(self.watched, 'CIS_FILE'), 'w') as out:
+            out.write('data\n')
+            out.flush()
+            out.write('more data\n')
+        self.assertEqual(self.events(), [(self.watched, 'CIS_FILE')])
+
+    def test_rename(self):
+        '''
+
+        **Purpose:**
+
+        A file renamed into the directory produces exactly one event, and the
+        write before the rename none.
+
+        '''
+        staged = os.path.join(self.tmpdir, 'CIS_FILE')
+        with open(staged, 'w') as out:
+            out.write('data\n')
+        os.rename(staged, os.path.join(self.watched, 'CIS_FILE'))
+        self.assertEqual(self.events(), [(self.watched, 'CIS_FILE')])
+
+    def test_ignored(self):
+        '''
+
+        **Purpose:**
+
+        A sub-directory produces no event, nor does a file written after the
+        directory has been removed from the watches.
+
+        '''
+        os.mkdir(os.path.join(self.watched, 'subdir'))
+        self.assertEqual(self.events(), [])
+        self.notify.remove(self.watched)
+        with open(os.path.join(self.watched, 'CIS_FILE'), 'w') as out:
+            out.write('data\n')
+        self.assertEqual(self.events(), [])
+        self.assertEqual(self.notify.watches, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python
+'''Test Extract Members'''
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zipfile
+from xfero.workflow_manager import manage_archives
+from xfero.workflow_manager.manage_archives import Manage_Archives
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the streaming extraction of ```Manage_Archives```,
+    and the limits on the size and number of files extracted
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory with a directory to extract to
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.to_path = os.path.join(self.tmpdir, 'IN')
+        os.mkdir(self.to_path)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the temporary directory
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def make_tar(self, members, name='bundle.tar.gz'):
+        '''Write a tar archive of (name, data) members'''
+        archive = os.path.join(self.tmpdir, name)
+        with tarfile.open(archive, 'w:gz') as atar:
+            for member, data in members:
+                info = tarfile.TarInfo(member)
+                info.size = len(data)
+                atar.addfile(info, io.BytesIO(data))
+        return archive
+
+    def test_members_released(self):
+        '''
+
+        **Purpose:**
+
+        Each file is released into the directory under its own name, without
+        its directory, the archive is deleted and there is nothing left to
+        transfer.
+
+        '''
+        archive = self.make_tar([('A_one.txt', b'one'),
+                                 ('sub/A_two.txt', b'two'),
+                                 ('other/A_one.txt', b'three')])
+        result = Manage_Archives('test').extract_members(archive,
+                                                         self.to_path)
+        self.assertIsNone(result)
+        self.assertFalse(os.path.exists(archive))
+        self.assertEqual(sorted(os.listdir(self.to_path)),
+                         ['2_A_one.txt', 'A_one.txt', 'A_two.txt'])
+        with open(os.path.join(self.to_path, '2_A_one.txt'), 'rb') as infile:
+            self.assertEqual(infile.read(), b'three')
+
+    def test_zip_members(self):
+        '''
+
+        **Purpose:**
+
+        The files of a zip archive are released in the same way, skipping
+        directories.
+
+        '''
+        archive = os.path.join(self.tmpdir, 'bundle.zip')
+        with zipfile.ZipFile(archive, 'w') as azip:
+            azip.writestr('dir/', '')
+            azip.writestr('dir/A_one.txt', 'one')
+        Manage_Archives('test').extract_members(archive, self.to_path)
+        self.assertEqual(os.listdir(self.to_path), ['A_one.txt'])
+
+    def test_streamed(self):
+        '''
+
+        **Purpose:**
+
+        Each file is in place before the next is extracted, and is never
+        seen part written.
+
+        '''
+        archive = self.make_tar([('A_%s.txt' % num, b'x' * 1000)
+                                 for num in range(3)])
+        obj = Manage_Archives('test')
+        seen = []
+        for name, staged in obj.stream_members(archive, self.to_path):
+            self.assertEqual(os.path.getsize(staged), 1000)
+            self.assertEqual(sorted(name for name in os.listdir(self.to_path)
+                                    if not name.startswith('.')), seen)
+            os.replace(staged, os.path.join(self.to_path, name))
+            seen = sorted(seen + [name])
+        self.assertEqual(len(seen), 3)
+
+    def test_max_bytes(self):
+        '''
+
+        **Purpose:**
+
+        An archive which expands beyond max_bytes raises a ValueError once
+        the limit is reached. The files already released are kept, the part
+        written file is removed and the archive is kept for the error
+        directory.
+
+        '''
+        archive = self.make_tar([('A_small.txt', b'x' * 100),
+                                 ('A_bomb.txt', b'\0' * 1000000)])
+        with self.assertRaises(ValueError):
+            Manage_Archives('test').extract_members(archive, self.to_path,
+                                                    '10000')
+        self.assertEqual(os.listdir(self.to_path), ['A_small.txt'])
+        self.assertTrue(os.path.exists(archive))
+
+    def test_max_members(self):
+        '''
+
+        **Purpose:**
+
+        An archive holding more than max_members files raises a ValueError.
+
+        '''
+        archive = self.make_tar([('A_%s.txt' % num, b'x')
+                                 for num in range(5)])
+        with self.assertRaises(ValueError):
+            Manage_Archives('test').extract_members(archive, self.to_path,
+                                                    '', '3')
+        self.assertEqual(len(os.listdir(self.to_path)), 3)
+
+    def test_extract_limit(self):
+        '''
+
+        **Purpose:**
+
+        extract applies the same limits, keeps the directories of the
+        archive, and will not write outside of the directory.
+
+        '''
+        archive = self.make_tar([('sub/A_one.txt', b'one'),
+                                 ('../A_escape.txt', b'escape')])
+        obj = Manage_Archives('test')
+        self.assertEqual(obj.extract(archive, self.to_path), self.to_path)
+        self.assertEqual(os.listdir(self.to_path), ['sub'])
+        self.assertFalse(os.path.exists(os.path.join(self.tmpdir,
+                                                     'A_escape.txt')))
+
+        archive = self.make_tar([('A_%s.txt' % num, b'x')
+                                 for num in range(3)])
+        members = manage_archives.extract_max_members
+        manage_archives.extract_max_members = 2
+        try:
+            with self.assertRaises(ValueError):
+                obj.extract(archive, self.to_path)
+        finally:
+            manage_archives.extract_max_members = members
+
+if __name__ == '__main__':
+    unittest.main()
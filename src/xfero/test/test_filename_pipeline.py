@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+'''Test Filename Pipeline'''
+import os
+import shutil
+import tempfile
+import unittest
+from xfero.workflow_manager import filename_pipeline
+from xfero.workflow_manager.case_converter import Case_Converter
+from xfero.workflow_manager.transform_filename import Transform_Filename
+
+
+def row(wf_class, function_call, args='NULL'):
+    '''Return a workflow item row'''
+    return {'workflow_item_class': wf_class,
+            'workflow_item_function_call': function_call,
+            'workflow_item_args': args}
+
+# A naming workflow with a step which reads the file in the middle
+ROWS = (row('Transform_Filename', 'delete_extension'),
+        row('Transform_Filename', 'add_prefix', 'OUT_'),
+        row('Case_Converter', 'to_upper'),
+        row('Checksum', 'cksum'),
+        row('Transform_Filename', 'insert_name_part', 'OUT_, ACME_, After'),
+        row('Transform_Filename', 'remove_name_part', 'FILE'),
+        row('Transform_Filename', 'add_extension', '.dat'))
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the module ```filename_pipeline```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory holding a file to rename
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.tmpdir, 'my_file.txt')
+        with open(self.filename, 'w') as out:
+            out.write('Just a test file\n')
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the temporary directory
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def test_compile(self):
+        '''
+
+        **Purpose:**
+
+        Consecutive filename steps are compiled into one pipeline and the
+        Checksum step is left between them.
+
+        '''
+        steps = filename_pipeline.compile_workflow(ROWS)
+        self.assertEqual(len(steps), 3)
+        self.assertEqual(len(steps[0].steps), 3)
+        self.assertIs(steps[1], ROWS[3])
+        self.assertEqual(len(steps[2].steps), 3)
+
+    def test_same_name(self):
+        '''
+
+        **Purpose:**
+
+        The pipelines give the same name as applying each workflow method in
+        turn, and the file is renamed once for each pipeline.
+
+        '''
+        expected = self.filename
+        for workflow in ROWS:
+            if workflow['workflow_item_class'] == 'Checksum':
+                continue
+            obj = (Transform_Filename('test') if
+                   workflow['workflow_item_class'] == 'Transform_Filename'
+                   else Case_Converter('test'))
+            expected = getattr(obj, workflow['workflow_item_function_call'])(
+                expected, *filename_pipeline.step_args(workflow))
+        self.assertEqual(os.path.basename(expected), 'OUT_ACME_MY_.dat')
+        os.rename(expected, self.filename)
+
+        filename = self.filename
+        for step in filename_pipeline.compile_workflow(ROWS):
+            if isinstance(step, filename_pipeline.Filename_Pipeline):
+                filename = step.rename(filename, 'test')
+                self.assertEqual(os.listdir(self.tmpdir),
+                                 [os.path.basename(filename)])
+        self.assertEqual(filename, expected)
+
+    def test_invalid(self):
+        '''
+
+        **Purpose:**
+
+        An eye-catcher which is not in the file name raises a TypeError and
+        the file is not renamed.
+
+        '''
+        pipeline = filename_pipeline.compile_workflow((
+            row('Transform_Filename', 'add_prefix', 'OUT_'),
+            row('Transform_Filename', 'insert_name_part',
+                'MISSING, X, Before')))[0]
+        with self.assertRaises(TypeError):
+            pipeline.rename(self.filename, 'test')
+        self.assertTrue(os.path.isfile(self.filename))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+'''Test Line End Converter'''
+import os
+import shutil
+import tempfile
+import unittest
+from xfero.workflow_manager import line_end_converter
+from xfero.workflow_manager.line_end_converter import Line_End_Converter
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Line_End_Converter```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a working directory and use a small block size so line ends
+        fall on block boundaries.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.saved_blocksize = line_end_converter.BLOCKSIZE
+        line_end_converter.BLOCKSIZE = 4
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the working directory and restore the block size.
+
+        '''
+        line_end_converter.BLOCKSIZE = self.saved_blocksize
+        shutil.rmtree(self.tmpdir)
+
+    def make_file(self, name, data):
+        '''Create a file in the working directory'''
+        path = os.path.join(self.tmpdir, name)
+        with open(path, 'wb') as out:
+            out.write(data)
+        return path
+
+    def read_file(self, path):
+        '''Return the contents of a file'''
+        with open(path, 'rb') as infile:
+            return infile.read()
+
+    def test_dos2unix(self):
+        '''
+
+        **Purpose:**
+
+        CRLF pairs, including those split across blocks, and lone CRs become
+        LF.
+
+        '''
+        path = self.make_file('dos.txt', b'abc\r\ndefghi\r\nj\rk\r')
+        self.assertEqual(Line_End_Converter().dos2unix(path), path)
+        self.assertEqual(self.read_file(path), b'abc\ndefghi\nj\nk\n')
+        self.assertEqual(os.listdir(self.tmpdir), ['dos.txt'])
+
+    def test_unix2dos(self):
+        '''
+
+        **Purpose:**
+
+        LF becomes CRLF, and converting again leaves the file unchanged.
+
+        '''
+        path = self.make_file('unix.txt', b'abc\ndefghi\r\njk\n')
+        self.assertEqual(Line_End_Converter().unix2dos(path), path)
+        self.assertEqual(self.read_file(path), b'abc\r\ndefghi\r\njk\r\n')
+
+        Line_End_Converter().unix2dos(path)
+        self.assertEqual(self.read_file(path), b'abc\r\ndefghi\r\njk\r\n')
+
+    def test_mode_preserved(self):
+        '''
+
+        **Purpose:**
+
+        The converted file keeps the permissions of the original.
+
+        '''
+        path = self.make_file('mode.txt', b'abc\r\n')
+        os.chmod(path, 0o640)
+        Line_End_Converter().dos2unix(path)
+        self.assertEqual(os.stat(path).st_mode & 0o777, 0o640)
+
+    def test_directory(self):
+        '''
+
+        **Purpose:**
+
+        Every file in a directory is converted.
+
+        '''
+        for num in range(8):
+            self.make_file('file%s' % num,
+                           ('line %s\r\nend\r\n' % num).encode())
+
+        Line_End_Converter().dos2unix(self.tmpdir)
+        self.assertEqual(len(os.listdir(self.tmpdir)), 8)
+        for num in range(8):
+            self.assertEqual(
+                self.read_file(os.path.join(self.tmpdir, 'file%s' % num)),
+                ('line %s\nend\n' % num).encode())
+
+    def test_missing_file(self):
+        '''
+
+        **Purpose:**
+
+        A missing file raises an IOError.
+
+        '''
+        path = os.path.join(self.tmpdir, 'missing.txt')
+        self.assertRaises(IOError, Line_End_Converter().dos2unix, path)
+        self.assertEqual(os.listdir(self.tmpdir), [])
+
+if __name__ == "__main__":
+    unittest.main()
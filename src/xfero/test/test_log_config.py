@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+'''Test Log Config'''
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from xfero import get_conf as get_conf
+from xfero import log_config
+
+LOGGING_CONF = '''[loggers]
+keys=root,workflow
+
+[handlers]
+keys=fileHandler
+
+[formatters]
+keys=simpleFormatter
+
+[logger_root]
+level=DEBUG
+handlers=fileHandler
+
+[logger_workflow]
+level=DEBUG
+handlers=fileHandler
+qualname=workflow
+propagate=0
+
+[handler_fileHandler]
+class=FileHandler
+level=DEBUG
+formatter=simpleFormatter
+args=(%r,)
+
+[formatter_simpleFormatter]
+format=%%(process)d %%(name)s %%(message)s
+'''
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the module ```log_config```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Write a logging configuration file which logs to a temporary file
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.logfile = os.path.join(self.tmpdir, 'xfero.log')
+        self.xfero_logger = os.path.join(self.tmpdir, 'logging.conf')
+        with open(self.xfero_logger, 'w') as out:
+            out.write(LOGGING_CONF % self.logfile)
+        log_config.stop()
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Restore the XFERO logging configuration and remove the temporary
+        directory
+
+        '''
+        log_config.stop()
+        log_config.configure(get_conf.get_xfero_config()[0])
+        shutil.rmtree(self.tmpdir)
+
+    def read_log(self):
+        '''Return the lines of the log file, once every record is written'''
+        log_config.stop()
+        with open(self.logfile, 'r') as infile:
+            return infile.read().splitlines()
+
+    def test_configure(self):
+        '''
+
+        **Purpose:**
+
+        Each logger with handlers is given a Routing_Queue_Handler, the
+        configuration is only read once per process, and the listener writes
+        each record once.
+
+        '''
+        log_config.configure(self.xfero_logger)
+        listener = log_config.LISTENER
+        log_config.configure(self.xfero_logger)
+        self.assertIs(log_config.LISTENER, listener)
+
+        for name in ('', 'workflow'):
+            handlers = logging.getLogger(name).handlers
+            self.assertEqual(len(handlers), 1)
+            self.assertIsInstance(handlers[0],
+                                  log_config.Routing_Queue_Handler)
+
+        logging.getLogger('workflow').info('Workflow record')
+        logging.getLogger('other').info('Other record')
+        self.assertEqual(self.read_log(),
+                         ['%s workflow Workflow record' % os.getpid(),
+                          '%s other Other record' % os.getpid()])
+
+    def test_worker(self):
+        '''
+
+        **Purpose:**
+
+        A record logged in a pool process is sent to the parent, which writes
+        it once.
+
+        '''
+        log_config.configure(self.xfero_logger)
+        with ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=log_config.init_worker,
+                initargs=(log_config.worker_queue(),
+                          self.xfero_logger)) as pool:
+            worker = pool.submit(os.getpid).result()
+            pool.submit(logging.getLogger('workflow').warning,
+                        'Worker record').result()
+            pool.submit(logging.getLogger('pool').warning,
+                        'Other record').result()
+
+        self.assertNotEqual(worker, os.getpid())
+        self.assertEqual(self.read_log(),
+                         ['%s workflow Worker record' % worker,
+                          '%s pool Other record' % worker])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+''' Test Manage AV Pattern'''
+import unittest
+import configparser
+import os
+import sqlite3 as lite
+from xfero.db import manage_av_pattern as db_av_pattern
+from xfero.db import create_XFERO_DB as db
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the function ```crud_XFERO_AV_Pattern```
+
+    **Usage Notes:**
+
+    XFERO stores the database location and database name in an ini file which is
+    found in <INSTALL_DIR>/conf/XFERO_config.ini. Before proceeding with the test
+    please ensure that the XFERO_config.ini file has been suitably modified for the
+    purposes of this test.
+
+    **Warning:**
+
+    ALL DATABASE TABLE WILL BE DROPPED DURING THE EXECUTION OF THESE TESTS
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a test /Xfero/ Database with two AV patterns
+
+        '''
+        # Create the database
+        db.create_db()
+
+        for tst in [('McAfee VirusScan', 'XFERO_MCAFEE_AV_PATTERN',
+                     'uvscan -c -v {File_to_Check}'),
+                    ('ClamAV', 'XFERO_CLAMAV_AV_PATTERN',
+                     'clamdscan --no-summary {File_to_Check}')]:
+            db_av_pattern.create_XFERO_AV_Pattern(*tst)
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Delete the test /Xfero/ Database.
+
+        '''
+
+        config = configparser.RawConfigParser()
+        try:
+            config.read('conf/XFERO_config.ini')
+        except configparser.Error as err:
+            raise err
+
+        xfero_db = config.get('database', 'db_location')
+
+        # Delete the test DB
+        os.remove(xfero_db)
+
+    def test_read_XFERO_AV_Pattern(self):
+        '''
+
+        **Purpose:**
+
+        SELECT the row with avpattern_id = 2 and confirm that the row returned
+        is as expected
+
+        '''
+        row = db_av_pattern.read_XFERO_AV_Pattern('2')
+        self.assertTupleEqual(
+            row, (2, 'ClamAV', 'XFERO_CLAMAV_AV_PATTERN',
+                  'clamdscan --no-summary {File_to_Check}'),
+            'Unexpected row retrieved')
+
+    def test_read_with_name_XFERO_AV_Pattern(self):
+        '''
+
+        **Purpose:**
+
+        SELECT a row using the AV Pattern Name and confirm that the row
+        returned is as expected
+
+        '''
+        row = db_av_pattern.read_with_name_XFERO_AV_Pattern(
+            'XFERO_MCAFEE_AV_PATTERN')
+        self.assertTupleEqual(
+            row, (1, 'McAfee VirusScan', 'XFERO_MCAFEE_AV_PATTERN',
+                  'uvscan -c -v {File_to_Check}'),
+            'Unexpected row retrieved')
+        self.assertIsNone(
+            db_av_pattern.read_with_name_XFERO_AV_Pattern('NO_SUCH_PATTERN'))
+
+    def test_update_XFERO_AV_Pattern(self):
+        '''
+
+        **Purpose:**
+
+        UPDATE the row with avpattern_id = 1 and confirm that the update has
+        been applied to the table.
+
+        '''
+        db_av_pattern.update_XFERO_AV_Pattern(
+            '1', 'McAfee VirusScan', 'XFERO_MCAFEE_AV_PATTERN',
+            'uvscan -c {File_to_Check}')
+        row = db_av_pattern.read_XFERO_AV_Pattern('1')
+        self.assertEqual(row[3], 'uvscan -c {File_to_Check}',
+                         'Unexpected row retrieved')
+
+    def test_delete_XFERO_AV_Pattern(self):
+        '''
+
+        **Purpose:**
+
+        DELETE the row with avpattern_id = 1 and confirm that the deletion has
+        been successful.
+
+        '''
+        db_av_pattern.delete_XFERO_AV_Pattern('1')
+
+        config = configparser.RawConfigParser()
+        try:
+            config.read('conf/XFERO_config.ini')
+        except configparser.Error as err:
+            raise err
+
+        xfero_db = config.get('database', 'db_location')
+        con = lite.connect(xfero_db)
+        cur = con.execute('SELECT avpattern_id FROM XFERO_AV_Pattern')
+        self.assertEqual(cur.fetchall(), [(2,)], 'Unexpected row selected')
+        con.close()
+
+    def test_list_XFERO_AV_Pattern(self):
+        '''
+
+        **Purpose:**
+
+        SELECT all rows and confirm they are returned in order
+
+        '''
+        rows = db_av_pattern.list_XFERO_AV_Pattern()
+        self.assertEqual([row[0] for row in rows], [1, 2],
+                         'Unexpected rows retrieved')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+''' Test Manage Partner Limit'''
+import unittest
+import configparser
+import os
+import sqlite3 as lite
+from xfero.db import manage_partner as db_partner
+from xfero.db import manage_partner_limit as db_partner_limit
+from xfero.db import create_XFERO_DB as db
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the function ```crud_XFERO_Partner_Limit```
+
+    **Usage Notes:**
+
+    XFERO stores the database location and database name in an ini file which is
+    found in <INSTALL_DIR>/conf/XFERO_config.ini. Before proceeding with the test
+    please ensure that the XFERO_config.ini file has been suitably modified for the
+    purposes of this test.
+
+    **Warning:**
+
+    ALL DATABASE TABLE WILL BE DROPPED DURING THE EXECUTION OF THESE TESTS
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a test /Xfero/ Database with two partners
+
+        '''
+        # Create the database
+        db.create_db()
+
+        for partner_service_name in ('PARTNER_1', 'PARTNER_2'):
+            db_partner.create_XFERO_Partner(
+                *([partner_service_name, 'Test Partner', 'FTP', 'localhost'] +
+                  [''] * 28))
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Delete the test /Xfero/ Database.
+
+        '''
+
+        config = configparser.RawConfigParser()
+        try:
+            config.read('conf/XFERO_config.ini')
+        except configparser.Error as err:
+            raise err
+
+        xfero_db = config.get('database', 'db_location')
+
+        # Delete the test DB
+        os.remove(xfero_db)
+
+    def test_create_XFERO_Partner_Limit(self):
+        '''
+
+        **Purpose:**
+
+        INSERT rows into the XFERO_Partner_Limit table and confirm they have
+        been successfully inserted. A row for a partner which does not exist
+        is rejected.
+
+        '''
+        for tst in [(1, 2, 1048576), (2, None, 65536)]:
+            result = db_partner_limit.create_XFERO_Partner_Limit(*tst)
+            self.assertEqual(result, 'Row Inserted', 'Row not inserted')
+
+        with self.assertRaises(lite.IntegrityError):
+            db_partner_limit.create_XFERO_Partner_Limit(3, 1, None)
+
+        rows = db_partner_limit.list_XFERO_Partner_Limit()
+        self.assertEqual(sorted(rows), [(1, 2, 1048576), (2, None, 65536)])
+
+    def test_read_XFERO_Partner_Limit(self):
+        '''
+
+        **Purpose:**
+
+        SELECT the limits of a partner.
+
+        '''
+        db_partner_limit.create_XFERO_Partner_Limit(1, 2, 1048576)
+
+        row = db_partner_limit.read_XFERO_Partner_Limit(1)
+        self.assertEqual(row, (1, 2, 1048576), 'Unexpected row retrieved')
+        self.assertIsNone(db_partner_limit.read_XFERO_Partner_Limit(2))
+
+    def test_update_XFERO_Partner_Limit(self):
+        '''
+
+        **Purpose:**
+
+        UPDATE the limits of a partner.
+
+        '''
+        db_partner_limit.create_XFERO_Partner_Limit(1, 2, 1048576)
+
+        result = db_partner_limit.update_XFERO_Partner_Limit(1, 4, None)
+        self.assertEqual(result, 'Success', 'Update failed')
+        self.assertEqual(db_partner_limit.read_XFERO_Partner_Limit(1),
+                         (1, 4, None), 'Unexpected row retrieved')
+
+    def test_delete_XFERO_Partner_Limit(self):
+        '''
+
+        **Purpose:**
+
+        DELETE the limits of a partner, and confirm that the limits are
+        deleted with the partner.
+
+        '''
+        db_partner_limit.create_XFERO_Partner_Limit(1, 2, 1048576)
+        db_partner_limit.create_XFERO_Partner_Limit(2, 1, None)
+
+        result = db_partner_limit.delete_XFERO_Partner_Limit(1)
+        self.assertEqual(result, 'Success', 'Delete failed')
+        self.assertIsNone(db_partner_limit.read_XFERO_Partner_Limit(1))
+
+        db_partner.delete_XFERO_Partner(2)
+        self.assertEqual(db_partner_limit.list_XFERO_Partner_Limit(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+''' Test Manage Xfer Retry'''
+import unittest
+import configparser
+import os
+from xfero.db import manage_cots_pattern as db_cots_pattern
+from xfero.db import manage_partner as db_partner
+from xfero.db import manage_priority as db_priority
+from xfero.db import manage_route as db_route
+from xfero.db import manage_xfer as db_xfer
+from xfero.db import manage_xfer_retry as db_retry
+from xfero.db import create_XFERO_DB as db
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the function ```crud_XFERO_Xfer_Retry```
+
+    **Usage Notes:**
+
+    XFERO stores the database location and database name in an ini file which is
+    found in <INSTALL_DIR>/conf/XFERO_config.ini. Before proceeding with the test
+    please ensure that the XFERO_config.ini file has been suitably modified for the
+    purposes of this test.
+
+    **Warning:**
+
+    ALL DATABASE TABLE WILL BE DROPPED DURING THE EXECUTION OF THESE TESTS
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a test /Xfero/ Database with a route and two transfers
+
+        '''
+        # Create the database
+        db.create_db()
+
+        db_priority.create_XFERO_Priority('1', 'High')
+        db_route.create_XFERO_Route('/xfero/IN', '^CIS_', '1', '1')
+        db_cots_pattern.create_XFERO_COTS_Pattern(
+            'CURL', 'FILE', 'curl -T {File_to_Send_with_Path} file:///x')
+        partner = ['PART001', 'Partner', 'FILE', 'localhost'] + [''] * 28
+        db_partner.create_XFERO_Partner(*partner)
+        db_xfer.create_XFERO_Xfer('1', '1', '1', 'curl', 'params', 'No')
+        db_xfer.create_XFERO_Xfer('1', '1', '1', 'curl', 'params', 'No')
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Delete the test /Xfero/ Database.
+
+        '''
+
+        config = configparser.RawConfigParser()
+        try:
+            config.read('conf/XFERO_config.ini')
+        except configparser.Error as err:
+            raise err
+
+        xfero_db = config.get('database', 'db_location')
+
+        # Delete the test DB
+        os.remove(xfero_db)
+
+    def create_retries(self):
+        '''Create a retry for each transfer, the first due before the second'''
+        for xfer_id, next_attempt in ((1, 1000.0), (2, 2000.0)):
+            result = db_retry.create_XFERO_Xfer_Retry(
+                1, xfer_id, 1, 1, '/xfero/retry/%s/CIS_FILE' % xfer_id,
+                'CIS_FILE', 'TOKEN', 1, next_attempt, 'RC 7')
+            self.assertEqual(result, 'Row Inserted', 'Row not inserted')
+
+    def test_create_read_XFERO_Xfer_Retry(self):
+        '''
+
+        **Purpose:**
+
+        INSERT rows into the XFERO_Xfer_Retry table and confirm they have been
+        successfully inserted.
+
+        '''
+        self.create_retries()
+
+        row = db_retry.read_XFERO_Xfer_Retry(2)
+        self.assertEqual(row, (2, 1, 2, 1, 1, '/xfero/retry/2/CIS_FILE',
+                               'CIS_FILE', 'TOKEN', 1, 2000.0, 'RC 7'))
+        self.assertEqual(len(db_retry.list_XFERO_Xfer_Retry()), 2)
+
+    def test_list_due_XFERO_Xfer_Retry(self):
+        '''
+
+        **Purpose:**
+
+        Only retries which are due are listed.
+
+        '''
+        self.create_retries()
+
+        self.assertEqual(db_retry.list_XFERO_Xfer_Retry_Due(500.0), [])
+        self.assertEqual(
+            [row[0] for row in db_retry.list_XFERO_Xfer_Retry_Due(1500.0)],
+            [1])
+        self.assertEqual(
+            [row[0] for row in db_retry.list_XFERO_Xfer_Retry_Due(2500.0)],
+            [1, 2])
+
+    def test_update_XFERO_Xfer_Retry(self):
+        '''
+
+        **Purpose:**
+
+        UPDATE the attempts and the time of the next attempt.
+
+        '''
+        self.create_retries()
+
+        result = db_retry.update_XFERO_Xfer_Retry(1, 2, 3000.0, 'RC 6')
+        self.assertEqual(result, 'Success', 'Update failed')
+        self.assertEqual(db_retry.read_XFERO_Xfer_Retry(1)[8:],
+                         (2, 3000.0, 'RC 6'))
+
+        result = db_retry.update_XFERO_Xfer_Retry_Next_Attempt(1, 4000.0)
+        self.assertEqual(result, 'Success', 'Update failed')
+        self.assertEqual(db_retry.read_XFERO_Xfer_Retry(1)[8:],
+                         (2, 4000.0, 'RC 6'))
+
+    def test_delete_XFERO_Xfer_Retry(self):
+        '''
+
+        **Purpose:**
+
+        DELETE a retry.
+
+        '''
+        self.create_retries()
+
+        result = db_retry.delete_XFERO_Xfer_Retry(1)
+        self.assertEqual(result, 'Success', 'Delete failed')
+        self.assertIsNone(db_retry.read_XFERO_Xfer_Retry(1))
+        self.assertEqual(len(db_retry.list_XFERO_Xfer_Retry()), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+'''Test Parallel Compress'''
+import bz2
+import gzip
+import io
+import lzma
+import os
+import shutil
+import tarfile
+import tempfile
+import unittest
+import zlib
+from xfero.workflow_manager import manage_archives
+from xfero.workflow_manager import parallel_compress
+from xfero.workflow_manager.manage_archives import Manage_Archives
+
+DECOMPRESS = {'gzip': gzip.decompress,
+              'bz2': bz2.decompress,
+              'lzma': lzma.decompress}
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the module ```parallel_compress``` and the parallel
+    compression of ```Manage_Archives```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory holding a file of several blocks
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = b''.join(b'Line %d of the test file\n' % num
+                             for num in range(5000))
+        self.filename = os.path.join(self.tmpdir, 'test.txt')
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+        self.block_size = manage_archives.compress_block_size
+        manage_archives.compress_block_size = 16384
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the temporary directory
+
+        '''
+        manage_archives.compress_block_size = self.block_size
+        shutil.rmtree(self.tmpdir)
+
+    def compress(self, data, codec, workers, block_size=16384):
+        '''Compress data with a Parallel_Writer'''
+        out = io.BytesIO()
+        with parallel_compress.Parallel_Writer(out, codec, 6, workers,
+                                               block_size) as writer:
+            writer.write(data)
+        return out.getvalue()
+
+    def test_codecs(self):
+        '''
+
+        **Purpose:**
+
+        The concatenated streams of each codec decompress to the original
+        data, whatever the number of threads.
+
+        '''
+        for codec in parallel_compress.CODECS:
+            for workers in (1, 3):
+                compressed = self.compress(self.data, codec, workers)
+                self.assertEqual(DECOMPRESS[codec](compressed), self.data,
+                                 '%s with %s workers' % (codec, workers))
+
+    def test_gzip_members(self):
+        '''
+
+        **Purpose:**
+
+        Each block is written as its own gzip member, in order.
+
+        '''
+        compressed = self.compress(self.data, 'gzip', 4)
+        members = []
+        while compressed:
+            member = zlib.decompressobj(zlib.MAX_WBITS | 16)
+            members.append(member.decompress(compressed))
+            compressed = member.unused_data
+        self.assertEqual(len(members), -(-len(self.data) // 16384))
+        self.assertEqual(b''.join(members), self.data)
+
+    def test_empty(self):
+        '''
+
+        **Purpose:**
+
+        An empty file is written as one empty stream.
+
+        '''
+        for codec in parallel_compress.CODECS:
+            self.assertEqual(DECOMPRESS[codec](self.compress(b'', codec, 2)),
+                             b'')
+
+    def test_invalid_codec(self):
+        '''
+
+        **Purpose:**
+
+        An unknown codec raises a ValueError.
+
+        '''
+        with self.assertRaises(ValueError):
+            parallel_compress.Parallel_Writer(io.BytesIO(), 'zstd')
+
+    def test_compress_file(self):
+        '''
+
+        **Purpose:**
+
+        Manage_Archives compresses a file without an archive, at the level
+        given, and deletes the file.
+
+        '''
+        compressed = Manage_Archives('test').compress_file(self.filename,
+                                                           '.xz', '1', '2')
+        self.assertEqual(compressed, self.filename + '.xz')
+        self.assertFalse(os.path.exists(self.filename))
+        with lzma.open(compressed) as infile:
+            self.assertEqual(infile.read(), self.data)
+
+    def test_compress_tar(self):
+        '''
+
+        **Purpose:**
+
+        Manage_Archives writes a tar archive, with the sum file, through the
+        parallel writer and extracts it again.
+
+        '''
+        for archive_type in ('.tar.gz', 'tar.bz2', '.tar.xz'):
+            filename = os.path.join(self.tmpdir, 'test.txt')
+            with open(filename, 'wb') as out:
+                out.write(self.data)
+            with open(filename + '.sum', 'w') as out:
+                out.write('sum')
+
+            obj = Manage_Archives('test')
+            archive = obj.compress_file(filename, archive_type, '9', '3')
+            self.assertTrue(archive.endswith(archive_type.lstrip('.')))
+            with tarfile.open(archive) as atar:
+                self.assertEqual(atar.getnames(), ['test.txt', 'test.txt.sum'])
+
+            extract_dir = os.path.join(self.tmpdir, 'extract')
+            obj.extract(archive, extract_dir)
+            with open(os.path.join(extract_dir, 'test.txt'), 'rb') as infile:
+                self.assertEqual(infile.read(), self.data)
+            shutil.rmtree(extract_dir)
+
+    def test_compress_dir(self):
+        '''
+
+        **Purpose:**
+
+        Manage_Archives writes a directory to a tar archive through the
+        parallel writer.
+
+        '''
+        dirname = os.path.join(self.tmpdir, 'dir')
+        os.mkdir(dirname)
+        shutil.move(self.filename, dirname)
+
+        archive = Manage_Archives('test').compress_dir(dirname, '.tar.xz',
+                                                       'batch')
+        self.assertTrue(archive.endswith('.tar.xz'))
+        with tarfile.open(archive) as atar:
+            self.assertEqual(atar.extractfile('test.txt').read(), self.data)
+
+if __name__ == '__main__':
+    unittest.main()
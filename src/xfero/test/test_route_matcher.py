@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+'''Test Route Matcher'''
+import unittest
+from xfero import route_matcher as matcher
+
+
+def make_route(route_id, monitoreddir, pattern, priority):
+    '''Build a route row as returned by list_XFERO_Route_Active'''
+    return {'route_id': route_id,
+            'route_monitoreddir': monitoreddir,
+            'route_filenamepattern': pattern,
+            'route_active': 1,
+            'route_priority': priority}
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Route_Matcher```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Set up a set of routes which share the monitored directory
+        ```/xfero/IN``` together with one route on ```/xfero/WIN1```
+
+        '''
+        self.routes = [
+            make_route(1, '/xfero/IN', '^CIS_', 3),
+            make_route(2, '/xfero/IN', '_PAYT$', 2),
+            make_route(3, '/xfero/IN', '^CIS_.*_PAYT$', 1),
+            make_route(4, '/xfero/IN', 'XYZ', 2),
+            make_route(5, '/xfero/WIN1', '^WIN1_Pattern', 1),
+        ]
+
+    def test_match_highest_priority(self):
+        '''
+
+        **Purpose:**
+
+        Where several route patterns match a file the route with the highest
+        priority (lowest route_priority) wins.
+
+        '''
+        obj = matcher.Route_Matcher(self.routes[:4])
+        self.assertIsNotNone(obj.combined)
+        self.assertEqual(obj.match('CIS_123_PAYT')['route_id'], 3)
+        self.assertEqual(obj.match('CIS_123_XYZ')['route_id'], 4)
+        self.assertEqual(obj.match('CIS_123')['route_id'], 1)
+        self.assertEqual(obj.match('UC_PAYT')['route_id'], 2)
+
+    def test_match_equal_priority_uses_route_id(self):
+        '''
+
+        **Purpose:**
+
+        Where routes of equal priority match a file the lowest route_id wins.
+
+        '''
+        obj = matcher.Route_Matcher(self.routes[:4])
+        self.assertEqual(obj.match('A_XYZ_PAYT')['route_id'], 2)
+
+    def test_no_match(self):
+        '''
+
+        **Purpose:**
+
+        A file which matches no pattern returns None.
+
+        '''
+        obj = matcher.Route_Matcher(self.routes[:4])
+        self.assertIsNone(obj.match('FCO_123'))
+        self.assertIsNone(obj.match('PAYT_CIS_'))
+
+    def test_search_semantics(self):
+        '''
+
+        **Purpose:**
+
+        Unanchored patterns match anywhere in the file name, as with
+        ```re.search```.
+
+        '''
+        obj = matcher.Route_Matcher(
+            [make_route(1, '/xfero/IN', r'\.csv', 1)])
+        self.assertEqual(obj.match('report.csv.gz')['route_id'], 1)
+        self.assertIsNone(obj.match('report_csv'))
+
+    def test_fallback_with_groups(self):
+        '''
+
+        **Purpose:**
+
+        Patterns containing capture groups and back-references are not
+        combined but still match in priority order.
+
+        '''
+        routes = [make_route(1, '/xfero/IN', r'^(\w)\1_', 2),
+                  make_route(2, '/xfero/IN', '_DAT$', 1)]
+        obj = matcher.Route_Matcher(routes)
+        self.assertIsNone(obj.combined)
+        self.assertEqual(obj.match('AA_FILE')['route_id'], 1)
+        self.assertEqual(obj.match('AA_DAT')['route_id'], 2)
+        self.assertIsNone(obj.match('AB_FILE'))
+
+    def test_invalid_pattern(self):
+        '''
+
+        **Purpose:**
+
+        A route with an invalid pattern is never matched and is reported in
+        the invalid attribute.
+
+        '''
+        routes = [make_route(1, '/xfero/IN', '^CIS_(', 1),
+                  make_route(2, '/xfero/IN', '^CIS_', 2)]
+        obj = matcher.Route_Matcher(routes)
+        self.assertEqual([route['route_id'] for route in obj.invalid], [1])
+        self.assertEqual(obj.match('CIS_123')['route_id'], 2)
+
+    def test_group_routes(self):
+        '''
+
+        **Purpose:**
+
+        Routes are grouped by monitored directory.
+
+        '''
+        matchers = matcher.group_routes(self.routes)
+        self.assertEqual(list(matchers.keys()), ['/xfero/IN', '/xfero/WIN1'])
+        self.assertEqual(len(matchers['/xfero/IN'].routes), 4)
+        self.assertEqual(
+            matchers['/xfero/WIN1'].match('WIN1_Pattern.txt')['route_id'], 5)
+
+if __name__ == "__main__":
+    unittest.main()
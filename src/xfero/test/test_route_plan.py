@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+'''Test Route Plan Cache'''
+import unittest
+import os
+from xfero import get_conf
+from xfero import route_plan
+from xfero.db import manage_cots_pattern as db_cots_pattern
+from xfero.db import manage_partner as db_partner
+from xfero.db import manage_priority as db_priority
+from xfero.db import manage_route as db_route
+from xfero.db import manage_xfer as db_xfer
+from xfero.db import manage_xfer_retry as db_retry
+from xfero.db import create_XFERO_DB as db
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Route_Plan_Cache```
+
+    **Usage Notes:**
+
+    XFERO stores the database location and database name in an ini file which is
+    found in <INSTALL_DIR>/conf/XFERO_config.ini. Before proceeding with the test
+    please ensure that the XFERO_config.ini file has been suitably modified for the
+    purposes of this test.
+
+    **Warning:**
+
+    ALL DATABASE TABLE WILL BE DROPPED DURING THE EXECUTION OF THESE TESTS
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_keep_on_retry                      |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_split_last                         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | test_split_last checks the warning            |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a test XFERO Database holding a single active route with one
+        transfer.
+
+        '''
+        db.create_db()
+
+        db_priority.create_XFERO_Priority('1', 'High')
+        db_route.create_XFERO_Route('/xfero/IN', '^CIS_', '1', '1')
+        db_cots_pattern.create_XFERO_COTS_Pattern(
+            'CURL', 'FILE', 'curl -T {File_to_Send_with_Path} file:///x')
+        partner = ['PART001', 'Partner', 'FILE', 'localhost'] + [''] * 28
+        db_partner.create_XFERO_Partner(*partner)
+        db_xfer.create_XFERO_Xfer('1', '1', '1', 'curl', 'params', 'No')
+
+        (xfero_logger, self.xfero_db, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+        self.cache = route_plan.Route_Plan_Cache(self.xfero_db)
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Delete the test XFERO Database.
+
+        '''
+        self.cache.close()
+
+        # Delete the test DB
+        os.remove(self.xfero_db)
+
+    def test_get(self):
+        '''
+
+        **Purpose:**
+
+        The plan for a route holds its xfer rows and is loaded once.
+
+        '''
+        plan = self.cache.get(1)
+        self.assertEqual(len(plan.workflow), 0)
+        self.assertEqual(len(plan.xfer), 1)
+        self.assertEqual(plan.xfer[0]['xfer_params'], 'params')
+        self.assertIs(self.cache.get('1'), plan)
+
+    def test_reload_on_change(self):
+        '''
+
+        **Purpose:**
+
+        A change committed to the database discards the cached plans and
+        routes.
+
+        '''
+        plan = self.cache.get(1)
+        routes = self.cache.active_routes()
+        self.assertEqual(len(routes), 1)
+        self.assertFalse(self.cache.check())
+
+        db_xfer.update_XFERO_Xfer(
+            '1', '1', '1', '1', 'curl', 'changed', 'No')
+        db_route.update_XFERO_Route('/xfero/IN', '^CIS_', '0', '1', '1')
+
+        self.assertTrue(self.cache.check())
+        self.assertIsNot(self.cache.get(1), plan)
+        self.assertEqual(self.cache.get(1).xfer[0]['xfer_params'], 'changed')
+        self.assertEqual(len(self.cache.active_routes()), 0)
+
+    def test_keep_on_retry(self):
+        '''
+
+        **Purpose:**
+
+        Recording a retry changes the database but not the configuration, so
+        the cached plans are kept.
+
+        '''
+        plan = self.cache.get(1)
+        self.assertFalse(self.cache.check())
+
+        db_retry.create_XFERO_Xfer_Retry(
+            1, 1, 1, 1, '/xfero/retry/1/CIS_FILE', 'CIS_FILE', 'TOKEN', 1,
+            0.0, 'RC 7')
+
+        self.assertFalse(self.cache.check())
+        self.assertIs(self.cache.get(1), plan)
+
+    def test_split_last(self):
+        '''
+
+        **Purpose:**
+
+        The items after a split are applied to the whole file before it is
+        split, and the move is logged.
+
+        '''
+        rows = [{'workflow_item_class': wf_class,
+                 'workflow_item_function_call': function_call,
+                 'workflow_item_args': args}
+                for wf_class, function_call, args in (
+                    ('Split_File', 'split_file', 'bytes, 1000'),
+                    ('Manage_Archives', 'compress_file', 'gz'),
+                    ('Transform_Filename', 'add_prefix', 'OUT_'))]
+        with self.assertLogs('workflow', 'WARNING') as logs:
+            plan = route_plan.Route_Plan('1', rows, ())
+        self.assertEqual(plan.workflow, (rows[1], rows[2], rows[0]))
+        self.assertEqual(plan.steps[-1], rows[0])
+        self.assertIn('Route 1: Split_File split_file moved to the end of the '
+                      'workflow, after Manage_Archives compress_file, '
+                      'Transform_Filename add_prefix', logs.output[0])
+
+        with self.assertNoLogs('workflow', 'WARNING'):
+            plan = route_plan.Route_Plan('1', plan.workflow, ())
+        self.assertEqual(plan.workflow, (rows[1], rows[2], rows[0]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+'''Test Split File'''
+import errno
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+from xfero.workflow_manager import split_file
+from xfero.workflow_manager.split_file import Split_File
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the class ```Split_File```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_copy_range_resume and              |
+    |            |             | test_merge_wait                               |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a sending and a receiving directory, and a file of 25 lines
+        to split.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.senddir = os.path.join(self.tmpdir, 'send')
+        self.recvdir = os.path.join(self.tmpdir, 'recv')
+        os.makedirs(self.senddir)
+        os.makedirs(self.recvdir)
+
+        self.data = b''.join(b'line %d of the file\n' % line
+                             for line in range(25))
+        self.filename = os.path.join(self.senddir, 'CIS_FILE')
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the directories.
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def read_file(self, path):
+        '''Return the contents of a file'''
+        with open(path, 'rb') as infile:
+            return infile.read()
+
+    def deliver(self, files):
+        '''Move the pieces and manifest to the receiving directory'''
+        for path in files:
+            shutil.move(path, self.recvdir)
+        return os.path.join(self.recvdir, os.path.basename(files[-1]))
+
+    def test_split_by_bytes(self):
+        '''
+
+        **Purpose:**
+
+        A file is split into pieces of a number of bytes, in order, followed
+        by the manifest, and the file is deleted.
+
+        '''
+        files = Split_File().split_file(self.filename, 'bytes', '100')
+
+        pieces = files[:-1]
+        self.assertEqual(len(pieces), (len(self.data) + 99) // 100)
+        self.assertEqual(os.path.basename(pieces[0]), 'CIS_FILE.part0001')
+        self.assertEqual(files[-1], self.filename + '.manifest')
+        self.assertEqual(b''.join(self.read_file(piece) for piece in pieces),
+                         self.data)
+        self.assertFalse(os.path.exists(self.filename))
+
+        name, root, size, entries = split_file.read_manifest(files[-1])
+        self.assertEqual((name, size), ('CIS_FILE', len(self.data)))
+        for piece, entry in zip(pieces, entries):
+            self.assertEqual(entry[2],
+                             hashlib.sha256(self.read_file(piece)).hexdigest())
+            self.assertEqual(entry[3], os.path.basename(piece))
+
+    def test_split_by_lines(self):
+        '''
+
+        **Purpose:**
+
+        A file is split into pieces of a number of lines, the last piece
+        holding the remainder.
+
+        '''
+        files = Split_File().split_file(self.filename, 'lines', '10')
+
+        lines = self.data.splitlines(True)
+        self.assertEqual([self.read_file(piece) for piece in files[:-1]],
+                         [b''.join(lines[0:10]), b''.join(lines[10:20]),
+                          b''.join(lines[20:])])
+
+    def test_line_ranges(self):
+        '''
+
+        **Purpose:**
+
+        Ranges end after the line end of their last line, across blocks, and a
+        last line without a line end is kept.
+
+        '''
+        saved_blocksize = split_file.BLOCKSIZE
+        split_file.BLOCKSIZE = 7
+        try:
+            with open(self.filename, 'wb') as out:
+                out.write(b'a\nbb\nccc\n\ndddd\ne')
+            self.assertEqual(split_file.line_ranges(self.filename, 2),
+                             [(0, 5), (5, 5), (10, 6)])
+            self.assertEqual(split_file.line_ranges(self.filename, 5),
+                             [(0, 15), (15, 1)])
+        finally:
+            split_file.BLOCKSIZE = saved_blocksize
+
+    def test_merge(self):
+        '''
+
+        **Purpose:**
+
+        The pieces are merged into the original file alongside the manifest,
+        from the directory they were received in.
+
+        '''
+        files = Split_File().split_file(self.filename, 'bytes', '64')
+        manifest = self.deliver(files)
+        shutil.move(manifest, self.tmpdir)
+        manifest = os.path.join(self.tmpdir, os.path.basename(manifest))
+
+        merged = Split_File().merge_file(manifest, self.recvdir, '0')
+        self.assertEqual(merged, os.path.join(self.tmpdir, 'CIS_FILE'))
+        self.assertEqual(self.read_file(merged), self.data)
+        self.assertEqual(os.listdir(self.recvdir), [])
+        self.assertFalse(os.path.exists(manifest))
+
+    def test_merge_wait(self):
+        '''
+
+        **Purpose:**
+
+        The merge waits for a piece which arrives after the manifest.
+
+        '''
+        files = Split_File().split_file(self.filename, 'bytes', '100')
+        late = os.path.join(self.tmpdir, os.path.basename(files[1]))
+        shutil.move(files[1], late)
+        manifest = self.deliver([files[0]] + files[2:])
+
+        timer = threading.Timer(0.5, shutil.move, (late, self.recvdir))
+        timer.start()
+        try:
+            merged = Split_File().merge_file(manifest, '', '30')
+        finally:
+            timer.join()
+        self.assertEqual(self.read_file(merged), self.data)
+
+    def test_merge_missing_piece(self):
+        '''
+
+        **Purpose:**
+
+        The file is not merged until every piece has been received.
+
+        '''
+        files = Split_File().split_file(self.filename, 'bytes', '100')
+        os.remove(files[1])
+        manifest = self.deliver([files[0]] + files[2:])
+
+        self.assertRaises(IOError, Split_File().merge_file, manifest, '', '0')
+        self.assertFalse(os.path.exists(os.path.join(self.recvdir,
+                                                     'CIS_FILE')))
+
+    def test_merge_corrupt_piece(self):
+        '''
+
+        **Purpose:**
+
+        A piece which does not match its digest fails verification.
+
+        '''
+        files = Split_File().split_file(self.filename, 'bytes', '100')
+        with open(files[0], 'r+b') as out:
+            out.write(b'X')
+        manifest = self.deliver(files)
+
+        self.assertRaises(ValueError, Split_File().merge_file, manifest, '',
+                          '0')
+        self.assertTrue(os.path.exists(manifest))
+
+    def test_copy_range_resume(self):
+        '''
+
+        **Purpose:**
+
+        A copy method which fails part way through is followed by the next
+        from the first byte it did not copy.
+
+        '''
+        def partial(copier):
+            '''Copy 10 bytes on the first call, then fail'''
+            calls = []
+
+            def copy(*args):
+                if calls:
+                    raise OSError(errno.EXDEV, 'Invalid cross-device link')
+                calls.append(args)
+                return copier(*args)
+            return copy
+
+        def copy_file_range(src_fd, dst_fd, count, offset):
+            return os.write(dst_fd, os.pread(src_fd, min(count, 10), offset))
+
+        def sendfile(dst_fd, src_fd, offset, count):
+            return os.write(dst_fd, os.pread(src_fd, min(count, 10), offset))
+
+        target = os.path.join(self.tmpdir, 'TARGET')
+        saved = dict((name, getattr(os, name)) for name in
+                     ('copy_file_range', 'sendfile') if hasattr(os, name))
+        os.copy_file_range = partial(copy_file_range)
+        os.sendfile = partial(sendfile)
+        try:
+            src_fd = os.open(self.filename, os.O_RDONLY)
+            dst_fd = os.open(target, os.O_WRONLY | os.O_CREAT, 0o644)
+            try:
+                os.write(dst_fd, b'HEAD')
+                split_file.copy_range(src_fd, dst_fd, 5, 200)
+            finally:
+                os.close(src_fd)
+                os.close(dst_fd)
+        finally:
+            for name in ('copy_file_range', 'sendfile'):
+                if name in saved:
+                    setattr(os, name, saved[name])
+                else:
+                    delattr(os, name)
+
+        self.assertEqual(self.read_file(target), b'HEAD' + self.data[5:205])
+
+    def test_invalid_split(self):
+        '''
+
+        **Purpose:**
+
+        An unknown split type or a size which is not a positive number is
+        rejected, and the file is left as it was.
+
+        '''
+        self.assertRaises(TypeError, Split_File().split_file, self.filename,
+                          'records', '10')
+        self.assertRaises(TypeError, Split_File().split_file, self.filename,
+                          'lines', 'ten')
+        self.assertEqual(os.listdir(self.senddir), ['CIS_FILE'])
+
+if __name__ == "__main__":
+    unittest.main()
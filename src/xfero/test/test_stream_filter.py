@@ -0,0 +1,280 @@
+#!/usr/bin/env python
+'''Test Stream Filter'''
+import gzip
+import io
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from xfero.workflow_manager import crypt
+from xfero.workflow_manager import line_end_converter
+from xfero.workflow_manager import stream_filter
+from xfero.workflow_manager.filename_pipeline import Filename_Pipeline
+from xfero.workflow_manager.line_end_converter import Line_End_Converter
+from xfero.workflow_manager.manage_archives import Manage_Archives
+
+PASSPHRASE = 'xfero test passphrase'
+
+
+def row(wf_class, function_call, args='NULL'):
+    '''Return a workflow item row'''
+    return {'workflow_item_class': wf_class,
+            'workflow_item_function_call': function_call,
+            'workflow_item_args': args}
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the module ```stream_filter```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added tests of Filter_Pipeline                |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory holding a text file with DOS line ends
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.data = b''.join(b'Line %d of the file\r\n' % num
+                             for num in range(20000))
+        self.filename = os.path.join(self.tmpdir, 'CIS_FILE')
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the temporary directory
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def test_trailing(self):
+        '''
+
+        **Purpose:**
+
+        Only the content steps at the end of the workflow which can be
+        applied to a stream are counted, and their suffixes are added to the
+        name in order.
+
+        '''
+        rows = (row('Manage_Archives', 'compress_file', 'tar.gz'),
+                row('Line_End_Converter', 'dos2unix'),
+                row('Manage_Archives', 'compress_file', 'gz'),
+                row('Crypt', 'encrypt_file', 'PART001'))
+        self.assertEqual(stream_filter.trailing_filters(rows), 3)
+        self.assertEqual(stream_filter.trailing_filters(rows[:1]), 0)
+        self.assertEqual(stream_filter.trailing_filters(
+            rows + (row('Transform_Filename', 'add_prefix', 'OUT_'),)), 0)
+
+        filters = stream_filter.build_filters(rows[1:], 'CIS_FILE', 'test')
+        self.assertEqual([stream.name for stream in filters],
+                         ['CIS_FILE', 'CIS_FILE', 'CIS_FILE.gz'])
+        self.assertEqual(''.join(stream.suffix for stream in filters),
+                         '.gz.gpg')
+
+    def test_line_end_compress(self):
+        '''
+
+        **Purpose:**
+
+        Converting and compressing a stream gives the data the workflow
+        steps would, with CRLF pairs split between blocks.
+
+        '''
+        filters = stream_filter.build_filters(
+            (row('Line_End_Converter', 'dos2unix'),
+             row('Manage_Archives', 'compress_file', 'gz, 6, 2')),
+            'CIS_FILE')
+        output = b''.join(stream_filter.file_blocks(self.filename, filters,
+                                                    block_size=4095))
+        expected = io.BytesIO()
+        line_end_converter.translate(io.BytesIO(self.data), expected, b'\n')
+        self.assertEqual(gzip.decompress(output), expected.getvalue())
+
+        filters = stream_filter.build_filters(
+            (row('Line_End_Converter', 'unix2dos'),), 'CIS_FILE')
+        self.assertEqual(b''.join(stream_filter.file_blocks(
+            self.filename, filters, block_size=7)), self.data)
+
+    def test_compile(self):
+        '''
+
+        **Purpose:**
+
+        Runs of two or more content steps are compiled into one pipeline. A
+        single content step and the other steps are left as they are.
+
+        '''
+        rows = (row('Line_End_Converter', 'dos2unix'),
+                row('Manage_Archives', 'compress_file', 'gz'),
+                row('Checksum', 'cksum', 'tar.gz'),
+                row('Line_End_Converter', 'unix2dos'))
+        name_step = Filename_Pipeline()
+        steps = stream_filter.compile_workflow(rows + (name_step,))
+        self.assertEqual(len(steps), 4)
+        self.assertEqual(steps[0].steps, [rows[0], rows[1]])
+        self.assertEqual(steps[1:], rows[2:] + (name_step,))
+
+    def test_fused(self):
+        '''
+
+        **Purpose:**
+
+        A pipeline writes the same file as running each step in turn, reading
+        and writing the file once, and leaves nothing else behind.
+
+        '''
+        Line_End_Converter('test').dos2unix(self.filename)
+        expected_name = Manage_Archives('test').compress_file(self.filename,
+                                                              'gz')
+        with open(expected_name, 'rb') as infile:
+            expected = infile.read()
+        os.remove(expected_name)
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+        os.chmod(self.filename, 0o640)
+
+        pipeline = stream_filter.compile_workflow(
+            (row('Line_End_Converter', 'dos2unix'),
+             row('Manage_Archives', 'compress_file', 'gz')))[0]
+        result = pipeline.process(self.filename, 'test')
+        self.assertEqual(result, expected_name)
+        self.assertEqual(os.listdir(self.tmpdir), ['CIS_FILE.gz'])
+        self.assertEqual(os.stat(result).st_mode & 0o777, 0o640)
+        with open(result, 'rb') as infile:
+            self.assertEqual(infile.read(), expected)
+
+    def test_fused_failure(self):
+        '''
+
+        **Purpose:**
+
+        A failed step leaves the file as it was.
+
+        '''
+        pipeline = stream_filter.compile_workflow(
+            (row('Line_End_Converter', 'dos2unix'),
+             row('Crypt', 'encrypt_file', 'not a key')))[0]
+        with self.assertRaises(Exception):
+            pipeline.process(self.filename, 'test')
+        self.assertEqual(os.listdir(self.tmpdir), ['CIS_FILE'])
+        with open(self.filename, 'rb') as infile:
+            self.assertEqual(infile.read(), self.data)
+
+    def test_reader(self):
+        '''
+
+        **Purpose:**
+
+        The Filter_Reader reads the blocks as a file, and closing it closes
+        the generator.
+
+        '''
+        blocks = stream_filter.file_blocks(self.filename, [], block_size=1000)
+        with stream_filter.Filter_Reader(blocks) as source:
+            self.assertEqual(source.read(10), self.data[:10])
+            self.assertEqual(source.read(), self.data[10:])
+            self.assertEqual(source.read(10), b'')
+
+        blocks = stream_filter.file_blocks(self.filename, [])
+        stream_filter.Filter_Reader(blocks).close()
+        with self.assertRaises(StopIteration):
+            next(blocks)
+
+    def test_run_streamed(self):
+        '''
+
+        **Purpose:**
+
+        The blocks are written to the command's stdin. A failure in the
+        blocks kills the command and is raised.
+
+        '''
+        popen, p_stdout, p_stderr = stream_filter.run_streamed(
+            [sys.executable, '-c',
+             'import sys; print(len(sys.stdin.buffer.read()))'],
+            stream_filter.file_blocks(self.filename, []))
+        self.assertEqual(popen.returncode, 0)
+        self.assertEqual(int(p_stdout), len(self.data))
+
+        def failing():
+            yield b'part of the file'
+            raise IOError('gpg failed')
+
+        with self.assertRaises(IOError):
+            stream_filter.run_streamed(
+                [sys.executable, '-c', 'import sys; sys.stdin.read()'],
+                failing())
+
+    @unittest.skipUnless(shutil.which('gpg'), 'gpg is not installed')
+    def test_encrypt(self):
+        '''
+
+        **Purpose:**
+
+        A stream encrypted and signed with gpg decrypts to the original.
+
+        '''
+        homedir = tempfile.mkdtemp()
+        saved_keyring = crypt.KEYRING
+        crypt.KEYRING = crypt.Key_Ring()
+        try:
+            gpg = ['gpg', '--homedir', homedir, '--batch', '--yes',
+                   '--pinentry-mode', 'loopback', '--passphrase', PASSPHRASE]
+            subprocess.check_output(gpg + [
+                '--quick-gen-key', 'XFERO Test <test@xfero>',
+                'future-default', 'default', 'never'],
+                                    stderr=subprocess.DEVNULL)
+            public_key = subprocess.check_output(
+                gpg + ['--armor', '--export']).decode('utf-8')
+            private_key = subprocess.check_output(
+                gpg + ['--armor', '--export-secret-keys'],
+                stderr=subprocess.DEVNULL).decode('utf-8')
+
+            filters = [stream_filter.Encrypt_Filter(
+                'CIS_FILE', 'test', public_key, 'Yes', private_key,
+                PASSPHRASE)]
+            encrypted = os.path.join(self.tmpdir, 'CIS_FILE.gpg')
+            with open(encrypted, 'wb') as out:
+                for block in stream_filter.file_blocks(self.filename,
+                                                       filters):
+                    out.write(block)
+
+            decrypted = subprocess.check_output(
+                gpg + ['--decrypt', encrypted], stderr=subprocess.DEVNULL)
+            self.assertEqual(decrypted, self.data)
+
+            filters = [stream_filter.Encrypt_Filter('CIS_FILE', 'test',
+                                                    'not a key')]
+            with self.assertRaises(Exception):
+                b''.join(stream_filter.file_blocks(self.filename, filters))
+        finally:
+            crypt.KEYRING.close()
+            crypt.KEYRING = saved_keyring
+            subprocess.call(['gpgconf', '--homedir', homedir, '--kill',
+                             'gpg-agent'])
+            shutil.rmtree(homedir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+'''Test Tree Hash'''
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from xfero.workflow_manager import tree_hash
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for ```tree_hash```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a file of five chunks, the last of them short.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.chunk_size = 1000
+        self.data = os.urandom(4500)
+        self.filename = os.path.join(self.tmpdir, 'CIS_FILE')
+        with open(self.filename, 'wb') as out:
+            out.write(self.data)
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Remove the file.
+
+        '''
+        shutil.rmtree(self.tmpdir)
+
+    def test_chunks(self):
+        '''
+
+        **Purpose:**
+
+        A file is divided into whole chunks and a short last chunk.
+
+        '''
+        self.assertEqual(tree_hash.chunks(0, 10), [(0, 0)])
+        self.assertEqual(tree_hash.chunks(20, 10), [(0, 10), (10, 10)])
+        self.assertEqual(tree_hash.chunks(25, 10),
+                         [(0, 10), (10, 10), (20, 5)])
+
+    def test_merkle_root(self):
+        '''
+
+        **Purpose:**
+
+        Pairs are hashed together and an odd digest is carried up.
+
+        '''
+        leaves = [hashlib.sha256(bytes([i])).digest() for i in range(3)]
+        pair = hashlib.sha256(leaves[0] + leaves[1]).digest()
+        root = hashlib.sha256(pair + leaves[2]).hexdigest()
+
+        self.assertEqual(tree_hash.merkle_root([leaf.hex()
+                                                for leaf in leaves]), root)
+        self.assertEqual(tree_hash.merkle_root([leaves[0].hex()]),
+                         leaves[0].hex())
+
+    def test_tree_sums(self):
+        '''
+
+        **Purpose:**
+
+        The chunk digests are those of the chunks, and hashing them in a
+        process pool gives the same tree as hashing them in turn.
+
+        '''
+        tree = tree_hash.tree_sums(self.filename, self.chunk_size, 1)
+        self.assertEqual(tree['size'], 4500)
+        self.assertEqual(
+            tree['chunks'],
+            [hashlib.sha256(self.data[i:i + 1000]).hexdigest()
+             for i in range(0, 4500, 1000)])
+        self.assertEqual(tree,
+                         tree_hash.tree_sums(self.filename, self.chunk_size,
+                                             3))
+
+    def test_manifest(self):
+        '''
+
+        **Purpose:**
+
+        A manifest is read back as the tree it was written from, and a
+        manifest whose digests do not give its root is rejected.
+
+        '''
+        tree = tree_hash.tree_sums(self.filename, self.chunk_size, 1)
+        manifest = self.filename + '.sum'
+        with open(manifest, 'w') as out:
+            out.writelines(tree_hash.manifest_lines('CIS_FILE', tree))
+        self.assertEqual(tree_hash.read_manifest(manifest), tree)
+
+        lines = tree_hash.manifest_lines('CIS_FILE', tree)
+        lines[3] = lines[3].replace(tree['chunks'][1], '0' * 64)
+        with open(manifest, 'w') as out:
+            out.writelines(lines)
+        self.assertRaises(ValueError, tree_hash.read_manifest, manifest)
+
+    def test_verify(self):
+        '''
+
+        **Purpose:**
+
+        Only the chunks which differ from the tree fail verification.
+
+        '''
+        tree = tree_hash.tree_sums(self.filename, self.chunk_size, 1)
+        self.assertEqual(tree_hash.verify(self.filename, tree, 1), [])
+
+        with open(self.filename, 'r+b') as out:
+            out.seek(2500)
+            out.write(b'X')
+        self.assertEqual(tree_hash.verify(self.filename, tree, 1), [2])
+
+        with open(self.filename, 'ab') as out:
+            out.write(os.urandom(1000))
+        self.assertEqual(tree_hash.verify(self.filename, tree, 1), [2, 4, 5])
+
+        os.truncate(self.filename, 3000)
+        self.assertEqual(tree_hash.verify(self.filename, tree, 1), [2, 3, 4])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+'''Test Workflow Pool'''
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+from xfero import workflow_pool
+from xfero.workflow_manager import stream_filter
+from xfero.workflow_manager.line_end_converter import Line_End_Converter
+from xfero.workflow_manager.transform_filename import Transform_Filename
+
+
+def row(wf_class, function_call, args='NULL'):
+    '''Return a workflow item row'''
+    return {'workflow_item_class': wf_class,
+            'workflow_item_function_call': function_call,
+            'workflow_item_args': args}
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the module ```workflow_pool```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added test_directory                          |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+
+        **Purpose:**
+
+        Create a temporary directory holding files with DOS line ends, and
+        use a pool of two processes
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.filenames = []
+        for num in range(3):
+            filename = os.path.join(self.tmpdir, 'CIS_FILE_%s' % num)
+            with open(filename, 'wb') as out:
+                out.write(b'Line of file %d\r\n' % num * 1000)
+            self.filenames.append(filename)
+
+        workflow_pool.close_pool()
+        self.processes = workflow_pool.workflow_processes
+        workflow_pool.workflow_processes = 2
+
+    def tearDown(self):
+        '''
+
+        **Purpose:**
+
+        Stop the pool and remove the temporary directory
+
+        '''
+        workflow_pool.close_pool()
+        workflow_pool.workflow_processes = self.processes
+        shutil.rmtree(self.tmpdir)
+
+    def read_file(self, filename):
+        '''Return the contents of a file'''
+        with open(filename, 'rb') as infile:
+            return infile.read()
+
+    def test_cpu_bound(self):
+        '''
+
+        **Purpose:**
+
+        The method of a CPU bound class is run in the pool for each piece,
+        and the results are returned in order.
+
+        '''
+        self.assertTrue(workflow_pool.is_cpu_bound(Line_End_Converter('test')))
+        results = workflow_pool.run(Line_End_Converter('test'), 'dos2unix',
+                                    [(name,) for name in self.filenames],
+                                    'test')
+        self.assertEqual(results, self.filenames)
+        self.assertIsNotNone(workflow_pool.POOL)
+        for num, filename in enumerate(self.filenames):
+            self.assertEqual(self.read_file(filename),
+                             b'Line of file %d\n' % num * 1000)
+
+    def test_directory(self):
+        '''
+
+        **Purpose:**
+
+        Each file of a directory is converted by its own call in the pool,
+        and the directory is returned.
+
+        '''
+        pool = workflow_pool.get_pool()
+        submitted = []
+        submit = pool.submit
+
+        def record_submit(func, *args):
+            '''Record the arguments of each call submitted to the pool'''
+            submitted.append(args)
+            return submit(func, *args)
+
+        pool.submit = record_submit
+        results = workflow_pool.run(Line_End_Converter('test'), 'dos2unix',
+                                    [(self.tmpdir,)], 'test')
+        self.assertEqual(results, [self.tmpdir])
+        self.assertEqual(sorted(args[3][0] for args in submitted),
+                         self.filenames)
+        self.assertTrue(all(args[2] == 'convert_file' for args in submitted))
+        for num, filename in enumerate(self.filenames):
+            self.assertEqual(self.read_file(filename),
+                             b'Line of file %d\n' % num * 1000)
+
+    def test_io_bound(self):
+        '''
+
+        **Purpose:**
+
+        The method of any other class is called on the thread, and the pool
+        is not started.
+
+        '''
+        result = workflow_pool.run(Transform_Filename('test'), 'add_prefix',
+                                   [(self.filenames[0], 'OUT_')], 'test')
+        self.assertEqual(result, [os.path.join(self.tmpdir,
+                                               'OUT_CIS_FILE_0')])
+        self.assertIsNone(workflow_pool.POOL)
+
+    def test_pipeline(self):
+        '''
+
+        **Purpose:**
+
+        A Filter_Pipeline with a CPU bound step is run in the pool.
+
+        '''
+        pipeline = stream_filter.compile_workflow(
+            (row('Line_End_Converter', 'dos2unix'),
+             row('Manage_Archives', 'compress_file', 'gz')))[0]
+        self.assertTrue(workflow_pool.is_cpu_bound(pipeline))
+        result = workflow_pool.run(pipeline, 'process',
+                                   [(self.filenames[0], 'test')], 'test')[0]
+        self.assertEqual(result, self.filenames[0] + '.gz')
+        self.assertEqual(gzip.decompress(self.read_file(result)),
+                         b'Line of file 0\n' * 1000)
+
+    def test_error(self):
+        '''
+
+        **Purpose:**
+
+        An exception in the pool is raised once every call has finished.
+
+        '''
+        missing = os.path.join(self.tmpdir, 'MISSING')
+        with self.assertRaises(IOError):
+            workflow_pool.run(Line_End_Converter('test'), 'dos2unix',
+                              [(missing,), (self.filenames[0],)], 'test')
+        self.assertEqual(self.read_file(self.filenames[0]),
+                         b'Line of file 0\n' * 1000)
+
+    def test_disabled(self):
+        '''
+
+        **Purpose:**
+
+        With workflow_processes 0 every step is called on the thread.
+
+        '''
+        workflow_pool.workflow_processes = 0
+        workflow_pool.run(Line_End_Converter('test'), 'dos2unix',
+                          [(self.filenames[0],)], 'test')
+        self.assertIsNone(workflow_pool.POOL)
+        self.assertEqual(self.read_file(self.filenames[0]),
+                         b'Line of file 0\n' * 1000)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,441 @@
+#!/usr/bin/env python
+'''Test Transfer Engines'''
+import http.server
+import os
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+import unittest
+from xfero.xfer_engine import engines
+from xfero.xfer_engine import local_engine
+from xfero.xfer_engine import session_pool
+
+
+class Stand_In_HTTP_Handler(http.server.BaseHTTPRequestHandler):
+
+    '''Stand-in HTTP server accepting PUT requests into a directory'''
+
+    protocol_version = 'HTTP/1.1'
+
+    def do_PUT(self):
+        '''Store the request body'''
+        if self.headers.get('Transfer-Encoding') == 'chunked':
+            body = self.read_chunked()
+        else:
+            body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests.append(
+            (self.path, self.headers.get('Authorization'), body))
+        if self.path.startswith('/denied'):
+            self.send_response(403)
+        else:
+            self.send_response(201)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def read_chunked(self):
+        '''Read a chunked request body'''
+        body = b''
+        while True:
+            size = int(self.rfile.readline().split(b';')[0], 16)
+            if not size:
+                self.rfile.readline()
+                return body
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+    def log_message(self, *args):
+        '''Quiet'''
+        pass
+
+
+class Stand_In_HTTP_Server(socketserver.ThreadingMixIn,
+                           http.server.HTTPServer):
+
+    '''Stand-in HTTP server counting connections'''
+
+    daemon_threads = True
+
+    def __init__(self):
+        http.server.HTTPServer.__init__(self, ('127.0.0.1', 0),
+                                        Stand_In_HTTP_Handler)
+        self.requests = []
+        self.connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        socketserver.ThreadingMixIn.process_request(
+            self, request, client_address)
+
+
+class Stand_In_FTP_Handler(socketserver.StreamRequestHandler):
+
+    '''Minimal stand-in FTP server supporting passive STOR and rename'''
+
+    def reply(self, line):
+        '''Send a reply line'''
+        self.wfile.write((line + '\r\n').encode('utf-8'))
+
+    def handle(self):
+        '''Handle the control connection'''
+        self.server.connections += 1
+        root = self.server.root
+        passive = None
+        rename_from = None
+        self.reply('220 Stand-in FTP')
+        for line in self.rfile:
+            command, _, arg = line.decode('utf-8').rstrip('\r\n').partition(' ')
+            command = command.upper()
+            if command == 'USER':
+                self.reply('331 Password required')
+            elif command == 'PASS':
+                if arg == self.server.password:
+                    self.reply('230 Logged in')
+                else:
+                    self.reply('530 Login incorrect')
+            elif command in ('TYPE', 'NOOP'):
+                self.reply('200 OK')
+            elif command == 'PASV':
+                passive = socket.socket()
+                passive.bind(('127.0.0.1', 0))
+                passive.listen(1)
+                port = passive.getsockname()[1]
+                self.reply('227 Entering Passive Mode (127,0,0,1,%d,%d)' %
+                           (port >> 8, port & 0xff))
+            elif command == 'STOR':
+                self.reply('150 Opening data connection')
+                data, _ = passive.accept()
+                with open(os.path.join(root, arg.lstrip('/')), 'wb') as out:
+                    while True:
+                        block = data.recv(65536)
+                        if not block:
+                            break
+                        out.write(block)
+                data.close()
+                passive.close()
+                self.server.stored.append(arg)
+                self.reply('226 Transfer complete')
+            elif command == 'RNFR':
+                rename_from = arg
+                self.reply('350 Ready for RNTO')
+            elif command == 'RNTO':
+                os.rename(os.path.join(root, rename_from.lstrip('/')),
+                          os.path.join(root, arg.lstrip('/')))
+                self.reply('250 Rename successful')
+            elif command == 'QUIT':
+                self.reply('221 Goodbye')
+                break
+            else:
+                self.reply('502 Command not implemented')
+
+
+class Stand_In_FTP_Server(socketserver.ThreadingTCPServer):
+
+    '''Stand-in FTP server counting connections'''
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, root, password):
+        socketserver.ThreadingTCPServer.__init__(
+            self, ('127.0.0.1', 0), Stand_In_FTP_Handler)
+        self.root = root
+        self.password = password
+        self.connections = 0
+        self.stored = []
+
+
+def make_row(product, port, user='xfero', password='xferopassword',
+             partner=1):
+    '''Build a row as returned by join_xfer_partner'''
+    return {'xfer_partner': partner,
+            'cotspattern_product': product,
+            'partner_remote_system_id': '127.0.0.1',
+            'partner_control_port': port,
+            'partner_remote_user': user,
+            'partner_remote_password': password,
+            'partner_CA_certificate': '',
+            'partner_cert_bundle': ''}
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for the in-process transfer engines in
+    ```xfero.xfer_engine```. The FTP and HTTP engines are tested against
+    stand-in servers listening on the loopback interface.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added tests of XFERO_LINK                     |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added tests of sending a file object          |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a file to send, a target directory and a session pool.
+
+        '''
+        self.tmpdir = tempfile.mkdtemp()
+        self.target = os.path.join(self.tmpdir, 'target')
+        os.mkdir(self.target)
+        self.sendfile = os.path.join(self.tmpdir, 'xfero_FILE_1')
+        with open(self.sendfile, 'wb') as out:
+            out.write(b'XFERO test data\n' * 1000)
+        self.pool = session_pool.Session_Pool()
+        self.servers = []
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Close the sessions, stop the servers and remove the files.
+
+        '''
+        self.pool.close_all()
+        for server in self.servers:
+            server.shutdown()
+            server.server_close()
+        shutil.rmtree(self.tmpdir)
+
+    def start(self, server):
+        '''Start a stand-in server'''
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.servers.append(server)
+        return server
+
+    def test_is_engine(self):
+        '''
+
+        **Purpose:**
+
+        Only the XFERO_ COTS pattern products are handled in-process.
+
+        '''
+        self.assertTrue(engines.is_engine('XFERO_FTP'))
+        self.assertTrue(engines.is_engine('XFERO_LOCAL'))
+        self.assertFalse(engines.is_engine('FTP_CLEAR'))
+        self.assertFalse(engines.is_engine(None))
+
+    def test_ftp(self):
+        '''
+
+        **Purpose:**
+
+        Files are stored under the temporary name and renamed, and the
+        logged in session is reused for the second file.
+
+        '''
+        server = self.start(Stand_In_FTP_Server(self.target, 'xferopassword'))
+        row = make_row('XFERO_FTP', server.server_address[1])
+
+        for name in ('FILE_1', 'FILE_2'):
+            engines.send(row, self.sendfile, '/', name, 'xfero_' + name,
+                         pool=self.pool)
+
+        self.assertEqual(server.stored, ['/xfero_FILE_1', '/xfero_FILE_2'])
+        self.assertEqual(sorted(os.listdir(self.target)),
+                         ['FILE_1', 'FILE_2'])
+        with open(os.path.join(self.target, 'FILE_2'), 'rb') as received, \
+            open(self.sendfile, 'rb') as sent:
+            self.assertEqual(received.read(), sent.read())
+        self.assertEqual(server.connections, 1)
+
+    def test_ftp_login_failure(self):
+        '''
+
+        **Purpose:**
+
+        A failed login raises an exception.
+
+        '''
+        server = self.start(Stand_In_FTP_Server(self.target, 'other'))
+        row = make_row('XFERO_FTP', server.server_address[1])
+        with self.assertRaises(Exception):
+            engines.send(row, self.sendfile, '/', 'FILE_1', 'xfero_FILE_1',
+                         pool=self.pool)
+        self.assertEqual(os.listdir(self.target), [])
+
+    def test_http(self):
+        '''
+
+        **Purpose:**
+
+        Files are sent with PUT and basic authentication on a single
+        keep-alive connection.
+
+        '''
+        server = self.start(Stand_In_HTTP_Server())
+        row = make_row('XFERO_HTTP', server.server_address[1])
+
+        for name in ('FILE_1', 'FILE_2', 'FILE 3'):
+            status = engines.send(row, self.sendfile, '/in/', name,
+                                  pool=self.pool)
+            self.assertEqual(status, 201)
+
+        self.assertEqual([request[0] for request in server.requests],
+                         ['/in/FILE_1', '/in/FILE_2', '/in/FILE%203'])
+        self.assertTrue(server.requests[0][1].startswith('Basic '))
+        with open(self.sendfile, 'rb') as sent:
+            self.assertEqual(server.requests[0][2], sent.read())
+        self.assertEqual(server.connections, 1)
+
+    def test_http_stream(self):
+        '''
+
+        **Purpose:**
+
+        A file object is sent chunked on a new connection.
+
+        '''
+        server = self.start(Stand_In_HTTP_Server())
+        row = make_row('XFERO_HTTP', server.server_address[1])
+
+        for name in ('FILE_1', 'FILE_2'):
+            with open(self.sendfile, 'rb') as source:
+                engines.send(row, source, '/in/', name, pool=self.pool)
+
+        with open(self.sendfile, 'rb') as sent:
+            data = sent.read()
+        self.assertEqual([request[2] for request in server.requests],
+                         [data, data])
+        self.assertEqual(server.connections, 2)
+
+    def test_http_reconnect(self):
+        '''
+
+        **Purpose:**
+
+        A pooled connection closed by the server is replaced transparently.
+
+        '''
+        server = self.start(Stand_In_HTTP_Server())
+        row = make_row('XFERO_HTTP', server.server_address[1])
+
+        engines.send(row, self.sendfile, '/in/', 'FILE_1', pool=self.pool)
+        for sessions in self.pool.idle.values():
+            for session, last_used in sessions:
+                session.con.sock.shutdown(socket.SHUT_RDWR)
+
+        engines.send(row, self.sendfile, '/in/', 'FILE_2', pool=self.pool)
+        self.assertEqual(len(server.requests), 2)
+
+    def test_http_failure(self):
+        '''
+
+        **Purpose:**
+
+        A response other than 2xx raises an exception and the session is not
+        returned to the pool.
+
+        '''
+        server = self.start(Stand_In_HTTP_Server())
+        row = make_row('XFERO_HTTP', server.server_address[1])
+        with self.assertRaises(Exception):
+            engines.send(row, self.sendfile, '/denied/', 'FILE_1',
+                         pool=self.pool)
+        self.assertEqual(self.pool.idle, {})
+
+    def test_local(self):
+        '''
+
+        **Purpose:**
+
+        Files are delivered into an existing directory and no temporary file
+        is left behind.
+
+        '''
+        row = make_row('XFERO_LOCAL', '')
+        result = engines.send(row, self.sendfile, self.target, 'FILE_1',
+                              'xfero_FILE_1', pool=self.pool)
+        self.assertEqual(result, os.path.join(self.target, 'FILE_1'))
+        self.assertEqual(os.listdir(self.target), ['FILE_1'])
+
+    def test_local_stream(self):
+        '''
+
+        **Purpose:**
+
+        A file object is copied by XFERO_LOCAL and XFERO_LINK.
+
+        '''
+        for product in ('XFERO_LOCAL', 'XFERO_LINK'):
+            row = make_row(product, '')
+            with open(self.sendfile, 'rb') as source:
+                result = engines.send(row, source, self.target, product,
+                                      pool=self.pool)
+            with open(result, 'rb') as received, \
+                open(self.sendfile, 'rb') as sent:
+                self.assertEqual(received.read(), sent.read())
+            self.assertEqual(os.stat(result).st_nlink, 1)
+        self.assertEqual(sorted(os.listdir(self.target)),
+                         ['XFERO_LINK', 'XFERO_LOCAL'])
+
+    def test_link(self):
+        '''
+
+        **Purpose:**
+
+        On the same filesystem the file is delivered by a reflink or a hard
+        link rather than copied, and no temporary file is left behind.
+
+        '''
+        try:
+            local_engine.reflink(self.sendfile,
+                                 os.path.join(self.tmpdir, 'reflink'))
+            reflinks = True
+        except OSError:
+            reflinks = False
+
+        row = make_row('XFERO_LINK', '')
+        result = engines.send(row, self.sendfile, self.target, 'FILE_1',
+                              'xfero_FILE_1', pool=self.pool)
+        self.assertEqual(result, os.path.join(self.target, 'FILE_1'))
+        self.assertEqual(os.listdir(self.target), ['FILE_1'])
+        if not reflinks:
+            self.assertTrue(os.path.samefile(self.sendfile, result))
+
+        # Sending the file again replaces the delivered file
+        result = engines.send(row, self.sendfile, self.target, 'FILE_1',
+                              'xfero_FILE_1', pool=self.pool)
+        self.assertEqual(os.listdir(self.target), ['FILE_1'])
+        with open(result, 'rb') as infile:
+            self.assertEqual(infile.read(), b'XFERO test data\n' * 1000)
+
+    @unittest.skipUnless(os.path.isdir('/dev/shm'), 'No /dev/shm')
+    def test_link_other_filesystem(self):
+        '''
+
+        **Purpose:**
+
+        A file which cannot be linked to the target is copied.
+
+        '''
+        target = tempfile.mkdtemp(dir='/dev/shm')
+        try:
+            row = make_row('XFERO_LINK', '')
+            result = engines.send(row, self.sendfile, target, 'FILE_1',
+                                  'xfero_FILE_1', pool=self.pool)
+            self.assertFalse(os.path.samefile(self.sendfile, result))
+            self.assertEqual(os.listdir(target), ['FILE_1'])
+            with open(result, 'rb') as infile:
+                self.assertEqual(infile.read(), b'XFERO test data\n' * 1000)
+        finally:
+            shutil.rmtree(target)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python
+'''Test Xfer Retry'''
+import unittest
+import os
+import queue
+import shutil
+import tempfile
+import time
+from xfero import get_conf
+from xfero import xfer_retry
+from xfero.db import manage_cots_pattern as db_cots_pattern
+from xfero.db import manage_partner as db_partner
+from xfero.db import manage_priority as db_priority
+from xfero.db import manage_route as db_route
+from xfero.db import manage_xfer as db_xfer
+from xfero.db import manage_xfer_retry as db_retry
+from xfero.db import create_XFERO_DB as db
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for ```xfer_retry```: the circuit breaker, the backoff
+    and the retry schedule held in the XFERO_Xfer_Retry table.
+
+    **Usage Notes:**
+
+    XFERO stores the database location and database name in an ini file which is
+    found in <INSTALL_DIR>/conf/XFERO_config.ini. Before proceeding with the test
+    please ensure that the XFERO_config.ini file has been suitably modified for the
+    purposes of this test.
+
+    **Warning:**
+
+    ALL DATABASE TABLE WILL BE DROPPED DURING THE EXECUTION OF THESE TESTS
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a test XFERO Database holding a route with one transfer, a file
+        to send and a retry directory.
+
+        '''
+        db.create_db()
+
+        db_priority.create_XFERO_Priority('1', 'High')
+        db_route.create_XFERO_Route('/xfero/IN', '^CIS_', '1', '1')
+        db_cots_pattern.create_XFERO_COTS_Pattern(
+            'CURL', 'FILE', 'curl -T {File_to_Send_with_Path} file:///x')
+        partner = ['PART001', 'Partner', 'FILE', 'localhost'] + [''] * 28
+        db_partner.create_XFERO_Partner(*partner)
+        db_xfer.create_XFERO_Xfer('1', '1', '1', 'curl', 'params', 'No')
+
+        (xfero_logger, self.xfero_db, outbound_directory, transient_directory,
+         error_directory, xfero_pid) = get_conf.get_xfero_config()
+
+        self.tmpdir = tempfile.mkdtemp()
+        self.saved_directory = xfer_retry.retry_directory
+        xfer_retry.retry_directory = os.path.join(self.tmpdir, 'retry')
+        self.saved_breaker = xfer_retry.BREAKER
+        xfer_retry.BREAKER = xfer_retry.Circuit_Breaker(threshold=2,
+                                                        probe=60)
+
+        self.sendfile = os.path.join(self.tmpdir, 'xfero_CIS_FILE')
+        with open(self.sendfile, 'w') as out:
+            out.write('XFERO test data\n')
+        self.row = {'xfer_id': 1, 'xfer_partner': 1}
+
+    def tearDown(self):
+        '''
+        **Purpose:**
+
+        Delete the test XFERO Database and files.
+
+        '''
+        xfer_retry.retry_directory = self.saved_directory
+        xfer_retry.BREAKER = self.saved_breaker
+        shutil.rmtree(self.tmpdir)
+
+        # Delete the test DB
+        os.remove(self.xfero_db)
+
+    def test_backoff(self):
+        '''
+
+        **Purpose:**
+
+        The delay doubles with each attempt, with jitter, up to the maximum.
+
+        '''
+        for attempts in range(1, 20):
+            delay = min(xfer_retry.retry_max_delay,
+                        xfer_retry.retry_delay * 2 ** (attempts - 1))
+            wait = xfer_retry.backoff(attempts)
+            self.assertGreaterEqual(wait, delay / 2)
+            self.assertLessEqual(wait, delay)
+
+    def test_circuit_breaker(self):
+        '''
+
+        **Purpose:**
+
+        The circuit opens after the threshold of consecutive failures, lets a
+        single probe through once the probe interval has passed, and closes
+        when the probe succeeds.
+
+        '''
+        breaker = xfer_retry.Circuit_Breaker(threshold=2, probe=0.2)
+
+        breaker.record_failure(1)
+        self.assertTrue(breaker.allow(1))
+        breaker.record_failure(1)
+        self.assertFalse(breaker.allow(1))
+        self.assertFalse(breaker.ready(1))
+        self.assertTrue(breaker.allow(2))
+        self.assertGreater(breaker.reopen_at(1), time.time())
+
+        time.sleep(0.25)
+        self.assertTrue(breaker.ready(1))
+        self.assertTrue(breaker.allow(1))
+        self.assertFalse(breaker.allow(1), 'Only one probe at a time')
+
+        # A failed probe keeps the circuit open for another interval
+        breaker.record_failure(1)
+        self.assertFalse(breaker.allow(1))
+        time.sleep(0.25)
+        self.assertTrue(breaker.allow(1))
+        breaker.record_success(1)
+        self.assertFalse(breaker.is_open(1))
+        self.assertTrue(breaker.allow(1))
+
+    def test_schedule_and_dispatch(self):
+        '''
+
+        **Purpose:**
+
+        A failed transfer is held in the retry directory and put to the xfer
+        queue once it is due, and is leased while in progress.
+
+        '''
+        retry_file = xfer_retry.schedule(1, 1, 'CIS_FILE', 'TOKEN', self.row,
+                                         self.sendfile, 'CIS_FILE', 7)
+        self.assertEqual(os.path.basename(retry_file), 'CIS_FILE')
+        self.assertTrue(os.path.isfile(retry_file))
+
+        (retry_id, route, xfer, partner, priority, held, original, token,
+         attempts, next_attempt, error) = db_retry.list_XFERO_Xfer_Retry()[0]
+        self.assertEqual((attempts, error, held), (1, 'RC 7', retry_file))
+        self.assertGreater(next_attempt, time.time())
+
+        xferq = queue.Queue()
+        dispatcher = xfer_retry.Retry_Thread(xferq)
+        self.assertEqual(dispatcher.dispatch(), 0, 'Not yet due')
+
+        db_retry.update_XFERO_Xfer_Retry_Next_Attempt(retry_id, time.time())
+        self.assertEqual(dispatcher.dispatch(), 1)
+        self.assertEqual(xferq.get_nowait(),
+                         (1, 1, retry_file, 'CIS_FILE', 'TOKEN',
+                          (retry_id, 1, 1, 1)))
+        self.assertEqual(dispatcher.dispatch(), 0, 'Leased')
+
+    def test_open_circuit_defers(self):
+        '''
+
+        **Purpose:**
+
+        A retry for a partner whose circuit is open is deferred until the
+        next probe without an attempt being counted.
+
+        '''
+        xfer_retry.BREAKER.record_failure(1)
+        xfer_retry.BREAKER.record_failure(1)
+
+        xfer_retry.schedule(1, 1, 'CIS_FILE', 'TOKEN', self.row,
+                            self.sendfile, 'CIS_FILE', None)
+        row = db_retry.list_XFERO_Xfer_Retry()[0]
+        self.assertEqual(row[8], 0)
+        self.assertGreater(row[9], time.time() + 50)
+
+        self.assertTrue(xfer_retry.reschedule((row[0], 1, 1, 0), None))
+        self.assertEqual(db_retry.read_XFERO_Xfer_Retry(row[0])[8], 0)
+
+    def test_retry_budget(self):
+        '''
+
+        **Purpose:**
+
+        A retry is rescheduled until the retry budget is used up and then
+        deleted.
+
+        '''
+        xfer_retry.schedule(1, 1, 'CIS_FILE', 'TOKEN', self.row,
+                            self.sendfile, 'CIS_FILE', 7)
+        retry_id = db_retry.list_XFERO_Xfer_Retry()[0][0]
+
+        for attempts in range(1, xfer_retry.xfer_retries):
+            self.assertTrue(xfer_retry.reschedule((retry_id, 1, 1, attempts),
+                                                  7))
+            self.assertEqual(db_retry.read_XFERO_Xfer_Retry(retry_id)[8],
+                             attempts + 1)
+
+        self.assertFalse(xfer_retry.reschedule(
+            (retry_id, 1, 1, xfer_retry.xfer_retries), 7))
+        self.assertIsNone(db_retry.read_XFERO_Xfer_Retry(retry_id))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+'''Test Xfer Scheduler'''
+import io
+import queue
+import threading
+import time
+import unittest
+from xfero.xfer_engine.throttle import Throttled_File, Token_Bucket
+from xfero.xfer_scheduler import Xfer_Scheduler
+
+
+def make_work(priority, partner, name):
+    '''Build a work item for a route sending to the partner'''
+    return (priority, partner, name, name, 'TOKEN')
+
+
+class Test(unittest.TestCase):
+
+    '''
+
+    **Purpose:**
+
+    Unit Test class for ```xfer_scheduler.Xfer_Scheduler``` and the token
+    bucket in ```xfer_engine.throttle```. The partners of a work item are
+    taken from its route ID, so no database is required.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def setUp(self):
+        '''
+        **Purpose:**
+
+        Create a scheduler where partner 1 may have one transfer at a time.
+
+        '''
+        self.limits = {1: (1, None)}
+        self.sched = Xfer_Scheduler(partners_for=lambda work: (work[1],),
+                                    limits_for=lambda: self.limits)
+
+    def test_priority_order(self):
+        '''
+
+        **Purpose:**
+
+        Work is taken by priority, then in the order it was put.
+
+        '''
+        for work in (make_work(3, 2, 'C'), make_work(1, 2, 'A'),
+                     make_work(3, 3, 'D'), make_work(2, 3, 'B')):
+            self.sched.put(work)
+        names = [self.sched.get(timeout=1)[2] for i in range(4)]
+        self.assertEqual(names, ['A', 'B', 'C', 'D'])
+
+    def test_skip_partner_at_limit(self):
+        '''
+
+        **Purpose:**
+
+        Work for a partner at its limit is skipped in favour of work for other
+        partners, and is handed out once the partner's transfer is released.
+
+        '''
+        first = make_work(1, 1, 'P1_A')
+        for work in (first, make_work(1, 1, 'P1_B'), make_work(5, 2, 'P2_A')):
+            self.sched.put(work)
+
+        self.assertEqual(self.sched.get(timeout=1)[2], 'P1_A')
+        self.assertEqual(self.sched.get(timeout=1)[2], 'P2_A')
+        with self.assertRaises(queue.Empty):
+            self.sched.get(block=False)
+
+        self.sched.release(first)
+        self.assertEqual(self.sched.get(timeout=1)[2], 'P1_B')
+
+    def test_release_wakes_waiting_thread(self):
+        '''
+
+        **Purpose:**
+
+        A thread waiting for work is woken when a partner slot is released.
+
+        '''
+        first = make_work(1, 1, 'P1_A')
+        self.sched.put(first)
+        self.sched.put(make_work(1, 1, 'P1_B'))
+        self.sched.get(timeout=1)
+
+        taken = []
+        waiter = threading.Thread(
+            target=lambda: taken.append(self.sched.get(timeout=5)))
+        waiter.start()
+        time.sleep(0.1)
+        self.assertEqual(taken, [])
+
+        self.sched.release(first)
+        waiter.join(5)
+        self.assertEqual(taken[0][2], 'P1_B')
+
+    def test_done_after_work(self):
+        '''
+
+        **Purpose:**
+
+        The done item is not handed out while work remains, even work which
+        is held back by a partner limit.
+
+        '''
+        first = make_work(1, 1, 'P1_A')
+        self.sched.put(first)
+        self.sched.put(make_work(1, 1, 'P1_B'))
+        self.sched.put((999, 'NONE'))
+        self.sched.get(timeout=1)
+
+        with self.assertRaises(queue.Empty):
+            self.sched.get(block=False)
+
+        self.sched.release(first)
+        self.assertEqual(self.sched.get(timeout=1)[2], 'P1_B')
+        self.assertEqual(self.sched.get(timeout=1), (999, 'NONE'))
+
+    def test_join(self):
+        '''
+
+        **Purpose:**
+
+        join returns once every item has been marked done.
+
+        '''
+        self.sched.put(make_work(1, 2, 'A'))
+        self.sched.get(timeout=1)
+        self.sched.task_done()
+        self.sched.join()
+        with self.assertRaises(ValueError):
+            self.sched.task_done()
+
+    def test_bandwidth_limit(self):
+        '''
+
+        **Purpose:**
+
+        A partner with a bandwidth limit has a token bucket, its rate is
+        shared between its transfers, and its work is held back while the
+        bucket is in debt.
+
+        '''
+        self.limits = {2: (None, 1000)}
+        first = make_work(1, 2, 'A')
+        self.sched.put(first)
+        self.sched.put(make_work(1, 2, 'B'))
+
+        self.sched.get(timeout=1)
+        bucket = self.sched.bucket(2)
+        self.assertEqual(bucket.rate, 1000)
+        self.assertEqual(self.sched.rate_share(2), 1000)
+        self.assertIsNone(self.sched.rate_share(1))
+
+        bucket.consume(1500)
+        with self.assertRaises(queue.Empty):
+            self.sched.get(block=False)
+        self.assertEqual(self.sched.get(timeout=2)[2], 'B')
+        self.assertEqual(self.sched.rate_share(2), 500)
+
+    def test_token_bucket(self):
+        '''
+
+        **Purpose:**
+
+        The bucket allows a burst of its capacity and then asks for a wait in
+        proportion to the debt.
+
+        '''
+        bucket = Token_Bucket(1000)
+        self.assertEqual(bucket.consume(1000), 0)
+        self.assertAlmostEqual(bucket.consume(500), 0.5, places=1)
+        self.assertGreater(bucket.wait_time(), 0)
+
+    def test_throttled_file(self):
+        '''
+
+        **Purpose:**
+
+        Reading through the bucket takes about as long as the rate requires.
+
+        '''
+        data = b'x' * 60000
+        bucket = Token_Bucket(40000)
+        source = Throttled_File(io.BytesIO(data), bucket)
+        start = time.monotonic()
+        read = b''
+        while True:
+            block = source.read(1024 * 1024)
+            if not block:
+                break
+            read += block
+        elapsed = time.monotonic() - start
+        self.assertEqual(read, data)
+        self.assertGreater(elapsed, 0.4)
+        self.assertLess(elapsed, 2)
+
+if __name__ == "__main__":
+    unittest.main()
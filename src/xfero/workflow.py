@@ -8,6 +8,7 @@ import sys
 import os
 import socket
 import logging.config
+from xfero import log_config
 from xfero import get_conf as get_conf
 from xfero.workflow_manager.copy_file import Copy_File
 from xfero.workflow_manager.av_check import Anti_Virus
@@ -15,13 +16,17 @@ from xfero.workflow_manager.case_converter import Case_Converter
 from xfero.workflow_manager.checksum import Checksum
 from xfero.workflow_manager.crypt import Crypt
 from xfero.workflow_manager.exit import Exit
+from xfero.workflow_manager.filename_pipeline import Filename_Pipeline
 from xfero.workflow_manager.line_end_converter \
 import Line_End_Converter
 from xfero.workflow_manager.manage_archives import Manage_Archives
+from xfero.workflow_manager.micro_batch import Micro_Batch
 from xfero.workflow_manager.split_file import Split_File
+from xfero.workflow_manager.stream_filter import Filter_Pipeline
 from xfero.workflow_manager.transform_filename \
 import Transform_Filename
-from xfero.db import manage_workflow as db_workflow
+from xfero import route_plan
+from xfero import workflow_pool
 
 try:
     (xfero_logger,
@@ -29,12 +34,12 @@ try:
      outbound_directory,
      transient_directory,
      error_directory,
-     xfero_pid) = get_conf.get.xfero_config()
+     xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('workflow')
 
@@ -76,6 +81,13 @@ class Workflow_Thread(Thread):
     record, indicating that there is no further work to be done. At which point
     the workflow thread will terminate.
 
+    A workflow step which returns a list of files, such as
+    ``Split_File.split_file``, has each file put on the Output Queue
+    separately so that the xfer threads can send them in parallel. Any later
+    steps are applied to each of the files, except after a split, which is
+    always the last step of a route (see route_plan) so that the pieces
+    match their manifest.
+
     *Example usage:*
 
     ```w = Workflow_Thread(inq, outq)```
@@ -98,9 +110,8 @@ class Workflow_Thread(Thread):
 
     os (xfero.workflow)
     xfero
-      db
-          manage_workflow (xfero.workflow)
       get_conf (xfero.workflow)
+      route_plan (xfero.workflow)
 
     +------------+-------------+-----------------------------------------------+
     | Date       | Author      | Change Details                                |
@@ -114,6 +125,38 @@ class Workflow_Thread(Thread):
     |            |             | config file. This is used to hold files that  |
     |            |             | have failed in workflow or transfer processing|
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Threads are resident in pipeline.Pipeline. A  |
+    |            |             | workflow with nothing to transfer no longer   |
+    |            |             | enqueues None, which shut down an xfer thread |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Workflow items are read from the route plan   |
+    |            |             | cache rather than queried for every file      |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Logging is configured once per process by     |
+    |            |             | log_config rather than for every file         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | A step may return a list of files, such as    |
+    |            |             | the pieces from Split_File. Later steps are   |
+    |            |             | applied to each file and each is put on the   |
+    |            |             | output queue as a separate item               |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added the Micro_Batch workflow step           |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Runs of consecutive filename only steps are   |
+    |            |             | applied with one rename by Filename_Pipeline  |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Runs of consecutive content steps which can   |
+    |            |             | be applied to a stream are applied in one     |
+    |            |             | read and write of the file by Filter_Pipeline |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Steps of classes declared CPU bound are run   |
+    |            |             | in the process pool of workflow_pool. The     |
+    |            |             | pieces of a split file are processed there    |
+    |            |             | concurrently                                  |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | A split is the last step, so the steps after  |
+    |            |             | it are not applied to the pieces              |
+    +------------+-------------+-----------------------------------------------+
     '''
 
     def __init__(self, iq, oq, *args, **kw):
@@ -128,7 +171,6 @@ class Workflow_Thread(Thread):
 
     def run(self):
 
-        logging.config.fileConfig(xfero_logger)
         # create logger
         logger = logging.getLogger('workflow')
 
@@ -168,28 +210,34 @@ class Workflow_Thread(Thread):
 
                 if self.working_filename is None or \
                     self.working_filename == 'success':
+                    # Nothing to transfer. The xfer threads are resident so
+                    # no None is enqueued, as that would shut one down
                     logger.debug(
-                        'Enqueue None : Result %s. (XFERO_Token=%s)',
+                        'Nothing to enqueue : Result %s. (XFERO_Token=%s)',
                         self.working_filename, self.xfero_token)
-                    print('None to outq worker')
-                    self.outputq.put(self.done)
                     self.inputq.task_done()
                     logger.info(
                         '%s - DONE. (XFERO_Token=%s)',
                         self.name, self.xfero_token)
                 else:
                     # print(route_id, result, self.xfero_token)
-                    work = (
-                        self.priority,
-                        route_id,
-                        self.working_filename,
-                        self.original_filename,
-                        self.xfero_token)
-                    logger.debug(
-                        'Enqueue Work %s. (XFERO_Token=%s)',
-                        work, self.xfero_token)
-                    # Enqueue result which is route_id & modified filename
-                    self.outputq.put(work)
+                    if isinstance(self.working_filename, list):
+                        working_filenames = self.working_filename
+                    else:
+                        working_filenames = [self.working_filename]
+
+                    for working_filename in working_filenames:
+                        work = (
+                            self.priority,
+                            route_id,
+                            working_filename,
+                            self.original_filename,
+                            self.xfero_token)
+                        logger.debug(
+                            'Enqueue Work %s. (XFERO_Token=%s)',
+                            work, self.xfero_token)
+                        # Enqueue result which is route_id & modified filename
+                        self.outputq.put(work)
                     self.inputq.task_done()
                     logger.info(
                         '%s - DONE. (XFERO_Token=%s)',
@@ -212,7 +260,6 @@ class Workflow_Thread(Thread):
         Workflow processing
         '''
 
-        logging.config.fileConfig(xfero_logger)
         # create logger
         logger = logging.getLogger('workflow')
 
@@ -222,15 +269,12 @@ class Workflow_Thread(Thread):
 
         try:
             logger.debug(
-                'db_workflow.list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor: \
-                %s. (XFERO_Token=%s)', route_id, self.xfero_token)
-            wf_rows = \
-            db_workflow.list_XFERO_Workflow_Item_OrderBy_Run_Order_monitor(
-                str(route_id),
-                self.xfero_token)
+                'route_plan.get_cache().get: %s. (XFERO_Token=%s)',
+                route_id, self.xfero_token)
+            wf_rows = route_plan.get_cache().get(
+                route_id, self.xfero_token).steps
 
         except Exception as err:
-            self.oq.put(self.done)
             logger.error(
                 '%s - Exception while retrieving workflow: Error %s. \
                 (XFERO_Token=%s)',
@@ -274,72 +318,100 @@ class Workflow_Thread(Thread):
             '%s - Perform workflow. (XFERO_Token=%s)',
             self.name, self.xfero_token)
         for workflow in wf_rows:
-            wf_args = ''
-            wf_id = workflow['workflow_item_id']
-            wf_route = workflow['workflow_item_route']
-            wf_class = workflow['workflow_item_class']
-            wf_function_call = workflow['workflow_item_function_call']
-            if workflow['workflow_item_args'] != 'NULL':
-                wf_args = workflow['workflow_item_args']
-            wf_run_order = workflow['workflow_item_running_order']
-
-            args = (filename,)
-            # its possible that no parameters supplied to call
-            if len(wf_args) > 0:
-                # Split the wf_args on comma
-                words = wf_args.split(',')
-
-                # Convert args tuple to list temporarily
-                list_args = list(args)
-
-                for word in words:
-                    list_args.append(word.strip())
-
-                # Convert back to tuple
-                args = tuple(list_args)
-
-            # Instantiate Class:
-            try:
-                logger.debug(
-                    '%s - Instantiate Class for thread. (XFERO_Token=%s)',
-                    self.name, self.xfero_token)
-                wf_instance = globals()[wf_class](self.xfero_token)
-            except Exception as err:
-                logger.error(
-                    '%s - Error instantiating class: %s: Error %s. \
-                    (XFERO_Token=%s)',
-                    self.name, wf_class, err, self.xfero_token, exc_info=True)
-                logger.error(
-                    '%s - Exception: Original file name: %s. (XFERO_Token=%s)',
-                    self.name, self.original_filename, self.xfero_token)
-                logger.error(
-                    '%s - Exception: Current file name: %s. (XFERO_Token=%s)',
-                    self.name, filename, self.xfero_token)
-                # Move to error dir
-                logger.error(
-                    '%s - Exception: Moving %s to %s. (XFERO_Token=%s)',
-                    self.name, filename, error_directory, self.xfero_token)
-
-                args = (filename, error_directory)
-
+            if isinstance(workflow, Filename_Pipeline):
+                # Consecutive steps which only change the file name are
+                # applied with a single rename
+                wf_instance = workflow
+                wf_function_call = 'rename'
+                args = (filename, self.xfero_token)
+            elif isinstance(workflow, Filter_Pipeline):
+                # Consecutive content steps are applied in one pass over the
+                # file
+                wf_instance = workflow
+                wf_function_call = 'process'
+                args = (filename, self.xfero_token)
+            else:
+                wf_args = ''
+                wf_id = workflow['workflow_item_id']
+                wf_route = workflow['workflow_item_route']
+                wf_class = workflow['workflow_item_class']
+                wf_function_call = workflow['workflow_item_function_call']
+                if workflow['workflow_item_args'] != 'NULL':
+                    wf_args = workflow['workflow_item_args']
+                wf_run_order = workflow['workflow_item_running_order']
+
+                args = (filename,)
+                # its possible that no parameters supplied to call
+                if len(wf_args) > 0:
+                    # Split the wf_args on comma
+                    words = wf_args.split(',')
+
+                    # Convert args tuple to list temporarily
+                    list_args = list(args)
+
+                    for word in words:
+                        list_args.append(word.strip())
+
+                    # Convert back to tuple
+                    args = tuple(list_args)
+
+                # Instantiate Class:
                 try:
-                    obj = Copy_File()
-                    print(obj.move_file(*args))
+                    logger.debug(
+                        '%s - Instantiate Class for thread. (XFERO_Token=%s)',
+                        self.name, self.xfero_token)
+                    wf_instance = globals()[wf_class](self.xfero_token)
                 except Exception as err:
                     logger.error(
-                        '%s - Exception moving file from %s to %s: Error %s. \
+                        '%s - Error instantiating class: %s: Error %s. \
+                        (XFERO_Token=%s)',
+                        self.name, wf_class, err, self.xfero_token,
+                        exc_info=True)
+                    logger.error(
+                        '%s - Exception: Original file name: %s. \
+                        (XFERO_Token=%s)',
+                        self.name, self.original_filename, self.xfero_token)
+                    logger.error(
+                        '%s - Exception: Current file name: %s. \
                         (XFERO_Token=%s)',
-                        self.name, filename, error_directory, err,
-                        self.xfero_token, exc_info=True)
+                        self.name, filename, self.xfero_token)
+                    # Move to error dir
+                    logger.error(
+                        '%s - Exception: Moving %s to %s. (XFERO_Token=%s)',
+                        self.name, filename, error_directory,
+                        self.xfero_token)
 
-                raise err
+                    args = (filename, error_directory)
+
+                    try:
+                        obj = Copy_File()
+                        print(obj.move_file(*args))
+                    except Exception as err:
+                        logger.error(
+                            '%s - Exception moving file from %s to %s: \
+                            Error %s. (XFERO_Token=%s)',
+                            self.name, filename, error_directory, err,
+                            self.xfero_token, exc_info=True)
+
+                    raise err
 
             # Call Method
             try:
                 logger.info(
                     '%s - Calling workflow method. (XFERO_Token=%s)',
                     self.name, self.xfero_token)
-                filename = getattr(wf_instance, wf_function_call)(*args)
+                # Steps of CPU bound classes are run in the process pool
+                if isinstance(filename, list):
+                    # An earlier step returned several files, such as a file
+                    # and its signature, so the step is performed on each
+                    filename = workflow_pool.run(
+                        wf_instance, wf_function_call,
+                        [(piece,) + args[1:] for piece in filename],
+                        self.xfero_token)
+                else:
+                    filename = workflow_pool.run(
+                        wf_instance, wf_function_call, [args],
+                        self.xfero_token)[0]
             except Exception as err:
                 logger.error(
                     '%s - Error in called method: %s: Error %s. (XFERO_Token=%s)',
@@ -351,22 +423,29 @@ class Workflow_Thread(Thread):
                 logger.error(
                     '%s - Exception: Current file name: %s. (XFERO_Token=%s)',
                     self.name, filename, self.xfero_token)
-                # Move to error dir
-                logger.error(
-                    '%s - Exception: Moving %s to %s. (XFERO_Token=%s)',
-                    self.name, filename, error_directory, self.xfero_token)
-
-                args = (filename, error_directory)
+                # Move to error dir, each of the files of an earlier step
+                if isinstance(filename, list):
+                    error_files = filename
+                else:
+                    error_files = [filename]
 
-                try:
-                    obj = Copy_File()
-                    print(obj.move_file(*args))
-                except Exception as err:
+                for error_file in error_files:
                     logger.error(
-                        '%s - Exception moving file from %s to %s: Error %s. \
-                        (XFERO_Token=%s)',
-                        self.name, filename, error_directory, err,
-                        self.xfero_token, exc_info=True)
+                        '%s - Exception: Moving %s to %s. (XFERO_Token=%s)',
+                        self.name, error_file, error_directory,
+                        self.xfero_token)
+
+                    args = (error_file, error_directory)
+
+                    try:
+                        obj = Copy_File()
+                        print(obj.move_file(*args))
+                    except Exception as move_err:
+                        logger.error(
+                            '%s - Exception moving file from %s to %s: Error \
+                            %s. (XFERO_Token=%s)',
+                            self.name, error_file, error_directory, move_err,
+                            self.xfero_token, exc_info=True)
 
                 raise err
 
@@ -16,18 +16,42 @@
 +-----------------------------------+------------------------------------------+
 | Class: exit                       | Exit methods                             |
 +-----------------------------------+------------------------------------------+
+| Class: filename_pipeline          | Single rename of filename only steps     |
++-----------------------------------+------------------------------------------+
+| Func: kernel_copy.fast_copy       | File copy made in the kernel             |
++-----------------------------------+------------------------------------------+
 | Class: line_end_converter         | Line end conversion methods              |
 +-----------------------------------+------------------------------------------+
 | Class: manage_archives            | Archive Management                       |
 +-----------------------------------+------------------------------------------+
+| Class: micro_batch                | Micro batching of small files            |
++-----------------------------------+------------------------------------------+
+| Class: parallel_compress          | Block parallel compression               |
++-----------------------------------+------------------------------------------+
 | Class: split_file                 | File Splitting and Merging               |
 +-----------------------------------+------------------------------------------+
+| Class: stream_filter              | Content steps applied to a stream        |
++-----------------------------------+------------------------------------------+
 | Class: Transform Filename         | File name Transformation                 |
 +-----------------------------------+------------------------------------------+
+| Func: tree_hash.tree_sums         | Parallel Merkle tree hashing             |
++-----------------------------------+------------------------------------------+
 
 +------------+-------------+---------------------------------------------------+
 | Date       | Author      | Change Details                                    |
 +============+=============+===================================================+
 | 04/05/2013 | Chris Falck | Created                                           |
 +------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added tree_hash                                   |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added parallel_compress                           |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added micro_batch                                 |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added filename_pipeline                           |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added stream_filter                               |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added kernel_copy                                 |
++------------+-------------+---------------------------------------------------+
 '''
@@ -0,0 +1,430 @@
+#!/usr/bin/env python
+'''AV Check'''
+import hashlib
+import logging.config
+import queue
+import shlex
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from xfero import log_config
+from xfero import get_conf as get_conf
+from xfero.db import manage_av_pattern as db_av_pattern
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+log_config.configure(xfero_logger)
+# create logger
+logger = logging.getLogger('av_check')
+
+# Maximum number of files passed to one run of the scanner, and how long the
+# scanner waits for further files once the first of a batch has arrived
+av_batch_size = int(get_conf.get_xfero_option('settings', 'av_batch_size',
+                                              64))
+av_batch_wait = float(get_conf.get_xfero_option('settings', 'av_batch_wait',
+                                                0.5))
+
+# Number of clean verdicts remembered, and for how many seconds, so that the
+# verdicts expire once the scanner's signatures have been updated
+av_cache_size = int(get_conf.get_xfero_option('settings', 'av_cache_size',
+                                              10000))
+av_cache_ttl = int(get_conf.get_xfero_option('settings', 'av_cache_ttl',
+                                             86400))
+
+# Size of the blocks read from a file to hash it
+BLOCKSIZE = 1024 * 1024
+
+# Replaced in the scanner's command line by the files to scan
+FILE_TO_CHECK = '{File_to_Check}'
+
+# Column of XFERO_AV_Pattern holding the scanner's command line
+AV_PATTERN_PARAMS = 3
+
+SCANNERS = {}
+SCANNERS_LOCK = threading.Lock()
+
+
+def file_digest(filename):
+    '''
+    Return the SHA-256 hex digest of a file
+    '''
+    sha256 = hashlib.sha256()
+    with open(filename, 'rb', buffering=0) as source:
+        while True:
+            block = source.read(BLOCKSIZE)
+            if not block:
+                break
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def scan_command(command, filenames):
+    '''
+
+    **Purpose:**
+
+    Build the command line which scans a batch of files. A word of the
+    command which is ``{File_to_Check}`` is replaced by all of the files, and
+    a word which contains it is repeated for each file. The files are added
+    to the end of a command without ``{File_to_Check}``.
+
+    *Example usage:*
+
+    ```scan_command('uvscan -c -v {File_to_Check}', ['/xfero/IN/A'])```
+
+    :param command: The scanner's command line
+    :param filenames: The files to scan
+    :returns: List of the arguments
+
+    '''
+    args = []
+    found = False
+    for word in shlex.split(command):
+        if word == FILE_TO_CHECK:
+            args.extend(filenames)
+            found = True
+        elif FILE_TO_CHECK in word:
+            args.extend(word.replace(FILE_TO_CHECK, filename)
+                        for filename in filenames)
+            found = True
+        else:
+            args.append(word)
+    if not found:
+        args.extend(filenames)
+    return args
+
+
+class Verdict_Cache(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`av_check.Verdict_Cache` class remembers the SHA-256 digests of
+    files which a scanner found to be clean, so that a file with the same
+    content is not scanned again. The least recently used digest is
+    forgotten once the cache holds av_cache_size digests, and each digest is
+    forgotten av_cache_ttl seconds after it was scanned.
+
+    *Example usage:*
+
+    ```cache = Verdict_Cache()```
+    ```cache.add(digest)```
+    ```cache.is_clean(digest)```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, size=None, ttl=None):
+        '''init'''
+        self.size = size or av_cache_size
+        self.ttl = ttl or av_cache_ttl
+        self.digests = OrderedDict()
+        self.lock = threading.Lock()
+
+    def is_clean(self, digest):
+        '''Return True if the digest was found to be clean'''
+        with self.lock:
+            scanned = self.digests.get(digest)
+            if scanned is None:
+                return False
+            if time.time() - scanned > self.ttl:
+                del self.digests[digest]
+                return False
+            self.digests.move_to_end(digest)
+            return True
+
+    def add(self, digest):
+        '''Remember that the digest is clean'''
+        with self.lock:
+            self.digests[digest] = time.time()
+            self.digests.move_to_end(digest)
+            while len(self.digests) > self.size:
+                self.digests.popitem(last=False)
+
+
+class Scanner(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`av_check.Scanner` class runs an AV product over batches of
+    files. The workflow threads hand their files to the scanner, whose
+    thread gathers the files which arrive within av_batch_wait seconds of
+    each other, up to av_batch_size of them, and scans them with one run of
+    the product. Starting the product, and loading its signatures, is then
+    paid once for the batch rather than once for each file.
+
+    A run which exits with zero means every file in the batch is clean. When
+    the run fails the batch is split in two and each half is scanned again,
+    until the files at fault are found on their own.
+
+    Files whose content has already been found to be clean are not scanned
+    again, see :class:`av_check.Verdict_Cache`.
+
+    *Example usage:*
+
+    ```scanner = get_scanner('uvscan -c -v {File_to_Check}')```
+    ```scanner.scan(filename)```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, command, batch_size=None, batch_wait=None):
+        '''init'''
+        self.command = command
+        self.batch_size = batch_size or av_batch_size
+        self.batch_wait = av_batch_wait if batch_wait is None else batch_wait
+        self.cache = Verdict_Cache()
+        self.pending = queue.Queue()
+        self.runs = 0
+        self.thread = threading.Thread(target=self.run, daemon=True,
+                                       name='av_scanner')
+        self.thread.start()
+
+    def scan(self, filename):
+        '''
+        Scan a file, waiting for its batch to be scanned. Returns None if the
+        file is clean or the scanner's output if it is not
+        '''
+        digest = file_digest(filename)
+        if self.cache.is_clean(digest):
+            logger.debug('File %s is known to be clean', filename)
+            return None
+
+        verdict = Future()
+        self.pending.put((filename, digest, verdict))
+        return verdict.result()
+
+    def run(self):
+        '''Gather the files handed to the scanner into batches and scan
+        them'''
+        while True:
+            batch = [self.pending.get()]
+            deadline = time.time() + self.batch_wait
+            while len(batch) < self.batch_size:
+                wait = deadline - time.time()
+                if wait <= 0:
+                    break
+                try:
+                    batch.append(self.pending.get(timeout=wait))
+                except queue.Empty:
+                    break
+            self.scan_batch(batch)
+
+    def scan_batch(self, batch):
+        '''Scan a batch of (filename, digest, verdict) and set each verdict'''
+        # Files with the same content are scanned once, and those found clean
+        # while the batch was gathered are not scanned at all
+        files = OrderedDict()
+        for filename, digest, verdict in batch:
+            if self.cache.is_clean(digest):
+                verdict.set_result(None)
+            else:
+                files.setdefault(digest, (filename, []))[1].append(verdict)
+        if not files:
+            return
+
+        try:
+            infected = self.bisect([filename for filename, verdicts
+                                    in files.values()])
+        except Exception as err:
+            for filename, verdicts in files.values():
+                for verdict in verdicts:
+                    verdict.set_exception(err)
+            return
+
+        for digest, (filename, verdicts) in files.items():
+            output = infected.get(filename)
+            if output is None:
+                self.cache.add(digest)
+            for verdict in verdicts:
+                verdict.set_result(output)
+
+    def bisect(self, filenames):
+        '''
+        Scan the files, splitting them until those at fault are found.
+        Returns a dictionary of the scanner's output keyed on each of them
+        '''
+        args = scan_command(self.command, filenames)
+        logger.debug('Scanning %s files: %s', len(filenames), args[0])
+        self.runs += 1
+        result = subprocess.run(args, stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        if result.returncode == 0:
+            return {}
+
+        if len(filenames) == 1:
+            output = result.stdout.decode('utf-8', 'replace').strip()
+            return {filenames[0]: output or
+                    'Exit status %s' % result.returncode}
+
+        half = len(filenames) // 2
+        infected = self.bisect(filenames[:half])
+        infected.update(self.bisect(filenames[half:]))
+        return infected
+
+
+def get_scanner(command):
+    '''
+
+    **Purpose:**
+
+    Return the scanner for an AV command line, which is created the first
+    time it is used and then shared by every workflow thread so that their
+    files are scanned together.
+
+    *Example usage:*
+
+    ```scanner = get_scanner('uvscan -c -v {File_to_Check}')```
+
+    :param command: The scanner's command line
+    :returns: The :class:`av_check.Scanner`
+
+    '''
+    with SCANNERS_LOCK:
+        if command not in SCANNERS:
+            SCANNERS[command] = Scanner(command)
+        return SCANNERS[command]
+
+
+class Anti_Virus(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`av_check.Anti_Virus` class checks a file with an AV product.
+    The file is passed on unchanged if it is clean. Otherwise an IOError is
+    raised and the workflow moves the file to the error directory.
+
+    **Usage Notes:**
+
+    The files being checked by all of the workflow threads are gathered into
+    batches, each of which is scanned with one run of the AV product. The
+    SHA-256 digest of every clean file is remembered, so a file whose content
+    has already been found to be clean is passed on without being scanned.
+    See :class:`av_check.Scanner`.
+
+    The scanner of each command, and its verdict cache, is held once per
+    process by ```get_scanner```. The class must therefore never be declared
+    CPU bound, see :mod:`workflow_pool`. In the pool each process would keep
+    a scanner and a cache of its own, so the batches would be smaller and a
+    clean file could be scanned again by another process.
+
+    The parameter args will hold the following parameters:
+
+    * filename - The file to check.
+    * av_pattern - The name of a row of the XFERO_AV_Pattern table, or the
+      command line of the AV product. ``{File_to_Check}`` in the command line
+      is replaced by the files to scan. Defaults to the first row of the
+      XFERO_AV_Pattern table.
+
+    *Example usage:*
+
+    ```obj = Anti_Virus()```
+    ```obj.av_check(args)```
+
+    :param args: The parameters listed above
+    :returns: filename: The file checked or raises an Exception
+
+    **Unit Test Module:** test_av_check.py
+
+    *External dependencies*
+
+    xfero
+      get_conf (xfero.workflow_manager.av_check)
+      manage_av_pattern (xfero.workflow_manager.av_check)
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Documented that the class is not CPU bound    |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    # The scanner is shared by the workflow threads of this process, so the
+    # check is never run in the workflow process pool
+    cpu_bound = False
+
+    def __init__(self, xfero_token=False):
+        '''init'''
+        logger.debug('Object initialised: Anti_Virus')
+        self.xfero_token = xfero_token
+        self.filename = ''
+
+    def av_check(self, filename, av_pattern=''):
+        '''AV check a file'''
+        self.filename = filename
+
+        logger.info('AV check: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        command = self.pattern_command(av_pattern)
+
+        try:
+            output = get_scanner(command).scan(self.filename)
+        except OSError as err:
+            logger.error('OSError running AV check of %s: %s. \
+            (XFERO_Token=%s)', self.filename, err, self.xfero_token)
+            raise err
+
+        if output is not None:
+            logger.error('AV check failed for %s: %s. (XFERO_Token=%s)',
+                         self.filename, output, self.xfero_token)
+            raise IOError('AV check failed for %s: %s. (XFERO_Token=%s)' %
+                          (self.filename, output, self.xfero_token))
+
+        return self.filename
+
+    def pattern_command(self, av_pattern):
+        '''Return the command line of an AV pattern name or command'''
+        if av_pattern and FILE_TO_CHECK in av_pattern:
+            return av_pattern
+
+        if av_pattern:
+            row = db_av_pattern.read_with_name_XFERO_AV_Pattern(
+                av_pattern, self.xfero_token)
+        else:
+            rows = db_av_pattern.list_XFERO_AV_Pattern(self.xfero_token)
+            row = rows[0] if rows else None
+
+        if row is not None:
+            return row[AV_PATTERN_PARAMS]
+
+        if av_pattern:
+            # Taken to be the command line of the AV product
+            return av_pattern
+
+        logger.error('ValueError: No AV pattern defined. (XFERO_Token=%s)',
+                     self.xfero_token)
+        raise ValueError('No AV pattern defined')
+
+if __name__ == "__main__":
+
+    fname = '/ftran/av_check.txt'
+    try:
+        obj = Anti_Virus()
+        print(obj.av_check(fname, 'FTH_MCAFEE_AV_PATTERN'))
+    except Exception as err:
+        print('Caught an exception: %s' % err)
+        # Here we would continue processing other files in the loop with the
+        # continue statement
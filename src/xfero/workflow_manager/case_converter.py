@@ -1,22 +1,42 @@
 #!/usr/bin/env python
 '''Case Conversion'''
 import logging.config
+from xfero import log_config
 import os
-from /xfero/ import get_conf as get_conf
-from /xfero/.workflow_manager import copy_file as renameFile
+from xfero import get_conf as get_conf
+from xfero.workflow_manager import copy_file as renameFile
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('case_converter')
 
 
+def name_to_lower(filename):
+    '''Return the file name in lower case, leaving its directory unchanged'''
+    head, tail = os.path.split(filename)
+    return head + os.sep + tail.lower()
+
+
+def name_to_upper(filename):
+    '''Return the file name in upper case, leaving its directory unchanged'''
+    head, tail = os.path.split(filename)
+    return head + os.sep + tail.upper()
+
+# The functions computing the new file name for each method of
+# Case_Converter, for filename_pipeline
+NAME_FUNCTIONS = {
+    'to_lower': name_to_lower,
+    'to_upper': name_to_upper,
+}
+
+
 class Case_Converter(object):
 
     '''
@@ -52,13 +72,16 @@ class Case_Converter(object):
     +------------+-------------+-----------------------------------------------+
     | 27/10/2014 | Chris Falck | modified call to get_conf                     |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The new file names are computed by the        |
+    |            |             | functions in NAME_FUNCTIONS                   |
+    +------------+-------------+-----------------------------------------------+
 
     '''
 
     def __init__(self, xfero_token=False):
         '''init'''
         logger.debug('Object initialised: To_Lower')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
 
     def to_lower(self, filename):
@@ -97,9 +120,7 @@ class Case_Converter(object):
             (XFERO_Token=%s)', self.filename, self.xfero_token)
             raise OSError(2, 'No such file or directory %s', self.filename)
 
-        head, tail = os.path.split(self.filename)
-
-        new_fn = head + os.sep + tail.lower()
+        new_fn = name_to_lower(self.filename)
 
         logger.info('Renaming file from %s to %s. (XFERO_Token=%s)',
                     self.filename, new_fn, self.xfero_token)
@@ -150,9 +171,7 @@ class Case_Converter(object):
             raise OSError(2, 'No such file or directory %s. \
             (XFERO_Token=%s)', self.filename, self.xfero_token)
 
-        head, tail = os.path.split(self.filename)
-
-        new_fn = head + os.sep + tail.upper()
+        new_fn = name_to_upper(self.filename)
 
         logger.info('Renaming file from %s to %s. (XFERO_Token=%s)',
                     self.filename, new_fn, self.xfero_token)
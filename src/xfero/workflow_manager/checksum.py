@@ -0,0 +1,353 @@
+#!/usr/bin/env python
+'''Checksum'''
+import hashlib
+import logging.config
+import os
+import zlib
+from xfero import log_config
+from xfero import get_conf as get_conf
+from xfero.workflow_manager.manage_archives import Manage_Archives
+from xfero.workflow_manager import tree_hash
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+log_config.configure(xfero_logger)
+# create logger
+logger = logging.getLogger('checksum')
+
+# Size of the blocks read from the file
+BLOCKSIZE = 1024 * 1024
+
+# Name of the sum file written for a directory or an archive of files
+SUMFILE = 'sumfile.sum'
+
+# Size of the chunks used by tree_cksum, and 1 to hash them in this process
+tree_chunk_size = int(get_conf.get_xfero_option(
+    'settings', 'tree_chunk_size', tree_hash.CHUNK_SIZE))
+tree_hash_workers = int(get_conf.get_xfero_option(
+    'settings', 'tree_hash_workers', os.cpu_count() or 1))
+
+ARCHIVE_TYPES = ('zip', '.zip', 'tar.gz', '.tar.gz')
+ARCHIVE_EXTENSIONS = ('.zip', '.tar.gz', '.tgz')
+
+# Each byte with its bits in reverse order. zlib computes the reflected form
+# of the CRC-32 used by POSIX cksum, so the bytes are reversed on the way in
+# and the result is reversed on the way out.
+REVERSED = bytes(int('{0:08b}'.format(byte)[::-1], 2) for byte in range(256))
+
+
+class Posix_Cksum(object):
+
+    '''
+
+    **Purpose:**
+
+    Compute the CRC printed by the POSIX ```cksum``` utility. The object is
+    updated in the same way as a hashlib object so that it can be fed the
+    same blocks as the other algorithms.
+
+    *Example usage:*
+
+    ```crc = Posix_Cksum()```
+    ```crc.update(data)```
+    ```crc.value()```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    name = 'cksum'
+
+    def __init__(self):
+        '''init'''
+        # POSIX cksum starts with a register of zero, which zlib is given as
+        # its complement
+        self.crc = 0xFFFFFFFF
+        self.length = 0
+
+    def update(self, data):
+        '''Add data to the CRC'''
+        self.crc = zlib.crc32(data.translate(REVERSED), self.crc)
+        self.length += len(data)
+
+    def value(self):
+        '''Return the CRC of the data added so far'''
+        # The length of the data is added to the CRC least significant byte
+        # first, using as few bytes as are needed
+        length = self.length
+        trailer = bytearray()
+        while length:
+            trailer.append(length & 0xFF)
+            length >>= 8
+        crc = zlib.crc32(bytes(trailer).translate(REVERSED), self.crc)
+
+        return int('{0:032b}'.format(crc)[::-1], 2)
+
+
+def file_sums(filename):
+    '''
+
+    **Purpose:**
+
+    Read a file once, in large blocks, and compute its POSIX cksum CRC, MD5
+    and SHA-256 digests from the same blocks.
+
+    *Example usage:*
+
+    ```file_sums('/xfero/IN/CIS_FILE')```
+
+    :param filename: The file to sum
+    :returns: Dictionary of the sums keyed on cksum, md5, sha256 and size
+
+    '''
+    crc = Posix_Cksum()
+    md5 = hashlib.md5()
+    sha256 = hashlib.sha256()
+
+    with open(filename, 'rb', buffering=0) as source:
+        while True:
+            block = source.read(BLOCKSIZE)
+            if not block:
+                break
+            crc.update(block)
+            md5.update(block)
+            sha256.update(block)
+
+    return {'cksum': crc.value(),
+            'size': crc.length,
+            'md5': md5.hexdigest(),
+            'sha256': sha256.hexdigest()}
+
+
+def sum_lines(name, sums):
+    '''
+
+    **Purpose:**
+
+    Format the sums of a file as the lines written to a sum file. The first
+    line is as printed by ```cksum``` and the others as printed by
+    ```md5sum --tag``` and ```sha256sum --tag```.
+
+    :param name: The file name written with the sums
+    :param sums: Dictionary returned by file_sums
+    :returns: The lines
+
+    '''
+    return ['%s %s %s\n' % (sums['cksum'], sums['size'], name),
+            'MD5 (%s) = %s\n' % (name, sums['md5']),
+            'SHA256 (%s) = %s\n' % (name, sums['sha256'])]
+
+
+class Checksum(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`checksum.Checksum` class produces an archive holding a file, or
+    a directory of files, together with a sum file giving the POSIX cksum CRC,
+    MD5 and SHA-256 digest of each file.
+
+    For a file, the sum file is named after the file with a ``.sum``
+    extension, which :class:`manage_archives.Manage_Archives` includes in the
+    archive. For a directory, or an archive which is first extracted, the sum
+    file is called ``sumfile.sum`` and holds the sums of every file.
+
+    **Usage Notes:**
+
+    Each file is read once. The three sums are computed from the same blocks.
+    The files of a directory are summed in turn, as the class already runs in
+    the workflow process pool.
+
+    For very large files ``tree_cksum`` is used in place of ``cksum``. The file
+    is divided into chunks of ``tree_chunk_size`` bytes which are hashed with
+    SHA-256, in the workflow process pool when ``tree_hash_workers`` is more
+    than 1, so a single file uses several cores. When the step is itself
+    running in a pool process the chunks are hashed in turn in that process,
+    so pools are never nested. The chunk digests are combined into a Merkle tree and
+    the sum file is a manifest holding the root and the digest of every
+    chunk, which allows a partner to verify, or request again, each chunk on
+    its own. See :mod:`tree_hash`.
+
+    The parameter args will hold the following parameters:
+
+    * filename - A file, archive or directory of files to sum.
+    * archive_type - The type of archive to be created.
+      * Accepted values = .tar.gz or .zip.
+    * extract_dir - The directory an archive is extracted to. Defaults to a
+      directory named after the archive, alongside it.
+    * archive_name - The name of the archive created for a directory.
+
+    *Example usage:*
+
+    ```obj = Checksum()```
+    ```obj.cksum(args)```
+    ```obj.tree_cksum(args)```
+
+    :param args: The parameters listed above
+    :returns: archive_name: The name of the archive produced or raises an
+    Exception
+
+    **Unit Test Module:** test_cksum.py
+
+    *External dependencies*
+
+    hashlib (xfero.workflow_manager.checksum)
+    zlib (xfero.workflow_manager.checksum)
+    xfero
+      get_conf (xfero.workflow_manager.checksum)
+      manage_archives (xfero.workflow_manager.checksum)
+      tree_hash (xfero.workflow_manager.checksum)
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added tree_cksum, which hashes a file as a    |
+    |            |             | Merkle tree of chunks in a process pool       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Declared CPU bound, see workflow_pool         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The files of a directory are summed in turn   |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Tree chunks are hashed in the shared workflow |
+    |            |             | pool rather than a pool for each file         |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    # The cksum CRC holds the GIL, so it is run in the workflow process pool
+    cpu_bound = True
+
+    def __init__(self, xfero_token=False):
+        '''init'''
+        logger.debug('Object initialised: Checksum')
+        self.xfero_token = xfero_token
+        self.filename = ''
+        self.tree = False
+
+    def cksum(self, filename, archive_type, extract_dir='', archive_name=''):
+        '''Sum a file, archive or directory and archive it with the sums'''
+        self.tree = False
+        return self.process(filename, archive_type, extract_dir, archive_name)
+
+    def tree_cksum(self, filename, archive_type, extract_dir='',
+                   archive_name=''):
+        '''Tree hash a file, archive or directory and archive it with the
+        manifest'''
+        self.tree = True
+        return self.process(filename, archive_type, extract_dir, archive_name)
+
+    def process(self, filename, archive_type, extract_dir, archive_name):
+        '''Process method'''
+        self.filename = filename
+        self.archive_type = archive_type
+        self.extract_dir = extract_dir
+        self.archive_name = archive_name
+
+        logger.info('Checksum: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        if self.archive_type not in ARCHIVE_TYPES:
+            logger.error('TypeError: Invalid Archive Type supplied: %s. \
+            (XFERO_Token=%s)', self.archive_type, self.xfero_token)
+            raise TypeError(1, 'Invalid Archive Type. \
+                Should be .zip or .tar.gz')
+
+        archives = Manage_Archives(self.xfero_token)
+
+        if os.path.isdir(self.filename):
+            return self.sum_dir(self.filename, archives)
+
+        if not os.path.isfile(self.filename):
+            logger.error('OSError No such file or directory: %s. \
+            (XFERO_Token=%s)', self.filename, self.xfero_token)
+            raise OSError(2, 'No such file or directory')
+
+        if self.filename.endswith(ARCHIVE_EXTENSIONS):
+            # Sum the files held in the archive
+            basename = os.path.basename(self.filename)
+            for extension in ARCHIVE_EXTENSIONS:
+                if basename.endswith(extension):
+                    basename = basename[:-len(extension)]
+                    break
+            if not self.archive_name:
+                self.archive_name = basename
+            if not self.extract_dir:
+                self.extract_dir = os.path.join(
+                    os.path.dirname(self.filename), basename)
+
+            dirname = archives.extract(self.filename, self.extract_dir)
+            return self.sum_dir(dirname, archives)
+
+        self.write_sumfile(self.filename + '.sum',
+                           [(os.path.basename(self.filename), self.filename)])
+
+        return archives.compress_file(self.filename, self.archive_type)
+
+    def sum_dir(self, dirname, archives):
+        '''Sum the files in a directory and archive the directory'''
+        dirname = dirname.rstrip(os.sep)
+        names = sorted(filen for filen in os.listdir(dirname)
+                       if filen != SUMFILE and
+                       os.path.isfile(os.path.join(dirname, filen)))
+        paths = [os.path.join(dirname, filen) for filen in names]
+
+        self.write_sumfile(os.path.join(dirname, SUMFILE),
+                           list(zip(names, paths)))
+
+        if not self.archive_name:
+            self.archive_name = os.path.basename(dirname)
+
+        return archives.compress_dir(dirname, self.archive_type,
+                                     self.archive_name)
+
+    def sum_lines(self, names, paths):
+        '''Return the lines of the sum file for the files'''
+        if self.tree:
+            # Each file is hashed in turn, see tree_hash.hash_chunks
+            lines = []
+            for name, path in zip(names, paths):
+                tree = tree_hash.tree_sums(path, tree_chunk_size,
+                                           tree_hash_workers)
+                lines.extend(tree_hash.manifest_lines(name, tree))
+            return lines
+
+        lines = []
+        for name, path in zip(names, paths):
+            lines.extend(sum_lines(name, file_sums(path)))
+        return lines
+
+    def write_sumfile(self, sumfile, files):
+        '''Write the sums of each (name, path) in files to the sum file'''
+        logger.info('Write sum file %s. (XFERO_Token=%s)', sumfile,
+                    self.xfero_token)
+        lines = self.sum_lines([name for name, path in files],
+                               [path for name, path in files])
+        try:
+            with open(sumfile, 'w') as out:
+                out.writelines(lines)
+        except IOError:
+            logger.error('IOError writing file %s. (XFERO_Token=%s)',
+                         sumfile, self.xfero_token)
+            raise IOError('Error writing file %s. (XFERO_Token=%s)' %
+                          (sumfile, self.xfero_token))
+
+if __name__ == "__main__":
+
+    fname = '/ftran/cksum.txt'
+    try:
+        obj = Checksum()
+        print(obj.cksum(fname, '.zip', '/ftran/extract'))
+    except Exception as err:
+        print('Caught an exception: %s' % err)
+        # Here we would continue processing other files in the loop with the
+        # continue statement
@@ -4,17 +4,19 @@ import shutil
 import os
 import time
 import logging.config
+from xfero import log_config
 import errno
-from /xfero/ import get_conf as get_conf
+from xfero import get_conf as get_conf
+from xfero.workflow_manager.kernel_copy import fast_copy, fast_move
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('copy_file')
 
@@ -54,13 +56,19 @@ class Copy_File(object):
     +------------+-------------+-----------------------------------------------+
     | 27/10/2014 | Chris Falck | modified call to get_conf                     |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Files are copied and moved between            |
+    |            |             | filesystems by fast_copy and fast_move,       |
+    |            |             | without waiting unless the move fails         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | fast_copy and fast_move moved to kernel_copy  |
+    +------------+-------------+-----------------------------------------------+
 
     '''
 
     def __init__(self, xfero_token=False):
 
         logger.debug('Object initialised: Copy_File')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
         self.target = ''
 
@@ -104,13 +112,13 @@ class Copy_File(object):
         copy_fn = self.filename + '_' + str(tstamp)
 
         try:
-            shutil.copy(self.filename, copy_fn)
+            fast_copy(self.filename, copy_fn)
         except OSError as err:
             logger.error('Error copying file %s retrying: ERR - %s. \
             (XFERO_Token=%s)', self.filename, err, self.xfero_token)
             try:
                 time.sleep(10)
-                shutil.copy(self.filename, copy_fn)
+                fast_copy(self.filename, copy_fn)
             except Exception as err:
                 logger.info('Error copying file %s: ERR - %s. (XFERO_Token=%s)',
                             self.filename, err, self.xfero_token)
@@ -188,8 +196,9 @@ class Copy_File(object):
         logger.info('Moving %s to %s. (XFERO_Token=%s)',
                     self.filename, self.target, self.xfero_token)
         try:
-            # os.rename(self.filename, target_file)
-            shutil.move(self.filename, target_file)
+            # A move to another filesystem is copied by fast_move, so only a
+            # move which has failed waits before it is retried
+            fast_move(self.filename, target_file)
         except OSError as exc:
             logger.error('OSError: Failed to move file - %s to %s : \
             errno = %s. (XFERO_Token=%s)', self.filename, self.target, exc.errno,
@@ -197,18 +206,8 @@ class Copy_File(object):
 
             time.sleep(10)
 
-            if exc.errno == 18:
-                try:
-                    shutil.copy2(self.filename, target_file)
-                except OSError as exc1:
-                    logger.error('Failed to move file - %s to %s : errno = %s. \
-                    (XFERO_Token=%s)', self.filename, self.target, exc1.errno,
-                                 self.xfero_token)
-
-            time.sleep(10)
-
             try:
-                shutil.move(self.filename, target_file)
+                fast_move(self.filename, target_file)
             except OSError as exc:
                 logger.error('OSError: Failed to move file - %s to %s : \
                 errno = %s. (XFERO_Token=%s)', self.filename, self.target,
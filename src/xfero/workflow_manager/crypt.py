@@ -0,0 +1,485 @@
+#!/usr/bin/env python
+'''Crypt'''
+import atexit
+import hashlib
+import logging.config
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from xfero import log_config
+from xfero import get_conf as get_conf
+from xfero.db import manage_control as db_control
+from xfero.db import manage_partner as db_partner
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+log_config.configure(xfero_logger)
+# create logger
+logger = logging.getLogger('crypt')
+
+# The gpg executable, and the number of gpg processes run at once
+gpg_command = get_conf.get_xfero_option('settings', 'gpg_command', 'gpg')
+crypt_workers = int(get_conf.get_xfero_option('settings', 'crypt_workers',
+                                              os.cpu_count() or 1))
+
+# Compression level used by gpg before encrypting, from 0 (none) to 9
+crypt_compress_level = int(get_conf.get_xfero_option(
+    'settings', 'crypt_compress_level', 6))
+
+ENCRYPTED_EXTENSIONS = ('.gpg', '.pgp', '.asc')
+
+# Files which are already compressed, and gain nothing from compressing again
+COMPRESSED_EXTENSIONS = ('.zip', '.gz', '.tgz', '.bz2', '.xz', '.7z', '.gpg',
+                         '.pgp')
+
+SIGNATURE_EXTENSION = '.sig'
+
+# Size of the blocks read from gpg when it is run on a stream
+STREAM_BLOCKSIZE = 1024 * 1024
+
+# Column of XFERO_Partner holding the partner's public key
+PARTNER_PGP_PUB_KEY = 16
+
+KEYRING = None
+KEYRING_LOCK = threading.Lock()
+
+
+class Key_Ring(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`crypt.Key_Ring` class holds the keys used by
+    :class:`crypt.Crypt` in a keyring private to the process. Each key is
+    imported into the keyring the first time it is used and is then found by
+    a digest of the key, so keys are parsed once per process rather than for
+    every file.
+
+    The number of gpg processes run at once is limited to crypt_workers, as
+    each of them uses a core while it encrypts or decrypts a file.
+
+    *Example usage:*
+
+    ```keyring = get_keyring()```
+    ```fingerprint = keyring.fingerprint(key)```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added stream, to run gpg on a stream of       |
+    |            |             | blocks                                        |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, workers=None):
+        '''init'''
+        self.homedir = tempfile.mkdtemp(prefix='xfero_gpg_')
+        self.keys = {}
+        self.lock = threading.Lock()
+        self.slots = threading.BoundedSemaphore(workers or crypt_workers)
+        self.imports = 0
+
+    def run(self, args, stdin=None):
+        '''Run gpg with the keyring and return its output'''
+        command = [gpg_command, '--homedir', self.homedir, '--batch',
+                   '--yes', '--no-tty', '--pinentry-mode', 'loopback'] + args
+        with self.slots:
+            proc = subprocess.run(command, input=stdin,
+                                  stdout=subprocess.PIPE,
+                                  stderr=subprocess.PIPE)
+        if proc.returncode != 0:
+            raise IOError(proc.returncode,
+                          proc.stderr.decode('utf-8', 'replace').strip())
+        return proc.stdout
+
+    def stream(self, args, blocks, passphrase=None):
+        '''Run gpg with the keyring on a stream of blocks, yielding its output
+        as it is written. The passphrase, if any, is given on a pipe of its
+        own as the blocks are given on stdin'''
+        command = [gpg_command, '--homedir', self.homedir, '--batch',
+                   '--yes', '--no-tty', '--pinentry-mode', 'loopback']
+        pass_fds = ()
+        if passphrase is not None:
+            read_fd, write_fd = os.pipe()
+            os.write(write_fd, passphrase.encode('utf-8'))
+            os.close(write_fd)
+            command += ['--passphrase-fd', str(read_fd)]
+            pass_fds = (read_fd,)
+        command += args
+
+        with self.slots, tempfile.TemporaryFile() as errors:
+            try:
+                proc = subprocess.Popen(command, stdin=subprocess.PIPE,
+                                        stdout=subprocess.PIPE,
+                                        stderr=errors, pass_fds=pass_fds)
+            finally:
+                for fdesc in pass_fds:
+                    os.close(fdesc)
+
+            failed = []
+            feeder = threading.Thread(target=feed,
+                                      args=(proc.stdin, blocks, failed),
+                                      daemon=True)
+            feeder.start()
+            finished = False
+            try:
+                while True:
+                    data = proc.stdout.read1(STREAM_BLOCKSIZE)
+                    if not data:
+                        break
+                    yield data
+                finished = True
+            finally:
+                if not finished and proc.poll() is None:
+                    # The output is no longer wanted, so gpg is stopped and
+                    # the feeder with it
+                    proc.kill()
+                proc.stdout.close()
+                feeder.join()
+                returncode = proc.wait()
+
+            if failed:
+                raise failed[0]
+            if returncode != 0:
+                errors.seek(0)
+                raise IOError(returncode,
+                              errors.read().decode('utf-8', 'replace').strip())
+
+    def fingerprint(self, key, passphrase=''):
+        '''Return the fingerprint of a key, importing it on first use'''
+        digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+        with self.lock:
+            if digest in self.keys:
+                return self.keys[digest]
+
+            # The key is imported from a file so that the passphrase can be
+            # given on stdin
+            fdesc, keyfile = tempfile.mkstemp(dir=self.homedir)
+            try:
+                with os.fdopen(fdesc, 'w') as out:
+                    out.write(key)
+                output = self.run(
+                    ['--passphrase-fd', '0', '--with-colons',
+                     '--import-options', 'import-show', '--import', keyfile],
+                    stdin=passphrase.encode('utf-8'))
+            finally:
+                os.remove(keyfile)
+
+            fingerprints = [line.split(':')[9]
+                            for line in output.decode('utf-8').splitlines()
+                            if line.startswith('fpr:')]
+            if not fingerprints:
+                raise ValueError('No key found in key material')
+
+            self.imports += 1
+            self.keys[digest] = fingerprints[0]
+            return fingerprints[0]
+
+    def close(self):
+        '''Stop the keyring's agent and delete the keyring'''
+        try:
+            subprocess.run(['gpgconf', '--homedir', self.homedir, '--kill',
+                            'gpg-agent'], stdout=subprocess.DEVNULL,
+                           stderr=subprocess.DEVNULL)
+        except OSError:
+            pass
+        shutil.rmtree(self.homedir, ignore_errors=True)
+
+
+def feed(stdin, blocks, failed):
+    '''Write the blocks to stdin and close it, recording any exception in
+    failed'''
+    try:
+        for block in blocks:
+            stdin.write(block)
+    except BrokenPipeError:
+        # gpg has stopped, and its return code gives the reason
+        pass
+    except Exception as err:
+        failed.append(err)
+    finally:
+        try:
+            stdin.close()
+        except BrokenPipeError:
+            pass
+
+
+def get_keyring():
+    '''
+
+    **Purpose:**
+
+    Return the keyring for this process, creating it on first use.
+
+    *Example usage:*
+
+    ```keyring = get_keyring()```
+
+    :returns: The Key_Ring
+
+    '''
+    global KEYRING
+
+    with KEYRING_LOCK:
+        if KEYRING is None:
+            KEYRING = Key_Ring()
+            atexit.register(KEYRING.close)
+        return KEYRING
+
+
+def key_material(key):
+    '''
+
+    **Purpose:**
+
+    Return an armored key given either the key itself or the path of a file
+    holding it.
+
+    :param key: The key or the path of a key file
+    :returns: The key
+
+    '''
+    if key and not key.lstrip().startswith('-----BEGIN') and \
+            os.path.isfile(key):
+        with open(key, 'r') as infile:
+            return infile.read()
+    return key
+
+
+class Crypt(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`crypt.Crypt` class encrypts, decrypts and signs files with
+    OpenPGP, using gpg.
+
+    gpg reads the file and writes the result itself, a block at a time, so
+    the file is never held in memory and no intermediate copy of the plain
+    text is made. The result is written to a temporary file alongside the
+    file and renamed once complete. The work is done by the gpg process, so
+    it runs on another core to the workflow thread, and at most crypt_workers
+    gpg processes are run at once.
+
+    gpg compresses the file before encrypting it, at crypt_compress_level.
+    Compression takes most of the time to encrypt a file, so files which are
+    already compressed, such as archives, are encrypted without it.
+
+    The keys are held in a keyring private to the XFERO process, see
+    :class:`crypt.Key_Ring`, and are imported once rather than for every
+    file.
+
+    **Usage Notes:**
+
+    Files are encrypted to the public key of a partner. The key is given as
+    the partner service name, whose partner_pgp_pub_key is used, or as the
+    key itself or the path of a key file.
+
+    Files are decrypted and signed with the private key and passphrase held
+    in XFERO_Control, unless a key and passphrase are given.
+
+    * encrypt_file - Writes <file>.gpg and deletes the file. If sign is Yes
+      the file is also signed.
+    * decrypt_file - Writes the file without its .gpg, .pgp or .asc extension
+      and deletes the encrypted file.
+    * sign_file - Writes a detached signature <file>.sig and returns the file
+      and the signature, which are both transferred.
+
+    *Example usage:*
+
+    ```obj = Crypt()```
+    ```obj.encrypt_file(filename, 'PART001')```
+    ```obj.decrypt_file(filename)```
+    ```obj.sign_file(filename)```
+
+    :returns: The name of the file produced or raises an Exception
+
+    **Unit Test Module:** test_crypt.py
+
+    *External dependencies*
+
+    gpg
+    xfero
+      get_conf (xfero.workflow_manager.crypt)
+      manage_control (xfero.workflow_manager.crypt)
+      manage_partner (xfero.workflow_manager.crypt)
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added encrypt_args, shared with the streamed  |
+    |            |             | encryption of stream_filter                   |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, xfero_token=False):
+        '''init'''
+        logger.debug('Object initialised: Crypt')
+        self.xfero_token = xfero_token
+        self.filename = ''
+
+    def encrypt_file(self, filename, public_key, sign='No', private_key='',
+                     passphrase=''):
+        '''Encrypt a file to a partner's public key'''
+        self.filename = filename
+        self.check_file()
+
+        logger.info('Encrypt File: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        args, passphrase = self.encrypt_args(self.filename, public_key, sign,
+                                             private_key, passphrase)
+        stdin = None
+        if passphrase is not None:
+            args = ['--passphrase-fd', '0'] + args
+            stdin = passphrase.encode('utf-8')
+
+        return self.process(args, self.filename + '.gpg', stdin)
+
+    def encrypt_args(self, filename, public_key, sign='No', private_key='',
+                     passphrase=''):
+        '''Return the gpg arguments to encrypt a file of the name given, and
+        the passphrase to give gpg, or None if the file is not signed'''
+        keyring = get_keyring()
+        compress_level = crypt_compress_level
+        if filename.lower().endswith(COMPRESSED_EXTENSIONS):
+            compress_level = 0
+        args = ['--trust-model', 'always', '--compress-level',
+                str(compress_level), '--recipient',
+                keyring.fingerprint(self.public_key(public_key))]
+        if sign != 'Yes':
+            return args + ['--encrypt'], None
+
+        private_key, passphrase = self.private_key(private_key, passphrase)
+        args += ['--local-user', keyring.fingerprint(private_key, passphrase),
+                 '--sign']
+        return args + ['--encrypt'], passphrase
+
+    def decrypt_file(self, filename, private_key='', passphrase=''):
+        '''Decrypt a file with the private key'''
+        self.filename = filename
+        self.check_file()
+
+        logger.info('Decrypt File: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        private_key, passphrase = self.private_key(private_key, passphrase)
+        get_keyring().fingerprint(private_key, passphrase)
+
+        target = self.filename
+        for extension in ENCRYPTED_EXTENSIONS:
+            if target.endswith(extension):
+                target = target[:-len(extension)]
+                break
+        else:
+            target = self.filename + '.out'
+
+        return self.process(['--passphrase-fd', '0', '--decrypt'], target,
+                            passphrase.encode('utf-8'))
+
+    def sign_file(self, filename, private_key='', passphrase=''):
+        '''Write a detached signature of a file'''
+        self.filename = filename
+        self.check_file()
+
+        logger.info('Sign File: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        private_key, passphrase = self.private_key(private_key, passphrase)
+        fingerprint = get_keyring().fingerprint(private_key, passphrase)
+
+        signature = self.process(
+            ['--local-user', fingerprint, '--passphrase-fd', '0',
+             '--detach-sign'], self.filename + SIGNATURE_EXTENSION,
+            passphrase.encode('utf-8'), keep=True)
+
+        return [self.filename, signature]
+
+    def check_file(self):
+        '''Check the file exists'''
+        if not os.path.isfile(self.filename):
+            logger.error('OSError No such file or directory: %s. \
+            (XFERO_Token=%s)', self.filename, self.xfero_token)
+            raise OSError(2, 'No such file or directory: %s. \
+            (XFERO_Token=%s)' % (self.filename, self.xfero_token))
+
+    def public_key(self, public_key):
+        '''Return a public key given a partner, key or key file'''
+        if public_key and not public_key.lstrip().startswith('-----BEGIN') \
+                and not os.path.isfile(public_key):
+            row = db_partner.read_psn_XFERO_Partner(public_key,
+                                                    self.xfero_token)
+            if row is None or not row[PARTNER_PGP_PUB_KEY]:
+                logger.error('No public key for partner %s. \
+                (XFERO_Token=%s)', public_key, self.xfero_token)
+                raise ValueError('No public key for partner %s. \
+                (XFERO_Token=%s)' % (public_key, self.xfero_token))
+            public_key = row[PARTNER_PGP_PUB_KEY]
+        return key_material(public_key)
+
+    def private_key(self, private_key, passphrase):
+        '''Return the private key and passphrase, by default from
+        XFERO_Control'''
+        if not private_key:
+            control = db_control.read_XFERO_Control(1, self.xfero_token)
+            if control is None or not control['control_pgp_priv_key']:
+                logger.error('No private key in XFERO_Control. \
+                (XFERO_Token=%s)', self.xfero_token)
+                raise ValueError('No private key in XFERO_Control. \
+                (XFERO_Token=%s)' % self.xfero_token)
+            private_key = control['control_pgp_priv_key']
+            passphrase = control['control_pgp_passphrase'] or ''
+        return key_material(private_key), passphrase
+
+    def process(self, args, target, stdin, keep=False):
+        '''Run gpg on the file, writing the result to target'''
+        fdesc, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(target),
+            prefix='.' + os.path.basename(target) + '.', suffix='.part')
+        os.close(fdesc)
+
+        try:
+            get_keyring().run(['--output', temp_path] + args +
+                              [self.filename], stdin)
+            os.replace(temp_path, target)
+        except (IOError, OSError) as err:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+            logger.error('Error processing file %s with gpg: %s. \
+            (XFERO_Token=%s)', self.filename, err, self.xfero_token)
+            raise IOError('Error processing file %s with gpg: %s. \
+            (XFERO_Token=%s)' % (self.filename, err, self.xfero_token))
+
+        if not keep:
+            try:
+                os.remove(self.filename)
+            except OSError:
+                logger.warning('Unable to delete the file %s. \
+                (XFERO_Token=%s)', self.filename, self.xfero_token)
+
+        return target
+
+if __name__ == "__main__":
+
+    fname = '/ftran/crypt.txt'
+    try:
+        obj = Crypt()
+        print(obj.decrypt_file(obj.encrypt_file(fname, 'PART001')))
+    except Exception as err:
+        print('Caught an exception: %s' % err)
+        # Here we would continue processing other files in the loop with the
+        # continue statement
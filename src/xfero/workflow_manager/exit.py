@@ -1,18 +1,19 @@
 #!/usr/bin/env python
 '''Exit'''
 import logging.config
+from xfero import log_config
 import subprocess
 import shlex
-from /xfero/ import get_conf as get_conf
+from xfero import get_conf as get_conf
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('exit')
 
@@ -49,7 +50,7 @@ class Exit(object):
     def __init__(self, xfero_token=False):
         '''init'''
         logger.debug('Object initialised: Exit')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
         self.exit_call = ''
 
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+'''Filename Pipeline'''
+import logging
+from xfero.workflow_manager import case_converter
+from xfero.workflow_manager import transform_filename
+from xfero.workflow_manager.copy_file import Copy_File
+
+# The workflow classes whose methods only change the name of a file, with the
+# function computing the new name for each method
+NAME_STEPS = {
+    'Transform_Filename': transform_filename.NAME_FUNCTIONS,
+    'Case_Converter': case_converter.NAME_FUNCTIONS,
+}
+
+# create logger
+logger = logging.getLogger('workflow')
+
+
+def step_args(workflow):
+    '''Return the arguments of a workflow item as a tuple'''
+    args = workflow['workflow_item_args']
+    if not args or args == 'NULL':
+        return ()
+    return tuple(word.strip() for word in args.split(','))
+
+
+def name_function(workflow):
+    '''
+
+    **Purpose:**
+
+    Return the function computing the new file name for a workflow item, or
+    None if the workflow item does more than change the name of the file.
+
+    *Example usage:*
+
+    ```name_function(workflow)```
+
+    :param workflow: Row from the XFERO_Workflow_Item table
+    :returns: The function or None
+
+    '''
+    functions = NAME_STEPS.get(workflow['workflow_item_class'], {})
+    return functions.get(workflow['workflow_item_function_call'])
+
+
+def compile_workflow(rows):
+    '''
+
+    **Purpose:**
+
+    Replace each run of consecutive workflow items which only change the name
+    of the file with a single :class:`filename_pipeline.Filename_Pipeline`.
+    Any other workflow item ends the run, so the steps either side of a step
+    which reads or writes the file are not combined.
+
+    *Example usage:*
+
+    ```steps = compile_workflow(plan.workflow)```
+
+    :param rows: Workflow items in running order
+    :returns: Tuple of workflow items and Filename_Pipeline objects
+
+    '''
+    steps = []
+    for workflow in rows:
+        function = name_function(workflow)
+        if function is None:
+            steps.append(workflow)
+            continue
+        if not steps or not isinstance(steps[-1], Filename_Pipeline):
+            steps.append(Filename_Pipeline())
+        steps[-1].add(function, step_args(workflow), workflow)
+    return tuple(steps)
+
+
+class Filename_Pipeline(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`filename_pipeline.Filename_Pipeline` class applies a run of
+    consecutive Transform_Filename and Case_Converter workflow items with one
+    rename. The new name is computed from the functions in NAME_FUNCTIONS of
+    each module, in running order, and the file is renamed once to the final
+    name. A five step naming workflow therefore renames the file once rather
+    than five times.
+
+    **Usage Notes:**
+
+    The pipelines of a route are built once, by ``compile_workflow``, when the
+    route plan is loaded.
+
+    An invalid argument, such as an eye-catcher which is not in the file
+    name, raises a TypeError before the file is renamed.
+
+    *Example usage:*
+
+    ```pipeline = Filename_Pipeline()```
+    ```pipeline.add(transform_filename.name_add_prefix, ('OUT_',), row)```
+    ```pipeline.rename(filename, xfero_token)```
+
+    **Unit Test Module:** test_filename_pipeline.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self):
+        '''init'''
+        self.steps = []
+
+    def add(self, function, args, workflow):
+        '''Add a step to the end of the pipeline'''
+        self.steps.append((function, args, workflow))
+
+    def new_name(self, filename):
+        '''Return the name the file is renamed to'''
+        for function, args, workflow in self.steps:
+            filename = function(filename, *args)
+        return filename
+
+    def rename(self, filename, xfero_token=False):
+        '''Rename the file once to its new name, returning the new name'''
+        new_fn = self.new_name(filename)
+
+        logger.info('Renaming file from %s to %s for %s steps. \
+        (XFERO_Token=%s)', filename, new_fn, len(self.steps), xfero_token)
+
+        return Copy_File(xfero_token).rename_file(filename, new_fn)
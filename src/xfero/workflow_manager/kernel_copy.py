@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+'''
+Kernel Copy
+'''
+
+import errno
+import os
+import shutil
+import tempfile
+
+# Size of the blocks read and written when the kernel cannot copy the file
+BLOCKSIZE = 1024 * 1024
+
+
+def copy_range(src_fd, dst_fd, offset, length):
+    '''
+
+    **Purpose:**
+
+    Copy length bytes from offset in one file to the current position of
+    another. The copy is made in the kernel with copy_file_range, or sendfile
+    where that is not supported between the files, and only falls back to
+    reading and writing through a buffer if neither is available. A method
+    which fails part way through is followed by the next from the first byte
+    it did not copy.
+
+    *Example usage:*
+
+    ```copy_range(src_fd, dst_fd, 0, 1048576)```
+
+    :param src_fd: File descriptor of the source
+    :param dst_fd: File descriptor of the target
+    :param offset: Offset of the range in the source
+    :param length: Length of the range
+    :returns: None
+
+    '''
+    start = offset
+    end = offset + length
+    position = os.lseek(dst_fd, 0, os.SEEK_CUR)
+    for copier in ('copy_file_range', 'sendfile'):
+        if not hasattr(os, copier):
+            continue
+        try:
+            while offset < end:
+                if copier == 'copy_file_range':
+                    copied = os.copy_file_range(src_fd, dst_fd, end - offset,
+                                                offset)
+                else:
+                    copied = os.sendfile(dst_fd, src_fd, offset, end - offset)
+                if copied == 0:
+                    break
+                offset += copied
+            return
+        except OSError as err:
+            if err.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL,
+                                 errno.EOPNOTSUPP, errno.EBADF):
+                raise
+            # The next method resumes after the bytes already copied
+            os.lseek(dst_fd, position + offset - start, os.SEEK_SET)
+
+    while offset < end:
+        block = os.pread(src_fd, min(BLOCKSIZE, end - offset), offset)
+        if not block:
+            break
+        os.write(dst_fd, block)
+        offset += len(block)
+
+
+def fast_copy(filename, target):
+    '''
+
+    **Purpose:**
+
+    Copy a file, with its permissions and times, so that it appears at the
+    target complete or not at all. The data is written to a hidden temporary
+    file in the target directory, which is renamed to the target once the copy
+    is complete. The copy is made in the kernel with copy_file_range where
+    possible, which on some filesystems shares the blocks of the file rather
+    than copying them, then sendfile and finally through a large buffer.
+
+    *Example usage:*
+
+    ```fast_copy('/xfero/IN/CIS_FILE', '/xfero/transient/CIS_FILE')```
+
+    :param filename: File to copy
+    :param target: Name of the copy
+    :returns: target or raises an OSError
+
+    '''
+    head, tail = os.path.split(target)
+    tmp_fd, tmp_name = tempfile.mkstemp(prefix='.' + tail + '.',
+                                        dir=head or os.curdir)
+    try:
+        with open(filename, 'rb') as source:
+            copy_range(source.fileno(), tmp_fd, 0,
+                       os.fstat(source.fileno()).st_size)
+        os.close(tmp_fd)
+        tmp_fd = None
+        shutil.copystat(filename, tmp_name)
+        os.replace(tmp_name, target)
+    except BaseException:
+        if tmp_fd is not None:
+            os.close(tmp_fd)
+        try:
+            os.remove(tmp_name)
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def fast_move(filename, target):
+    '''
+
+    **Purpose:**
+
+    Move a file, renaming it where the target is on the same filesystem and
+    otherwise copying it with ``fast_copy`` and removing the original.
+
+    *Example usage:*
+
+    ```fast_move('/xfero/IN/CIS_FILE', '/mnt/outbound/CIS_FILE')```
+
+    :param filename: File to move
+    :param target: Name to move the file to
+    :returns: target or raises an OSError
+
+    '''
+    try:
+        os.rename(filename, target)
+    except OSError as err:
+        if err.errno != errno.EXDEV:
+            raise
+        fast_copy(filename, target)
+        os.remove(filename)
+    return target
@@ -1,20 +1,26 @@
 #!/usr/bin/env python
 '''Line End Conversion'''
 import logging.config
+from xfero import log_config
 import os
-from /xfero/ import get_conf as get_conf
+import shutil
+import tempfile
+from xfero import get_conf as get_conf
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('line_end_converter')
 
+# Size of the blocks read and written
+BLOCKSIZE = 1024 * 1024
+
 
 class Line_End_Converter(object):
 
@@ -32,6 +38,10 @@ class Line_End_Converter(object):
 
     **Usage Notes:**
 
+    CRLF, LF and CR line ends are all converted. The file is converted as
+    bytes, so any ASCII compatible encoding, such as UTF-8 or Latin-1, is
+    supported.
+
     PyDevPackage: file_manager
     Dir Structure - src/file_manager/
 
@@ -73,12 +83,32 @@ class Line_End_Converter(object):
     +------------+-------------+-----------------------------------------------+
     | 27/10/2014 | Chris Falck | modified call to get_conf                     |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Files are converted as a binary stream in     |
+    |            |             | blocks to a temporary file, which is renamed  |
+    |            |             | over the original, so memory use does not    |
+    |            |             | depend on the size of the file. The files of  |
+    |            |             | a directory are converted concurrently.       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Declared CPU bound, see workflow_pool         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The files of a directory are converted in     |
+    |            |             | turn, as the conversion holds the GIL         |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Each file of a directory is converted in the  |
+    |            |             | workflow process pool                         |
+    +------------+-------------+-----------------------------------------------+
     '''
 
+    # The conversion holds the GIL, so it is run in the workflow process pool
+    cpu_bound = True
+    # A directory is converted on the workflow thread, which runs the
+    # conversion of each of its files in the pool
+    splits_directories = True
+
     def __init__(self, xfero_token=False):
         '''init'''
         logger.debug('Object initialised: Line_End_Converter')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
         self.newline = None
         self.retv = None
@@ -117,61 +147,132 @@ class Line_End_Converter(object):
     def convert(self):
         '''Conversion method'''
         if os.path.isdir(self.filename):
-
-            for filen in os.listdir(self.filename):
-
-                try:
-                    self.filecontents = open(
-                        os.path.join(self.filename, filen), "r").read()
-                except:
-                    logger.error('FileNotFoundError: [Errno 2] No such file or \
-                    directory: %s. (XFERO_Token=%s)', os.path.join(self.filename,
-                                                                filen),
-                                 self.xfero_token)
-                    raise IOError('Error opening file: %s. (XFERO_Token=%s)' % (
-                        os.path.join(self.filename, filen), self.xfero_token))
-
-                self.filepath = os.path.join(self.filename, filen)
-
-                try:
-                    self.process()
-                except:
-                    raise
+            # Imported here as workflow_pool imports this module through
+            # stream_filter
+            from xfero import workflow_pool
+
+            workflow_pool.run(self, 'convert_file',
+                              [(os.path.join(self.filename, filen),
+                                self.newline)
+                               for filen in sorted(os.listdir(self.filename))],
+                              self.xfero_token)
         else:
-            try:
-                self.filecontents = open(self.filename, "r").read()
-            except:
-                logger.error('FileNotFoundError: [Errno 2] No such file or \
-                directory: %s. (XFERO_Token=%s)', self.filename, self.xfero_token)
-                raise IOError(
-                    'Error opening file: %s. \
-                    (XFERO_Token=%s)' % (self.filename, self.xfero_token))
+            self.process(self.filename)
 
-            self.filepath = self.filename
+    def convert_file(self, filepath, newline):
+        '''Convert one file of a directory to the newline line end'''
+        self.newline = newline
+        self.process(filepath)
+        return filepath
 
-            try:
-                self.process()
-            except:
-                raise
-
-    def process(self):
+    def process(self, filepath=None):
         '''Process method'''
-        try:
-            filen = open(self.filepath, "w", newline=self.newline)
-        except IOError:
-            logger.error('IOError opening file %s. (XFERO_Token=%s)',
-                         self.filepath, self.xfero_token)
-            raise IOError('Error opening file %s. (XFERO_Token=%s)' %
-                          (self.filepath, self.xfero_token))
+        if filepath is None:
+            filepath = self.filepath
+        self.filepath = filepath
+        newline = self.newline.encode('ascii')
 
         try:
-            filen.write(self.filecontents)
-            filen.close()
-        except IOError:
-            logger.error('IOError writing file %s. (XFERO_Token=%s)',
-                         self.filepath, self.xfero_token)
-            raise IOError('Error writing file %s. (XFERO_Token=%s)' %
-                          (self.filepath, self.xfero_token))
+            source = open(filepath, 'rb')
+        except (IOError, OSError):
+            logger.error('FileNotFoundError: [Errno 2] No such file or \
+            directory: %s. (XFERO_Token=%s)', filepath, self.xfero_token)
+            raise IOError('Error opening file: %s. (XFERO_Token=%s)' % (
+                filepath, self.xfero_token))
+
+        with source:
+            # The converted file is written alongside the original and
+            # renamed over it once complete, so the original is untouched if
+            # the conversion fails
+            try:
+                fd, temp_path = tempfile.mkstemp(
+                    dir=os.path.dirname(filepath),
+                    prefix='.' + os.path.basename(filepath) + '.',
+                    suffix='.part')
+            except (IOError, OSError):
+                logger.error('IOError opening file %s. (XFERO_Token=%s)',
+                             filepath, self.xfero_token)
+                raise IOError('Error opening file %s. (XFERO_Token=%s)' %
+                              (filepath, self.xfero_token))
+
+            try:
+                with os.fdopen(fd, 'wb') as target:
+                    translate(source, target, newline)
+                shutil.copymode(filepath, temp_path)
+                os.replace(temp_path, filepath)
+            except (IOError, OSError):
+                os.remove(temp_path)
+                logger.error('IOError writing file %s. (XFERO_Token=%s)',
+                             filepath, self.xfero_token)
+                raise IOError('Error writing file %s. (XFERO_Token=%s)' %
+                              (filepath, self.xfero_token))
+
+
+def translate(source, target, newline):
+    '''
+
+    **Purpose:**
+
+    Copy a binary stream, replacing each line end with newline. CRLF, LF and
+    CR are all treated as line ends, as in Python's universal newlines mode.
+
+    The stream is copied in blocks so memory use does not depend on the size
+    of the file. A CR at the end of a block is held back until the next block
+    is read, so a CRLF pair split between two blocks is a single line end.
+
+    *Example usage:*
+
+    ```translate(source, target, b'\\n')```
+
+    :param source: Binary file object to read
+    :param target: Binary file object to write
+    :param newline: Line end to write, b'\\n' or b'\\r\\n'
+    :returns: None
+
+    '''
+    for block in translate_blocks(iter(lambda: source.read(BLOCKSIZE), b''),
+                                  newline):
+        target.write(block)
+
+
+def translate_blocks(blocks, newline):
+    '''
+
+    **Purpose:**
+
+    Replace each line end in a stream of blocks with newline, as
+    ``translate`` does, yielding each block once converted. This is used by
+    ``translate`` and by :class:`stream_filter.Line_End_Filter`.
+
+    *Example usage:*
+
+    ```for block in translate_blocks(blocks, b'\\r\\n'):```
+
+    :param blocks: Iterable of blocks of bytes
+    :param newline: Line end to write, b'\\n' or b'\\r\\n'
+    :returns: Generator of the converted blocks
+
+    '''
+    pending_cr = False
+
+    for block in blocks:
+        if not block:
+            continue
+
+        if pending_cr:
+            block = b'\r' + block
+        pending_cr = block.endswith(b'\r')
+        if pending_cr:
+            block = block[:-1]
+
+        block = block.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        if newline != b'\n':
+            block = block.replace(b'\n', newline)
+        if block:
+            yield block
+
+    if pending_cr:
+        yield newline
 
 if __name__ == "__main__":
 
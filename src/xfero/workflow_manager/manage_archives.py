@@ -1,24 +1,94 @@
 #!/usr/bin/env python
 '''Manage Archives'''
 import logging.config
+from xfero import log_config
 import os
 import shutil
 import zipfile
 import tarfile
 import datetime
-from /xfero/ import get_conf as get_conf
+import tempfile
+from xfero import get_conf as get_conf
+from xfero.workflow_manager import parallel_compress
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('manage_archives')
 
+# Compression level, number of threads and size of the blocks used when
+# compressing. Each block is compressed on its own by one of the threads
+compress_level = int(get_conf.get_xfero_option(
+    'settings', 'compress_level', parallel_compress.LEVEL))
+compress_workers = int(get_conf.get_xfero_option(
+    'settings', 'compress_workers', os.cpu_count() or 1))
+compress_block_size = int(get_conf.get_xfero_option(
+    'settings', 'compress_block_size', parallel_compress.BLOCK_SIZE))
+
+# Codec of each type of tar archive, and of each type of compressed file
+TAR_TYPES = {'tar.gz': 'gzip', 'tar.bz2': 'bz2', 'tar.xz': 'lzma'}
+FILE_TYPES = {'gz': 'gzip', 'bz2': 'bz2', 'xz': 'lzma'}
+
+# Extension and tarfile mode of the archives which can be extracted
+EXTRACT_TYPES = (('.tar.gz', 'r:gz'), ('.tgz', 'r:gz'),
+                 ('.tar.bz2', 'r:bz2'), ('.tbz2', 'r:bz2'),
+                 ('.tar.xz', 'r:xz'), ('.txz', 'r:xz'))
+
+# Limits on the files extracted from one archive, so that an archive which
+# expands without bound, such as a zip bomb, cannot fill the disk
+extract_max_bytes = int(get_conf.get_xfero_option(
+    'settings', 'extract_max_bytes', 10737418240))
+extract_max_members = int(get_conf.get_xfero_option(
+    'settings', 'extract_max_members', 10000))
+
+# Size of the blocks copied from an archive member
+BLOCKSIZE = 1024 * 1024
+
+# Prefix of the directory members are written to by extract_members before
+# they are renamed into place
+STAGING_PREFIX = '.xfero_extract_'
+
+
+def archive_members(filename):
+    '''
+
+    **Purpose:**
+
+    Yield each regular file held in an archive, in the order it is stored. A
+    tar archive is read one member at a time, so each member is available as
+    soon as it has been decompressed. Directories, links and devices are skipped.
+
+    *Example usage:*
+
+    ```for name, source in archive_members('/xfero/IN/bundle.tar.gz'):```
+
+    :param filename: A zip or tar archive
+    :returns: Generator of (member name, file object to read it from)
+
+    '''
+    if filename.endswith('.zip'):
+        with zipfile.ZipFile(filename, 'r') as azip:
+            for info in azip.infolist():
+                if info.is_dir():
+                    continue
+                with azip.open(info) as source:
+                    yield info.filename, source
+        return
+
+    # The members are read in turn as the archive is iterated. A stream, 'r|*',
+    # is not used as it stops after the first of the gzip members written by
+    # parallel compression
+    with tarfile.open(filename, 'r:*') as atar:
+        for member in atar:
+            if member.isfile():
+                yield member.name, atar.extractfile(member)
+
 class Manage_Archives(object):
 
     '''
@@ -31,7 +101,8 @@ class Manage_Archives(object):
 
     *Archive Creation*
 
-    Archives are created in either tar.gz or zip format.
+    Archives are created in tar.gz, tar.bz2, tar.xz or zip format. A file can
+    also be compressed on its own, without an archive, in gz, bz2 or xz format.
 
     There are 2 methods for Archive creation. These are ``compress_file`` and
     ``compress_dir``
@@ -44,9 +115,33 @@ class Manage_Archives(object):
     or directory name with a ``.sum`` extension to include in the archive but if
     one is not found the archive is still produced without the sum file.
 
+    *Parallel Compression*
+
+    The tar archives and compressed files are compressed in the style of
+    pigz. The data is divided into blocks of compress_block_size bytes which
+    are compressed by compress_workers threads at once, each block into its
+    own gzip member or bzip2 or xz stream, and the streams are concatenated.
+    The result is read by gunzip, bunzip2, unxz and tar like any other file of
+    its type. See :mod:`parallel_compress`.
+
     *Archive Extraction*
 
-    Archives in either tar.gz or zip format can be extracted.
+    Archives in tar.gz, tar.bz2, tar.xz or zip format can be extracted.
+
+    ``extract`` extracts the files of an archive to a directory. The
+    ``extract_members`` workflow step instead releases each file into a
+    directory, normally the monitored directory of a route, as soon as it has
+    been extracted. The monitor then routes each file as a work item of its
+    own, so the files pass through workflow and transfer in parallel while
+    the rest of the archive is still being extracted. Each file is written in
+    a hidden directory and renamed into place once complete, so the monitor
+    never sees part of a file.
+
+    No more than extract_max_members files or extract_max_bytes bytes are
+    extracted from an archive. The sizes recorded in the archive are not
+    trusted, the limit is applied to the data as it is written. An archive
+    which exceeds a limit raises a ValueError. Files released by
+    ``extract_members`` before the limit was reached are processed as usual.
 
     Extracted files will be placed in the directory passed to the method.
 
@@ -57,7 +152,11 @@ class Manage_Archives(object):
     * filename or directory name - A file or directory of files to include in
     the archive.
     * self.archive_type - The type of archive to be created.
-      * Accepted values = .tar.gz or .zip.
+      * Accepted values = .tar.gz, .tar.bz2, .tar.xz or .zip, or .gz, .bz2 or
+        .xz to compress a file without an archive.
+    * level - The compression level, from 1 to 9. Defaults to compress_level.
+    * workers - The number of threads compressing at once. Defaults to
+      compress_workers.
 
     *Example usage:*
 
@@ -108,18 +207,26 @@ class Manage_Archives(object):
     |            |             | and compress_dir to delete either the file or |
     |            |             | the directory provided it has been Archived.  |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added parallel compression, the compression   |
+    |            |             | level and the bz2 and xz codecs               |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added extract_members and the limits on the   |
+    |            |             | size and number of files extracted            |
+    +------------+-------------+-----------------------------------------------+
     '''
 
     def __init__(self, xfero_token):
         '''init'''
         logger.debug('Object initialised: Manage_Archives')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
 
-    def compress_file(self, filename, archive_type):
+    def compress_file(self, filename, archive_type, level='', workers=''):
         '''compress file'''
         self.filename = filename
         self.archive_type = archive_type
+        self.level = int(level) if level else compress_level
+        self.workers = int(workers) if workers else compress_workers
 
         logger.info('Compress File: %s. (XFERO_Token=%s)',
                     self.filename, self.xfero_token)
@@ -135,14 +242,35 @@ class Manage_Archives(object):
         logger.debug('Determine if a .zip or a .tar.gz is required: Type: %s. \
         (XFERO_Token=%s)', self.archive_type, self.xfero_token)
 
-        if self.archive_type == "tar.gz" or self.archive_type == ".tar.gz":
-            logger.info('Archive Type is .tar.gz. (XFERO_Token=%s)', self.xfero_token)
-            archive_name = self.filename + ".tar.gz"
+        archive_ext = self.archive_type.lstrip('.')
+
+        if archive_ext in FILE_TYPES:
+            logger.info('Compress Type is .%s. (XFERO_Token=%s)', archive_ext,
+                        self.xfero_token)
+            archive_name = self.filename + '.' + archive_ext
+
+            # Compress the file without an archive, leaving any sum file
+            logger.info('Create Compressed File %s. (XFERO_Token=%s)',
+                        archive_name, self.xfero_token)
+            parallel_compress.compress_file(
+                self.filename, archive_name, FILE_TYPES[archive_ext],
+                self.level, self.workers, compress_block_size)
+            try:
+                os.remove(self.filename)
+            except OSError:
+                logger.warning('Unable to delete the file %s following \
+                successful compression. (XFERO_Token=%s)', self.filename,
+                               self.xfero_token)
+            return archive_name
+
+        if archive_ext in TAR_TYPES:
+            logger.info('Archive Type is .%s. (XFERO_Token=%s)', archive_ext,
+                        self.xfero_token)
+            archive_name = self.filename + '.' + archive_ext
 
             # Create Archive
             logger.info('Create Archive %s. (XFERO_Token=%s)', archive_name,
                         self.xfero_token)
-            atar = tarfile.open(archive_name, "w:gz")
 
         elif self.archive_type == "zip" or self.archive_type == ".zip":
             logger.info('Archive Type is .zip. (XFERO_Token=%s)', self.xfero_token)
@@ -151,7 +279,8 @@ class Manage_Archives(object):
             # Create Archive
             logger.info('Create Archive %s. (XFERO_Token=%s)', archive_name,
                         self.xfero_token)
-            azip = zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED)
+            azip = zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED,
+                                   compresslevel=self.level)
 
         else:
             logger.error('TypeError: Invalid Archive Type supplied: %s. \
@@ -173,11 +302,11 @@ class Manage_Archives(object):
                 azip.write(sumfile, filen)
             azip.close()
         else:
-            atar.add(self.filename, filen)
+            members = [(self.filename, filen)]
             if os.path.isfile(sumfile):
                 path, filen = os.path.split(sumfile)
-                atar.add(sumfile, filen)
-            atar.close()
+                members.append((sumfile, filen))
+            self.write_tar(archive_name, TAR_TYPES[archive_ext], members)
         # Close the Archive
         logger.info("Close the Archive. (XFERO_Token=%s)", self.xfero_token)
 
@@ -199,11 +328,14 @@ class Manage_Archives(object):
 
         return archive_name
 
-    def compress_dir(self, dirname, archive_type, archive_name):
+    def compress_dir(self, dirname, archive_type, archive_name, level='',
+                     workers=''):
         '''compress dire'''
         self.dirname = dirname
         self.archive_type = archive_type
         self.archive_name = archive_name
+        self.level = int(level) if level else compress_level
+        self.workers = int(workers) if workers else compress_workers
 
         # Make sure that there is no trailing separator on directory
         self.dirname = self.dirname.rstrip(os.sep)
@@ -228,16 +360,17 @@ class Manage_Archives(object):
             'Determine if a .zip or a .tar.gz is required. \
             (XFERO_Token=%s)', self.xfero_token)
 
-        if self.archive_type == "tar.gz" or self.archive_type == ".tar.gz":
-            logger.info('Archive Type is .tar.gz - Type %s. \
-            (XFERO_Token=%s)', self.archive_type, self.xfero_token)
+        archive_ext = self.archive_type.lstrip('.')
+
+        if archive_ext in TAR_TYPES:
+            logger.info('Archive Type is .%s - Type %s. \
+            (XFERO_Token=%s)', archive_ext, self.archive_type, self.xfero_token)
             self.ts_archive_name = self.basedir + os.sep + \
-                self.archive_name + '_' + tstamp + ".tar.gz"
+                self.archive_name + '_' + tstamp + '.' + archive_ext
 
             # Create Archive
             logger.info('Create Archive %s. (XFERO_Token=%s)',
                         self.ts_archive_name, self.xfero_token)
-            atar = tarfile.open(self.ts_archive_name, "w:gz")
 
         elif self.archive_type == "zip" or self.archive_type == ".zip":
             logger.info('Archive Type is .zip - Type %s. (XFERO_Token=%s)',
@@ -249,7 +382,8 @@ class Manage_Archives(object):
             logger.info('Create Archive %s. (XFERO_Token=%s)',
                         self.ts_archive_name, self.xfero_token)
             azip = zipfile.ZipFile(
-                self.ts_archive_name, 'w', zipfile.ZIP_DEFLATED)
+                self.ts_archive_name, 'w', zipfile.ZIP_DEFLATED,
+                compresslevel=self.level)
 
         else:
             logger.error('TypeError: Invalid Archive Type supplied: %s. \
@@ -270,12 +404,15 @@ class Manage_Archives(object):
             azip.close()
         else:
 
+            members = []
             for filename in os.listdir(self.dirname):
 
                 if os.path.isfile(self.dirname + os.sep + filename):
-                    atar.add(self.dirname + os.sep + filename, filename)
+                    members.append((self.dirname + os.sep + filename,
+                                    filename))
 
-            atar.close()
+            self.write_tar(self.ts_archive_name, TAR_TYPES[archive_ext],
+                           members)
         # Delete the directory
         try:
             shutil.rmtree(self.dirname)
@@ -291,6 +428,17 @@ class Manage_Archives(object):
 
         return self.ts_archive_name
 
+    def write_tar(self, archive_name, codec, members):
+        '''Write the (path, arcname) members to a tar archive compressed in
+        parallel'''
+        with open(archive_name, 'wb') as out:
+            with parallel_compress.Parallel_Writer(
+                    out, codec, self.level, self.workers,
+                    compress_block_size) as writer:
+                with tarfile.open(fileobj=writer, mode='w|') as atar:
+                    for path, arcname in members:
+                        atar.add(path, arcname)
+
     def extract(self, filename, to_path):
         '''extract'''
         self.filename = filename
@@ -315,28 +463,35 @@ class Manage_Archives(object):
             'Determine if a .zip or a .tar.gz is required. \
             (XFERO_Token=%s)', self.xfero_token)
 
-        if self.filename.endswith('.zip'):
-            opener, mode = zipfile.ZipFile, 'r'
-        elif self.filename.endswith('.tar.gz') or \
-        self.filename.endswith('.tgz'):
-            opener, mode = tarfile.open, 'r:gz'
-        else:
+        if not (self.filename.endswith('.zip') or
+                any(self.filename.endswith(ext) for ext, mode in
+                    EXTRACT_TYPES)):
             raise ValueError('Could not extract file as no appropriate \
             extractor is found: %s. (XFERO_Token=%s)' % (self.filename,
                                                       self.xfero_token))
 
         try:
-            file = opener(self.filename, mode)
+            logger.info('Extracting file %s. (XFERO_Token=%s)', self.filename,
+                        self.xfero_token)
             try:
-                logger.info('Extracting file %s. (XFERO_Token=%s)', self.filename,
-                            self.xfero_token)
-                try:
-                    file.extractall(self.to_path)
-                except Exception as err:
-                    raise err
+                for name, staged in self.stream_members(self.filename,
+                                                        self.to_path):
+                    # Members keep their directories, but may not be written
+                    # outside of to_path
+                    name = os.path.normpath(name).lstrip(os.sep)
+                    if name.startswith(os.pardir):
+                        logger.warning('Member %s of %s is outside the \
+                        archive... Skipping. (XFERO_Token=%s)', name,
+                                       self.filename, self.xfero_token)
+                        os.remove(staged)
+                        continue
+                    target = os.path.join(self.to_path, name)
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    os.replace(staged, target)
             finally:
-                file.close()
                 os.remove(self.filename)
+        except ValueError as err:
+            raise err
         except Exception as err:
             raise ValueError(
                 'Can not open archive file: %s. \
@@ -344,6 +499,104 @@ class Manage_Archives(object):
 
         return self.to_path
 
+    def extract_members(self, filename, to_path, max_bytes='',
+                        max_members=''):
+        '''Release each member of an archive into to_path as it is
+        extracted'''
+        self.filename = filename
+        self.to_path = to_path.rstrip(os.sep)
+        max_bytes = int(max_bytes) if max_bytes else extract_max_bytes
+        max_members = int(max_members) if max_members else \
+            extract_max_members
+
+        logger.info('Extract members of %s to %s. (XFERO_Token=%s)',
+                    self.filename, self.to_path, self.xfero_token)
+
+        if os.path.isfile(self.filename) is False:
+            logger.error('OSError No such file or directory: %s. \
+            (XFERO_Token=%s)', self.filename, self.xfero_token)
+            raise OSError(2, 'No such file or directory %s. (XFERO_Token=%s)' % (
+                self.filename, self.xfero_token))
+
+        if os.path.isdir(self.to_path) is False:
+            logger.error('OSError No such directory: %s. (XFERO_Token=%s)',
+                         self.to_path, self.xfero_token)
+            raise OSError(2, 'No such directory %s. (XFERO_Token=%s)' % (
+                self.to_path, self.xfero_token))
+
+        released = 0
+        for name, staged in self.stream_members(self.filename, self.to_path,
+                                                max_bytes, max_members):
+            # The members are released into a single directory, under their
+            # own names where these are free
+            name = os.path.basename(name)
+            target = os.path.join(self.to_path, name)
+            if os.path.exists(target):
+                target = os.path.join(self.to_path,
+                                      '%s_%s' % (released, name))
+            os.replace(staged, target)
+            released += 1
+            logger.info('Released member %s of %s. (XFERO_Token=%s)', target,
+                        self.filename, self.xfero_token)
+
+        logger.info('Released %s members of %s. (XFERO_Token=%s)', released,
+                    self.filename, self.xfero_token)
+        os.remove(self.filename)
+
+        # The members are transferred as files of their own, so there is
+        # nothing left to transfer
+        return None
+
+    def stream_members(self, filename, to_path, max_bytes=None,
+                       max_members=None):
+        '''
+        Yield (name, staged path) for each member of the archive once it has
+        been written to a hidden directory in to_path, enforcing the limits
+        on the size and number of members. The caller moves each staged file
+        into place.
+        '''
+        max_bytes = extract_max_bytes if max_bytes is None else max_bytes
+        max_members = extract_max_members if max_members is None else \
+            max_members
+
+        if not (filename.endswith('.zip') or
+                any(filename.endswith(ext) for ext, mode in EXTRACT_TYPES)):
+            raise ValueError('Could not extract file as no appropriate \
+            extractor is found: %s. (XFERO_Token=%s)' % (filename,
+                                                      self.xfero_token))
+
+        staging = tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=to_path)
+        total = 0
+        try:
+            for index, (name, source) in enumerate(archive_members(filename)):
+                if index >= max_members:
+                    logger.error('Archive %s holds more than %s members. \
+                    (XFERO_Token=%s)', filename, max_members,
+                                 self.xfero_token)
+                    raise ValueError('Archive %s holds more than %s members. \
+                    (XFERO_Token=%s)' % (filename, max_members,
+                                         self.xfero_token))
+
+                staged = os.path.join(staging, '%06d' % index)
+                with open(staged, 'wb') as out:
+                    while True:
+                        block = source.read(BLOCKSIZE)
+                        if not block:
+                            break
+                        total += len(block)
+                        if total > max_bytes:
+                            logger.error('Archive %s expands to more than \
+                            %s bytes. (XFERO_Token=%s)', filename, max_bytes,
+                                         self.xfero_token)
+                            raise ValueError('Archive %s expands to more \
+                            than %s bytes. (XFERO_Token=%s)' % (
+                                filename, max_bytes, self.xfero_token))
+                        out.write(block)
+
+                yield name, staged
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
 if __name__ == "__main__":
     '''
     file_name = '/xfero/WIN1/win1_archive'
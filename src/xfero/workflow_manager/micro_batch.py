@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+'''Micro Batch'''
+import logging.config
+from xfero import get_conf as get_conf
+
+# Defaults for the arguments of the Micro_Batch workflow item
+batch_window = float(get_conf.get_xfero_option('settings', 'batch_window',
+                                               60))
+batch_max_files = int(get_conf.get_xfero_option('settings', 'batch_max_files',
+                                                1000))
+batch_max_bytes = int(get_conf.get_xfero_option('settings', 'batch_max_bytes',
+                                                104857600))
+
+ARCHIVE_TYPES = ('tar.gz', 'tar.bz2', 'tar.xz', 'zip')
+
+# create logger
+logger = logging.getLogger('workflow')
+
+
+def batch_settings(archive_type='tar.gz', window='', max_files='',
+                   max_bytes=''):
+    '''
+
+    **Purpose:**
+
+    Return the settings of a batch from the arguments of a Micro_Batch
+    workflow item, using the defaults for those which are not given.
+
+    *Example usage:*
+
+    ```batch_settings('tar.gz', '30', '500')```
+
+    :param archive_type: The type of archive the batch is sent as
+    :param window: Longest time in seconds a file waits for its batch
+    :param max_files: Number of files which fill a batch
+    :param max_bytes: Total size of the files which fill a batch
+    :returns: Dictionary of archive_type, window, max_files and max_bytes or
+    raises a TypeError for an invalid archive type
+
+    '''
+    archive_type = archive_type.lstrip('.')
+    if archive_type not in ARCHIVE_TYPES:
+        raise TypeError(1, 'Invalid Archive Type supplied: %s' % archive_type)
+
+    return {'archive_type': archive_type,
+            'window': float(window) if window else batch_window,
+            'max_files': int(max_files) if max_files else batch_max_files,
+            'max_bytes': int(max_bytes) if max_bytes else batch_max_bytes}
+
+
+class Micro_Batch(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`micro_batch.Micro_Batch` class marks a route whose files are
+    sent in batches. Rather than each file being renamed and transferred on
+    its own, the files which complete the workflow of the route are gathered
+    into one archive, together with a manifest, which is transferred as a
+    single file. See :class:`batcher.Batcher`.
+
+    **Usage Notes:**
+
+    The workflow item is placed last in the workflow of the route. The file
+    is passed on unchanged and is gathered into its batch once the workflow
+    is complete.
+
+    A batch is sent once it holds max_files files or max_bytes bytes, or
+    window seconds after its first file arrived, whichever is sooner.
+
+    The parameter args will hold the following parameters:
+
+    * filename - The file to batch.
+    * archive_type - The type of archive the batch is sent as.
+      * Accepted values = .tar.gz, .tar.bz2, .tar.xz or .zip.
+    * window - Defaults to batch_window.
+    * max_files - Defaults to batch_max_files.
+    * max_bytes - Defaults to batch_max_bytes.
+
+    *Example usage:*
+
+    ```obj = Micro_Batch()```
+    ```obj.batch(args)```
+
+    :param args: The parameters listed above
+    :returns: filename: The file to batch or raises an Exception
+
+    **Unit Test Module:** test_batcher.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, xfero_token=False):
+        '''init'''
+        logger.debug('Object initialised: Micro_Batch')
+        self.xfero_token = xfero_token
+
+    def batch(self, filename, *args):
+        '''Check the batch settings and pass the file on to be batched'''
+        try:
+            batch_settings(*args)
+        except (TypeError, ValueError) as err:
+            logger.error('Invalid batch settings %s: %s. (XFERO_Token=%s)',
+                         args, err, self.xfero_token)
+            raise err
+
+        logger.info('File %s will be batched. (XFERO_Token=%s)', filename,
+                    self.xfero_token)
+        return filename
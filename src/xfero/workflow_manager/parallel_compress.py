@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+'''
+Parallel Compress
+'''
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Size of the blocks compressed independently
+BLOCK_SIZE = 1024 * 1024
+
+# Compression level used when none is given
+LEVEL = 6
+
+# Extension of the files written by each codec
+CODECS = {'gzip': '.gz',
+          'bz2': '.bz2',
+          'lzma': '.xz'}
+
+
+def compress_block(codec, data, level=LEVEL):
+    '''
+
+    **Purpose:**
+
+    Compress a block of data into a complete stream of the codec: a gzip
+    member, a bzip2 stream or an xz stream. Streams of each of these codecs
+    may be concatenated, and gunzip, bunzip2 and unxz decompress the
+    concatenation as a single file.
+
+    *Example usage:*
+
+    ```compress_block('gzip', data, 6)```
+
+    :param codec: gzip, bz2 or lzma
+    :param data: The block of data
+    :param level: The compression level, from 1 to 9
+    :returns: The compressed block
+
+    '''
+    if codec == 'gzip':
+        return gzip.compress(data, level, mtime=0)
+    if codec == 'bz2':
+        return bz2.compress(data, max(level, 1))
+    if codec == 'lzma':
+        return lzma.compress(data, preset=level)
+    raise ValueError('Invalid codec: %s' % codec)
+
+
+class Parallel_Writer(io.RawIOBase):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`parallel_compress.Parallel_Writer` class is a file object
+    which compresses the data written to it, in the style of pigz. The data
+    is divided into blocks of block_size bytes, each of which is compressed
+    into its own stream of the codec by a pool of threads, and the streams
+    are written to the target in order.
+
+    zlib, bz2 and lzma release the GIL while they compress, so the blocks are
+    compressed on separate cores. At most two blocks per thread are held in
+    memory at once.
+
+    *Example usage:*
+
+    ```with Parallel_Writer(open(name, 'wb'), 'gzip', 6) as writer:```
+    ```    writer.write(data)```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, target, codec='gzip', level=LEVEL, workers=None,
+                 block_size=BLOCK_SIZE):
+        '''init'''
+        super(Parallel_Writer, self).__init__()
+        if codec not in CODECS:
+            raise ValueError('Invalid codec: %s' % codec)
+        self.target = target
+        self.codec = codec
+        self.level = level
+        self.workers = workers or os.cpu_count() or 1
+        self.block_size = block_size
+        self.buffer = bytearray()
+        self.pending = deque()
+        self.executor = None
+        self.empty = True
+
+    def writable(self):
+        '''The writer can be written to'''
+        return True
+
+    def write(self, data):
+        '''Add data, compressing each block as it is filled'''
+        self.buffer += data
+        while len(self.buffer) >= self.block_size:
+            self.submit(bytes(self.buffer[:self.block_size]))
+            del self.buffer[:self.block_size]
+        return len(data)
+
+    def submit(self, block):
+        '''Compress a block, writing the oldest blocks once compressed'''
+        self.empty = False
+        if self.workers <= 1:
+            self.target.write(compress_block(self.codec, block, self.level))
+            return
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers)
+        self.pending.append(self.executor.submit(compress_block, self.codec,
+                                                 block, self.level))
+        while len(self.pending) > self.workers * 2:
+            self.target.write(self.pending.popleft().result())
+
+    def close(self):
+        '''Compress the rest of the data and write out every block. The
+        target is not closed'''
+        if self.closed:
+            return
+        try:
+            if self.buffer or self.empty:
+                # An empty file is written as one empty stream
+                self.submit(bytes(self.buffer))
+                self.buffer = bytearray()
+            while self.pending:
+                self.target.write(self.pending.popleft().result())
+        finally:
+            if self.executor is not None:
+                self.executor.shutdown()
+            super(Parallel_Writer, self).close()
+
+
+def compress_file(filename, target, codec='gzip', level=LEVEL, workers=None,
+                  block_size=BLOCK_SIZE):
+    '''
+
+    **Purpose:**
+
+    Compress a file into a file of concatenated streams with a
+    :class:`parallel_compress.Parallel_Writer`.
+
+    *Example usage:*
+
+    ```compress_file('/xfero/IN/CIS_FILE', '/xfero/IN/CIS_FILE.gz')```
+
+    :param filename: The file to compress
+    :param target: The compressed file to write
+    :param codec: gzip, bz2 or lzma
+    :param level: The compression level, from 1 to 9
+    :param workers: Maximum number of threads, defaults to the CPU count
+    :param block_size: The size of each block
+    :returns: target
+
+    '''
+    with open(filename, 'rb') as source, open(target, 'wb') as out:
+        with Parallel_Writer(out, codec, level, workers,
+                             block_size) as writer:
+            while True:
+                block = source.read(block_size)
+                if not block:
+                    break
+                writer.write(block)
+    return target
@@ -0,0 +1,468 @@
+#!/usr/bin/env python
+'''Split File'''
+import logging.config
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from xfero import log_config
+from xfero import get_conf as get_conf
+from xfero import dirnotify
+from xfero.workflow_manager import tree_hash
+from xfero.workflow_manager.kernel_copy import copy_range
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+log_config.configure(xfero_logger)
+# create logger
+logger = logging.getLogger('split_file')
+
+# Size of the blocks read when counting lines
+BLOCKSIZE = 1024 * 1024
+
+# Maximum number of pieces hashed at once when merging
+WORKERS = 4
+
+# Seconds merge_file waits for the pieces to arrive, and how often it looks
+# when it is not told of their arrival
+MERGE_TIMEOUT = 600
+MERGE_POLL = 5
+
+MANIFEST_EXTENSION = '.manifest'
+
+# Name of the split in the manifest, after the tagged lines of sha256sum
+SPLIT_TAG = 'SPLIT'
+
+SPLIT_TYPES = ('bytes', 'lines')
+
+
+def wait_for_pieces(paths, lengths, timeout, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    Wait up to timeout seconds for files to reach their lengths. The
+    directories of the files are watched with :class:`dirnotify.Notify`, so
+    the files are checked again as soon as one is written rather than every
+    MERGE_POLL seconds. Without inotify the files are checked every
+    MERGE_POLL seconds.
+
+    *Example usage:*
+
+    ```missing = wait_for_pieces(paths, lengths, 600)```
+
+    :param paths: List of the files
+    :param lengths: List of the length of each file
+    :param timeout: Seconds to wait
+    :param xfero_token: Unique logging token
+    :returns: List of the files which have not arrived
+
+    '''
+    deadline = time.time() + timeout
+    try:
+        notify = dirnotify.Notify()
+    except OSError:
+        notify = None
+    else:
+        try:
+            for directory in set(os.path.dirname(path) for path in paths):
+                notify.add(directory)
+        except OSError:
+            notify.close()
+            notify = None
+
+    try:
+        while True:
+            missing = [path for path, length in zip(paths, lengths)
+                       if not os.path.isfile(path) or
+                       os.path.getsize(path) != length]
+            remaining = deadline - time.time()
+            if not missing or remaining <= 0:
+                return missing
+            logger.debug('Waiting for %s pieces. (XFERO_Token=%s)',
+                         len(missing), xfero_token)
+            if notify is None:
+                time.sleep(min(MERGE_POLL, remaining))
+            else:
+                # Events lost from an overflowing queue are caught by the
+                # next check
+                notify.read(min(MERGE_POLL, remaining))
+    finally:
+        if notify is not None:
+            notify.close()
+
+
+def line_ranges(filename, lines):
+    '''
+
+    **Purpose:**
+
+    Divide a file into ranges of a number of lines. Only the line ends are
+    counted, so the file is read once and not decoded. A last line without a
+    line end is part of the last range.
+
+    *Example usage:*
+
+    ```line_ranges('/xfero/IN/CIS_FILE', 1000000)```
+
+    :param filename: The file
+    :param lines: The number of lines in each range
+    :returns: List of (offset, length) tuples
+
+    '''
+    ranges = []
+    start = position = count = 0
+    with open(filename, 'rb', buffering=0) as source:
+        while True:
+            block = source.read(BLOCKSIZE)
+            if not block:
+                break
+            found = block.count(b'\n')
+            if count + found < lines:
+                count += found
+                position += len(block)
+                continue
+
+            # One or more ranges end in this block
+            index = 0
+            while count + block.count(b'\n', index) >= lines:
+                for line in range(lines - count):
+                    index = block.index(b'\n', index) + 1
+                ranges.append((start, position + index - start))
+                start = position + index
+                count = 0
+            count = block.count(b'\n', index)
+            position += len(block)
+
+    if position > start or not ranges:
+        ranges.append((start, position - start))
+    return ranges
+
+
+def manifest_lines(name, size, pieces, digests):
+    '''
+
+    **Purpose:**
+
+    Format a split as the lines of a manifest. The first line gives the
+    Merkle root of the piece digests, see :mod:`tree_hash`, the second the
+    size of the file and number of pieces, and then one line per piece, in
+    order, gives its index, offset, length, SHA-256 digest and name.
+
+    :param name: The name of the file which was split
+    :param size: The size of the file
+    :param pieces: List of (offset, length, piece name) tuples
+    :param digests: List of the hex digests of the pieces
+    :returns: The lines
+
+    '''
+    lines = ['%s (%s) = %s\n' % (SPLIT_TAG, name,
+                                 tree_hash.merkle_root(digests)),
+             'SIZE %s PIECES %s\n' % (size, len(pieces))]
+    for index, ((offset, length, piece), digest) in enumerate(
+            zip(pieces, digests)):
+        lines.append('%s %s %s %s %s\n' % (index, offset, length, digest,
+                                           piece))
+    return lines
+
+
+def read_manifest(manifest):
+    '''
+
+    **Purpose:**
+
+    Read a manifest written from manifest_lines.
+
+    *Example usage:*
+
+    ```read_manifest('/xfero/IN/CIS_FILE.manifest')```
+
+    :param manifest: The manifest file
+    :returns: Tuple of the file name, root, size and a list of (offset,
+    length, digest, piece name) tuples, or raises a ValueError if the manifest
+    is not valid
+
+    '''
+    with open(manifest, 'r') as infile:
+        lines = infile.read().splitlines()
+
+    try:
+        head, root = lines[0].rsplit(' = ', 1)
+        name = head[len(SPLIT_TAG) + 2:-1]
+        words = lines[1].split()
+        size, count = int(words[1]), int(words[3])
+        pieces = []
+        for line in lines[2:]:
+            if line:
+                index, offset, length, digest, piece = line.split(' ', 4)
+                pieces.append((int(offset), int(length), digest, piece))
+    except (IndexError, ValueError):
+        raise ValueError('Invalid manifest: %s' % manifest)
+
+    if (not head.startswith(SPLIT_TAG + ' (') or len(pieces) != count or
+            sum(piece[1] for piece in pieces) != size or
+            tree_hash.merkle_root([piece[2] for piece in pieces]) != root):
+        raise ValueError('Invalid manifest: %s' % manifest)
+
+    return name, root, size, pieces
+
+
+class Split_File(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`split_file.Split_File` class splits a large file into pieces
+    which are transferred independently, and merges the pieces back into the
+    original file once they have been received.
+
+    *Splitting*
+
+    ``split_file`` splits a file into pieces of a number of bytes, or of a
+    number of lines. The pieces are named after the file with a ``.partNNNN``
+    extension and are written alongside it, together with a manifest named
+    after the file with a ``.manifest`` extension. The manifest lists the
+    pieces in order with the SHA-256 digest of each.
+
+    The pieces are copied from the file in the kernel where the platform
+    allows, and are hashed in a process pool. The file is deleted once it has
+    been split.
+
+    ``split_file`` returns a list of the pieces followed by the manifest. The
+    workflow puts each on the xfer queue as a separate item, so the pieces
+    are sent in parallel. The split is always the last step of a route, as
+    :class:`route_plan.Route_Plan` applies any steps configured after it to
+    the whole file before it is split.
+
+    *Merging*
+
+    ``merge_file`` is given a manifest. It waits for the pieces listed in the
+    manifest to arrive, woken by :class:`dirnotify.Notify` as each is written
+    rather than polling, verifies each of them against its digest and then
+    joins them into the original file, which is written alongside the
+    manifest. The manifest and pieces are deleted once the file has been
+    merged.
+
+    **Usage Notes:**
+
+    The parameter args of split_file will hold the following parameters:
+
+    * filename - The file to split.
+    * split_by - bytes or lines.
+    * split_size - The number of bytes or lines in each piece.
+
+    The parameter args of merge_file will hold the following parameters:
+
+    * filename - The manifest.
+    * piece_dir - The directory the pieces are received in. Defaults to the
+      directory of the manifest.
+    * timeout - Seconds to wait for the pieces. Defaults to 600.
+
+    *Example usage:*
+
+    ```obj = Split_File()```
+    ```obj.split_file(filename, 'bytes', '1073741824')```
+    ```obj.merge_file(manifest, '/xfero/IN')```
+
+    :returns: split_file returns the list of pieces and the manifest,
+    merge_file the merged file, or raises an Exception
+
+    **Unit Test Module:** test_split_file.py
+
+    *External dependencies*
+
+    xfero
+      dirnotify (xfero.workflow_manager.split_file)
+      get_conf (xfero.workflow_manager.split_file)
+      kernel_copy (xfero.workflow_manager.split_file)
+      tree_hash (xfero.workflow_manager.split_file)
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | merge_file waits for the pieces with inotify  |
+    |            |             | rather than polling. The split is the last    |
+    |            |             | step of a route                               |
+    +------------+-------------+-----------------------------------------------+
+    '''
+
+    def __init__(self, xfero_token=False):
+        '''init'''
+        logger.debug('Object initialised: Split_File')
+        self.xfero_token = xfero_token
+        self.filename = ''
+
+    def split_file(self, filename, split_by='bytes', split_size='1073741824'):
+        '''Split a file into pieces and write a manifest of them'''
+        self.filename = filename
+
+        logger.info('Split File: %s by %s %s. (XFERO_Token=%s)',
+                    self.filename, split_size, split_by, self.xfero_token)
+
+        try:
+            split_size = int(split_size)
+        except ValueError:
+            split_size = 0
+        if split_by not in SPLIT_TYPES or split_size <= 0:
+            logger.error('TypeError: Invalid split supplied: %s %s. \
+            (XFERO_Token=%s)', split_size, split_by, self.xfero_token)
+            raise TypeError(1, 'Invalid split: %s %s. Should be bytes or \
+lines and a size greater than 0. (XFERO_Token=%s)' % (split_size, split_by,
+                                                      self.xfero_token))
+
+        if not os.path.isfile(self.filename):
+            logger.error('OSError No such file or directory: %s. \
+            (XFERO_Token=%s)', self.filename, self.xfero_token)
+            raise OSError(2, 'No such file or directory: %s. \
+            (XFERO_Token=%s)' % (self.filename, self.xfero_token))
+
+        size = os.path.getsize(self.filename)
+        if split_by == 'bytes':
+            ranges = tree_hash.chunks(size, split_size)
+        else:
+            ranges = line_ranges(self.filename, split_size)
+
+        # The digests of the pieces are those of their ranges of the file
+        digests = tree_hash.hash_chunks(self.filename, ranges)
+
+        width = max(4, len(str(len(ranges))))
+        piece_names = [self.filename + '.part%0*d' % (width, index + 1)
+                       for index in range(len(ranges))]
+
+        src_fd = os.open(self.filename, os.O_RDONLY)
+        try:
+            for (offset, length), piece in zip(ranges, piece_names):
+                dst_fd = os.open(piece, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                                 0o644)
+                try:
+                    copy_range(src_fd, dst_fd, offset, length)
+                finally:
+                    os.close(dst_fd)
+        except OSError as err:
+            logger.error('Error writing pieces of %s: Error %s. \
+            (XFERO_Token=%s)', self.filename, err, self.xfero_token)
+            for piece in piece_names:
+                if os.path.isfile(piece):
+                    os.remove(piece)
+            raise
+        finally:
+            os.close(src_fd)
+
+        manifest = self.filename + MANIFEST_EXTENSION
+        name = os.path.basename(self.filename)
+        with open(manifest, 'w') as out:
+            out.writelines(manifest_lines(
+                name, size,
+                [(offset, length, os.path.basename(piece))
+                 for (offset, length), piece in zip(ranges, piece_names)],
+                digests))
+
+        try:
+            os.remove(self.filename)
+        except OSError:
+            logger.warning('Unable to delete the file %s following \
+            successful split. (XFERO_Token=%s)', self.filename,
+                           self.xfero_token)
+
+        logger.info('Split %s into %s pieces. (XFERO_Token=%s)',
+                    self.filename, len(piece_names), self.xfero_token)
+
+        return piece_names + [manifest]
+
+    def merge_file(self, filename, piece_dir='', timeout=MERGE_TIMEOUT):
+        '''Merge the pieces listed in a manifest into the original file'''
+        self.filename = filename
+        timeout = float(timeout)
+
+        logger.info('Merge File: %s. (XFERO_Token=%s)', self.filename,
+                    self.xfero_token)
+
+        if not os.path.isfile(self.filename):
+            logger.error('OSError No such file or directory: %s. \
+            (XFERO_Token=%s)', self.filename, self.xfero_token)
+            raise OSError(2, 'No such file or directory: %s. \
+            (XFERO_Token=%s)' % (self.filename, self.xfero_token))
+
+        name, root, size, pieces = read_manifest(self.filename)
+        directory = os.path.dirname(self.filename)
+        piece_dir = piece_dir or directory
+        paths = [os.path.join(piece_dir, piece[3]) for piece in pieces]
+
+        # The pieces are sent in parallel so may arrive after the manifest
+        missing = wait_for_pieces(paths, [piece[1] for piece in pieces],
+                                  timeout, self.xfero_token)
+
+        if missing:
+            logger.error('Pieces of %s not received: %s. (XFERO_Token=%s)',
+                         name, missing, self.xfero_token)
+            raise IOError('Pieces of %s not received: %s. (XFERO_Token=%s)' %
+                          (name, missing, self.xfero_token))
+
+        workers = min(len(paths), WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            digests = list(executor.map(
+                tree_hash.chunk_digest, paths, [0] * len(paths),
+                [piece[1] for piece in pieces]))
+
+        bad = [path for path, digest, piece in zip(paths, digests, pieces)
+               if digest != piece[2]]
+        if bad:
+            logger.error('Pieces of %s failed verification: %s. \
+            (XFERO_Token=%s)', name, bad, self.xfero_token)
+            raise ValueError('Pieces of %s failed verification: %s. \
+            (XFERO_Token=%s)' % (name, bad, self.xfero_token))
+
+        # The file is joined under a temporary name and renamed once complete
+        target = os.path.join(directory, name)
+        dst_fd, temp_path = tempfile.mkstemp(dir=directory,
+                                             prefix='.' + name + '.',
+                                             suffix='.part')
+        try:
+            try:
+                for path, piece in zip(paths, pieces):
+                    src_fd = os.open(path, os.O_RDONLY)
+                    try:
+                        copy_range(src_fd, dst_fd, 0, piece[1])
+                    finally:
+                        os.close(src_fd)
+            finally:
+                os.close(dst_fd)
+            os.chmod(temp_path, 0o644)
+            os.replace(temp_path, target)
+        except OSError as err:
+            os.remove(temp_path)
+            logger.error('Error merging %s: Error %s. (XFERO_Token=%s)',
+                         target, err, self.xfero_token)
+            raise
+
+        for path in paths + [self.filename]:
+            try:
+                os.remove(path)
+            except OSError:
+                logger.warning('Unable to delete the file %s following \
+                successful merge. (XFERO_Token=%s)', path, self.xfero_token)
+
+        logger.info('Merged %s pieces into %s. (XFERO_Token=%s)',
+                    len(paths), target, self.xfero_token)
+
+        return target
+
+if __name__ == "__main__":
+
+    fname = '/ftran/split.txt'
+    try:
+        obj = Split_File()
+        print(obj.split_file(fname, 'lines', '1000'))
+        print(obj.merge_file(fname + MANIFEST_EXTENSION))
+    except Exception as err:
+        print('Caught an exception: %s' % err)
+        # Here we would continue processing other files in the loop with the
+        # continue statement
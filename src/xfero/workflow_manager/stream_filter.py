@@ -0,0 +1,575 @@
+#!/usr/bin/env python
+'''Stream Filter'''
+import abc
+import io
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import deque
+from xfero.workflow_manager import crypt
+from xfero.workflow_manager import line_end_converter
+from xfero.workflow_manager import manage_archives
+from xfero.workflow_manager import parallel_compress
+from xfero.workflow_manager.filename_pipeline import Filename_Pipeline
+from xfero.workflow_manager.filename_pipeline import step_args
+
+# Size of the blocks read from the file being streamed
+BLOCKSIZE = 1024 * 1024
+
+# create logger
+logger = logging.getLogger('workflow')
+
+
+class Stream_Filter(object, metaclass=abc.ABCMeta):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Stream_Filter` class is the base of the filters
+    which apply a content workflow step to a stream of blocks rather than to
+    a file. Each filter takes an iterable of blocks of bytes and yields the
+    blocks of its output as they are produced, so a chain of filters reads
+    the file once and writes nothing to disk.
+
+    **Usage Notes:**
+
+    A filter is built from the same arguments as the workflow step, with the
+    name the file would have when the step is reached, and adds suffix to the
+    name as the step does. workflow_class is the class of the workflow step,
+    which is used for anything other than a file.
+
+    accepts returns False for arguments the filter cannot apply to a stream,
+    for example a tar archive, in which case the step is run on the file.
+
+    Each filter defines the filter method.
+
+    *Example usage:*
+
+    ```blocks = Compress_Filter(name, xfero_token, 'gz').filter(blocks)```
+
+    :param name: Name of the file when the step is reached
+    :param xfero_token: Unique logging token
+    :param args: Arguments of the workflow step
+
+    **Unit Test Module:** test_stream_filter.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | filter is an abstract method                  |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    suffix = ''
+    workflow_class = None
+
+    def __init__(self, name, xfero_token, *args):
+        '''init'''
+        self.name = name
+        self.xfero_token = xfero_token
+        self.args = args
+
+    @staticmethod
+    def accepts(*args):
+        '''Return True if the step can be applied to a stream'''
+        return True
+
+    @abc.abstractmethod
+    def filter(self, blocks):
+        '''Yield the output of the step for the blocks'''
+
+
+class Line_End_Filter(Stream_Filter):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Line_End_Filter` class converts line ends as
+    Line_End_Converter.dos2unix and Line_End_Converter.unix2dos do, with
+    ```line_end_converter.translate_blocks```.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    newline = b'\n'
+    workflow_class = line_end_converter.Line_End_Converter
+
+    def filter(self, blocks):
+        '''Yield the blocks with their line ends converted'''
+        return line_end_converter.translate_blocks(blocks, self.newline)
+
+
+class Unix_To_Dos_Filter(Line_End_Filter):
+
+    '''Line_End_Filter writing CRLF line ends'''
+
+    newline = b'\r\n'
+
+
+class Compress_Filter(Stream_Filter):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Compress_Filter` class compresses a stream as
+    Manage_Archives.compress_file does for the gz, bz2 and xz types, in
+    blocks on the threads of a :class:`parallel_compress.Parallel_Writer`.
+    The zip and tar types hold the file in an archive, and are not streamed.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    workflow_class = manage_archives.Manage_Archives
+
+    def __init__(self, name, xfero_token, archive_type, level='',
+                 workers=''):
+        '''init'''
+        super(Compress_Filter, self).__init__(name, xfero_token, archive_type,
+                                              level, workers)
+        self.codec = manage_archives.FILE_TYPES[archive_type.lstrip('.')]
+        self.suffix = '.' + archive_type.lstrip('.')
+        self.level = int(level) if level else manage_archives.compress_level
+        self.workers = int(workers) if workers else \
+            manage_archives.compress_workers
+
+    @staticmethod
+    def accepts(archive_type='', *args):
+        '''Only files compressed without an archive can be streamed'''
+        return archive_type.lstrip('.') in manage_archives.FILE_TYPES
+
+    def filter(self, blocks):
+        '''Yield the compressed blocks in order'''
+        output = Block_Queue()
+        writer = parallel_compress.Parallel_Writer(
+            output, self.codec, self.level, self.workers,
+            manage_archives.compress_block_size)
+        try:
+            for block in blocks:
+                writer.write(block)
+                yield from output.drain()
+            writer.close()
+            yield from output.drain()
+        finally:
+            writer.close()
+
+
+class Encrypt_Filter(Stream_Filter):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Encrypt_Filter` class encrypts, and if asked
+    signs, a stream as Crypt.encrypt_file does, with gpg reading the stream
+    on stdin. The keys are looked up when the stream starts.
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    suffix = '.gpg'
+    workflow_class = crypt.Crypt
+
+    def filter(self, blocks):
+        '''Yield the encrypted blocks'''
+        args, passphrase = crypt.Crypt(self.xfero_token).encrypt_args(
+            self.name, *self.args)
+        yield from crypt.get_keyring().stream(args, blocks, passphrase)
+
+
+class Block_Queue(object):
+
+    '''File object collecting the blocks written to it'''
+
+    def __init__(self):
+        '''init'''
+        self.blocks = deque()
+
+    def write(self, data):
+        '''Hold a block until it is drained'''
+        self.blocks.append(data)
+        return len(data)
+
+    def drain(self):
+        '''Yield and remove the blocks held'''
+        while self.blocks:
+            yield self.blocks.popleft()
+
+
+class Filter_Reader(io.RawIOBase):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Filter_Reader` class is a file object reading
+    from a generator of blocks, so that the output of the filters can be
+    given to the transfer engines in place of a file. Closing the reader
+    closes the generator, which stops any gpg process.
+
+    *Example usage:*
+
+    ```with Filter_Reader(file_blocks(filename, filters)) as source:```
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, blocks):
+        '''init'''
+        super(Filter_Reader, self).__init__()
+        self.blocks = blocks
+        self.pending = memoryview(b'')
+
+    def readable(self):
+        '''The reader can be read from'''
+        return True
+
+    def readinto(self, buffer):
+        '''Read the next part of the current block into the buffer'''
+        while not self.pending:
+            block = next(self.blocks, None)
+            if block is None:
+                return 0
+            self.pending = memoryview(block)
+
+        size = min(len(buffer), len(self.pending))
+        buffer[:size] = self.pending[:size]
+        self.pending = self.pending[size:]
+        return size
+
+    def close(self):
+        '''Close the generator'''
+        if not self.closed:
+            close = getattr(self.blocks, 'close', None)
+            if close is not None:
+                close()
+        super(Filter_Reader, self).close()
+
+
+# The content workflow steps which can be applied to a stream, with the class
+# of the filter for each
+FILTER_STEPS = {
+    ('Line_End_Converter', 'dos2unix'): Line_End_Filter,
+    ('Line_End_Converter', 'unix2dos'): Unix_To_Dos_Filter,
+    ('Manage_Archives', 'compress_file'): Compress_Filter,
+    ('Crypt', 'encrypt_file'): Encrypt_Filter,
+}
+
+
+class Filter_Pipeline(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`stream_filter.Filter_Pipeline` class applies a run of
+    consecutive content workflow items which can be applied to a stream in a
+    single pass. The file is read once, each block passes through the filter
+    of each item in running order, and the result is written once, so a
+    workflow of line end conversion, compression and encryption reads and
+    writes the file once rather than three times.
+
+    **Usage Notes:**
+
+    The pipelines of a route are built once, by ``compile_workflow``, when the
+    route plan is loaded.
+
+    The result is written alongside the file under a temporary name and
+    renamed to the name the last item would have given it, with the
+    permissions of the file. The file is then deleted. If any item fails
+    nothing is written and the file is left as it was.
+
+    A directory, such as the output of an extract, is passed to each workflow
+    item in turn as before.
+
+    *Example usage:*
+
+    ```pipeline = Filter_Pipeline()```
+    ```pipeline.add(row)```
+    ```pipeline.process(filename, xfero_token)```
+
+    **Unit Test Module:** test_stream_filter.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self):
+        '''init'''
+        self.steps = []
+
+    def add(self, workflow):
+        '''Add a workflow item to the end of the pipeline'''
+        self.steps.append(workflow)
+
+    @property
+    def cpu_bound(self):
+        '''The pipeline is CPU bound if any of its workflow items are'''
+        return any(getattr(filter_class(workflow).workflow_class, 'cpu_bound',
+                           False) for workflow in self.steps)
+
+    def process(self, filename, xfero_token=False):
+        '''Apply the workflow items in one pass, returning the new name'''
+        if not os.path.isfile(filename):
+            for workflow in self.steps:
+                wf_instance = filter_class(workflow).workflow_class(
+                    xfero_token)
+                filename = getattr(
+                    wf_instance, workflow['workflow_item_function_call'])(
+                        filename, *step_args(workflow))
+            return filename
+
+        path, name = os.path.split(filename)
+        filters = build_filters(self.steps, name, xfero_token)
+        target = filename + ''.join(stream.suffix for stream in filters)
+
+        logger.info('Processing file %s to %s for %s steps in one pass. \
+        (XFERO_Token=%s)', filename, target, len(self.steps), xfero_token)
+
+        fdesc, temp_path = tempfile.mkstemp(
+            dir=path, prefix='.' + os.path.basename(target) + '.',
+            suffix='.part')
+        try:
+            with os.fdopen(fdesc, 'wb') as out:
+                for block in file_blocks(filename, filters):
+                    out.write(block)
+            shutil.copymode(filename, temp_path)
+            os.replace(temp_path, target)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if target != filename:
+            try:
+                os.remove(filename)
+            except OSError:
+                logger.warning('Unable to delete the file %s. \
+                (XFERO_Token=%s)', filename, xfero_token)
+
+        return target
+
+
+def compile_workflow(steps):
+    '''
+
+    **Purpose:**
+
+    Replace each run of two or more consecutive workflow items which can be
+    applied to a stream with a single :class:`stream_filter.Filter_Pipeline`.
+    Any other workflow item or step ends the run.
+
+    *Example usage:*
+
+    ```steps = compile_workflow(filename_pipeline.compile_workflow(rows))```
+
+    :param steps: Workflow items and Filename_Pipeline objects in running
+                  order
+    :returns: Tuple of the steps with the runs replaced
+
+    '''
+    compiled = []
+    for step in steps:
+        if isinstance(step, Filename_Pipeline) or filter_class(step) is None:
+            compiled.append(step)
+            continue
+        if not compiled or not isinstance(compiled[-1], Filter_Pipeline):
+            compiled.append(Filter_Pipeline())
+        compiled[-1].add(step)
+
+    # A single workflow item is run as it is
+    return tuple(step.steps[0] if isinstance(step, Filter_Pipeline) and
+                 len(step.steps) == 1 else step for step in compiled)
+
+
+def filter_class(workflow):
+    '''
+
+    **Purpose:**
+
+    Return the filter class for a workflow item, or None if the workflow item
+    cannot be applied to a stream.
+
+    *Example usage:*
+
+    ```filter_class(workflow)```
+
+    :param workflow: Row from the XFERO_Workflow_Item table
+    :returns: The filter class or None
+
+    '''
+    cls = FILTER_STEPS.get((workflow['workflow_item_class'],
+                            workflow['workflow_item_function_call']))
+    if cls is None or not cls.accepts(*step_args(workflow)):
+        return None
+    return cls
+
+
+def trailing_filters(rows):
+    '''
+
+    **Purpose:**
+
+    Return the number of workflow items at the end of the workflow which can
+    be applied to a stream. These may be run as the file is transferred
+    rather than before.
+
+    *Example usage:*
+
+    ```count = trailing_filters(plan.workflow)```
+
+    :param rows: Workflow items in running order
+    :returns: The number of workflow items
+
+    '''
+    count = 0
+    for workflow in reversed(rows):
+        if filter_class(workflow) is None:
+            break
+        count += 1
+    return count
+
+
+def build_filters(rows, name, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    Build the filters for workflow items which can be applied to a stream.
+    Each filter is given the name the file would have when its step is
+    reached.
+
+    *Example usage:*
+
+    ```filters = build_filters(plan.stream, 'CIS_FILE', xfero_token)```
+    ```remote_name = 'CIS_FILE' + ''.join(f.suffix for f in filters)```
+
+    :param rows: Workflow items in running order
+    :param name: Name of the file before the first of them
+    :param xfero_token: Unique logging token
+    :returns: List of filters
+
+    '''
+    filters = []
+    for workflow in rows:
+        stream = filter_class(workflow)(name, xfero_token,
+                                        *step_args(workflow))
+        name += stream.suffix
+        filters.append(stream)
+    return filters
+
+
+def file_blocks(filename, filters, block_size=BLOCKSIZE):
+    '''
+
+    **Purpose:**
+
+    Read a file in blocks through a chain of filters, returning a generator
+    of the output blocks. Nothing is read until the first block is asked for.
+
+    *Example usage:*
+
+    ```for block in file_blocks(filename, filters):```
+
+    :param filename: The file to read
+    :param filters: Filters to apply in order
+    :param block_size: Size of the blocks read from the file
+    :returns: Generator of blocks
+
+    '''
+    def read():
+        with open(filename, 'rb') as source:
+            yield from iter(lambda: source.read(block_size), b'')
+
+    blocks = read()
+    for stream in filters:
+        blocks = stream.filter(blocks)
+    return blocks
+
+
+def run_streamed(args, blocks):
+    '''
+
+    **Purpose:**
+
+    Run a command, such as curl -T -, writing the blocks to its stdin. The
+    output of the command is held in temporary files rather than pipes, so
+    the command cannot block on its output while the blocks are written.
+
+    If the blocks raise an exception, for example because gpg failed, the
+    command is killed before its stdin is closed, so that a partial file is
+    never sent as a complete one, and the exception is raised.
+
+    *Example usage:*
+
+    ```popen, p_stdout, p_stderr = run_streamed(args, blocks)```
+
+    :param args: The command and its arguments
+    :param blocks: Iterable of blocks of bytes
+    :returns: The Popen object, once the command has ended, and its stdout
+              and stderr
+
+    '''
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        popen = subprocess.Popen(args, stdin=subprocess.PIPE, stdout=out,
+                                 stderr=err)
+        try:
+            try:
+                for block in blocks:
+                    popen.stdin.write(block)
+            except BrokenPipeError:
+                # The command has ended, and its return code gives the reason
+                pass
+            except BaseException:
+                popen.kill()
+                popen.wait()
+                raise
+            finally:
+                close = getattr(blocks, 'close', None)
+                if close is not None:
+                    close()
+                try:
+                    popen.stdin.close()
+                except BrokenPipeError:
+                    pass
+            popen.wait()
+        except BaseException:
+            if popen.poll() is None:
+                popen.kill()
+                popen.wait()
+            raise
+
+        out.seek(0)
+        err.seek(0)
+        return popen, out.read(), err.read()
@@ -1,22 +1,101 @@
 #!/usr/bin/env python
 '''Transform Filename'''
 import logging.config
+from xfero import log_config
 import os
-from /xfero/ import get_conf as get_conf
-from /xfero/.workflow_manager import copy_file as renameFile
+from xfero import get_conf as get_conf
+from xfero.workflow_manager import copy_file as renameFile
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+log_config.configure(xfero_logger)
 # create logger
 logger = logging.getLogger('transform_filename')
 
 
+def name_delete_extension(filename):
+    '''Return the file name without its extension'''
+    return os.path.splitext(filename)[0]
+
+
+def name_add_extension(filename, extension):
+    '''Return the file name with the extension added'''
+    return filename + extension
+
+
+def name_add_prefix(filename, prefix):
+    '''Return the file name with the prefix added'''
+    head, tail = os.path.split(filename)
+    return head + os.sep + prefix + tail
+
+
+def name_add_suffix(filename, suffix):
+    '''Return the file name with the suffix added'''
+    return filename + suffix
+
+
+def name_remove_name_part(filename, name_element):
+    '''Return the file name without the first occurrence of name_element'''
+    head, tail = os.path.split(filename)
+
+    # index holds the starting index of the name_element
+    index = tail.find(name_element)
+
+    if index == -1:
+        logger.error('TypeError: Request to remove name element from file \
+        %s, but invalid name_element %s supplied', filename, name_element)
+        raise TypeError(1, 'Invalid name_element: %s' % name_element)
+
+    return head + os.sep + tail[0:index] + tail[index + len(name_element):]
+
+
+def name_insert_name_part(filename, eyecatcher, insert_element, where):
+    '''Return the file name with insert_element inserted before or after the
+    first occurrence of eyecatcher'''
+    head, tail = os.path.split(filename)
+
+    # index holds the starting index of the eyecatcher
+    index = tail.find(eyecatcher)
+    if index == -1:
+        logger.error('TypeError: Request to insert name element into file \
+        %s, but invalid eyecatcher %s suplied', filename, eyecatcher)
+        raise TypeError("Eye-catcher invalid: %s" % eyecatcher)
+
+    if where.capitalize() == 'Before':
+        part1 = tail[0:index]
+        part2 = tail[index:]
+    elif where.capitalize() == 'After':
+        new_index = index + len(eyecatcher)
+        part1 = tail[0:new_index]
+        part2 = tail[new_index:]
+    else:
+        logger.error(
+            'TypeError: Invalid Position supplied. \
+            Should be Before or After')
+        raise TypeError(
+            'Invalid Position supplied. \
+            Should be Before or After')
+
+    return head + os.sep + part1 + insert_element + part2
+
+# The functions computing the new file name for each method of
+# Transform_Filename. They do not touch the file, so consecutive steps can be
+# combined into a single rename by filename_pipeline
+NAME_FUNCTIONS = {
+    'delete_extension': name_delete_extension,
+    'add_extension': name_add_extension,
+    'add_prefix': name_add_prefix,
+    'add_suffix': name_add_suffix,
+    'remove_name_part': name_remove_name_part,
+    'insert_name_part': name_insert_name_part,
+}
+
+
 class Transform_Filename(object):
 
     '''
@@ -63,13 +142,16 @@ class Transform_Filename(object):
     +------------+-------------+-----------------------------------------------+
     | 27/10/2014 | Chris Falck | modified call to get_conf                     |
     +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The new file names are computed by the        |
+    |            |             | functions in NAME_FUNCTIONS                   |
+    +------------+-------------+-----------------------------------------------+
 
     '''
 
     def __init__(self, xfero_token=False):
         '''__init__'''
         logger.debug('Object initialised: Delete_Extension')
-        self.xfero_token =.xfero_token
+        self.xfero_token = xfero_token
         self.filename = ''
 
     def delete_extension(self, file_name):
@@ -106,7 +188,7 @@ class Transform_Filename(object):
                          self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        filename, fileextension = os.path.splitext(self.filename)
+        filename = name_delete_extension(self.filename)
 
         logger.info('Renaming file from %s to %s', self.filename, filename)
 
@@ -156,16 +238,16 @@ class Transform_Filename(object):
             logger.error('OSError No such file or directory: %s', self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        logger.info('renaming file from %s to %s', self.filename,
-                    (self.filename + self.extension))
+        new_fn = name_add_extension(self.filename, self.extension)
+
+        logger.info('renaming file from %s to %s', self.filename, new_fn)
 
         try:
             rename_obj = renameFile.Copy_File(self.xfero_token)
-            renamed_file = rename_obj.rename_file(
-                self.filename, self.filename + self.extension)
+            renamed_file = rename_obj.rename_file(self.filename, new_fn)
         except Exception as err:
             logger.error('Error Renaming file from %s to %s',
-                         self.filename, self.filename + self.extension)
+                         self.filename, new_fn)
             raise err
 
         return renamed_file
@@ -208,9 +290,7 @@ class Transform_Filename(object):
                          self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        head, tail = os.path.split(self.filename)
-
-        new_fn = head + os.sep + self.prefix + tail
+        new_fn = name_add_prefix(self.filename, self.prefix)
 
         logger.info('renaming file from %s to %s', self.filename, new_fn)
 
@@ -262,16 +342,16 @@ class Transform_Filename(object):
             logger.error('OSError No such file or directory: %s', self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        logger.info('renaming file from %s to %s',
-                    self.filename, (self.filename + self.suffix))
+        new_fn = name_add_suffix(self.filename, self.suffix)
+
+        logger.info('renaming file from %s to %s', self.filename, new_fn)
 
         try:
             rename_obj = renameFile.Copy_File(self.xfero_token)
-            renamed_file = rename_obj.rename_file(
-                self.filename, self.filename + self.suffix)
+            renamed_file = rename_obj.rename_file(self.filename, new_fn)
         except OSError as err:
             logger.error('Error Renaming file from %s to %s',
-                         self.filename, (self.filename + self.suffix))
+                         self.filename, new_fn)
             raise err
 
         return renamed_file
@@ -315,21 +395,7 @@ class Transform_Filename(object):
                          self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        head, tail = os.path.split(self.filename)
-
-        # index holds the starting index of the name_element
-        index = tail.find(self.name_element)
-
-        if index == -1:
-            logger.error('TypeError: Request to remove name element from file \
-            %s, but invalid self.name_element %s supplied',
-                         self.filename, self.name_element)
-            raise TypeError(1, 'Invalid name_element: %s' % self.name_element)
-
-        part1 = tail[0:index]
-        part2 = tail[index + len(self.name_element): len(tail)]
-
-        new_fn = head + os.sep + part1 + part2
+        new_fn = name_remove_name_part(self.filename, self.name_element)
         logger.info('Rename file from %s to %s', self.filename, new_fn)
 
         try:
@@ -388,32 +454,8 @@ class Transform_Filename(object):
             logger.error('OSError No such file or directory: %s', self.filename)
             raise OSError(2, 'No such file or directory', self.filename)
 
-        head, tail = os.path.split(self.filename)
-
-        # index holds the starting index of the eyecatcher
-        index = tail.find(self.eyecatcher)
-        if index == -1:
-            logger.error('TypeError: Request to insert name element into file \
-            %s, but invalid eyecatcher %s suplied', self.filename,
-                         self.eyecatcher)
-            raise TypeError("Eye-catcher invalid: %s" % self.eyecatcher)
-
-        if where.capitalize() == 'Before':
-            part1 = tail[0:index]
-            part2 = tail[index:len(self.filename)]
-        elif where.capitalize() == 'After':
-            new_index = index + len(eyecatcher)
-            part1 = tail[0:new_index]
-            part2 = tail[new_index:len(self.filename)]
-        else:
-            logger.error(
-                'TypeError: Invalid Position supplied. \
-                Should be Before or After')
-            raise TypeError(
-                'Invalid Position supplied. \
-                Should be Before or After')
-
-        new_fn = head + os.sep + part1 + insert_element + part2
+        new_fn = name_insert_name_part(self.filename, self.eyecatcher,
+                                       self.insert_element, self.where)
 
         logger.info('Rename file from %s to %s', self.filename, new_fn)
 
@@ -0,0 +1,273 @@
+#!/usr/bin/env python
+'''
+Tree Hash
+'''
+
+import hashlib
+import os
+
+# Size of the chunks hashed independently
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# Size of the blocks read from a chunk
+BLOCKSIZE = 1024 * 1024
+
+# Name of the tree in the manifest, after the tagged lines of sha256sum
+TREE_TAG = 'SHA256-TREE'
+
+
+def chunks(size, chunk_size=CHUNK_SIZE):
+    '''
+
+    **Purpose:**
+
+    Divide a file into chunks. Every chunk but the last is chunk_size bytes.
+    An empty file has a single empty chunk.
+
+    *Example usage:*
+
+    ```chunks(150, 64)```
+
+    :param size: The size of the file
+    :param chunk_size: The size of each chunk
+    :returns: List of (offset, length) tuples
+
+    '''
+    if size == 0:
+        return [(0, 0)]
+    return [(offset, min(chunk_size, size - offset))
+            for offset in range(0, size, chunk_size)]
+
+
+def chunk_digest(filename, offset, length):
+    '''
+
+    **Purpose:**
+
+    Return the SHA-256 digest of a chunk of a file. The file is opened by
+    each call so the chunks can be hashed in separate processes.
+
+    *Example usage:*
+
+    ```chunk_digest('/xfero/IN/CIS_FILE', 0, 67108864)```
+
+    :param filename: The file
+    :param offset: Offset of the chunk in the file
+    :param length: Length of the chunk
+    :returns: The hex digest of the chunk
+
+    '''
+    sha256 = hashlib.sha256()
+    fdesc = os.open(filename, os.O_RDONLY)
+    try:
+        end = offset + length
+        while offset < end:
+            block = os.pread(fdesc, min(BLOCKSIZE, end - offset), offset)
+            if not block:
+                break
+            sha256.update(block)
+            offset += len(block)
+    finally:
+        os.close(fdesc)
+    return sha256.hexdigest()
+
+
+def merkle_root(digests):
+    '''
+
+    **Purpose:**
+
+    Combine the digests of the chunks into the root of a Merkle tree. Each
+    level hashes the binary digests of adjacent pairs together. A digest
+    without a pair is carried up to the next level unchanged, so the root of
+    a single chunk is the digest of that chunk.
+
+    *Example usage:*
+
+    ```merkle_root(['ab12...', 'cd34...', 'ef56...'])```
+
+    :param digests: List of the hex digests of the chunks, in order
+    :returns: The hex digest of the root
+
+    '''
+    level = [bytes.fromhex(digest) for digest in digests]
+    while len(level) > 1:
+        pairs = []
+        for index in range(0, len(level) - 1, 2):
+            pairs.append(hashlib.sha256(level[index] +
+                                        level[index + 1]).digest())
+        if len(level) % 2:
+            pairs.append(level[-1])
+        level = pairs
+    return level[0].hex()
+
+
+def hash_chunks(filename, pieces, workers=None):
+    '''
+
+    **Purpose:**
+
+    Hash chunks of a file, in the workflow process pool when there is more
+    than one chunk and more than one worker, so that a single file uses
+    several cores.
+
+    **Usage Notes:**
+
+    No pool is created for the call. The chunks are submitted to the pool
+    shared by the workflow threads, see :mod:`workflow_pool`, and are hashed
+    in this process when that pool is disabled or when this is itself a pool
+    process, such as a CPU bound step like ```Checksum.tree_cksum```.
+
+    *Example usage:*
+
+    ```hash_chunks('/xfero/IN/CIS_FILE', [(0, 100), (100, 50)], 4)```
+
+    :param filename: The file
+    :param pieces: List of (offset, length) tuples
+    :param workers: 1 hashes the chunks in this process, defaults to the CPU
+    count
+    :returns: List of the hex digests of the chunks, in order
+
+    '''
+    pool = None
+    if min(len(pieces), workers or os.cpu_count() or 1) > 1:
+        # Imported here as workflow_pool imports the workflow classes, which
+        # import this module
+        from xfero import workflow_pool
+        pool = workflow_pool.get_pool()
+
+    if pool is None:
+        return [chunk_digest(filename, offset, length)
+                for offset, length in pieces]
+
+    return list(pool.map(chunk_digest, [filename] * len(pieces),
+                         [offset for offset, length in pieces],
+                         [length for offset, length in pieces]))
+
+
+def tree_sums(filename, chunk_size=CHUNK_SIZE, workers=None):
+    '''
+
+    **Purpose:**
+
+    Hash a file as a Merkle tree of fixed size chunks, hashing the chunks in
+    parallel.
+
+    *Example usage:*
+
+    ```tree = tree_sums('/xfero/IN/CIS_FILE')```
+
+    :param filename: The file
+    :param chunk_size: The size of each chunk
+    :param workers: 1 hashes the chunks in this process, see hash_chunks
+    :returns: Dictionary of the root, size, chunk_size and the list of the
+    chunk digests
+
+    '''
+    size = os.path.getsize(filename)
+    digests = hash_chunks(filename, chunks(size, chunk_size), workers)
+    return {'root': merkle_root(digests),
+            'size': size,
+            'chunk_size': chunk_size,
+            'chunks': digests}
+
+
+def manifest_lines(name, tree):
+    '''
+
+    **Purpose:**
+
+    Format a tree as the lines of a manifest. The first line gives the root
+    in the style of ```sha256sum --tag```, the second the size of the file and
+    of the chunks, and then one line per chunk gives its index, offset,
+    length and digest.
+
+    *Example usage:*
+
+    ```manifest_lines('CIS_FILE', tree)```
+
+    :param name: The file name written with the root
+    :param tree: Dictionary returned by tree_sums
+    :returns: The lines
+
+    '''
+    lines = ['%s (%s) = %s\n' % (TREE_TAG, name, tree['root']),
+             'SIZE %s CHUNK %s\n' % (tree['size'], tree['chunk_size'])]
+    for index, (offset, length) in enumerate(
+            chunks(tree['size'], tree['chunk_size'])):
+        lines.append('%s %s %s %s\n' % (index, offset, length,
+                                        tree['chunks'][index]))
+    return lines
+
+
+def read_manifest(manifest):
+    '''
+
+    **Purpose:**
+
+    Read a manifest written from manifest_lines.
+
+    *Example usage:*
+
+    ```tree = read_manifest('/xfero/IN/CIS_FILE.sum')```
+
+    :param manifest: The manifest file
+    :returns: Dictionary of the root, size, chunk_size and the list of the
+    chunk digests, or raises a ValueError if the manifest is not valid
+
+    '''
+    with open(manifest, 'r') as infile:
+        lines = infile.read().splitlines()
+
+    try:
+        root = lines[0].rsplit(' = ', 1)[1]
+        words = lines[1].split()
+        size, chunk_size = int(words[1]), int(words[3])
+        digests = [line.split()[3] for line in lines[2:] if line]
+    except (IndexError, ValueError):
+        raise ValueError('Invalid manifest: %s' % manifest)
+
+    if (not lines[0].startswith(TREE_TAG) or
+            len(digests) != len(chunks(size, chunk_size)) or
+            merkle_root(digests) != root):
+        raise ValueError('Invalid manifest: %s' % manifest)
+
+    return {'root': root,
+            'size': size,
+            'chunk_size': chunk_size,
+            'chunks': digests}
+
+
+def verify(filename, tree, workers=None):
+    '''
+
+    **Purpose:**
+
+    Check each chunk of a file against a tree, so that only the chunks which
+    differ need to be sent again. A chunk which is missing from the end of
+    the file, or beyond the end of the tree, does not match.
+
+    *Example usage:*
+
+    ```verify('/xfero/IN/CIS_FILE', read_manifest('/xfero/IN/CIS_FILE.sum'))```
+
+    :param filename: The file to check
+    :param tree: Dictionary returned by tree_sums or read_manifest
+    :param workers: 1 hashes the chunks in this process, see hash_chunks
+    :returns: List of the indexes of the chunks which do not match
+
+    '''
+    pieces = chunks(tree['size'], tree['chunk_size'])
+    size = os.path.getsize(filename)
+    digests = hash_chunks(filename, pieces, workers)
+
+    bad = [index for index, digest in enumerate(digests)
+           if digest != tree['chunks'][index] or
+           pieces[index][0] + pieces[index][1] > size]
+    if size > tree['size']:
+        # The last chunk of the tree is short, so the extra data is in it
+        last = len(pieces) - 1
+        if pieces[last][1] < tree['chunk_size'] and last not in bad:
+            bad.append(last)
+        bad.extend(range(len(pieces), len(chunks(size, tree['chunk_size']))))
+    return bad
@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+'''
+Process pool for CPU bound workflow steps
+'''
+
+import importlib
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from xfero import get_conf as get_conf
+from xfero import log_config
+from xfero.workflow_manager.stream_filter import Filter_Pipeline
+
+# Number of processes running CPU bound workflow steps. 0 runs every step on
+# the workflow thread
+workflow_processes = int(get_conf.get_xfero_option(
+    'settings', 'workflow_processes', os.cpu_count() or 1))
+
+# The process pool shared by every workflow thread in this process
+POOL = None
+POOL_LOCK = threading.Lock()
+# True in a pool process, which runs every step itself
+WORKER = False
+
+
+def is_cpu_bound(wf_instance):
+    '''
+    Return True if the workflow class declares itself CPU bound with a
+    cpu_bound attribute.
+    '''
+    return bool(getattr(wf_instance, 'cpu_bound', False))
+
+
+def is_directory_call(wf_instance, args):
+    '''
+    Return True if the call is on a directory and the workflow class runs a
+    call for each of its files itself, declared with a splits_directories
+    attribute.
+    '''
+    return (bool(getattr(wf_instance, 'splits_directories', False)) and
+            bool(args) and isinstance(args[0], str) and
+            os.path.isdir(args[0]))
+
+
+def run_step(module, wf_class, function_call, args, xfero_token):
+    '''
+    Run a workflow method in a pool process.
+    '''
+    wf_instance = getattr(importlib.import_module(module), wf_class)(
+        xfero_token)
+    return getattr(wf_instance, function_call)(*args)
+
+
+def init_worker(log_queue, xfero_logger):
+    '''
+    Initialise a pool process, which sends its records to be logged by the
+    parent.
+    '''
+    global WORKER
+
+    WORKER = True
+    log_config.init_worker(log_queue, xfero_logger)
+
+
+def run_pipeline(rows, args):
+    '''
+    Run a Filter_Pipeline of the workflow items in a pool process.
+    '''
+    pipeline = Filter_Pipeline()
+    for workflow in rows:
+        pipeline.add(workflow)
+    return pipeline.process(*args)
+
+
+def run(wf_instance, function_call, calls, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    Call a workflow method once for each tuple of arguments, returning the
+    results in order. The method of a class which declares itself CPU bound
+    is run in the pool of workflow_processes processes, so steps which hold
+    the GIL, such as line end conversion, use every core rather than one
+    between all of the workflow threads. The calls for each of the files
+    returned by an earlier step are run concurrently. Every other method is
+    called on the workflow thread, as before.
+
+    **Usage Notes:**
+
+    A workflow class declares itself CPU bound with the class attribute
+    ```cpu_bound = True```. The class is instantiated in the pool process with
+    the XFERO token, so the arguments and the result must be picklable.
+
+    A class which also declares ```splits_directories = True``` is called on
+    the workflow thread for a directory, and calls run itself for each of
+    the files of the directory, so that they are converted concurrently in
+    the pool rather than in turn in one pool process.
+
+    Every call is waited for before the first exception is raised, so no
+    file is still being written when the workflow thread moves the files to
+    the error directory.
+
+    *Example usage:*
+
+    ```filename = run(wf_instance, 'dos2unix', [(filename,)], token)[0]```
+
+    :param wf_instance: Instance of the workflow class, or a Filter_Pipeline
+    :param function_call: Name of the method
+    :param calls: List of tuples of arguments, one for each call
+    :param xfero_token: Unique logging token
+    :returns: List of the results of each call
+
+    **Unit Test Module:** test_workflow_pool.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Directory calls of a splits_directories class |
+    |            |             | are made on the workflow thread               |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    pool = get_pool() if is_cpu_bound(wf_instance) else None
+    if pool is not None and any(is_directory_call(wf_instance, args)
+                                for args in calls):
+        pool = None
+    if pool is None:
+        return [getattr(wf_instance, function_call)(*args) for args in calls]
+
+    if isinstance(wf_instance, Filter_Pipeline):
+        rows = [dict(workflow) for workflow in wf_instance.steps]
+        futures = [pool.submit(run_pipeline, rows, args) for args in calls]
+    else:
+        wf_class = type(wf_instance)
+        futures = [pool.submit(run_step, wf_class.__module__,
+                               wf_class.__name__, function_call, args,
+                               xfero_token) for args in calls]
+
+    results = []
+    error = None
+    for future in futures:
+        try:
+            results.append(future.result())
+        except BrokenProcessPool as err:
+            # A process died, so the pool is replaced for the next step
+            discard_pool(pool)
+            error = error or err
+        except Exception as err:
+            error = error or err
+    if error is not None:
+        raise error
+    return results
+
+
+def get_pool():
+    '''
+
+    **Purpose:**
+
+    Return the process pool for CPU bound workflow steps, creating it on first
+    use, or None if workflow_processes is 0 or this is a pool process.
+
+    The processes are started with spawn, as the workflow threads may be
+    holding locks when a process is forked. Each sends its log records to
+    this process, see ```log_config.init_worker```, so that only this process
+    writes and rotates the log files.
+
+    *Example usage:*
+
+    ```pool = get_pool()```
+
+    :returns: ProcessPoolExecutor or None
+
+    '''
+    global POOL
+
+    with POOL_LOCK:
+        if POOL is None and workflow_processes > 0 and not WORKER:
+            POOL = ProcessPoolExecutor(
+                max_workers=workflow_processes,
+                mp_context=multiprocessing.get_context('spawn'),
+                initializer=init_worker,
+                initargs=(log_config.worker_queue(),
+                          get_conf.get_xfero_config()[0]))
+        return POOL
+
+
+def discard_pool(pool):
+    '''
+    Stop using a pool whose processes have died.
+    '''
+    global POOL
+
+    with POOL_LOCK:
+        if POOL is pool:
+            POOL = None
+    pool.shutdown(wait=False)
+
+
+def close_pool():
+    '''
+
+    **Purpose:**
+
+    Shut down the process pool for CPU bound workflow steps, if it has been
+    started.
+
+    *Example usage:*
+
+    ```close_pool()```
+
+    :returns: None
+
+    '''
+    global POOL
+
+    with POOL_LOCK:
+        pool, POOL = POOL, None
+    if pool is not None:
+        pool.shutdown()
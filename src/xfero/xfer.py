@@ -78,6 +78,39 @@ threads
 |            |             | rather than make copies of the file into processing|
 |            |             | directory.
 +------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | Xfer and partner rows are read from the route plan |
+|            |             | cache rather than queried for every file           |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | Logging is configured once per process by          |
+|            |             | log_config rather than for every file              |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | Added engine_process. Xfers whose COTS pattern     |
+|            |             | product is handled by xfer_engine are sent on a    |
+|            |             | pooled in-process session instead of a subprocess. |
+|            |             | subproc_return is reset for each file.             |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | Destinations of a file are sent concurrently by    |
+|            |             | xfer_row, up to xfer_fanout at a time. Each has its|
+|            |             | own result and the file is cleaned up once all of  |
+|            |             | them have finished.                                |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | The partner slots reserved by the Xfer_Scheduler   |
+|            |             | are released once a file is sent. Engines read the |
+|            |             | file through the partner's token bucket and curl is|
+|            |             | given --limit-rate when the partner has a bandwidth|
+|            |             | limit.                                             |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | Failed destinations are retried with backoff by    |
+|            |             | xfer_retry rather than the file being moved to the |
+|            |             | error directory, and are not attempted while the   |
+|            |             | partner's circuit breaker is open. Work items for  |
+|            |             | a retry have a sixth element.                      |
++------------+-------------+----------------------------------------------------+
+| 17/10/2026 | agent       | The content steps held in the route plan's stream  |
+|            |             | are applied as the file is sent. curl reads the    |
+|            |             | output on stdin and the engines read it as a file  |
+|            |             | object, so nothing is written to disk.             |
++------------+-------------+----------------------------------------------------+
 
 '''
 # identity = lambda x: x
@@ -88,19 +121,27 @@ import os
 import shutil
 import shlex
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import logging.config
+from xfero import log_config
 import xfero.get_conf as get_conf
-from xfero.db import manage_xfer as db_xfer
+from xfero import route_plan
+from xfero import xfer_retry
+from xfero.xfer_engine import engines
+from xfero.workflow_manager import stream_filter
 from xfero.workflow_manager.copy_file import Copy_File
 
 try:
-    (xfero_logger,.xfero_database, outbound_directory, transient_directory,
-     error_directory, xfero_pid) = get_conf.get.xfero_config()
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
 except Exception as err:
     print('Cannot get XFERO Config: %s' % err)
     raise err
 
-logging.config.fileConfig(xfero_logger)
+# Maximum number of destinations a single file is sent to concurrently
+xfer_fanout = int(get_conf.get_xfero_option('settings', 'xfer_fanout', 4))
+
+log_config.configure(xfero_logger)
 
 # create logger
 logger = logging.getLogger('xfer')
@@ -122,10 +163,12 @@ class Xfer_Thread(threading.Thread):
         self.sendfile = ''
         self.delsrc = 'No'
         self.subproc_return = 0
+        self.fanout = None
+        self.retry = None
+        self.stream_rows = ()
 
     def run(self):
 
-        logging.config.fileConfig(xfero_logger)
         # create logger
         logger = logging.getLogger('xfer')
 
@@ -153,11 +196,16 @@ class Xfer_Thread(threading.Thread):
                 self.queue.task_done()
                 break
 
-            self.priority, route_id, self.filename, self.original_filename, self.xfero_token = work
+            self.priority, route_id, self.filename, self.original_filename, self.xfero_token = work[:5]
+            # A retry of a failed transfer to one destination, see xfer_retry
+            self.retry = work[5] if len(work) > 5 else None
 
             try:
                 # this is the "work"
-                result = (self.xfer_process(route_id, self.filename))
+                try:
+                    result = (self.xfer_process(route_id, self.filename))
+                finally:
+                    self.release(work)
                 logger.debug(
                     '%s - Result of xfer_process: %s. (XFERO_Token=%s)' % (self.name, result, self.xfero_token))
 
@@ -180,6 +228,12 @@ class Xfer_Thread(threading.Thread):
                             logger.warning(
                                 "%s - Delete file %s exception: %s. (XFERO_Token=%s)" % (self.name, self.sendfile, e, self.xfero_token))
 
+                elif result == xfer_retry.RETRY:
+                    # The file is held in the retry directory
+                    self.queue.task_done()
+                    logger.info('%s - Transfer of %s will be retried. (XFERO_Token=%s)' %
+                                (self.name, self.original_filename, self.xfero_token))
+
                 else:
                     logger.error(
                         '%s - Error in thread: Error %s. (XFERO_Token=%s)' % (self.name, result, self.xfero_token))
@@ -222,28 +276,71 @@ class Xfer_Thread(threading.Thread):
                 self.queue.task_done()
                 # raise err
 
+            if self.retry:
+                xfer_retry.release_dir(self.filename)
+
+        if self.fanout is not None:
+            self.fanout.shutdown()
+            self.fanout = None
+
         sys.stdout.flush()
         # print('Xfer Terminating')
 
+    def release(self, work):
+        '''
+        Free the partner slots reserved for the work by the xfer scheduler.
+        '''
+        release = getattr(self.queue, 'release', None)
+        if release is not None:
+            release(work)
+
+    def bucket(self, partner):
+        '''
+        Return the token bucket of the partner, or None if it has no bandwidth
+        limit.
+        '''
+        bucket = getattr(self.queue, 'bucket', None)
+        return bucket(partner) if bucket is not None else None
+
+    def rate_share(self, partner):
+        '''
+        Return the bytes per second available to a transfer to the partner, or
+        None if it has no bandwidth limit.
+        '''
+        rate_share = getattr(self.queue, 'rate_share', None)
+        return rate_share(partner) if rate_share is not None else None
+
     def xfer_process(self, route_id, filename):
 
-        logging.config.fileConfig(xfero_logger)
         # create logger
         logger = logging.getLogger('xfer')
 
         logger.info('%s - Performing Xfer on file %s. (XFERO_Token=%s)' %
                     (self.name, filename, self.xfero_token))
 
+        self.subproc_return = 0
+        self.sendfile = filename
+
         try:
             logger.debug(
-                'db_xfer.join_xfer_partner: %s. (XFERO_Token=%s)' % (route_id, self.xfero_token))
-            x_rows = db_xfer.join_xfer_partner(str(route_id), self.xfero_token)
+                'route_plan.get_cache().get: %s. (XFERO_Token=%s)' % (route_id, self.xfero_token))
+            plan = route_plan.get_cache().get(route_id, self.xfero_token)
+            x_rows = plan.xfer
+            # Content steps applied as the file is sent
+            self.stream_rows = plan.stream
 
         except Exception as err:
             logger.error('%s - Exception while retrieving xfer: Error %s. (XFERO_Token=%s)' %
                          (self.name, err, self.xfero_token), exc_info=True)
             raise err
 
+        if self.retry:
+            # Only the destination which failed
+            x_rows = [row for row in x_rows if row['xfer_id'] == self.retry[1]]
+            if not x_rows:
+                # The xfer has been deleted since the file failed
+                xfer_retry.complete(self.retry, self.xfero_token)
+
         if not x_rows:
             logger.info('%s - No xfer to perform. (XFERO_Token=%s)' %
                         (self.name, self.xfero_token))
@@ -269,130 +366,250 @@ class Xfer_Thread(threading.Thread):
                     filename, prefix_file, err, self.xfero_token)
             raise err
 
+        # Each destination is sent concurrently, up to xfer_fanout at a time,
+        # so a slow partner does not delay the others. Every destination has
+        # finished before the result is returned, so the file is only cleaned
+        # up by run once all of the transfers are complete.
         for row in x_rows:
-            xfer_id = row['xfer_id']
-            xfer_route = row['xfer_route']
-            xfer_cotspattern = row['xfer_cotspattern']
-            xfer_partner = row['xfer_partner']
-            xfer_cmd = row['xfer_cmd']
-            xfer_params = row['xfer_params']
             self.delsrc = row['xfer_delsrc']
-            partner_service_name = row['partner_service_name']
-
-            # 20150225 - decided not to create a copy files into processing
-            # instead send to all targets from transient directory
-            #send_dir = self.outbound_directory + os.sep + partner_service_name
-            #p, filename_no_path = os.path.split(filename)
-            #self.send_file = send_dir + os.sep + self.prefix + filename_no_path
-
-            # Do create directory in try except
-            #try:
-            #    os.stat(send_dir)
-            #except:
-            #    os.makedirs(send_dir)
-
-            #logger.info('%s - Copy file to target output directory: %s to %s. (XFERO_Token=%s)' %
-            #            (self.name, filename, self.send_file, self.xfero_token))
-
-            #try:
-            #    shutil.copy(filename, self.send_file)
-            #except OSError as err:
-            #    logger.error('%s - Unable to copy file from %s to %s: %s. (XFERO_Token=%s)' %
-            #                 (self.name, filename, self.send_file, err, self.xfero_token))
-            #    # self.queue.task_done()
-            #    raise err
-
-            # Construct send command for the transfer subprocess
-            # Will need to add the file name to the xfer params passed to the subprocess to add the send file name
-            # Things to replace from xfer_params = {File_to_Send_with_Path} ,
-            # {Remote_File_Name_No_Path}, {Remote_File_Name_With_Path}
-
-            #prefix_file = self.prefix + filename_no_path
-            #20150225 - rename self.filename to prefix filename
-
-
-            # 20150225 replaced with line below
-            #params = xfer_params.replace(
-            #    '{File_to_Send_with_Path}', self.send_file)
-            params = xfer_params.replace(
-                '{File_to_Send_with_Path}', self.sendfile)
-            ############# only works for FTP ############### Ibelieve this should work now we can specify target directory in the GUI !!!!!!!!!!!!!!!!!
-            xfer_params = params.replace(
-                '{Remote_File_Name}', filename_no_path)
-            params = xfer_params.replace('{Prefix_File_Name}', prefix_file)
-            ############# only works for FTP ###############
-            cmd = xfer_cmd + ' ' + params
-            # Added cmd.replace in shlex below to accommodate issues with
-            # windows file paths in shlex
-            args = shlex.split(cmd.replace('\\', '\\\\'))
-
-            logger.debug('%s - Shlex arguments = %s. (XFERO_Token=%s)' %
-                         (self.name, args, self.xfero_token))
-
-            if xfer_cmd == 'curl':
+
+        # Destinations whose partner's circuit is open are not attempted
+        breaker = xfer_retry.get_breaker()
+        allowed = [breaker.allow(row['xfer_partner']) for row in x_rows]
+        send_rows = [row for row, allow in zip(x_rows, allowed) if allow]
+
+        if len(send_rows) <= 1 or xfer_fanout <= 1:
+            results = [self.xfer_row(row, filename_no_path, prefix_file)
+                       for row in send_rows]
+        else:
+            if self.fanout is None:
+                self.fanout = ThreadPoolExecutor(
+                    max_workers=xfer_fanout,
+                    thread_name_prefix=self.name + '-fanout')
+            futures = [self.fanout.submit(self.xfer_row, row,
+                                          filename_no_path, prefix_file)
+                       for row in send_rows]
+            results = []
+            for row, future in zip(send_rows, futures):
                 try:
-                    logger.info(
-                        '%s - Performing Transfer: %s. (XFERO_Token=%s)' % (self.name, args, self.xfero_token))
+                    results.append(future.result())
+                except Exception as err:
+                    logger.error('%s - Xfer %s to %s failed: Error %s. (XFERO_Token=%s)' %
+                                 (self.name, row['xfer_id'],
+                                  row['partner_service_name'], err,
+                                  self.xfero_token), exc_info=True)
+                    results.append(1)
+
+        # None for each destination which was not attempted
+        results = iter(results)
+        results = [next(results) if allow else None for allow in allowed]
+
+        for row, result in zip(x_rows, results):
+            if result is None:
+                logger.warning('%s - Xfer %s to %s not attempted. Circuit open. (XFERO_Token=%s)' %
+                               (self.name, row['xfer_id'],
+                                row['partner_service_name'], self.xfero_token))
+            elif result == 0:
+                breaker.record_success(row['xfer_partner'])
+            else:
+                breaker.record_failure(row['xfer_partner'])
+                logger.error('%s - Xfer %s to %s failed RC: %s. (XFERO_Token=%s)' %
+                             (self.name, row['xfer_id'],
+                              row['partner_service_name'], result,
+                              self.xfero_token))
+
+        self.subproc_return = self.retry_failed(route_id, x_rows, results,
+                                                filename_no_path)
 
+        #if os.path.isfile(self.sendfile):
+        #    try:
+        #        os.remove(self.sendfile)
+        #    except (OSError, IOError) as e:
+        #        logger.warning("%s - Delete file %s exception: %s. (XFERO_Token=%s)" %
+        #        (self.name, self.sendfile, e, self.xfero_token))
+
+        return self.subproc_return
+
+    def retry_failed(self, route_id, x_rows, results, filename_no_path):
+
+        # create logger
+        logger = logging.getLogger('xfer')
+
+        failed = [(row, result) for row, result in zip(x_rows, results)
+                  if result != 0]
+
+        if not failed:
+            if self.retry:
+                xfer_retry.complete(self.retry, self.xfero_token)
+            return 0
+
+        if xfer_retry.xfer_retries <= 0:
+            return sum(result or 1 for row, result in failed)
+
+        if self.retry:
+            row, result = failed[0]
+            if xfer_retry.reschedule(self.retry, result, self.xfero_token):
+                # Hold the file under its own name for the next retry
+                os.replace(self.sendfile, self.filename)
+                return xfer_retry.RETRY
+
+            logger.error('%s - Xfer %s to %s failed after %s retries. (XFERO_Token=%s)' %
+                         (self.name, row['xfer_id'],
+                          row['partner_service_name'],
+                          xfer_retry.xfer_retries, self.xfero_token))
+            return result or 1
+
+        # A copy of the file is held for each destination which failed, so
+        # the file itself is cleaned up as though it had been sent
+        failures = 0
+        for row, result in failed:
+            try:
+                retry_file = xfer_retry.schedule(
+                    self.priority, route_id, self.original_filename,
+                    self.xfero_token, row, self.sendfile, filename_no_path,
+                    result)
+                logger.warning('%s - Xfer %s to %s will be retried from %s. (XFERO_Token=%s)' %
+                               (self.name, row['xfer_id'],
+                                row['partner_service_name'], retry_file,
+                                self.xfero_token))
+            except Exception as err:
+                logger.error('%s - Unable to schedule retry of xfer %s: Error %s. (XFERO_Token=%s)' %
+                             (self.name, row['xfer_id'], err,
+                              self.xfero_token), exc_info=True)
+                failures += result or 1
+
+        return failures
+
+    def xfer_row(self, row, filename_no_path, prefix_file):
+
+        # create logger
+        logger = logging.getLogger('xfer')
+
+        xfer_id = row['xfer_id']
+        xfer_route = row['xfer_route']
+        xfer_cotspattern = row['xfer_cotspattern']
+        xfer_partner = row['xfer_partner']
+        xfer_cmd = row['xfer_cmd']
+        xfer_params = row['xfer_params']
+        partner_service_name = row['partner_service_name']
+
+        # The content steps of a streamed route are applied as the file is
+        # sent, so the remote names have the suffixes the steps would add
+        filters = stream_filter.build_filters(
+            self.stream_rows, filename_no_path, self.xfero_token)
+        if filters:
+            suffix = ''.join(stream.suffix for stream in filters)
+            filename_no_path += suffix
+            prefix_file += suffix
+
+        # 20150225 - decided not to create a copy files into processing
+        # instead send to all targets from transient directory
+        #send_dir = self.outbound_directory + os.sep + partner_service_name
+        #p, filename_no_path = os.path.split(filename)
+        #self.send_file = send_dir + os.sep + self.prefix + filename_no_path
+
+        # Do create directory in try except
+        #try:
+        #    os.stat(send_dir)
+        #except:
+        #    os.makedirs(send_dir)
+
+        #logger.info('%s - Copy file to target output directory: %s to %s. (XFERO_Token=%s)' %
+        #            (self.name, filename, self.send_file, self.xfero_token))
+
+        #try:
+        #    shutil.copy(filename, self.send_file)
+        #except OSError as err:
+        #    logger.error('%s - Unable to copy file from %s to %s: %s. (XFERO_Token=%s)' %
+        #                 (self.name, filename, self.send_file, err, self.xfero_token))
+        #    # self.queue.task_done()
+        #    raise err
+
+        # Construct send command for the transfer subprocess
+        # Will need to add the file name to the xfer params passed to the subprocess to add the send file name
+        # Things to replace from xfer_params = {File_to_Send_with_Path} ,
+        # {Remote_File_Name_No_Path}, {Remote_File_Name_With_Path}
+
+        #prefix_file = self.prefix + filename_no_path
+        #20150225 - rename self.filename to prefix filename
+
+
+        # 20150225 replaced with line below
+        #params = xfer_params.replace(
+        #    '{File_to_Send_with_Path}', self.send_file)
+        params = xfer_params.replace(
+            '{File_to_Send_with_Path}', '-' if filters else self.sendfile)
+        ############# only works for FTP ############### Ibelieve this should work now we can specify target directory in the GUI !!!!!!!!!!!!!!!!!
+        xfer_params = params.replace(
+            '{Remote_File_Name}', filename_no_path)
+        params = xfer_params.replace('{Prefix_File_Name}', prefix_file)
+        ############# only works for FTP ###############
+
+        # Transfers for COTS patterns handled by an in-process engine use
+        # a warm session to the partner rather than running xfer_cmd
+        if engines.is_engine(row['cotspattern_product']):
+            return self.engine_process(row, params, filename_no_path,
+                                       prefix_file, filters)
+
+        cmd = xfer_cmd + ' ' + params
+        # Added cmd.replace in shlex below to accommodate issues with
+        # windows file paths in shlex
+        args = shlex.split(cmd.replace('\\', '\\\\'))
+
+        # Keep curl within the partner's share of its bandwidth limit
+        rate = self.rate_share(xfer_partner)
+        if xfer_cmd == 'curl' and rate:
+            args[1:1] = ['--limit-rate', str(rate)]
+
+        logger.debug('%s - Shlex arguments = %s. (XFERO_Token=%s)' %
+                     (self.name, args, self.xfero_token))
+
+        if xfer_cmd == 'curl':
+            try:
+                logger.info(
+                    '%s - Performing Transfer: %s. (XFERO_Token=%s)' % (self.name, args, self.xfero_token))
+
+                if filters:
+                    # curl reads the output of the steps on stdin
+                    popen, p_stdout, p_stderr = stream_filter.run_streamed(
+                        args, stream_filter.file_blocks(self.sendfile,
+                                                        filters))
+                else:
                     popen = subprocess.Popen(
                         args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
                     p_stdout, p_stderr = popen.communicate()
-                    # XFERS.append(popen)
-                    print(p_stdout)
-                    print(p_stderr)
-                    print(args)
-                    logger_stats = logging.getLogger('ftstats')
+                # XFERS.append(popen)
+                print(p_stdout)
+                print(p_stderr)
+                print(args)
+                logger_stats = logging.getLogger('ftstats')
+                logger_stats.info(
+                    "%s - Transfer initiated: %s. (XFERO_Token=%s)" % (self.name, cmd, self.xfero_token))
+                try:
+                    #20150225 - modified line below
+                    #sz = os.path.getsize(self.send_file)
+                    sz = os.path.getsize(self.sendfile)
                     logger_stats.info(
-                        "%s - Transfer initiated: %s. (XFERO_Token=%s)" % (self.name, cmd, self.xfero_token))
-                    try:
-                        #20150225 - modified line below
-                        #sz = os.path.getsize(self.send_file)
-                        sz = os.path.getsize(self.sendfile)
-                        logger_stats.info(
-                            "%s - File: %s is %s bytes. (XFERO_Token=%s)" % (self.name, self.sendfile, sz, self.xfero_token))
-                    except OSError as e:
-                        logger_stats.error(
-                            "%s - Can not get size of the file: %s. (XFERO_Token=%s)" % (self.name, self.sendfile, self.xfero_token))
-
-                    logger = logging.getLogger('xfer')
-                    logger.info(
-                        '%s - Transfer initiated: %s. (XFERO_Token=%s)' % (self.name, cmd, self.xfero_token))
-                    logger.info('%s - Subprocess: %s. (XFERO_Token=%s)' %
-                                (self.name, p_stdout, self.xfero_token))
-                    logger.info('%s - Subprocess: %s. (XFERO_Token=%s)' %
-                                (self.name, p_stderr, self.xfero_token))
-
-                    if (popen.returncode != 0):
-                        logger.error('%s - Transfer Failed RC: %s. (XFERO_Token=%s)' %
-                                     (self.name, popen.returncode, self.xfero_token))
-                        logger.error('%s - Failed to send file: %s. (XFERO_Token=%s)' %
-                                     (self.name, self.sendfile, self.xfero_token))
-
-                        self.subproc_return = self.subproc_return + \
-                            popen.returncode
-
-                        #20150225 - # Delete self.sendfile
-                        #try:
-                        #    os.remove(self.send_file)
-                        #except (OSError, IOError) as e:
-                        #    logger.warning("%s - Exception deleting transferred source file %s exception: %s. (XFERO_Token=%s)" % (
-                        #        self.name, self.send_file, e, self.xfero_token))
-
-                    else:
-                        logger.info('%s - Transfer Successful: %s. (XFERO_Token=%s)' %
-                                    (self.name, popen.returncode, self.xfero_token))
-                        logger.info('%s - Successfully sent file: %s. (XFERO_Token=%s)' %
-                                    (self.name, self.sendfile, self.xfero_token))
-                        #20150225 - # Delete self.sendfile
-                        #try:
-                        #    os.remove(self.send_file)
-                        #except (OSError, IOError) as e:
-                        #    logger.warning("%s - Exception deleting transferred source file %s exception: %s. (XFERO_Token=%s)" % (
-                        #        self.name, self.send_file, e, self.xfero_token))
+                        "%s - File: %s is %s bytes. (XFERO_Token=%s)" % (self.name, self.sendfile, sz, self.xfero_token))
+                except OSError as e:
+                    logger_stats.error(
+                        "%s - Can not get size of the file: %s. (XFERO_Token=%s)" % (self.name, self.sendfile, self.xfero_token))
+
+                logger = logging.getLogger('xfer')
+                logger.info(
+                    '%s - Transfer initiated: %s. (XFERO_Token=%s)' % (self.name, cmd, self.xfero_token))
+                logger.info('%s - Subprocess: %s. (XFERO_Token=%s)' %
+                            (self.name, p_stdout, self.xfero_token))
+                logger.info('%s - Subprocess: %s. (XFERO_Token=%s)' %
+                            (self.name, p_stderr, self.xfero_token))
+
+                if (popen.returncode != 0):
+                    logger.error('%s - Transfer Failed RC: %s. (XFERO_Token=%s)' %
+                                 (self.name, popen.returncode, self.xfero_token))
+                    logger.error('%s - Failed to send file: %s. (XFERO_Token=%s)' %
+                                 (self.name, self.sendfile, self.xfero_token))
+
 
-                except Exception as err:
-                    logger.error('%s - Unable to call subprocess %s to %s: Error %s. (XFERO_Token=%s)' %
-                                 (self.name, xfer_cmd, params, err, self.xfero_token), exc_info=True)
                     #20150225 - # Delete self.sendfile
                     #try:
                     #    os.remove(self.send_file)
@@ -400,16 +617,82 @@ class Xfer_Thread(threading.Thread):
                     #    logger.warning("%s - Exception deleting transferred source file %s exception: %s. (XFERO_Token=%s)" % (
                     #        self.name, self.send_file, e, self.xfero_token))
 
-                    raise err
-            else:
-                print('Calling %s' % cmd)
-                os.system(cmd)
+                else:
+                    logger.info('%s - Transfer Successful: %s. (XFERO_Token=%s)' %
+                                (self.name, popen.returncode, self.xfero_token))
+                    logger.info('%s - Successfully sent file: %s. (XFERO_Token=%s)' %
+                                (self.name, self.sendfile, self.xfero_token))
+                    #20150225 - # Delete self.sendfile
+                    #try:
+                    #    os.remove(self.send_file)
+                    #except (OSError, IOError) as e:
+                    #    logger.warning("%s - Exception deleting transferred source file %s exception: %s. (XFERO_Token=%s)" % (
+                    #        self.name, self.send_file, e, self.xfero_token))
 
-        #if os.path.isfile(self.sendfile):
-        #    try:
-        #        os.remove(self.sendfile)
-        #    except (OSError, IOError) as e:
-        #        logger.warning("%s - Delete file %s exception: %s. (XFERO_Token=%s)" %
-        #        (self.name, self.sendfile, e, self.xfero_token))
+            except Exception as err:
+                logger.error('%s - Unable to call subprocess %s to %s: Error %s. (XFERO_Token=%s)' %
+                             (self.name, xfer_cmd, params, err, self.xfero_token), exc_info=True)
+                #20150225 - # Delete self.sendfile
+                #try:
+                #    os.remove(self.send_file)
+                #except (OSError, IOError) as e:
+                #    logger.warning("%s - Exception deleting transferred source file %s exception: %s. (XFERO_Token=%s)" % (
+                #        self.name, self.send_file, e, self.xfero_token))
 
-        return self.subproc_return
+                return 1
+
+            return popen.returncode
+        else:
+            print('Calling %s' % cmd)
+            os.system(cmd)
+
+        return 0
+
+    def engine_process(self, row, remote_path, remote_name, temp_name,
+                       filters=()):
+
+        # create logger
+        logger = logging.getLogger('xfer')
+        logger_stats = logging.getLogger('ftstats')
+
+        product = row['cotspattern_product']
+        target = '%s %s:%s %s' % (product, row['partner_remote_system_id'],
+                                  row['partner_control_port'], remote_path)
+
+        logger.info('%s - Performing Transfer: %s. (XFERO_Token=%s)' %
+                    (self.name, target, self.xfero_token))
+        logger_stats.info("%s - Transfer initiated: %s. (XFERO_Token=%s)" %
+                          (self.name, target, self.xfero_token))
+        try:
+            sz = os.path.getsize(self.sendfile)
+            logger_stats.info("%s - File: %s is %s bytes. (XFERO_Token=%s)" %
+                              (self.name, self.sendfile, sz, self.xfero_token))
+        except OSError as e:
+            logger_stats.error("%s - Can not get size of the file: %s. (XFERO_Token=%s)" %
+                               (self.name, self.sendfile, self.xfero_token))
+
+        try:
+            if filters:
+                # The engine reads the output of the steps as a file
+                with stream_filter.Filter_Reader(stream_filter.file_blocks(
+                        self.sendfile, filters)) as source:
+                    result = engines.send(
+                        row, source, remote_path, remote_name, temp_name,
+                        bucket=self.bucket(row['xfer_partner']))
+            else:
+                result = engines.send(row, self.sendfile, remote_path,
+                                      remote_name, temp_name,
+                                      bucket=self.bucket(row['xfer_partner']))
+        except Exception as err:
+            logger.error('%s - Transfer Failed: %s: Error %s. (XFERO_Token=%s)' %
+                         (self.name, target, err, self.xfero_token), exc_info=True)
+            logger.error('%s - Failed to send file: %s. (XFERO_Token=%s)' %
+                         (self.name, self.sendfile, self.xfero_token))
+            return 1
+
+        logger.info('%s - Transfer Successful: %s. (XFERO_Token=%s)' %
+                    (self.name, result, self.xfero_token))
+        logger.info('%s - Successfully sent file: %s. (XFERO_Token=%s)' %
+                    (self.name, self.sendfile, self.xfero_token))
+
+        return 0
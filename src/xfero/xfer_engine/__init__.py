@@ -0,0 +1,34 @@
+'''
+**Transfer Engine Module:**
+
++-----------------------------------+------------------------------------------+
+| Type                              | Brief Description                        |
++===================================+==========================================+
+| Func: engines.send                | Send a file using an in-process engine   |
++-----------------------------------+------------------------------------------+
+| Class: session_pool.Session_Pool  | Warm sessions per partner                |
++-----------------------------------+------------------------------------------+
+| Class: ftp_engine.FTP_Session     | FTP and FTPS sessions (ftplib)           |
++-----------------------------------+------------------------------------------+
+| Class: http_engine.HTTP_Session   | HTTP and HTTPS sessions (http.client)    |
++-----------------------------------+------------------------------------------+
+| Class: local_engine.Local_Session | Local directory delivery                 |
++-----------------------------------+------------------------------------------+
+| Class: local_engine.Link_Session  | Local delivery by reflink or hard link   |
++-----------------------------------+------------------------------------------+
+| Class: throttle.Token_Bucket      | Per-partner bandwidth shaping            |
++-----------------------------------+------------------------------------------+
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added throttle                                    |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added local_engine.Link_Session                   |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | The engines also send file objects, for streamed  |
+|            |             | workflow steps                                    |
++------------+-------------+---------------------------------------------------+
+'''
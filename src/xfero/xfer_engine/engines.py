@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+'''
+In-process transfer engines
+'''
+
+import os
+from xfero.xfer_engine import session_pool
+from xfero.xfer_engine.ftp_engine import FTP_Session
+from xfero.xfer_engine.http_engine import HTTP_Session
+from xfero.xfer_engine.local_engine import Link_Session
+from xfero.xfer_engine.local_engine import Local_Session
+
+# XFERO_COTS_Pattern.cotspattern_product values handled in-process, with the
+# session class and whether TLS is used
+ENGINES = {
+    'XFERO_FTP': (FTP_Session, False),
+    'XFERO_FTPS': (FTP_Session, True),
+    'XFERO_HTTP': (HTTP_Session, False),
+    'XFERO_HTTPS': (HTTP_Session, True),
+    'XFERO_LOCAL': (Local_Session, False),
+    'XFERO_LINK': (Link_Session, False),
+}
+
+
+def is_engine(product):
+    '''
+
+    **Purpose:**
+
+    Return True if transfers for the COTS pattern product are carried out by
+    an in-process engine rather than by running the xfer command.
+
+    *Example usage:*
+
+    ```if is_engine(row['cotspattern_product']):```
+
+    :param product: XFERO_COTS_Pattern.cotspattern_product
+    :returns: True or False
+
+    '''
+    return product in ENGINES
+
+
+def send(row, local_file, remote_path, remote_name, temp_name=None,
+         pool=None, bucket=None):
+    '''
+
+    **Purpose:**
+
+    Send a file to a partner using the in-process engine for the COTS pattern
+    of the xfer, on a warm session taken from the session pool.
+
+    The engine is selected by the cotspattern_product of the
+    XFERO_COTS_Pattern row for the xfer:
+
+    +------------------+-------------------------------------------------------+
+    | Product          | Engine                                                |
+    +==================+=======================================================+
+    | XFERO_FTP        | FTP (ftplib). Stored as temp_name then renamed        |
+    +------------------+-------------------------------------------------------+
+    | XFERO_FTPS       | FTP with explicit TLS                                 |
+    +------------------+-------------------------------------------------------+
+    | XFERO_HTTP       | HTTP PUT (http.client) on a keep-alive connection     |
+    +------------------+-------------------------------------------------------+
+    | XFERO_HTTPS      | HTTPS PUT                                             |
+    +------------------+-------------------------------------------------------+
+    | XFERO_LOCAL      | Copy to a local directory as temp_name then rename    |
+    +------------------+-------------------------------------------------------+
+    | XFERO_LINK       | Reflink or hard link to a local directory, or copy    |
+    |                  | where the directory is on another filesystem          |
+    +------------------+-------------------------------------------------------+
+
+    The connection details are taken from the XFERO_Partner row for the xfer:
+    partner_remote_system_id (host), partner_control_port,
+    partner_remote_user, partner_remote_password, partner_CA_certificate and
+    partner_cert_bundle.
+
+    The remote path is taken from the xfer params, after the usual
+    substitutions. If it is empty or ends with a '/', or for local delivery is
+    an existing directory, the file is sent under remote_name.
+
+    **Usage Notes:**
+
+    Sessions are pooled per partner and connection settings. A change to the
+    partner settings therefore results in new sessions.
+
+    When a :class:`throttle.Token_Bucket` is given the file is sent no faster
+    than the bucket allows. The xfer scheduler holds one bucket per partner
+    with a bandwidth limit.
+
+    Any failure raises an exception and the session is closed.
+
+    *Example usage:*
+
+    ```send(row, '/xfero/transient/xfero_FILE', '/in/', 'FILE', 'xfero_FILE')```
+
+    :param row: Row from join_xfer_partner
+    :param local_file: File to send, or a file object to read the data
+                       from
+    :param remote_path: Remote path, or directory, to send the file to
+    :param remote_name: Remote file name
+    :param temp_name: Temporary remote file name used until the file is
+                      complete
+    :param pool: Session pool. Defaults to the pool for this process
+    :param bucket: Token bucket limiting the bandwidth used, or None
+    :returns: The result of the engine's send method
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added bucket                                  |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | Added XFERO_LINK                              |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | local_file may be a file object               |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+    product = row['cotspattern_product']
+    session_class, tls = ENGINES[product]
+
+    remote_path = (remote_path or '').strip()
+    if not remote_path or remote_path.endswith('/') or \
+        (issubclass(session_class, Local_Session) and
+         os.path.isdir(remote_path)):
+        remote_path = os.path.join(remote_path, remote_name) \
+            if issubclass(session_class, Local_Session) \
+            else remote_path + remote_name
+
+    settings = (row['partner_remote_system_id'],
+                row['partner_control_port'],
+                row['partner_remote_user'],
+                row['partner_remote_password'],
+                tls,
+                row['partner_CA_certificate'],
+                row['partner_cert_bundle'])
+    key = (product, row['xfer_partner']) + settings
+
+    if pool is None:
+        pool = session_pool.get_pool()
+
+    with pool.session(key, lambda: session_class(*settings)) as session:
+        return session.send(local_file, remote_path, temp_name, bucket)
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+'''
+FTP transfer engine
+'''
+
+import ftplib
+import posixpath
+import ssl
+from xfero.xfer_engine.throttle import Throttled_File
+from xfero.xfer_engine.throttle import open_source
+
+# Seconds to wait for the server
+TIMEOUT = 60
+
+# Size of the blocks written to the data connection
+BLOCKSIZE = 1024 * 1024
+
+
+class FTP_Session(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`ftp_engine.FTP_Session` class is a logged in FTP or FTPS
+    control connection to a partner which can send any number of files.
+
+    A file is stored under a temporary name and then renamed to the remote
+    name once the transfer is complete, in the same way as the
+    ```-Q "-RNFR {Prefix_File_Name}" -Q "-RNTO {Remote_File_Name}"``` curl
+    patterns. The partner therefore never sees a partially written file under
+    its final name.
+
+    **Usage Notes:**
+
+    For FTPS the session uses explicit TLS (AUTH TLS) and protects the data
+    connection. The CA certificate and certificate bundle must be PEM files.
+
+    Passive mode is used.
+
+    *Example usage:*
+
+    ```session = FTP_Session('host', 21, 'user', 'password')```
+    ```session.send('/xfero/transient/xfero_FILE', '/in/FILE', 'xfero_FILE')```
+
+    :param host: Remote host
+    :param port: Remote control port
+    :param user: Remote user
+    :param password: Remote password
+    :param tls: True for FTPS
+    :param cafile: CA certificate used to verify the server
+    :param certfile: Certificate bundle presented to the server
+    :returns: The remote path from the send method
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The file may be given as a file object        |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    default_port = 21
+
+    def __init__(self, host, port=None, user='', password='', tls=False,
+                 cafile=None, certfile=None):
+        '''init'''
+        port = int(port) if port else self.default_port
+
+        if tls:
+            context = ssl.create_default_context(cafile=cafile or None)
+            if certfile:
+                context.load_cert_chain(certfile)
+            self.ftp = ftplib.FTP_TLS(context=context, timeout=TIMEOUT)
+        else:
+            self.ftp = ftplib.FTP(timeout=TIMEOUT)
+
+        self.ftp.connect(host, port)
+        try:
+            self.ftp.login(user or 'anonymous', password or '')
+            if tls:
+                self.ftp.prot_p()
+        except Exception:
+            self.ftp.close()
+            raise
+
+    def send(self, local_file, remote_path, temp_name=None, bucket=None):
+        '''
+        Store the local file under the temporary name in the directory of the
+        remote path and rename it to the remote path. The file is read through
+        the token bucket, if one is given.
+        '''
+        if temp_name:
+            temp_path = posixpath.join(posixpath.dirname(remote_path),
+                                       temp_name)
+        else:
+            temp_path = remote_path
+
+        with open_source(local_file) as source:
+            if bucket is not None:
+                source = Throttled_File(source, bucket)
+            self.ftp.storbinary('STOR ' + temp_path, source, BLOCKSIZE)
+
+        if temp_path != remote_path:
+            self.ftp.rename(temp_path, remote_path)
+
+        return remote_path
+
+    def alive(self):
+        '''
+        Return True if the control connection is still usable.
+        '''
+        try:
+            self.ftp.voidcmd('NOOP')
+        except (OSError, EOFError, ftplib.Error):
+            return False
+        return True
+
+    def close(self):
+        '''
+        Log out and close the control connection.
+        '''
+        try:
+            self.ftp.quit()
+        except (OSError, EOFError, ftplib.Error):
+            self.ftp.close()
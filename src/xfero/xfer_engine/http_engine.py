@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+'''
+HTTP transfer engine
+'''
+
+import base64
+import http.client
+import os
+import ssl
+import urllib.parse
+from xfero.xfer_engine.throttle import Throttled_File
+from xfero.xfer_engine.throttle import open_source
+
+# Seconds to wait for the server
+TIMEOUT = 60
+
+# Size of the blocks written to the connection
+BLOCKSIZE = 1024 * 1024
+
+
+class HTTP_Session(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`http_engine.HTTP_Session` class is a persistent (keep-alive)
+    HTTP or HTTPS connection to a partner which can send any number of files.
+
+    Each file is sent with a PUT request to the remote path. A 2xx response
+    indicates success. Any other response raises http.client.HTTPException.
+
+    **Usage Notes:**
+
+    If the partner closed an idle keep-alive connection, the request fails
+    before a response is received. In that case the request is retried once
+    on a new connection.
+
+    Basic authentication is used when a remote user is configured. For HTTPS
+    the CA certificate and certificate bundle must be PEM files.
+
+    The temporary name is not used. The partner is responsible for only
+    exposing the file once the request body has been received.
+
+    *Example usage:*
+
+    ```session = HTTP_Session('host', 80, 'user', 'password')```
+    ```session.send('/xfero/transient/xfero_FILE', '/in/FILE')```
+
+    :param host: Remote host
+    :param port: Remote port
+    :param user: Remote user
+    :param password: Remote password
+    :param tls: True for HTTPS
+    :param cafile: CA certificate used to verify the server
+    :param certfile: Certificate bundle presented to the server
+    :returns: The HTTP status from the send method
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The file may be given as a file object, which |
+    |            |             | is sent chunked                               |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, host, port=None, user='', password='', tls=False,
+                 cafile=None, certfile=None):
+        '''init'''
+        if tls:
+            context = ssl.create_default_context(cafile=cafile or None)
+            if certfile:
+                context.load_cert_chain(certfile)
+            self.con = http.client.HTTPSConnection(
+                host, int(port) if port else None, timeout=TIMEOUT,
+                context=context, blocksize=BLOCKSIZE)
+        else:
+            self.con = http.client.HTTPConnection(
+                host, int(port) if port else None, timeout=TIMEOUT,
+                blocksize=BLOCKSIZE)
+
+        self.headers = {'Content-Type': 'application/octet-stream'}
+        if user:
+            credentials = ('%s:%s' % (user, password or '')).encode('utf-8')
+            self.headers['Authorization'] = \
+                'Basic ' + base64.b64encode(credentials).decode('ascii')
+
+    def send(self, local_file, remote_path, temp_name=None, bucket=None):
+        '''
+        PUT the local file to the remote path. The file is read through the
+        token bucket, if one is given.
+        '''
+        if not remote_path.startswith('/'):
+            remote_path = '/' + remote_path
+        url = urllib.parse.quote(remote_path)
+
+        headers = dict(self.headers)
+        streamed = hasattr(local_file, 'read')
+        if streamed:
+            # The length of a stream is not known, so it is sent chunked. A
+            # stream cannot be sent a second time, so it is sent on a new
+            # connection rather than one the partner may have closed
+            self.con.close()
+        else:
+            headers['Content-Length'] = str(os.path.getsize(local_file))
+
+        for attempt in (1, 2):
+            # A connection which has been used before may have been closed
+            # by the partner while idle
+            reused = self.con.sock is not None
+            with open_source(local_file) as source:
+                if bucket is not None:
+                    source = Throttled_File(source, bucket)
+                try:
+                    self.con.request('PUT', url, body=source, headers=headers,
+                                     encode_chunked=streamed)
+                    response = self.con.getresponse()
+                except (http.client.RemoteDisconnected,
+                        ConnectionResetError, BrokenPipeError):
+                    self.con.close()
+                    if reused and attempt == 1:
+                        continue
+                    raise
+
+            response.read()
+            if response.will_close:
+                self.con.close()
+
+            if 200 <= response.status < 300:
+                return response.status
+
+            raise http.client.HTTPException(
+                'PUT %s failed: %s %s' % (remote_path, response.status,
+                                          response.reason))
+
+    def alive(self):
+        '''
+        Return True. A connection closed by the partner is reopened by send.
+        '''
+        return True
+
+    def close(self):
+        '''
+        Close the connection.
+        '''
+        self.con.close()
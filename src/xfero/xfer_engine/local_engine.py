@@ -0,0 +1,228 @@
+#!/usr/bin/env python
+'''
+Local directory transfer engine
+'''
+
+import errno
+import os
+import shutil
+from xfero.workflow_manager.kernel_copy import fast_copy
+from xfero.xfer_engine.throttle import Throttled_File
+from xfero.xfer_engine.throttle import open_source
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Size of the blocks copied
+BLOCKSIZE = 1024 * 1024
+
+# The Linux ioctl which makes a file share the blocks of another, as cp
+# --reflink does
+FICLONE = 0x40049409
+
+# Errors meaning a link cannot be made between the files, so that the next
+# method is tried
+LINK_ERRORS = (errno.EXDEV, errno.EPERM, errno.EACCES, errno.EMLINK,
+               errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.ENOSYS)
+
+
+def reflink(local_file, target):
+    '''
+
+    **Purpose:**
+
+    Create target as a copy of local_file which shares its blocks, on a
+    filesystem which supports this such as btrfs or XFS. Nothing is copied
+    and later changes to either file do not affect the other.
+
+    *Example usage:*
+
+    ```reflink('/xfero/transient/xfero_FILE', '/partner/in/.FILE.part')```
+
+    :param local_file: File to copy
+    :param target: Name of the copy
+    :returns: None or raises an OSError if the blocks cannot be shared
+
+    '''
+    if fcntl is None:
+        raise OSError(errno.ENOSYS, 'Reflinks are not supported')
+
+    with open(local_file, 'rb') as source:
+        try:
+            with open(target, 'wb') as out:
+                fcntl.ioctl(out.fileno(), FICLONE, source.fileno())
+        except OSError:
+            os.remove(target)
+            raise
+    shutil.copystat(local_file, target)
+
+
+class Local_Session(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`local_engine.Local_Session` class delivers files to a
+    directory on the XFERO server, for example a directory exported to a
+    partner over NFS or collected by another application.
+
+    The file is copied to the temporary name in the target directory and then
+    renamed to the remote name, so the file only appears under its final name
+    once it is complete.
+
+    **Usage Notes:**
+
+    The remote path is the full path of the file to create. Any existing file
+    of the same name is replaced.
+
+    The session holds no connection. It is pooled in the same way as other
+    sessions so that all engines are used alike.
+
+    *Example usage:*
+
+    ```session = Local_Session()```
+    ```session.send('/xfero/transient/xfero_FILE', '/partner/in/FILE')```
+
+    :returns: The path of the delivered file from the send method
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | The file may be given as a file object        |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, *args, **kw):
+        '''init'''
+        pass
+
+    def send(self, local_file, remote_path, temp_name=None, bucket=None):
+        '''
+        Copy the local file to the remote path. The file is read through the
+        token bucket, if one is given.
+        '''
+        temp_path = os.path.join(
+            os.path.dirname(remote_path),
+            temp_name or '.' + os.path.basename(remote_path) + '.part')
+
+        try:
+            with open_source(local_file) as source, \
+                open(temp_path, 'wb') as target:
+                if bucket is not None:
+                    source = Throttled_File(source, bucket)
+                shutil.copyfileobj(source, target, BLOCKSIZE)
+            if not hasattr(local_file, 'read'):
+                shutil.copystat(local_file, temp_path)
+            os.replace(temp_path, remote_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return remote_path
+
+    def alive(self):
+        '''
+        Return True.
+        '''
+        return True
+
+    def close(self):
+        '''
+        Nothing to close.
+        '''
+        pass
+
+
+class Link_Session(Local_Session):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`local_engine.Link_Session` class delivers files to a
+    directory on the XFERO server without copying them where it can, so a
+    delivery takes the same time whatever the size of the file.
+
+    The file is delivered as the first of these which is possible:
+
+    * a reflink, sharing the blocks of the file, where the filesystem
+      supports it
+    * a hard link, where the target is on the same filesystem
+    * a copy made in the kernel by ```kernel_copy.fast_copy```
+
+    As with :class:`local_engine.Local_Session` the file is created under the
+    temporary name and renamed to the remote name.
+
+    **Usage Notes:**
+
+    XFERO removes its own name for the file once it has been transferred, so
+    a hard link leaves the partner's file as the only name for the data. A
+    hard link shares the permissions of the file, and when a file is sent to
+    several directories on one filesystem they all name the same data.
+    Partners which change delivered files in place should use a reflink
+    capable filesystem or the XFERO_LOCAL engine.
+
+    A bandwidth limit only applies when the file is copied.
+
+    *Example usage:*
+
+    ```session = Link_Session()```
+    ```session.send('/xfero/transient/xfero_FILE', '/partner/in/FILE')```
+
+    :returns: The path of the delivered file from the send method
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+    | 17/10/2026 | agent       | A file object is copied                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def send(self, local_file, remote_path, temp_name=None, bucket=None):
+        '''
+        Link the local file to the remote path, or copy it if it cannot be
+        linked.
+        '''
+        temp_path = os.path.join(
+            os.path.dirname(remote_path),
+            temp_name or '.' + os.path.basename(remote_path) + '.part')
+
+        if hasattr(local_file, 'read'):
+            # A stream can only be copied
+            return Local_Session.send(self, local_file, remote_path,
+                                      temp_name, bucket)
+
+        for link in (reflink, os.link):
+            try:
+                link(local_file, temp_path)
+            except OSError as err:
+                if err.errno not in LINK_ERRORS:
+                    raise
+                continue
+
+            try:
+                os.replace(temp_path, remote_path)
+            finally:
+                # A rename to another name for the same file does nothing
+                if os.path.lexists(temp_path):
+                    os.remove(temp_path)
+            return remote_path
+
+        if bucket is not None:
+            return Local_Session.send(self, local_file, remote_path,
+                                      temp_name, bucket)
+        return fast_copy(local_file, remote_path)
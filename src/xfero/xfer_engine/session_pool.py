@@ -0,0 +1,174 @@
+#!/usr/bin/env python
+'''
+Transfer session pool
+'''
+
+import contextlib
+import threading
+import time
+
+# The session pool shared by every xfer thread in this process
+POOL = None
+POOL_LOCK = threading.Lock()
+
+
+class Session_Pool(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`session_pool.Session_Pool` class keeps transfer sessions open
+    between files so that a transfer to a partner reuses a warm connection
+    rather than paying for a new connection, TLS handshake and login each
+    time.
+
+    Sessions are held against a key identifying the partner and its connection
+    settings. A session is used by one xfer thread at a time. It is taken from
+    the pool for the duration of a transfer and returned afterwards.
+
+    **Usage Notes:**
+
+    Sessions must provide the methods ```alive``` and ```close```.
+
+    An idle session is checked with ```alive``` before it is reused and is
+    discarded if it has been idle for longer than ```idle_timeout``` seconds.
+    At most ```max_idle``` idle sessions are kept per key. Further sessions are
+    closed when they are returned.
+
+    A session is closed rather than returned to the pool if the transfer
+    using it fails.
+
+    *Example usage:*
+
+    ```with get_pool().session(key, factory) as session:```
+        ```session.send(local_file, remote_path, temp_name)```
+
+    :param max_idle: Maximum number of idle sessions kept per key
+    :param idle_timeout: Seconds after which an idle session is discarded
+
+    **Unit Test Module:** test_xfer_engine.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, max_idle=4, idle_timeout=60.0):
+        '''init'''
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.lock = threading.Lock()
+        self.idle = {}
+
+    def acquire(self, key, factory):
+        '''
+        Return an idle session for the key, or a new session created by
+        calling factory.
+        '''
+        while True:
+            with self.lock:
+                sessions = self.idle.get(key)
+                entry = sessions.pop() if sessions else None
+
+            if entry is None:
+                return factory()
+
+            session, last_used = entry
+            if time.time() - last_used <= self.idle_timeout and \
+                session.alive():
+                return session
+
+            self.discard(session)
+
+    def release(self, key, session, reuse=True):
+        '''
+        Return a session to the pool, or close it if reuse is False or the
+        pool is full.
+        '''
+        if reuse:
+            with self.lock:
+                sessions = self.idle.setdefault(key, [])
+                if len(sessions) < self.max_idle:
+                    sessions.append((session, time.time()))
+                    return
+
+        self.discard(session)
+
+    @contextlib.contextmanager
+    def session(self, key, factory):
+        '''
+        Context manager which acquires a session and returns it to the pool
+        afterwards. The session is closed if an exception is raised.
+        '''
+        session = self.acquire(key, factory)
+        try:
+            yield session
+        except BaseException:
+            self.release(key, session, reuse=False)
+            raise
+        self.release(key, session)
+
+    def discard(self, session):
+        '''
+        Close a session, ignoring any error.
+        '''
+        try:
+            session.close()
+        except Exception:
+            pass
+
+    def close_all(self):
+        '''
+        Close all idle sessions.
+        '''
+        with self.lock:
+            idle, self.idle = self.idle, {}
+
+        for sessions in idle.values():
+            for session, last_used in sessions:
+                self.discard(session)
+
+
+def get_pool():
+    '''
+
+    **Purpose:**
+
+    Return the session pool for this process, creating it on first use.
+
+    *Example usage:*
+
+    ```pool = get_pool()```
+
+    :returns: The :class:`session_pool.Session_Pool`
+
+    '''
+    global POOL
+
+    with POOL_LOCK:
+        if POOL is None:
+            POOL = Session_Pool()
+        return POOL
+
+
+def close_pool():
+    '''
+
+    **Purpose:**
+
+    Close all idle sessions held by the session pool for this process.
+
+    *Example usage:*
+
+    ```close_pool()```
+
+    :returns: None
+
+    '''
+    with POOL_LOCK:
+        if POOL is not None:
+            POOL.close_all()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+'''
+Bandwidth shaping
+'''
+
+import contextlib
+import threading
+import time
+
+# Fraction of a second of bandwidth read at a time by Throttled_File, so the
+# rate is smooth rather than a burst followed by a long pause
+SLICE = 0.1
+
+# Smallest read made by Throttled_File
+MIN_READ = 4096
+
+
+class Token_Bucket(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`throttle.Token_Bucket` class limits the rate at which bytes
+    are sent to a partner. Every transfer to the partner takes tokens from the
+    same bucket, so the partner's bandwidth is shared between them.
+
+    The bucket holds up to one second of tokens and is refilled continuously
+    at the configured rate.
+
+    **Usage Notes:**
+
+    ```consume``` never blocks. It takes the tokens, allowing the bucket to
+    go into debt, and returns the number of seconds the caller should wait
+    before sending more. The xfer scheduler does not start a new transfer to
+    a partner whose bucket is in debt, see ```wait_time```.
+
+    The rate may be changed while transfers are in progress.
+
+    *Example usage:*
+
+    ```bucket = Token_Bucket(1048576)```
+    ```time.sleep(bucket.consume(len(data)))```
+
+    :param rate: Bytes per second
+    :param capacity: Largest burst in bytes. Defaults to rate
+
+    **Unit Test Module:** test_xfer_scheduler.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, rate, capacity=None):
+        '''init'''
+        self.lock = threading.Lock()
+        self.rate = float(rate)
+        self.capacity = float(capacity or rate)
+        self.tokens = self.capacity
+        self.stamp = time.monotonic()
+
+    def _refill(self):
+        '''
+        Add the tokens accrued since the last call. Called with the lock held.
+        '''
+        now = time.monotonic()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.stamp) * self.rate)
+        self.stamp = now
+
+    def set_rate(self, rate, capacity=None):
+        '''
+        Change the rate of the bucket.
+        '''
+        with self.lock:
+            self._refill()
+            self.rate = float(rate)
+            self.capacity = float(capacity or rate)
+            self.tokens = min(self.tokens, self.capacity)
+
+    def consume(self, size):
+        '''
+        Take size tokens and return the seconds to wait until the bucket is
+        out of debt.
+        '''
+        with self.lock:
+            self._refill()
+            self.tokens -= size
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def wait_time(self):
+        '''
+        Return the seconds until the bucket is out of debt. 0 if it is not.
+        '''
+        with self.lock:
+            self._refill()
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+
+def open_source(local_file):
+    '''
+
+    **Purpose:**
+
+    Open the file to be sent by an engine. The engines are given either the
+    path of a file or a file object to read, such as the output of the
+    streamed workflow steps. A file object is read as it is and is not closed.
+
+    *Example usage:*
+
+    ```with open_source(local_file) as source:```
+
+    :param local_file: Path of the file, or a file object opened for reading
+    :returns: Context manager giving the file object
+
+    '''
+    if hasattr(local_file, 'read'):
+        return contextlib.nullcontext(local_file)
+    return open(local_file, 'rb')
+
+
+class Throttled_File(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`throttle.Throttled_File` class wraps a file opened for reading
+    so that data is read from it no faster than a
+    :class:`throttle.Token_Bucket` allows.
+
+    The transfer engines read the file being sent through it, so the socket
+    is only written to as fast as the file is read.
+
+    **Usage Notes:**
+
+    Reads are limited to a tenth of a second of bandwidth so that the rate is
+    smooth.
+
+    *Example usage:*
+
+    ```source = Throttled_File(open(local_file, 'rb'), bucket)```
+
+    :param source: File object to read from
+    :param bucket: Token_Bucket shared by the transfers to the partner
+
+    **Unit Test Module:** test_xfer_scheduler.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, source, bucket):
+        '''init'''
+        self.source = source
+        self.bucket = bucket
+
+    def read(self, size=-1):
+        '''
+        Read up to size bytes, waiting for the bucket as required.
+        '''
+        limit = max(MIN_READ, int(self.bucket.rate * SLICE))
+        if size is None or size < 0 or size > limit:
+            size = limit
+
+        data = self.source.read(size)
+        if data:
+            wait = self.bucket.consume(len(data))
+            if wait:
+                time.sleep(wait)
+        return data
+
+    def close(self):
+        '''
+        Close the file.
+        '''
+        self.source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
@@ -0,0 +1,541 @@
+#!/usr/bin/env python
+'''
+
+**Purpose:**
+
+Durable retries of failed transfers, with exponential backoff and a circuit
+breaker per partner.
+
+When the transfer of a file to one of its destinations fails, a copy of the
+file is held in the retry directory and a row is added to the
+XFERO_Xfer_Retry table with the time of the next attempt. The
+:class:`xfer_retry.Retry_Thread` of the pipeline puts retries which are due to
+the xfer queue, where they are sent to that destination only. As the schedule
+is held in the database, retries survive a restart of XFERO.
+
+The delay before each attempt doubles, from retry_delay up to
+retry_max_delay, with jitter so that files which failed together are not all
+retried together. Once a file has failed xfer_retries retries it is moved to
+the error directory, as every failed transfer was before.
+
+The :class:`xfer_retry.Circuit_Breaker` counts consecutive failures to each
+partner. After breaker_threshold failures the circuit is opened and no
+transfers are attempted to the partner; files for it are scheduled for retry
+without an attempt being made or counted. Every breaker_probe seconds one
+transfer is let through. If it succeeds the circuit is closed, otherwise it
+stays open for another breaker_probe seconds.
+
+**Usage Notes:**
+
+The settings are read from the [settings] section of the XFERO
+configuration:
+
++-------------------+-------------+--------------------------------------------+
+| Setting           | Default     | Description                                |
++===================+=============+============================================+
+| xfer_retries      | 5           | Retries before a file is moved to the      |
+|                   |             | error directory. 0 disables retries        |
++-------------------+-------------+--------------------------------------------+
+| retry_delay       | 60          | Seconds before the first retry             |
++-------------------+-------------+--------------------------------------------+
+| retry_max_delay   | 3600        | Longest delay between retries              |
++-------------------+-------------+--------------------------------------------+
+| retry_poll        | 10          | Seconds between checks for retries due     |
++-------------------+-------------+--------------------------------------------+
+| retry_directory   | <transient  | Directory holding the files to retry       |
+|                   | >/retry     |                                            |
++-------------------+-------------+--------------------------------------------+
+| breaker_threshold | 5           | Consecutive failures opening the circuit.  |
+|                   |             | 0 disables the circuit breaker             |
++-------------------+-------------+--------------------------------------------+
+| breaker_probe     | 300         | Seconds between probes of an open circuit  |
++-------------------+-------------+--------------------------------------------+
+
+The circuit breaker is held in memory and starts closed when XFERO starts.
+
+**Unit Test Module:** test_xfer_retry.py
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import logging
+import os
+import random
+import shutil
+import sqlite3 as lite
+import threading
+import time
+import uuid
+from xfero import get_conf as get_conf
+from xfero.db import manage_xfer_retry as db_retry
+
+try:
+    (xfero_logger, xfero_database, outbound_directory, transient_directory,
+     error_directory, xfero_pid) = get_conf.get_xfero_config()
+except Exception as err:
+    print('Cannot get XFERO Config: %s' % err)
+    raise err
+
+xfer_retries = int(get_conf.get_xfero_option('settings', 'xfer_retries', 5))
+retry_delay = float(get_conf.get_xfero_option('settings', 'retry_delay', 60))
+retry_max_delay = float(get_conf.get_xfero_option('settings',
+                                                  'retry_max_delay', 3600))
+retry_poll = float(get_conf.get_xfero_option('settings', 'retry_poll', 10))
+retry_directory = get_conf.get_xfero_option(
+    'settings', 'retry_directory', os.path.join(transient_directory, 'retry'))
+breaker_threshold = int(get_conf.get_xfero_option('settings',
+                                                  'breaker_threshold', 5))
+breaker_probe = float(get_conf.get_xfero_option('settings', 'breaker_probe',
+                                                300))
+
+# Seconds a retry is leased to the xfer thread it was put to. If XFERO stops
+# before the attempt is recorded the retry is due again after this time.
+LEASE = 3600
+
+# Returned by Xfer_Thread.xfer_process when the file is held for a retry
+RETRY = 'retry'
+
+# The circuit breaker shared by every xfer thread in this process
+BREAKER = None
+BREAKER_LOCK = threading.Lock()
+
+
+def backoff(attempts):
+    '''
+
+    **Purpose:**
+
+    Return the seconds to wait before the next attempt, after the given
+    number of failed attempts. The delay doubles with each attempt up to
+    retry_max_delay, and is between half and all of that.
+
+    *Example usage:*
+
+    ```next_attempt = time.time() + backoff(attempts)```
+
+    :param attempts: Number of failed attempts
+    :returns: Seconds to wait
+
+    '''
+    delay = min(retry_max_delay,
+                retry_delay * 2 ** min(max(attempts - 1, 0), 32))
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class Circuit_Breaker(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`xfer_retry.Circuit_Breaker` class stops transfers to a partner
+    which is failing, and lets a single probe through periodically to find
+    out when it has recovered.
+
+    +-----------+------------------------------------------------------------+
+    | State     | Behaviour                                                  |
+    +===========+============================================================+
+    | Closed    | Transfers are attempted. Consecutive failures are counted  |
+    +-----------+------------------------------------------------------------+
+    | Open      | No transfers are attempted, from threshold consecutive     |
+    |           | failures until probe seconds have passed                   |
+    +-----------+------------------------------------------------------------+
+    | Half open | One transfer, the probe, is attempted. Success closes the  |
+    |           | circuit and failure opens it again                         |
+    +-----------+------------------------------------------------------------+
+
+    **Usage Notes:**
+
+    ```allow``` is called before a transfer is attempted and hands out the
+    probe of a half open circuit. ```ready``` answers the same question
+    without taking the probe.
+
+    The class is safe to share between threads.
+
+    *Example usage:*
+
+    ```if breaker.allow(partner):```
+    ```    breaker.record_success(partner)```
+
+    :param threshold: Consecutive failures opening the circuit. 0 disables
+                      the circuit breaker
+    :param probe: Seconds between probes of an open circuit
+
+    **Unit Test Module:** test_xfer_retry.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, threshold=None, probe=None):
+        '''init'''
+        self.threshold = breaker_threshold if threshold is None else threshold
+        self.probe = breaker_probe if probe is None else probe
+        self.lock = threading.Lock()
+        self.failures = {}
+        self.opened = {}
+        self.probing = set()
+
+    def _ready(self, partner):
+        '''
+        Return True if a transfer may be attempted. Called with the lock held.
+        '''
+        opened = self.opened.get(partner)
+        if opened is None:
+            return True
+        return partner not in self.probing and \
+            time.monotonic() >= opened + self.probe
+
+    def allow(self, partner):
+        '''
+        Return True if a transfer to the partner may be attempted. The probe
+        of a half open circuit is given to the caller.
+        '''
+        with self.lock:
+            if not self._ready(partner):
+                return False
+            if partner in self.opened:
+                self.probing.add(partner)
+            return True
+
+    def ready(self, partner):
+        '''
+        Return True if a transfer to the partner would be allowed.
+        '''
+        with self.lock:
+            return self._ready(partner)
+
+    def is_open(self, partner):
+        '''
+        Return True if the circuit of the partner is open or half open.
+        '''
+        with self.lock:
+            return partner in self.opened
+
+    def reopen_at(self, partner):
+        '''
+        Return the time, in seconds since the epoch, from which a transfer to
+        the partner will be allowed.
+        '''
+        with self.lock:
+            opened = self.opened.get(partner)
+            if opened is None:
+                return time.time()
+            return time.time() + max(0.0, opened + self.probe -
+                                     time.monotonic())
+
+    def record_success(self, partner):
+        '''
+        Record a successful transfer to the partner, closing its circuit.
+        '''
+        with self.lock:
+            self.failures.pop(partner, None)
+            self.probing.discard(partner)
+            if self.opened.pop(partner, None) is not None:
+                logger = logging.getLogger('xfer')
+                logger.info('Circuit closed for partner %s', partner)
+
+    def record_failure(self, partner):
+        '''
+        Record a failed transfer to the partner, opening its circuit once
+        threshold consecutive transfers have failed.
+        '''
+        with self.lock:
+            failures = self.failures.get(partner, 0) + 1
+            self.failures[partner] = failures
+
+            if partner in self.probing:
+                # The probe failed. Stay open for another probe interval
+                self.probing.discard(partner)
+                self.opened[partner] = time.monotonic()
+            elif self.threshold and failures >= self.threshold and \
+                partner not in self.opened:
+                self.opened[partner] = time.monotonic()
+                logger = logging.getLogger('xfer')
+                logger.warning('Circuit opened for partner %s after %s '
+                               'consecutive failures. Probing every %s '
+                               'seconds', partner, failures, self.probe)
+
+
+def get_breaker():
+    '''
+
+    **Purpose:**
+
+    Return the circuit breaker for this process, creating it on first use.
+
+    *Example usage:*
+
+    ```breaker = get_breaker()```
+
+    :returns: The :class:`xfer_retry.Circuit_Breaker`
+
+    '''
+    global BREAKER
+
+    with BREAKER_LOCK:
+        if BREAKER is None:
+            BREAKER = Circuit_Breaker()
+        return BREAKER
+
+
+def schedule(priority, route_id, original_filename, xfero_token, row,
+             sendfile, remote_name, result):
+    '''
+
+    **Purpose:**
+
+    Hold a copy of a file whose transfer to a destination failed and schedule
+    the retry of that destination.
+
+    The copy is a hard link to the file where possible. It is held in a
+    directory of its own within the retry directory, under remote_name, so
+    that the retry sends it under the same name.
+
+    *Example usage:*
+
+    ```schedule(priority, route_id, original_filename, xfero_token, row,
+    sendfile, 'FILE', 7)```
+
+    :param priority: Priority of the route
+    :param route_id: Route ID of the route
+    :param original_filename: Original file name
+    :param xfero_token: XFERO Token of the file
+    :param row: Row of the destination from join_xfer_partner
+    :param sendfile: File which failed to be sent
+    :param remote_name: Name of the file sent
+    :param result: Result of the transfer. None if it was not attempted
+                   because the partner's circuit is open
+    :returns: The path of the held file
+
+    '''
+    hold_dir = os.path.join(retry_directory, uuid.uuid4().hex)
+    os.makedirs(hold_dir)
+    retry_file = os.path.join(hold_dir, remote_name)
+    try:
+        os.link(sendfile, retry_file)
+    except OSError:
+        shutil.copy2(sendfile, retry_file)
+
+    attempts = 0 if result is None else 1
+    partner = row['xfer_partner']
+    next_attempt = max(time.time() + (backoff(attempts) if attempts else 0),
+                       get_breaker().reopen_at(partner))
+
+    try:
+        db_retry.create_XFERO_Xfer_Retry(
+            route_id, row['xfer_id'], partner, priority, retry_file,
+            original_filename, str(xfero_token), attempts, next_attempt,
+            last_error(result), xfero_token)
+    except Exception:
+        os.remove(retry_file)
+        os.rmdir(hold_dir)
+        raise
+
+    return retry_file
+
+
+def reschedule(retry, result, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    Record the failure of a retry and schedule the next. Returns False, and
+    deletes the retry, if the file has used all of its retries.
+
+    *Example usage:*
+
+    ```if not reschedule(retry, 7, xfero_token):```
+
+    :param retry: (retry_id, xfer_id, partner_id, attempts) from the work item
+    :param result: Result of the transfer. None if it was not attempted
+                   because the partner's circuit is open
+    :param xfero_token: XFERO Token of the file
+    :returns: True if the file is to be retried again
+
+    '''
+    retry_id, xfer_id, partner, attempts = retry
+
+    if result is not None:
+        attempts += 1
+        if attempts > xfer_retries:
+            db_retry.delete_XFERO_Xfer_Retry(retry_id, xfero_token)
+            return False
+
+    next_attempt = max(time.time() + (backoff(attempts) if attempts else 0),
+                       get_breaker().reopen_at(partner))
+    db_retry.update_XFERO_Xfer_Retry(retry_id, attempts, next_attempt,
+                                     last_error(result), xfero_token)
+    return True
+
+
+def complete(retry, xfero_token=False):
+    '''
+
+    **Purpose:**
+
+    Delete a retry once the file has been sent.
+
+    *Example usage:*
+
+    ```complete(retry, xfero_token)```
+
+    :param retry: (retry_id, xfer_id, partner_id, attempts) from the work item
+    :param xfero_token: XFERO Token of the file
+    :returns: None
+
+    '''
+    db_retry.delete_XFERO_Xfer_Retry(retry[0], xfero_token)
+
+
+def release_dir(retry_file):
+    '''
+
+    **Purpose:**
+
+    Remove the directory holding a retry file, once it is empty.
+
+    *Example usage:*
+
+    ```release_dir(retry_file)```
+
+    :param retry_file: Path of the retry file
+    :returns: None
+
+    '''
+    try:
+        os.rmdir(os.path.dirname(retry_file))
+    except OSError:
+        pass
+
+
+def last_error(result):
+    '''
+    Describe the result of a failed transfer for retry_last_error.
+    '''
+    if result is None:
+        return 'Circuit open'
+    return 'RC %s' % result
+
+
+class Retry_Thread(threading.Thread):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`xfer_retry.Retry_Thread` class checks the XFERO_Xfer_Retry
+    table every retry_poll seconds and puts the retries which are due to the
+    xfer queue.
+
+    The work item of a retry has a sixth element, (retry_id, xfer_id,
+    partner_id, attempts), so that the xfer thread sends it to that
+    destination only.
+
+    **Usage Notes:**
+
+    A retry is leased for an hour when it is put to the queue, so that it is
+    not put again while in progress. Its next attempt is set when the attempt
+    completes.
+
+    A retry for a partner whose circuit is open is deferred until the next
+    probe. A retry whose file no longer exists is deleted.
+
+    *Example usage:*
+
+    ```retry_thread = Retry_Thread(outq)```
+    ```retry_thread.start()```
+    ```retry_thread.stop()```
+
+    :param q: The xfer queue
+    :param poll: Seconds between checks. Defaults to retry_poll
+
+    **Unit Test Module:** test_xfer_retry.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, q, poll=None, *args, **kw):
+        '''init'''
+        threading.Thread.__init__(self, *args, **kw)
+        self.queue = q
+        self.poll = retry_poll if poll is None else poll
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.wait(self.poll):
+            try:
+                self.dispatch()
+            except Exception as err:
+                logger = logging.getLogger('xfer')
+                logger.error('%s - Error dispatching retries: %s', self.name,
+                             err, exc_info=True)
+
+    def dispatch(self):
+        '''
+        Put the retries which are due to the xfer queue. Returns the number
+        put.
+        '''
+        logger = logging.getLogger('xfer')
+        breaker = get_breaker()
+        now = time.time()
+
+        try:
+            rows = db_retry.list_XFERO_Xfer_Retry_Due(now)
+        except lite.OperationalError as err:
+            # A database created before XFERO_Xfer_Retry was added
+            logger.warning('%s - Cannot read retries: %s', self.name, err)
+            return 0
+
+        count = 0
+        for (retry_id, route_id, xfer_id, partner, priority, retry_file,
+             original_filename, xfero_token, attempts, next_attempt,
+             error) in rows:
+            if self.stopping.is_set():
+                break
+
+            if not os.path.isfile(retry_file):
+                logger.error('%s - Retry file %s no longer exists. '
+                             'Abandoning retry. (XFERO_Token=%s)',
+                             self.name, retry_file, xfero_token)
+                db_retry.delete_XFERO_Xfer_Retry(retry_id, xfero_token)
+                release_dir(retry_file)
+                continue
+
+            if not breaker.ready(partner):
+                db_retry.update_XFERO_Xfer_Retry_Next_Attempt(
+                    retry_id, breaker.reopen_at(partner), xfero_token)
+                continue
+
+            db_retry.update_XFERO_Xfer_Retry_Next_Attempt(
+                retry_id, now + LEASE, xfero_token)
+            logger.info('%s - Retrying %s to xfer %s, attempt %s. '
+                        '(XFERO_Token=%s)', self.name, retry_file, xfer_id,
+                        attempts + 1, xfero_token)
+            self.queue.put((priority, route_id, retry_file, original_filename,
+                            xfero_token, (retry_id, xfer_id, partner,
+                                          attempts)))
+            count += 1
+
+        return count
+
+    def stop(self):
+        '''
+        Stop checking for retries and wait for the thread to finish.
+        '''
+        self.stopping.set()
+        self.join()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+'''
+Partner aware xfer queue
+'''
+
+import bisect
+import collections
+import itertools
+import logging
+import queue
+import threading
+import time
+from xfero import route_plan
+from xfero.xfer_engine.throttle import Token_Bucket
+
+# Longest wait before the queue is looked at again while it only holds work
+# for partners at their limits. Limits changed in the database are picked up
+# within this time.
+RECHECK = 1.0
+
+
+def route_partners(work):
+    '''
+
+    **Purpose:**
+
+    Return the partner_ids a work item is to be sent to, from the xfer rows
+    of the route plan for its route.
+
+    *Example usage:*
+
+    ```partners = route_partners(work)```
+
+    :param work: Work item from the workflow thread
+    :returns: A tuple of partner_ids
+
+    '''
+    if len(work) > 5:
+        # A retry is sent to one partner only
+        return (work[5][2],)
+    priority, route_id, filename, original_filename, xfero_token = work
+    plan = route_plan.get_cache().get(route_id, xfero_token)
+    return tuple(sorted(set(row['xfer_partner'] for row in plan.xfer)))
+
+
+def partner_limits():
+    '''
+
+    **Purpose:**
+
+    Return the limits of every partner from the route plan cache.
+
+    *Example usage:*
+
+    ```max_xfers, bytes_per_sec = partner_limits().get(partner, (None, None))```
+
+    :returns: A dictionary of partner_id to (max_xfers, bytes_per_sec)
+
+    '''
+    return route_plan.get_cache().partner_limits()
+
+
+class Xfer_Scheduler(object):
+
+    '''
+
+    **Purpose:**
+
+    The :class:`xfer_scheduler.Xfer_Scheduler` class is the queue between the
+    workflow threads and the xfer threads. It enforces the limits held for
+    each partner in the XFERO_Partner_Limit table:
+
+    +-----------------------------+--------------------------------------------+
+    | Limit                       | Enforcement                                |
+    +=============================+============================================+
+    | partner_limit_max_xfers     | A file is not handed to an xfer thread     |
+    |                             | while that many files are already being    |
+    |                             | transferred to one of its partners         |
+    +-----------------------------+--------------------------------------------+
+    | partner_limit_bytes_per_sec | A :class:`throttle.Token_Bucket` is shared |
+    |                             | by all transfers to the partner. A file is |
+    |                             | not handed out while the bucket of one of  |
+    |                             | its partners is in debt                    |
+    +-----------------------------+--------------------------------------------+
+
+    Work is taken in priority order, as from a Priority Queue, but work for a
+    partner at its limit is skipped rather than waited for. An xfer thread
+    therefore moves on to work for other partners, and a burst of files for
+    one partner cannot hold every xfer thread.
+
+    **Usage Notes:**
+
+    The queue has the same put, get, task_done and join methods as a Priority
+    Queue. Work of the same priority is taken in the order it was put.
+
+    An xfer thread must call ```release``` with the work item once the file
+    has been transferred, to free its partner slots.
+
+    The partners of a work item are found when it is put. A work item with
+    the shape of the done item, (999, 'NONE'), is only handed out once no
+    other work remains, so that no work is left behind when the xfer threads
+    stop.
+
+    The bandwidth limit is applied to the in-process transfer engines by
+    reading the file through the partner's bucket, see ```bucket```, and to
+    curl with --limit-rate, see ```rate_share```. Other xfer commands are not
+    shaped.
+
+    *Example usage:*
+
+    ```outq = Xfer_Scheduler(maxsize=6)```
+    ```work = outq.get()```
+    ```outq.release(work)```
+    ```outq.task_done()```
+
+    :param maxsize: Maximum number of queued work items. 0 for no limit
+    :param partners_for: Function returning the partner_ids of a work item.
+                         Defaults to route_partners
+    :param limits_for: Function returning the dictionary of partner limits.
+                       Defaults to partner_limits
+
+    **Unit Test Module:** test_xfer_scheduler.py
+
+    +------------+-------------+-----------------------------------------------+
+    | Date       | Author      | Change Details                                |
+    +============+=============+===============================================+
+    | 17/10/2026 | agent       | Created                                       |
+    +------------+-------------+-----------------------------------------------+
+
+    '''
+
+    def __init__(self, maxsize=0, partners_for=None, limits_for=None):
+        '''init'''
+        self.maxsize = maxsize
+        self.partners_for = partners_for or route_partners
+        self.limits_for = limits_for or partner_limits
+
+        self.mutex = threading.Lock()
+        self.not_empty = threading.Condition(self.mutex)
+        self.not_full = threading.Condition(self.mutex)
+        self.all_tasks_done = threading.Condition(self.mutex)
+        self.unfinished_tasks = 0
+
+        # (priority, sequence, work, partners) in the order work is taken
+        self.items = []
+        self.sequence = itertools.count()
+        self.waiting_work = 0
+
+        self.active = collections.Counter()
+        self.reserved = {}
+        self.buckets = {}
+
+    def qsize(self):
+        '''
+        Return the number of queued work items.
+        '''
+        with self.mutex:
+            return len(self.items)
+
+    def empty(self):
+        '''
+        Return True if no work is queued.
+        '''
+        with self.mutex:
+            return not self.items
+
+    def put(self, work, block=True, timeout=None):
+        '''
+        Put a work item to the queue. Blocks while the queue is full.
+        '''
+        if len(work) == 2:
+            partners = ()
+        else:
+            try:
+                partners = self.partners_for(work)
+            except Exception as err:
+                logger = logging.getLogger('xfer')
+                logger.warning('Cannot find the partners of %s: %s',
+                               work[2], err)
+                partners = ()
+
+        with self.not_full:
+            if self.maxsize > 0:
+                if not block:
+                    if len(self.items) >= self.maxsize:
+                        raise queue.Full
+                elif timeout is None:
+                    while len(self.items) >= self.maxsize:
+                        self.not_full.wait()
+                else:
+                    endtime = time.monotonic() + timeout
+                    while len(self.items) >= self.maxsize:
+                        remaining = endtime - time.monotonic()
+                        if remaining <= 0.0:
+                            raise queue.Full
+                        self.not_full.wait(remaining)
+
+            bisect.insort(self.items,
+                          (work[0], next(self.sequence), work, partners))
+            if len(work) != 2:
+                self.waiting_work += 1
+            self.unfinished_tasks += 1
+            # Any waiting thread may be able to take the new work
+            self.not_empty.notify_all()
+
+    def get(self, block=True, timeout=None):
+        '''
+        Remove and return the first work item whose partners are within their
+        limits, reserving a slot with each partner. Blocks until there is one.
+        '''
+        with self.not_empty:
+            endtime = None if timeout is None else time.monotonic() + timeout
+            while True:
+                work, wait = self._take()
+                if work is not None:
+                    self.not_full.notify()
+                    return work
+
+                if not block:
+                    raise queue.Empty
+                if endtime is not None:
+                    remaining = endtime - time.monotonic()
+                    if remaining <= 0.0:
+                        raise queue.Empty
+                    wait = remaining if wait is None else min(wait, remaining)
+                self.not_empty.wait(wait)
+
+    def _take(self):
+        '''
+        Remove the first eligible work item. Called with the mutex held.
+        Returns the work item, or None and the time to wait before looking
+        again.
+        '''
+        if not self.items:
+            return None, None
+
+        limits = None
+        wait = None
+
+        for index, (priority, seq, work, partners) in enumerate(self.items):
+            if len(work) == 2:
+                # Done item. Only once all other work has been taken
+                if self.waiting_work:
+                    continue
+                del self.items[index]
+                return work, None
+
+            if partners:
+                if limits is None:
+                    try:
+                        limits = self.limits_for()
+                    except Exception as err:
+                        logger = logging.getLogger('xfer')
+                        logger.warning('Cannot read partner limits: %s', err)
+                        limits = {}
+
+                blocked = False
+                for partner in partners:
+                    max_xfers, bytes_per_sec = limits.get(partner,
+                                                          (None, None))
+                    if max_xfers and self.active[partner] >= max_xfers:
+                        blocked = True
+                        wait = RECHECK if wait is None else min(wait, RECHECK)
+                        break
+                    bucket = self._bucket(partner, bytes_per_sec)
+                    if bucket is not None:
+                        debt = bucket.wait_time()
+                        if debt:
+                            blocked = True
+                            debt = min(debt, RECHECK)
+                            wait = debt if wait is None else min(wait, debt)
+                            break
+                if blocked:
+                    continue
+
+            del self.items[index]
+            self.waiting_work -= 1
+            for partner in partners:
+                self.active[partner] += 1
+            self.reserved[id(work)] = partners
+            return work, None
+
+        return None, wait
+
+    def _bucket(self, partner, bytes_per_sec):
+        '''
+        Return the token bucket of the partner, creating it or changing its
+        rate to bytes_per_sec as required. Called with the mutex held.
+        '''
+        bucket = self.buckets.get(partner)
+        if not bytes_per_sec:
+            if bucket is not None:
+                del self.buckets[partner]
+            return None
+        if bucket is None:
+            bucket = self.buckets[partner] = Token_Bucket(bytes_per_sec)
+        elif bucket.rate != bytes_per_sec:
+            bucket.set_rate(bytes_per_sec)
+        return bucket
+
+    def release(self, work):
+        '''
+        Free the partner slots reserved for a work item by get.
+        '''
+        with self.mutex:
+            partners = self.reserved.pop(id(work), ())
+            for partner in partners:
+                self.active[partner] -= 1
+                if self.active[partner] <= 0:
+                    del self.active[partner]
+            if partners:
+                self.not_empty.notify_all()
+
+    def bucket(self, partner):
+        '''
+        Return the token bucket shared by transfers to the partner, or None if
+        the partner has no bandwidth limit.
+        '''
+        with self.mutex:
+            return self.buckets.get(partner)
+
+    def rate_share(self, partner):
+        '''
+        Return the bytes per second available to one transfer to the partner,
+        its bandwidth divided between the files being sent to it, or None if
+        the partner has no bandwidth limit.
+        '''
+        with self.mutex:
+            bucket = self.buckets.get(partner)
+            if bucket is None:
+                return None
+            return max(1, int(bucket.rate / max(1, self.active[partner])))
+
+    def task_done(self):
+        '''
+        Indicate that a work item taken by get is complete.
+        '''
+        with self.all_tasks_done:
+            unfinished = self.unfinished_tasks - 1
+            if unfinished <= 0:
+                if unfinished < 0:
+                    raise ValueError('task_done() called too many times')
+                self.all_tasks_done.notify_all()
+            self.unfinished_tasks = unfinished
+
+    def join(self):
+        '''
+        Block until every work item put has been taken and is complete.
+        '''
+        with self.all_tasks_done:
+            while self.unfinished_tasks:
+                self.all_tasks_done.wait()
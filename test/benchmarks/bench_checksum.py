@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of the sums computed by the Checksum workflow step.
+
+A file of random data is summed:
+
+* by each algorithm on its own - POSIX cksum CRC, MD5 and SHA-256 - reading
+  the file once per algorithm
+* by checksum.file_sums, which computes all three from a single read of the
+  file
+* by tree_hash.tree_sums, which hashes 64MB chunks with SHA-256 in the
+  workflow process pool, by default one process per CPU
+* by the ``cksum`` utility, for comparison with the POSIX CRC
+
+The throughput of each is reported in MB/s. The file is read once before the
+runs so that all of them read it from the page cache.
+
+The checksum module reads the XFERO configuration when imported, so
+XFERO_CONFIG should name a suitable XFERO_config.ini.
+
+*Example usage:*
+
+```python bench_checksum.py [size_mb] [runs]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+| 17/10/2026 | agent       | Added tree_sums                                   |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from xfero.workflow_manager import checksum
+from xfero.workflow_manager import tree_hash
+
+
+def sum_with(factory, filename):
+    '''Sum a file with a single algorithm'''
+    hasher = factory()
+    with open(filename, 'rb', buffering=0) as source:
+        while True:
+            block = source.read(checksum.BLOCKSIZE)
+            if not block:
+                break
+            hasher.update(block)
+
+
+def best_of(runs, func, *args):
+    '''Return the shortest time taken by func over the runs'''
+    best = None
+    for run in range(runs):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    tmpdir = tempfile.mkdtemp()
+    filename = os.path.join(tmpdir, 'bench.dat')
+    with open(filename, 'wb') as out:
+        for block in range(size_mb):
+            out.write(os.urandom(1024 * 1024))
+    sum_with(hashlib.md5, filename)
+
+    print('%-22s %10s %10s' % ('algorithm', 'seconds', 'MB/s'))
+
+    results = [
+        ('cksum', best_of(runs, sum_with, checksum.Posix_Cksum, filename)),
+        ('md5', best_of(runs, sum_with, hashlib.md5, filename)),
+        ('sha256', best_of(runs, sum_with, hashlib.sha256, filename))]
+    results.append(('separate passes', sum(r[1] for r in results)))
+    results.append(('file_sums (one pass)',
+                    best_of(runs, checksum.file_sums, filename)))
+    results.append(('tree_sums (%s procs)' % (os.cpu_count() or 1),
+                    best_of(runs, tree_hash.tree_sums, filename)))
+    if shutil.which('cksum'):
+        results.append(('cksum utility', best_of(
+            runs, subprocess.check_output, ['cksum', filename])))
+
+    for name, elapsed in results:
+        print('%-22s %10.3f %10.1f' % (name, elapsed, size_mb / elapsed))
+
+    shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    main()
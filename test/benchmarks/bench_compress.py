@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of the parallel compression used by Manage_Archives.
+
+A file of compressible text is compressed:
+
+* with gzip.open, on one thread, as the baseline
+* with parallel_compress.compress_file for each codec and each number of
+  threads from 1 up to the number of cores, doubling each time
+
+The throughput of each is reported in MB/s, with the size of the compressed
+file as a percentage of the original. The threads only run at once when
+there are cores for them, so the speed up is limited by the number of cores
+of the machine.
+
+*Example usage:*
+
+```python bench_compress.py [size_mb] [level]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import gzip
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from xfero.workflow_manager import parallel_compress
+
+
+def timed(func, *args):
+    '''Return the result of func and the time it took'''
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def make_file(filename, size_mb):
+    '''Write a file of text which compresses to about a quarter of its size'''
+    words = [''.join(random.choice('abcdefghijklmnopqrstuvwxyz')
+                     for _ in range(random.randint(2, 10)))
+             for _ in range(5000)]
+    with open(filename, 'w') as out:
+        written = 0
+        while written < size_mb * 1024 * 1024:
+            line = ','.join(random.choice(words) for _ in range(12)) + '\n'
+            out.write(line)
+            written += len(line)
+
+
+def gzip_file(filename, target, level):
+    '''Compress a file with gzip on one thread'''
+    with open(filename, 'rb') as source, \
+            gzip.open(target, 'wb', compresslevel=level) as out:
+        shutil.copyfileobj(source, out, parallel_compress.BLOCK_SIZE)
+
+
+def report(label, size, target, seconds):
+    '''Print the throughput and ratio of a run'''
+    print('%-24s %8.1f MB/s %6.1f%%' % (
+        label, size / seconds / 1024 / 1024,
+        100.0 * os.path.getsize(target) / size))
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 128
+    level = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    cores = os.cpu_count() or 1
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        filename = os.path.join(tmpdir, 'bench.txt')
+        make_file(filename, size_mb)
+        size = os.path.getsize(filename)
+        print('%s MB at level %s on %s cores' % (size_mb, level, cores))
+
+        target = filename + '.gz'
+        _, seconds = timed(gzip_file, filename, target, level)
+        report('gzip.open', size, target, seconds)
+
+        workers = [1]
+        while workers[-1] * 2 <= cores:
+            workers.append(workers[-1] * 2)
+        if workers[-1] != cores:
+            workers.append(cores)
+
+        for codec, ext in sorted(parallel_compress.CODECS.items()):
+            target = filename + ext
+            for count in workers:
+                _, seconds = timed(parallel_compress.compress_file, filename,
+                                   target, codec, level, count)
+                report('%s %s threads' % (codec, count), size, target,
+                       seconds)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()
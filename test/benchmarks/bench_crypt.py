@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of the Crypt workflow step against a plain copy of the same file.
+
+A key pair is generated and a file of random data is:
+
+* copied with shutil.copyfile, as the baseline
+* encrypted with Crypt.encrypt_file, which compresses it first
+* encrypted with Crypt.encrypt_file as a .zip, which is not compressed again
+* decrypted with Crypt.decrypt_file
+* encrypted as several copies at once from separate workflow threads, which
+  shows the gpg processes running on separate cores
+
+The throughput of each is reported in MB/s. The first encryption, which
+imports the key into the process keyring, is not timed.
+
+The crypt module reads the XFERO configuration when imported, so
+XFERO_CONFIG should name a suitable XFERO_config.ini.
+
+*Example usage:*
+
+```python bench_crypt.py [size_mb] [threads]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from xfero.workflow_manager import crypt
+
+
+def timed(func, *args):
+    '''Return the result of func and the time it took'''
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def make_file(filename, size_mb):
+    '''Write a file of random data'''
+    with open(filename, 'wb') as out:
+        for block in range(size_mb):
+            out.write(os.urandom(1024 * 1024))
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count() or 1
+
+    tmpdir = tempfile.mkdtemp()
+    homedir = os.path.join(tmpdir, 'gnupg')
+    os.mkdir(homedir, 0o700)
+    gpg = ['gpg', '--homedir', homedir, '--batch', '--yes', '--pinentry-mode',
+           'loopback', '--passphrase', '']
+    subprocess.check_call(gpg + ['--quick-gen-key', 'XFERO Bench', 'default',
+                                 'default', 'never'],
+                          stderr=subprocess.DEVNULL)
+    public_key = subprocess.check_output(gpg + ['--armor', '--export'])
+    private_key = subprocess.check_output(
+        gpg + ['--armor', '--export-secret-keys'])
+    public_key, private_key = public_key.decode(), private_key.decode()
+
+    filename = os.path.join(tmpdir, 'bench.dat')
+    make_file(filename, size_mb)
+    crypt.Crypt().decrypt_file(
+        crypt.Crypt().encrypt_file(filename, public_key), private_key, '')
+
+    print('%-26s %10s %10s' % ('operation', 'seconds', 'MB/s'))
+
+    result, elapsed = timed(shutil.copyfile, filename, filename + '.copy')
+    os.remove(filename + '.copy')
+    print('%-26s %10.3f %10.1f' % ('copy', elapsed, size_mb / elapsed))
+
+    encrypted, elapsed = timed(crypt.Crypt().encrypt_file, filename,
+                               public_key)
+    print('%-26s %10.3f %10.1f' % ('encrypt_file', elapsed,
+                                   size_mb / elapsed))
+
+    result, elapsed = timed(crypt.Crypt().decrypt_file, encrypted,
+                            private_key, '')
+    print('%-26s %10.3f %10.1f' % ('decrypt_file', elapsed,
+                                   size_mb / elapsed))
+
+    os.rename(filename, filename + '.zip')
+    encrypted, elapsed = timed(crypt.Crypt().encrypt_file, filename + '.zip',
+                               public_key)
+    print('%-26s %10.3f %10.1f' % ('encrypt_file (.zip)', elapsed,
+                                   size_mb / elapsed))
+    crypt.Crypt().decrypt_file(encrypted, private_key, '')
+    os.rename(filename + '.zip', filename)
+
+    copies = []
+    for copy in range(threads):
+        copies.append('%s.%s' % (filename, copy))
+        shutil.copyfile(filename, copies[-1])
+    workers = [threading.Thread(target=crypt.Crypt().encrypt_file,
+                                args=(copy, public_key)) for copy in copies]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    print('%-26s %10.3f %10.1f' % ('encrypt_file x %s threads' % threads,
+                                   elapsed, size_mb * threads / elapsed))
+
+    crypt.get_keyring().close()
+    subprocess.call(['gpgconf', '--homedir', homedir, '--kill', 'gpg-agent'])
+    shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of database access by the manage_* functions, before and after the
+introduction of xfero.db.connection.
+
+Each query is run the way a manage_* function runs it:
+
+* before - open a connection, set the foreign_keys pragma, run the statement
+  and close the connection
+* after  - obtain the thread's persistent connection from
+  db.connection.get_connection, set the pragma and run the statement
+
+Both are measured with a single reader thread, and with several reader
+threads while a writer thread updates the table, which is the contention seen
+when the GUI, scheduler and worker threads use the database together.
+
+*Example usage:*
+
+```python bench_db_connection.py [seconds_per_run] [reader_threads]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import os
+import sqlite3 as lite
+import sys
+import tempfile
+import threading
+import time
+from xfero.db import connection as db_connection
+
+SELECT = 'SELECT route_id, route_monitoreddir, route_filenamepattern, \
+route_active, route_priority FROM XFERO_Route WHERE route_active=1'
+UPDATE = 'UPDATE XFERO_Route SET route_priority=? WHERE route_id=?'
+
+
+def create_db(db_location):
+    '''Create a database holding 50 routes'''
+    con = lite.connect(db_location)
+    con.execute('CREATE TABLE XFERO_Route (route_id INTEGER NOT NULL PRIMARY \
+    KEY AUTOINCREMENT, route_monitoreddir TEXT NOT NULL, \
+    route_filenamepattern TEXT NOT NULL, route_active INTEGER NOT NULL, \
+    route_priority INTEGER NOT NULL)')
+    con.executemany('INSERT INTO XFERO_Route VALUES(NULL, ?, ?, 1, 1)',
+                    [('/xfero/IN%d' % i, '^FILE_%d' % i) for i in range(50)])
+    con.commit()
+    con.close()
+
+
+def query_before(db_location, sql, args=()):
+    '''Query as the manage_* functions did before db.connection'''
+    con = lite.connect(db_location)
+    cur = con.execute('pragma foreign_keys=ON')
+    cur.execute(sql, args)
+    rows = cur.fetchall()
+    con.commit()
+    cur.close()
+    con.close()
+    return rows
+
+
+def query_after(db_location, sql, args=()):
+    '''Query as the manage_* functions do using db.connection'''
+    con = db_connection.get_connection(db_location)
+    cur = con.execute('pragma foreign_keys=ON')
+    cur.execute(sql, args)
+    rows = cur.fetchall()
+    con.commit()
+    cur.close()
+    return rows
+
+
+def run(query, db_location, seconds, readers, writer):
+    '''
+    Run the query in reader threads for the given number of seconds and
+    return (read queries per second, writes per second, errors).
+    '''
+    stop = threading.Event()
+    counts = {'read': 0, 'write': 0, 'error': 0}
+    lock = threading.Lock()
+
+    def reader():
+        count = errors = 0
+        while not stop.is_set():
+            try:
+                query(db_location, SELECT)
+                count += 1
+            except lite.Error:
+                errors += 1
+        with lock:
+            counts['read'] += count
+            counts['error'] += errors
+        db_connection.close_connection()
+
+    def updater():
+        count = errors = 0
+        while not stop.is_set():
+            try:
+                query(db_location, UPDATE, (count % 5, count % 50 + 1))
+                count += 1
+            except lite.Error:
+                errors += 1
+        with lock:
+            counts['write'] += count
+            counts['error'] += errors
+        db_connection.close_connection()
+
+    threads = [threading.Thread(target=reader) for i in range(readers)]
+    if writer:
+        threads.append(threading.Thread(target=updater))
+
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    return (counts['read'] / seconds, counts['write'] / seconds,
+            counts['error'])
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    seconds = float(sys.argv[1]) if len(sys.argv) > 1 else 2.0
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    tmpdir = tempfile.mkdtemp()
+    db_location = os.path.join(tmpdir, 'XFERO.db')
+    create_db(db_location)
+
+    print('%-8s %-30s %12s %12s %8s' % (
+        'mode', 'workload', 'reads/s', 'writes/s', 'errors'))
+
+    for name, query in (('before', query_before), ('after', query_after)):
+        for workload, nreaders, writer in (
+                ('1 reader', 1, False),
+                ('%d readers + 1 writer' % readers, readers, True)):
+            reads, writes, errors = run(query, db_location, seconds,
+                                        nreaders, writer)
+            print('%-8s %-30s %12.0f %12.0f %8d' % (
+                name, workload, reads, writes, errors))
+
+    for name in os.listdir(tmpdir):
+        os.remove(os.path.join(tmpdir, name))
+    os.rmdir(tmpdir)
+
+if __name__ == '__main__':
+    main()
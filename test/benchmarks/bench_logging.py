@@ -0,0 +1,166 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of the per-file logging overhead of the workflow and xfer threads,
+before and after the introduction of xfero.log_config.
+
+For each file processed a worker thread:
+
+* before - calls logging.config.fileConfig and then writes the log lines for
+  the file
+* after  - calls log_config.configure, which returns immediately once the
+  process is configured, and then writes the log lines for the file to the
+  logging queue
+
+The time taken by the worker threads is reported as files per second together
+with the mean overhead per file. For the queue based logging the time taken
+for the listener to write the queued records is reported separately, as it is
+no longer spent by the workers.
+
+*Example usage:*
+
+```python bench_logging.py [files] [threads] [lines_per_file]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import logging
+import logging.config
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from xfero import log_config
+
+LOGGING_CONF = '''
+[loggers]
+keys=root,monitor,workflow,xfer,ftstats
+
+[handlers]
+keys=fileHandler,fileHandler_FTSTATS
+
+[formatters]
+keys=simpleFormatter
+
+[logger_root]
+level=DEBUG
+handlers=fileHandler
+
+[logger_monitor]
+level=DEBUG
+handlers=fileHandler
+qualname=monitor
+propagate=0
+
+[logger_workflow]
+level=DEBUG
+handlers=fileHandler
+qualname=workflow
+propagate=0
+
+[logger_xfer]
+level=DEBUG
+handlers=fileHandler
+qualname=xfer
+propagate=0
+
+[logger_ftstats]
+level=DEBUG
+handlers=fileHandler_FTSTATS
+qualname=ftstats
+propagate=0
+
+[handler_fileHandler]
+class=handlers.TimedRotatingFileHandler
+level=DEBUG
+formatter=simpleFormatter
+args=('%(logdir)s/xfero.log', 'midnight', 1, 7)
+
+[handler_fileHandler_FTSTATS]
+class=handlers.TimedRotatingFileHandler
+level=DEBUG
+formatter=simpleFormatter
+args=('%(logdir)s/ftstats.log', 'midnight', 1, 7)
+
+[formatter_simpleFormatter]
+format=%%(asctime)s - %%(name)s - %%(levelname)s - %%(message)s
+'''
+
+
+def process_file(configure, xfero_logger, filenum, lines):
+    '''Log as a workflow and xfer thread does for one file'''
+    configure(xfero_logger)
+    workflow = logging.getLogger('workflow')
+    xfer = logging.getLogger('xfer')
+    ftstats = logging.getLogger('ftstats')
+
+    token = 'token-%d' % filenum
+    ftstats.info('ftstats|%s|/xfero/IN|FILE_%d|1024', token, filenum)
+    for line in range(lines):
+        if line % 2:
+            workflow.info('Workflow-1 - Perform workflow step %s on '
+                          'FILE_%s. (XFERO_Token=%s)', line, filenum, token)
+        else:
+            xfer.info('Xfer-1 - Performing Xfer step %s on FILE_%s. '
+                      '(XFERO_Token=%s)', line, filenum, token)
+
+
+def run(configure, xfero_logger, files, threads, lines):
+    '''Process the files across the threads and return the elapsed time'''
+    per_thread = files // threads
+
+    def worker(start):
+        for filenum in range(start, start + per_thread):
+            process_file(configure, xfero_logger, filenum, lines)
+
+    workers = [threading.Thread(target=worker, args=(i * per_thread,))
+               for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start, per_thread * threads
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    files = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    lines = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+
+    logdir = tempfile.mkdtemp()
+    xfero_logger = os.path.join(logdir, 'logging.conf')
+    with open(xfero_logger, 'w') as conf:
+        conf.write(LOGGING_CONF.replace('%(logdir)s', logdir))
+
+    print('%-8s %10s %12s %16s %14s' % (
+        'mode', 'files', 'files/s', 'per file (ms)', 'drain (ms)'))
+
+    elapsed, done = run(logging.config.fileConfig, xfero_logger, files,
+                        threads, lines)
+    print('%-8s %10d %12.0f %16.3f %14s' % (
+        'before', done, done / elapsed, elapsed * 1000 / done, '-'))
+
+    log_config.configure(xfero_logger)
+    elapsed, done = run(log_config.configure, xfero_logger, files,
+                        threads, lines)
+    start = time.perf_counter()
+    log_config.stop()
+    drain = time.perf_counter() - start
+    print('%-8s %10d %12.0f %16.3f %14.1f' % (
+        'after', done, done / elapsed, elapsed * 1000 / done, drain * 1000))
+
+    logging.shutdown()
+    shutil.rmtree(logdir)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+'''
+**Purpose**
+
+Benchmark of the workflow process pool.
+
+A set of files with DOS line ends is converted with
+Line_End_Converter.dos2unix by eight threads, as eight workflow threads would,
+calling the step through ```workflow_pool.run```:
+
+* on the threads, with workflow_processes 0, so the conversions share the GIL
+* in the process pool, with workflow_processes 1, 2, 4 and 8
+
+The throughput of each is reported in MB/s as the best of several runs,
+together with the speed up over the threads. The number of cores available is
+printed first, as the pool cannot scale beyond it. The pool is started before
+each run is timed, as it is in a running XFERO.
+
+*Example usage:*
+
+```python bench_workflow_pool.py [size_mb] [files] [runs]```
+
++------------+-------------+---------------------------------------------------+
+| Date       | Author      | Change Details                                    |
++============+=============+===================================================+
+| 17/10/2026 | agent       | Created                                           |
++------------+-------------+---------------------------------------------------+
+
+'''
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from xfero import workflow_pool
+from xfero.workflow_manager.line_end_converter import Line_End_Converter
+
+PROCESSES = (0, 1, 2, 4, 8)
+THREADS = 8
+LINE = b'A line of a file sent to a partner, 0123456789\r\n'
+
+
+def make_files(tmpdir, size_mb, files):
+    '''Write the files to convert'''
+    block = LINE * (1024 * 1024 // len(LINE))
+    filenames = []
+    for num in range(files):
+        filename = os.path.join(tmpdir, 'bench_%s' % num)
+        with open(filename, 'wb') as out:
+            for _ in range(size_mb):
+                out.write(block)
+        filenames.append(filename)
+    return filenames
+
+
+def convert(filename):
+    '''Convert a file as a workflow thread would'''
+    return workflow_pool.run(Line_End_Converter('bench'), 'dos2unix',
+                             [(filename,)], 'bench')[0]
+
+
+def best_time(tmpdir, size_mb, files, runs):
+    '''Return the shortest time to convert the files over the runs'''
+    best = None
+    for _ in range(runs):
+        filenames = make_files(tmpdir, size_mb, files)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            list(executor.map(convert, filenames))
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+        for filename in filenames:
+            os.remove(filename)
+    return best
+
+
+def main():
+    '''Run the benchmark and print the results'''
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    files = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    runs = int(sys.argv[3]) if len(sys.argv) > 3 else 3
+
+    print('%s cores, %s files of %s MB, %s threads' % (
+        os.cpu_count(), files, size_mb, THREADS))
+    print('%-12s %12s %10s' % ('processes', 'MB/s', 'speed up'))
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        baseline = None
+        for processes in PROCESSES:
+            workflow_pool.close_pool()
+            workflow_pool.workflow_processes = processes
+            pool = workflow_pool.get_pool()
+            if pool is not None:
+                # Start the processes before the runs are timed
+                list(pool.map(abs, range(processes)))
+
+            seconds = best_time(tmpdir, size_mb, files, runs)
+            rate = size_mb * files / seconds
+            baseline = baseline or rate
+            print('%-12s %12.1f %9.2fx' % (processes or 'threads', rate,
+                                            rate / baseline))
+    finally:
+        workflow_pool.close_pool()
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == '__main__':
+    main()